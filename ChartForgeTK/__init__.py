@@ -60,6 +60,8 @@ from .gant import GanttChart
 from .validation import DataValidator
 from .resources import ResourceManager, create_safe_animation_callback, schedule_safe_animation
 from .coordinates import CoordinateTransformer
+from .animation import set_animations_enabled, animations_enabled
+from .export import BatchExporter
 
 # from .area import AreaChart
 
@@ -93,4 +95,7 @@ __all__ = [
     'CoordinateTransformer',
     'create_safe_animation_callback',
     'schedule_safe_animation',
+    'set_animations_enabled',
+    'animations_enabled',
+    'BatchExporter',
 ]
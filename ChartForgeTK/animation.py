@@ -0,0 +1,451 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Animation engine module for ChartForgeTK.
+
+Charts create their canvas items once and describe each animation as a set
+of tweens: the start and end coords or options of an item. The engine
+interpolates every tween once per frame with canvas.coords/itemconfig.
+Progress is computed from real elapsed time, so a late frame jumps ahead
+(the missed frames are dropped) instead of slowing the animation down.
+
+All engines of one Tk root share a single AnimationScheduler timer, which
+spends at most a frame budget per tick and pauses charts that are not
+visible (minimized or withdrawn windows).
+"""
+
+import time
+import weakref
+import logging
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from .validation import DataValidator
+
+logger = logging.getLogger('ChartForgeTK')
+
+# Process-wide default for charts that leave animations_enabled at None
+_animations_enabled = True
+
+
+def set_animations_enabled(enabled: bool):
+    """
+    Turn chart animations on or off for the whole process.
+
+    With animations off every chart draws its final frame directly, which
+    suits bulk refreshes and users who prefer reduced motion. A chart's own
+    Chart.set_animations_enabled() setting takes precedence.
+
+    Raises:
+        TypeError: If enabled is not a bool
+    """
+    global _animations_enabled
+    if not isinstance(enabled, bool):
+        raise TypeError(f"[ChartForgeTK] Error: enabled must be a bool, got {type(enabled).__name__}.")
+    _animations_enabled = enabled
+
+
+def animations_enabled() -> bool:
+    """Return the process-wide animation setting."""
+    return _animations_enabled
+
+
+def ease_in_out(t: float) -> float:
+    """Smoothstep easing used by all built-in chart animations."""
+    return t * t * (3 - 2 * t)
+
+
+def linear(t: float) -> float:
+    """No easing."""
+    return t
+
+
+def interpolate_value(start, end, t: float):
+    """
+    Interpolate one item option.
+
+    Numbers are interpolated linearly and '#rrggbb' colors per channel; any
+    other value (text, state, ...) switches to the end value on the last
+    frame.
+    """
+    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+        return start + (end - start) * t
+    if isinstance(start, str) and isinstance(end, str):
+        low = DataValidator.parse_hex_color(start)
+        high = DataValidator.parse_hex_color(end)
+        if low is not None and high is not None:
+            return '#%02x%02x%02x' % tuple(int(low[c] + (high[c] - low[c]) * t) for c in range(3))
+    return end if t >= 1.0 else start
+
+
+class Tween:
+    """
+    Start and end state of one canvas item.
+
+    start and end are either coordinate sequences of equal length (applied
+    with canvas.coords) or dicts of item options with the same keys
+    (applied with canvas.itemconfig).
+    """
+
+    __slots__ = ('item', 'start', 'end', 'is_options')
+
+    def __init__(self, item, start: Union[Sequence[float], Dict], end: Union[Sequence[float], Dict]):
+        """
+        Initialize the Tween.
+
+        Args:
+            item: Canvas item id or tag
+            start: Coords or options at progress 0
+            end: Coords or options at progress 1
+
+        Raises:
+            TypeError: If start and end are not the same kind
+            ValueError: If their lengths or keys differ
+        """
+        self.is_options = isinstance(end, dict)
+        if isinstance(start, dict) != self.is_options:
+            raise TypeError("[ChartForgeTK] Error: Tween start and end must both be coords or both be options.")
+        if self.is_options:
+            if set(start) != set(end):
+                raise ValueError("[ChartForgeTK] Error: Tween start and end must set the same options.")
+        else:
+            start, end = tuple(start), tuple(end)
+            if len(start) != len(end):
+                raise ValueError(
+                    f"[ChartForgeTK] Error: Tween start has {len(start)} coords, end has {len(end)}."
+                )
+        self.item = item
+        self.start = start
+        self.end = end
+
+    def apply(self, canvas: tk.Canvas, t: float):
+        """Set the item to progress t (already eased)."""
+        if self.is_options:
+            canvas.itemconfig(self.item, **{
+                key: interpolate_value(self.start[key], value, t) for key, value in self.end.items()
+            })
+        else:
+            canvas.coords(self.item, *[a + (b - a) * t for a, b in zip(self.start, self.end)])
+
+
+class Animation:
+    """
+    A group of tweens sharing one duration and easing.
+
+    on_frame(progress) runs after the tweens of every frame, for charts that
+    derive more than coords from progress (labels, angles); on_complete runs
+    once after the last frame.
+    """
+
+    def __init__(
+        self,
+        tweens: Sequence[Tween],
+        duration: float,
+        easing: Callable[[float], float] = ease_in_out,
+        on_frame: Optional[Callable[[float], None]] = None,
+        on_complete: Optional[Callable[[], None]] = None
+    ):
+        self.tweens: List[Tween] = list(tweens)
+        self.duration = max(0.0, float(duration))
+        self.easing = easing
+        self.on_frame = on_frame
+        self.on_complete = on_complete
+        self.started: Optional[float] = None
+        self.finished = False
+
+    def fraction(self, now: float) -> float:
+        """Linear progress in [0, 1] at clock time now (seconds)."""
+        if self.started is None or self.duration <= 0:
+            return 1.0
+        return min(1.0, (now - self.started) * 1000.0 / self.duration)
+
+    def apply(self, canvas: tk.Canvas, fraction: float):
+        """Apply every tween and on_frame at a linear progress fraction."""
+        progress = self.easing(fraction)
+        for tween in self.tweens:
+            tween.apply(canvas, progress)
+        if self.on_frame is not None:
+            self.on_frame(progress)
+
+
+class AnimationScheduler:
+    """
+    One frame timer for every animating chart of a Tk root.
+
+    Each tick advances the engines of visible charts, least recently served
+    first, until FRAME_BUDGET_MS is used up; the rest wait for the next tick.
+    Engines of hidden charts are paused, so their animations resume where
+    they stopped, and while nothing is visible the timer slows down to
+    IDLE_POLL_MS.
+    """
+
+    FRAME_MS = 16
+    FRAME_BUDGET_MS = 10.0
+    IDLE_POLL_MS = 200
+
+    _schedulers = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_widget(cls, widget) -> 'AnimationScheduler':
+        """Return the scheduler shared by all widgets of the widget's Tk root."""
+        root = widget._root() if hasattr(widget, '_root') else widget
+        scheduler = cls._schedulers.get(root)
+        if scheduler is None:
+            scheduler = cls._schedulers[root] = cls(root)
+        return scheduler
+
+    def __init__(self, root, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the AnimationScheduler.
+
+        Args:
+            root: Widget whose after() drives the timer
+            clock: Time source in seconds used for the frame budget
+        """
+        self.root = root
+        self.clock = clock
+        self.engines: List['AnimationEngine'] = []
+        self.ticks = 0
+        self.deferred = 0
+        self._after_id = None
+
+    def add(self, engine: 'AnimationEngine'):
+        """Start ticking an engine."""
+        if engine not in self.engines:
+            self.engines.append(engine)
+        self._schedule(self.FRAME_MS)
+
+    def discard(self, engine: 'AnimationEngine'):
+        """Stop ticking an engine; the timer stops with the last one."""
+        if engine in self.engines:
+            self.engines.remove(engine)
+        if not self.engines and self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _schedule(self, delay: int):
+        if self._after_id is not None or not self.engines:
+            return
+        try:
+            self._after_id = self.root.after(delay, self._tick)
+        except tk.TclError:
+            # The root is gone; nothing can animate any more
+            self.engines.clear()
+
+    def _tick(self):
+        self._after_id = None
+        self.ticks += 1
+        started = self.clock()
+
+        visible = []
+        for engine in list(self.engines):
+            if not engine.running:
+                self.engines.remove(engine)
+            elif engine.is_visible():
+                engine.resume()
+                visible.append(engine)
+            else:
+                engine.pause()
+
+        for served, engine in enumerate(visible):
+            if served and (self.clock() - started) * 1000.0 >= self.FRAME_BUDGET_MS:
+                self.deferred += len(visible) - served
+                break
+            try:
+                engine.step()
+            except Exception as e:
+                logger.error(f"Error in animation frame: {e}", exc_info=True)
+                engine.clear()
+            # Served engines queue up behind the ones that had to wait
+            if engine in self.engines:
+                self.engines.remove(engine)
+                if engine.running:
+                    self.engines.append(engine)
+
+        self._schedule(self.FRAME_MS if visible else self.IDLE_POLL_MS)
+
+
+class AnimationEngine:
+    """
+    Runs the animations of one chart.
+
+    Frames come from the AnimationScheduler of the canvas' Tk root, shared
+    with every other chart; ResourceManager.cancel_animations() clears the
+    engine.
+    """
+
+    # Target frame interval (~60 FPS), used to count dropped frames
+    FRAME_MS = 16
+
+    def __init__(self, canvas: tk.Canvas, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the AnimationEngine.
+
+        Args:
+            canvas: Canvas holding the animated items
+            clock: Time source in seconds
+        """
+        self.canvas = canvas
+        self.clock = clock
+        self.animations: List[Animation] = []
+        self.frames = 0
+        self.dropped_frames = 0
+        self._scheduler: Optional[AnimationScheduler] = None
+        self._last_frame: Optional[float] = None
+        self._paused_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        """True while any animation is unfinished."""
+        return bool(self.animations)
+
+    @property
+    def paused(self) -> bool:
+        """True while the chart is hidden and its animations are frozen."""
+        return self._paused_at is not None
+
+    @property
+    def scheduler(self) -> AnimationScheduler:
+        if self._scheduler is None:
+            self._scheduler = AnimationScheduler.for_widget(self.canvas)
+        return self._scheduler
+
+    def is_visible(self) -> bool:
+        """Whether the canvas is currently mapped on screen."""
+        try:
+            return bool(self.canvas.winfo_viewable())
+        except tk.TclError:
+            return False
+
+    def animate(
+        self,
+        tweens: Sequence[Tween],
+        duration: float,
+        easing: Callable[[float], float] = ease_in_out,
+        on_frame: Optional[Callable[[float], None]] = None,
+        on_complete: Optional[Callable[[], None]] = None
+    ) -> Animation:
+        """
+        Start an animation; its start state is applied immediately.
+
+        Args:
+            tweens: Tweens to interpolate
+            duration: Length in milliseconds; 0 jumps straight to the end
+            easing: Maps linear progress to eased progress
+            on_frame: Called with the eased progress after every frame
+            on_complete: Called once after the last frame
+
+        Returns:
+            Animation: Handle for cancel() or finish()
+        """
+        animation = Animation(tweens, duration, easing, on_frame, on_complete)
+        animation.started = self._paused_at if self.paused else self.clock()
+        if animation.duration <= 0:
+            self._complete(animation)
+            return animation
+        animation.apply(self.canvas, 0.0)
+        self.animations.append(animation)
+        self.scheduler.add(self)
+        return animation
+
+    def finish(self, animation: Optional[Animation] = None):
+        """Jump one animation (or all) to its end state and complete it."""
+        targets = list(self.animations) if animation is None else [animation]
+        for target in targets:
+            if target in self.animations:
+                self.animations.remove(target)
+                self._complete(target)
+        if not self.animations:
+            self.clear()
+
+    def cancel(self, animation: Optional[Animation] = None):
+        """Stop one animation (or all) where it is, without completing it."""
+        if animation is None:
+            self.animations.clear()
+        elif animation in self.animations:
+            self.animations.remove(animation)
+        if not self.animations:
+            self.clear()
+
+    def clear(self):
+        """Forget all animations and leave the scheduler."""
+        self.animations.clear()
+        self._last_frame = None
+        self._paused_at = None
+        if self._scheduler is not None:
+            self._scheduler.discard(self)
+
+    def pause(self):
+        """Freeze all animations at their current progress."""
+        if self._paused_at is None:
+            self._paused_at = self.clock()
+            self._last_frame = None
+
+    def resume(self):
+        """Continue after pause(); the time spent paused is skipped."""
+        if self._paused_at is None:
+            return
+        hidden_for = self.clock() - self._paused_at
+        for animation in self.animations:
+            animation.started += hidden_for
+        self._paused_at = None
+
+    def _complete(self, animation: Animation):
+        animation.finished = True
+        try:
+            animation.apply(self.canvas, 1.0)
+        except tk.TclError as e:
+            logger.debug(f"Animation items no longer exist: {e}")
+            return
+        if animation.on_complete is not None:
+            animation.on_complete()
+
+    def step(self):
+        """Advance every animation to the current time (one frame)."""
+        try:
+            if not self.canvas.winfo_exists():
+                self.clear()
+                return
+        except tk.TclError:
+            self.clear()
+            return
+
+        now = self.clock()
+        if self._last_frame is not None:
+            missed = int((now - self._last_frame) * 1000.0 / self.FRAME_MS) - 1
+            if missed > 0:
+                self.dropped_frames += missed
+        self._last_frame = now
+        self.frames += 1
+
+        for animation in list(self.animations):
+            fraction = animation.fraction(now)
+            if fraction >= 1.0:
+                self.animations.remove(animation)
+                self._complete(animation)
+                continue
+            try:
+                animation.apply(self.canvas, fraction)
+            except tk.TclError as e:
+                logger.debug(f"Dropping animation whose items were deleted: {e}")
+                self.animations.remove(animation)
+
+        if not self.animations:
+            self.clear()
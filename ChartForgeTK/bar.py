@@ -21,6 +21,7 @@ from tkinter import ttk
 import math
 import logging
 from .core import Chart
+from .animation import Tween
 from .validation import DataValidator
 
 logger = logging.getLogger('ChartForgeTK')
@@ -41,13 +42,16 @@ class BarChart(Chart):
         self.animation_duration = 500  # ms
         self.bars = []  # Store bar references
         self._tooltip = None  # Tooltip window reference
+        self.fill = 'gradient'  # 'gradient' (cached image per bar) or 'flat'
+        self._bar_images = []  # Gradient images shown by the current bars
         
     def plot(
         self,
         data: Any,
         labels: Optional[Union[List[str], str]] = None,
         value_column: Optional[str] = None,
-        label_column: Optional[str] = None
+        label_column: Optional[str] = None,
+        fill: str = 'gradient'
     ):
         """
         Plot the bar chart with the given data and optional labels.
@@ -67,14 +71,22 @@ class BarChart(Chart):
                 If not specified, uses the first numeric column.
             label_column: Column name for labels when data is a DataFrame.
                 If not specified, uses the DataFrame index.
+            fill: 'gradient' draws each bar as one cached gradient image,
+                'flat' as a single solid rectangle (fastest)
             
         Raises:
             TypeError: If data is None or contains non-numeric values
-            ValueError: If data is empty, contains negative values, or labels mismatch
+            ValueError: If data is empty, contains negative values, labels mismatch,
+                or fill is unknown
             ImportError: If pandas DataFrame/Series is passed but pandas is not installed
             
         Requirements: 1.1, 1.2, 1.3, 1.4, 4.1, 4.5, 2.4, 9.1, 9.2
         """
+        if fill not in ('gradient', 'flat'):
+            raise ValueError(
+                f"[ChartForgeTK] Error: fill must be 'gradient' or 'flat', got {fill!r}."
+            )
+        
         # Handle pandas DataFrame input (Requirements: 4.1, 4.5)
         if DataValidator.is_pandas_dataframe(data):
             converted_values, converted_labels = DataValidator.convert_dataframe_to_list(
@@ -116,6 +128,7 @@ class BarChart(Chart):
         # Create copies for immutability (Requirements: 9.1, 9.2)
         self.data = validated_data.copy()
         self.labels = validated_labels.copy()
+        self.fill = fill
         
         # Cancel pending animations before redrawing (Requirements: 3.2, 3.6)
         self.resource_manager.cancel_animations()
@@ -144,8 +157,8 @@ class BarChart(Chart):
             padding = y_max * 0.1
             y_max += padding
         
-        # Clear previous content
-        self.canvas.delete('all')
+        # Clear previous content; grid and axes are updated in place
+        self.clear_layer('data')
         self.bars.clear()
         
         self._draw_axes(x_min, x_max, y_min, y_max)
@@ -172,103 +185,108 @@ class BarChart(Chart):
         
         corner_radius = min(4, bar_width / 4)
         
-        def ease(t):
-            return t * t * (3 - 2 * t)
-        
-        def update_animation(frame: int, total_frames: int):
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
+        self.bars.clear()
+        self._bar_images.clear()
+        y_base = self._data_to_pixel_y(y_min, y_min, y_max)
+        # Without animation the final bodies are drawn straight away
+        instant = not self.should_animate(2 * len(self.data))
+        tweens = []
+        bodies = []
+        for i, value in enumerate(self.data):
+            if value == 0:
+                continue
+            x = self._data_to_pixel_x(i, -0.5, len(self.data) - 0.5)
+            y_top = self._data_to_pixel_y(value, y_min, y_max)
+            color = self.style.get_color(i)
+            x1 = x - bar_width / 2
+            x2 = x + bar_width / 2
+            
+            if instant:
+                self.bars.append(self._draw_bar_body(i, x1, y_top, x2, y_base, color))
+            else:
+                # Bars grow as flat rectangles; gradient fills replace them once
+                # the final height is known
+                body = self.canvas.create_rectangle(
+                    x1, y_base, x2, y_base, fill=color, outline="",
+                    tags=('bar_grad', f'bar_{i}')
+                )
+                self.bars.append(body)
+                bodies.append((i, body, x1, y_top, x2, color))
+                tweens.append(Tween(body, (x1, y_base, x2, y_base), (x1, y_top, x2, y_base)))
             
-            progress = ease(frame / total_frames)
+            # Highlight top edge
+            highlight_y = y_top if instant else y_base
+            highlight = self.canvas.create_line(
+                x1, highlight_y, x2, highlight_y,
+                fill=self.style.create_lighter(color, 1.4),
+                width=2, capstyle=tk.ROUND,
+                tags=('bar_highlight', f'bar_{i}')
+            )
+            self.bars.append(highlight)
+            if not instant:
+                tweens.append(Tween(highlight, (x1, y_base, x2, y_base), (x1, y_top, x2, y_top)))
             
-            for item in self.bars:
-                try:
-                    self.canvas.delete(item)
-                except tk.TclError:
-                    pass
-            self.bars.clear()
+            # Bottom shadow
+            self.bars.append(
+                self.canvas.create_rectangle(
+                    x1 + 2, y_base - 1, x2 + 2, y_base + 2,
+                    fill=self.style.create_shadow(color, 0.5),
+                    outline="",
+                    tags=('shadow', f'bar_{i}')
+                )
+            )
+        
+        def finish():
+            if self.fill == 'gradient':
+                for i, body, x1, y_top, x2, color in bodies:
+                    self.canvas.delete(body)
+                    self.bars.remove(body)
+                    image_item = self._draw_bar_body(i, x1, y_top, x2, y_base, color)
+                    self.canvas.tag_lower(image_item, f'bar_{i}')
+                    self.bars.append(image_item)
             
             for i, value in enumerate(self.data):
-                x = self._data_to_pixel_x(i, -0.5, len(self.data) - 0.5)
-                y_base = self._data_to_pixel_y(y_min, y_min, y_max)
-                y_top = self._data_to_pixel_y(value, y_min, y_max)
-                
                 if value == 0:
-                    y_current = y_base
+                    value_text = "0"
+                elif value == int(value):
+                    value_text = f"{int(value):,}"
                 else:
-                    y_current = y_base - (y_base - y_top) * progress
-                
-                color = self.style.get_color(i)
-                
-                # Gradient bar
-                x1 = x - bar_width / 2
-                x2 = x + bar_width / 2
+                    value_text = f"{value:,.1f}"
                 
-                if y_current < y_base:
-                    num_steps = max(8, int((y_base - y_current) / 3))
-                    step_h = (y_base - y_current) / num_steps
-                    for s in range(num_steps):
-                        sy1 = y_current + s * step_h
-                        sy2 = sy1 + step_h + 1
-                        ratio = s / num_steps
-                        lighter = self.style.create_lighter(color, 1.0 + 0.3 * (1 - ratio))
-                        self.bars.append(
-                            self.canvas.create_rectangle(
-                                x1, sy1, x2, sy2,
-                                fill=lighter, outline="",
-                                tags=('bar_grad', f'bar_{i}')
-                            )
-                        )
-                    
-                    # Highlight top edge
-                    self.bars.append(
-                        self.canvas.create_line(
-                            x1, y_current, x2, y_current,
-                            fill=self.style.create_lighter(color, 1.4),
-                            width=2, capstyle=tk.ROUND,
-                            tags=('bar_highlight', f'bar_{i}')
-                        )
-                    )
-                    
-                    # Bottom shadow
-                    self.bars.append(
-                        self.canvas.create_rectangle(
-                            x1 + 2, y_base - 1, x2 + 2, y_base + 2,
-                            fill=self.style.create_shadow(color, 0.5),
-                            outline="",
-                            tags=('shadow', f'bar_{i}')
-                        )
-                    )
-                
-                if progress == 1:
-                    if value == 0:
-                        value_text = "0"
-                    elif value == int(value):
-                        value_text = f"{int(value):,}"
-                    else:
-                        value_text = f"{value:,.1f}"
-                    
-                    label_y = y_top - 8
-                    self.bars.append(
-                        self.canvas.create_text(
-                            x, label_y,
-                            text=f"{value_text}",
-                            font=self.style.VALUE_FONT,
-                            fill=self.style.TEXT,
-                            anchor='s',
-                            tags=('label', f'bar_{i}')
-                        )
+                x = self._data_to_pixel_x(i, -0.5, len(self.data) - 0.5)
+                label_y = self._data_to_pixel_y(value, y_min, y_max) - 8
+                self.bars.append(
+                    self.canvas.create_text(
+                        x, label_y,
+                        text=f"{value_text}",
+                        font=self.style.VALUE_FONT,
+                        fill=self.style.TEXT,
+                        anchor='s',
+                        tags=('label', f'bar_{i}')
                     )
-            
-            if frame < total_frames:
-                after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                self.resource_manager.register_animation(after_id)
+                )
         
-        total_frames = self.animation_duration // 16
-        update_animation(0, total_frames)
+        self.animate(tweens, on_complete=finish, item_count=2 * len(self.data))
+    
+    def _draw_bar_body(self, i: int, x1: float, y1: float, x2: float, y2: float, color: str) -> int:
+        """Draw the fill of bar i as one canvas item and return its id.
+        
+        Gradient bars brighten from 1.3x the color at the top to the color at
+        the base; the image comes from the renderer's cache, so bars of equal
+        size and color share it.
+        """
+        if self.fill == 'flat':
+            return self.canvas.create_rectangle(
+                x1, y1, x2, y2, fill=color, outline="", tags=('bar_grad', f'bar_{i}')
+            )
+        left, top = int(round(x1)), int(round(y1))
+        image = self.renderer.gradient_image(
+            self.canvas, color, int(round(x2)) - left, int(round(y2)) - top, 1.3, 1.0
+        )
+        self._bar_images.append(image)
+        return self.canvas.create_image(
+            left, top, image=image, anchor='nw', tags=('bar_grad', f'bar_{i}')
+        )
     
     def _redraw_bars(self, y_min, y_max):
         """Redraw bars for resize/redraw without animation."""
@@ -279,6 +297,7 @@ class BarChart(Chart):
             bar_spacing = (self.width - 2 * self.padding) / len(self.data)
             bar_width = bar_spacing * self.bar_width_factor
         
+        self._bar_images.clear()
         for i, value in enumerate(self.data):
             x = self._data_to_pixel_x(i, -0.5, len(self.data) - 0.5)
             y_base = self._data_to_pixel_y(y_min, y_min, y_max)
@@ -288,18 +307,8 @@ class BarChart(Chart):
             x1 = x - bar_width / 2
             x2 = x + bar_width / 2
             
-            num_steps = max(8, int((y_base - y_top) / 3))
-            step_h = (y_base - y_top) / num_steps
-            for s in range(num_steps):
-                sy1 = y_top + s * step_h
-                sy2 = sy1 + step_h + 1
-                ratio = s / num_steps
-                lighter = self.style.create_lighter(color, 1.0 + 0.3 * (1 - ratio))
-                self.canvas.create_rectangle(
-                    x1, sy1, x2, sy2,
-                    fill=lighter, outline="",
-                    tags=('bar_grad', f'bar_{i}')
-                )
+            if y_top < y_base:
+                self._draw_bar_body(i, x1, y_top, x2, y_base, color)
             
             self.canvas.create_line(
                 x1, y_top, x2, y_top,
@@ -354,12 +363,7 @@ class BarChart(Chart):
         
         Requirements: 3.1, 3.5, 7.1, 7.2, 7.6
         """
-        current_highlight = None
-        current_glow = None
-        
         def on_motion(event):
-            nonlocal current_highlight, current_glow
-            
             if not self.data:
                 return
             
@@ -382,33 +386,15 @@ class BarChart(Chart):
                     y_top = self._data_to_pixel_y(value, 0, y_max_display)
                     y_base = self._data_to_pixel_y(0, 0, y_max_display)
                     
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
-                    
-                    if current_glow:
-                        try:
-                            self.canvas.delete(current_glow)
-                        except tk.TclError:
-                            pass
-                    
-                    try:
-                        glow = self.canvas.create_rectangle(
-                            bar_x - bar_width/2 - 4,
-                            y_top - 4,
-                            bar_x + bar_width/2 + 4,
-                            y_base + 4,
-                            fill="",
-                            outline=self.style.HIGHLIGHT_GLOW,
-                            width=3,
-                            stipple="gray12",
-                            tags=('glow',)
-                        )
-                        current_glow = glow
-                    except tk.TclError:
-                        current_glow = None
+                    self.show_overlay(
+                        'glow', 'rectangle',
+                        (bar_x - bar_width/2 - 4, y_top - 4,
+                         bar_x + bar_width/2 + 4, y_base + 4),
+                        fill="",
+                        outline=self.style.HIGHLIGHT_GLOW,
+                        width=3,
+                        stipple="gray12"
+                    )
                     
                     if value == 0:
                         value_text = "0"
@@ -422,54 +408,17 @@ class BarChart(Chart):
                         f"{self.labels[bar_index]}\nValue: {value_text}"
                     )
                 else:
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
-                        current_highlight = None
-                    if current_glow:
-                        try:
-                            self.canvas.delete(current_glow)
-                        except tk.TclError:
-                            pass
-                        current_glow = None
+                    self.hide_overlay('glow')
                     self.hide_tooltip()
             else:
-                if current_highlight:
-                    try:
-                        self.canvas.delete(current_highlight)
-                    except tk.TclError:
-                        pass
-                    current_highlight = None
-                if current_glow:
-                    try:
-                        self.canvas.delete(current_glow)
-                    except tk.TclError:
-                        pass
-                    current_glow = None
+                self.hide_overlay('glow')
                 self.hide_tooltip()
         
         def on_leave(event):
-            nonlocal current_highlight, current_glow
-            if current_highlight:
-                try:
-                    self.canvas.delete(current_highlight)
-                except tk.TclError:
-                    pass
-                current_highlight = None
-            if current_glow:
-                try:
-                    self.canvas.delete(current_glow)
-                except tk.TclError:
-                    pass
-                current_glow = None
+            self.hide_overlay('glow')
             self.hide_tooltip()
         
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
+        self.bind_hover(on_motion, on_leave)
 
 # Usage example:
 """
@@ -22,6 +22,7 @@ import math
 import statistics
 import logging
 from .core import Chart, ChartStyle
+from .animation import Tween
 from .validation import DataValidator
 
 logger = logging.getLogger('ChartForgeTK')
@@ -284,8 +285,8 @@ class BoxPlot(Chart):
         self.x_label = "Groups"
         self.y_label = "Values"
         
-        # Clear previous content
-        self.canvas.delete('all')
+        # Clear previous content; grid and axes are updated in place
+        self.clear_layer('data')
         self.elements.clear()
         
         self._draw_axes(self.x_min, self.x_max, self.y_min, self.y_max)
@@ -376,9 +377,6 @@ class BoxPlot(Chart):
         
         Requirements: 3.2, 3.6
         """
-        def ease(t):
-            return t * t * (3 - 2 * t)
-        
         # Handle edge case: single dataset (Requirements: 2.1)
         if len(self.data) == 1:
             box_spacing = (self.width - 2 * self.padding) / 2  # Center the single box
@@ -387,170 +385,111 @@ class BoxPlot(Chart):
             box_spacing = (self.width - 2 * self.padding) / len(self.data)
             box_width = box_spacing * self.box_width_factor
         
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
+        self.elements.clear()
+        tweens = []
+        for i, dataset in enumerate(self.data):
+            x = self._data_to_pixel_x(i, self.x_min, self.x_max)
+            color = self.style.get_gradient_color(i, len(self.data))
             
-            progress = ease(frame / total_frames)
+            # Calculate box plot statistics with edge case handling
+            stats = self._calculate_box_statistics(dataset)
+            median = stats['median']
+            iqr = stats['iqr']
+            outliers = stats['outliers']
             
-            # Clear previous elements
-            for item in self.elements:
-                try:
-                    self.canvas.delete(item)
-                except tk.TclError:
-                    pass
-            self.elements.clear()
+            # Convert to pixel coordinates
+            y_q1 = self._data_to_pixel_y(stats['q1'], self.y_min, self.y_max)
+            y_q3 = self._data_to_pixel_y(stats['q3'], self.y_min, self.y_max)
+            y_median = self._data_to_pixel_y(median, self.y_min, self.y_max)
+            y_lower = self._data_to_pixel_y(stats['lower_whisker'], self.y_min, self.y_max)
+            y_upper = self._data_to_pixel_y(stats['upper_whisker'], self.y_min, self.y_max)
             
-            for i, dataset in enumerate(self.data):
-                x = self._data_to_pixel_x(i, self.x_min, self.x_max)
-                color = self.style.get_gradient_color(i, len(self.data))
-                
-                # Calculate box plot statistics with edge case handling
-                stats = self._calculate_box_statistics(dataset)
-                q1 = stats['q1']
-                median = stats['median']
-                q3 = stats['q3']
-                iqr = stats['iqr']
-                lower_whisker = stats['lower_whisker']
-                upper_whisker = stats['upper_whisker']
-                outliers = stats['outliers']
-                
-                # Convert to pixel coordinates
-                y_q1 = self._data_to_pixel_y(q1, self.y_min, self.y_max)
-                y_q3 = self._data_to_pixel_y(q3, self.y_min, self.y_max)
-                y_median = self._data_to_pixel_y(median, self.y_min, self.y_max)
-                y_lower = self._data_to_pixel_y(lower_whisker, self.y_min, self.y_max)
-                y_upper = self._data_to_pixel_y(upper_whisker, self.y_min, self.y_max)
-                
-                # Handle identical values case - ensure box has minimum height (Requirements: 2.2)
-                if iqr == 0:
-                    # Create a thin box for identical values
-                    box_height_pixels = 4  # Minimum visible height
-                    y_q1 = y_median + box_height_pixels / 2
-                    y_q3 = y_median - box_height_pixels / 2
-                    box_height = 0  # No animation needed for height
-                else:
-                    box_height = (y_q1 - y_q3) * progress
-                
-                # Shadow (only if box has height)
-                if y_q1 > y_q3:
-                    shadow = self.canvas.create_rectangle(
-                        x - box_width/2 + 2, y_q3 + 2,
-                        x + box_width/2 + 2, y_q1 + 2,
-                        fill=self.style.create_shadow(color),
-                        outline="",
-                        tags=('shadow', f'box_{i}')
-                    )
-                    self.elements.append(shadow)
-                
-                # Box (Requirements: 2.2 - handles identical values)
-                if iqr == 0:
-                    # Draw thin box for identical values
-                    box = self.canvas.create_rectangle(
-                        x - box_width/2, y_q3,
-                        x + box_width/2, y_q1,
-                        fill=color,
-                        outline=self.style.adjust_brightness(color, 0.8),
-                        tags=('box', f'box_{i}')
-                    )
-                else:
-                    # Animate box height
-                    animated_y_q3 = y_q3 + (y_q1 - y_q3) * (1 - progress) / 2
-                    animated_y_q1 = y_q1 - (y_q1 - y_q3) * (1 - progress) / 2
-                    box = self.canvas.create_rectangle(
-                        x - box_width/2, animated_y_q3,
-                        x + box_width/2, animated_y_q1,
-                        fill=color,
-                        outline=self.style.adjust_brightness(color, 0.8),
-                        tags=('box', f'box_{i}')
-                    )
-                self.elements.append(box)
-                
-                # Median line
-                median_line = self.canvas.create_line(
-                    x - box_width/2, y_median,
-                    x + box_width/2, y_median,
-                    fill=self.style.TEXT,
-                    width=2,
-                    tags=('median', f'box_{i}')
-                )
-                self.elements.append(median_line)
-                
-                # Whiskers (animate length)
-                whisker_progress = progress
-                
-                # Lower whisker
-                lower_whisker_item = self.canvas.create_line(
-                    x, y_q1, x, y_q1 + (y_lower - y_q1) * whisker_progress,
-                    fill=self.style.TEXT,
-                    width=1,
-                    tags=('whisker', f'box_{i}')
-                )
-                self.elements.append(lower_whisker_item)
-                
-                # Upper whisker
-                upper_whisker_item = self.canvas.create_line(
-                    x, y_q3, x, y_q3 - (y_q3 - y_upper) * whisker_progress,
+            # Handle identical values case - ensure box has minimum height (Requirements: 2.2)
+            if iqr == 0:
+                # Create a thin box for identical values
+                box_height_pixels = 4  # Minimum visible height
+                y_q1 = y_median + box_height_pixels / 2
+                y_q3 = y_median - box_height_pixels / 2
+            
+            # Shadow (only if box has height)
+            if y_q1 > y_q3:
+                self.elements.append(self.canvas.create_rectangle(
+                    x - box_width/2 + 2, y_q3 + 2,
+                    x + box_width/2 + 2, y_q1 + 2,
+                    fill=self.style.create_shadow(color),
+                    outline="",
+                    tags=('shadow', f'box_{i}')
+                ))
+            
+            # Box grows from its middle; thin boxes for identical values are
+            # drawn at full size (Requirements: 2.2)
+            box_end = (x - box_width/2, y_q3, x + box_width/2, y_q1)
+            y_mid = (y_q1 + y_q3) / 2
+            box_start = box_end if iqr == 0 else (x - box_width/2, y_mid, x + box_width/2, y_mid)
+            box = self.canvas.create_rectangle(
+                *box_start,
+                fill=color,
+                outline=self.style.adjust_brightness(color, 0.8),
+                tags=('box', f'box_{i}')
+            )
+            self.elements.append(box)
+            if iqr != 0:
+                tweens.append(Tween(box, box_start, box_end))
+            
+            # Median line
+            self.elements.append(self.canvas.create_line(
+                x - box_width/2, y_median,
+                x + box_width/2, y_median,
+                fill=self.style.TEXT,
+                width=2,
+                tags=('median', f'box_{i}')
+            ))
+            
+            # Whiskers grow out of the box
+            for y_from, y_to in ((y_q1, y_lower), (y_q3, y_upper)):
+                whisker = self.canvas.create_line(
+                    x, y_from, x, y_from,
                     fill=self.style.TEXT,
                     width=1,
                     tags=('whisker', f'box_{i}')
                 )
-                self.elements.append(upper_whisker_item)
-                
-                # Whisker caps
-                lower_cap = self.canvas.create_line(
-                    x - box_width/4, y_lower,
-                    x + box_width/4, y_lower,
-                    fill=self.style.TEXT,
-                    width=1,
-                    tags=('cap', f'box_{i}')
-                )
-                self.elements.append(lower_cap)
-                
-                upper_cap = self.canvas.create_line(
-                    x - box_width/4, y_upper,
-                    x + box_width/4, y_upper,
+                self.elements.append(whisker)
+                tweens.append(Tween(whisker, (x, y_from, x, y_from), (x, y_from, x, y_to)))
+            
+            # Whisker caps
+            for y_cap in (y_lower, y_upper):
+                self.elements.append(self.canvas.create_line(
+                    x - box_width/4, y_cap,
+                    x + box_width/4, y_cap,
                     fill=self.style.TEXT,
                     width=1,
                     tags=('cap', f'box_{i}')
-                )
-                self.elements.append(upper_cap)
-                
-                # Outliers
-                for outlier in outliers:
-                    y_out = self._data_to_pixel_y(outlier, self.y_min, self.y_max)
-                    outlier_mark = self.canvas.create_oval(
-                        x - 3, y_out - 3,
-                        x + 3, y_out + 3,
-                        fill=self.style.ACCENT,
-                        outline="",
-                        tags=('outlier', f'box_{i}')
-                    )
-                    self.elements.append(outlier_mark)
-                
-                # Label
-                if progress == 1:
-                    label = self.canvas.create_text(
-                        x, self.height - self.padding + 15,
-                        text=self.labels[i],
-                        font=self.style.VALUE_FONT,
-                        fill=self.style.TEXT,
-                        anchor='n',
-                        tags=('label', f'box_{i}')
-                    )
-                    self.elements.append(label)
+                ))
             
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                self.resource_manager.register_animation(after_id)
+            # Outliers
+            for outlier in outliers:
+                y_out = self._data_to_pixel_y(outlier, self.y_min, self.y_max)
+                self.elements.append(self.canvas.create_oval(
+                    x - 3, y_out - 3,
+                    x + 3, y_out + 3,
+                    fill=self.style.ACCENT,
+                    outline="",
+                    tags=('outlier', f'box_{i}')
+                ))
+        
+        def add_labels():
+            for i in range(len(self.data)):
+                x = self._data_to_pixel_x(i, self.x_min, self.x_max)
+                self.elements.append(self.canvas.create_text(
+                    x, self.height - self.padding + 15,
+                    text=self.labels[i],
+                    font=self.style.VALUE_FONT,
+                    fill=self.style.TEXT,
+                    anchor='n',
+                    tags=('label', f'box_{i}')
+                ))
         
-        total_frames = self.animation_duration // 16
-        update_animation(0, total_frames)
+        self.animate(tweens, on_complete=add_labels)
 
     def _add_interactive_effects(self):
         """
@@ -581,12 +520,8 @@ class BoxPlot(Chart):
         style.configure('Tooltip.TLabel', background=self.style.TEXT, foreground=self.style.BACKGROUND,
                        font=self.style.TOOLTIP_FONT)
         
-        current_highlight = None
-        
         def on_motion(event):
             """Handle mouse motion events (Requirements: 7.2)"""
-            nonlocal current_highlight
-            
             # Safety check - ensure data exists
             if not self.data:
                 return
@@ -615,25 +550,14 @@ class BoxPlot(Chart):
                     y_q1 = self._data_to_pixel_y(q1, self.y_min, self.y_max)
                     y_q3 = self._data_to_pixel_y(q3, self.y_min, self.y_max)
                     
-                    # Remove previous highlight
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
-                    
-                    # Create highlight effect
-                    try:
-                        highlight = self.canvas.create_rectangle(
-                            px - box_width/2 - 2, y_q3 - 2,
-                            px + box_width/2 + 2, y_q1 + 2,
-                            outline=self.style.ACCENT,
-                            width=2,
-                            tags=('highlight',)
-                        )
-                        current_highlight = highlight
-                    except tk.TclError:
-                        current_highlight = None
+                    # Move the pooled highlight onto the box
+                    self.show_overlay(
+                        'highlight', 'rectangle',
+                        (px - box_width/2 - 2, y_q3 - 2,
+                         px + box_width/2 + 2, y_q1 + 2),
+                        outline=self.style.ACCENT,
+                        width=2
+                    )
                     
                     # Update tooltip with statistics
                     try:
@@ -649,23 +573,13 @@ class BoxPlot(Chart):
                     except tk.TclError:
                         pass  # Tooltip may have been destroyed
                 else:
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
-                        current_highlight = None
+                    self.hide_overlay('highlight')
                     try:
                         tooltip.withdraw()
                     except tk.TclError:
                         pass
             else:
-                if current_highlight:
-                    try:
-                        self.canvas.delete(current_highlight)
-                    except tk.TclError:
-                        pass
-                    current_highlight = None
+                self.hide_overlay('highlight')
                 try:
                     tooltip.withdraw()
                 except tk.TclError:
@@ -673,20 +587,11 @@ class BoxPlot(Chart):
         
         def on_leave(event):
             """Handle mouse leave events"""
-            nonlocal current_highlight
-            if current_highlight:
-                try:
-                    self.canvas.delete(current_highlight)
-                except tk.TclError:
-                    pass
-                current_highlight = None
+            self.hide_overlay('highlight')
             try:
                 tooltip.withdraw()
             except tk.TclError:
                 pass
         
         # Bind events and register with resource manager (Requirements: 3.5)
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
\ No newline at end of file
+        self.bind_hover(on_motion, on_leave)
@@ -21,7 +21,9 @@ from tkinter import ttk
 import math
 import logging
 from .core import Chart, ChartStyle
+from .animation import Tween
 from .validation import DataValidator
+from .spatial import PointGrid
 
 logger = logging.getLogger('ChartForgeTK')
 
@@ -41,6 +43,7 @@ class BubbleChart(Chart):
         self.animation_duration = 500
         self.bubbles = []  # Store canvas items
         self._tooltip = None  # Tooltip window reference
+        self._hover_index = PointGrid()  # Pixel positions and hit radii of self.data
         
     def _convert_dataframe_to_tuples(
         self,
@@ -298,89 +301,67 @@ class BubbleChart(Chart):
         self.x_label = "X Axis"
         self.y_label = "Y Axis"
         
-        self.canvas.delete('all')
+        self.clear_layer('data')
         self.bubbles.clear()
         
         self._draw_axes(self.x_min, self.x_max, self.y_min, self.y_max)
+        self._build_hover_index()
         self._animate_bubbles()
         self._add_interactive_effects()
 
+    def _bubble_radius(self, size: float) -> float:
+        """Return the drawn radius of a bubble of the given size."""
+        if self.size_max == self.size_min:
+            return self.min_radius
+        return self.min_radius + (self.max_radius - self.min_radius) * \
+            (size - self.size_min) / (self.size_max - self.size_min)
+
+    def _build_hover_index(self):
+        """Index bubble centres with their hit radius once per render for hover hit-testing."""
+        self._hover_index = PointGrid()
+        for i, (x, y, size) in enumerate(self.data):
+            px = self._data_to_pixel_x(x, self.x_min, self.x_max)
+            py = self._data_to_pixel_y(y, self.y_min, self.y_max)
+            # Within bubble radius + buffer
+            self._hover_index.add(px, py, i, reach=self._bubble_radius(size) + 10)
+
     def _animate_bubbles(self):
         """Draw bubbles with smooth size animation.
         
         Requirements: 3.2, 3.6, 6.3
         """
-        def ease(t):
-            return t * t * (3 - 2 * t)
-        
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
-            
-            progress = ease(frame / total_frames)
-            
-            for item in self.bubbles:
-                try:
-                    self.canvas.delete(item)
-                except tk.TclError:
-                    pass
-            self.bubbles.clear()
+        self.bubbles.clear()
+        tweens = []
+        for i, (x, y, size) in enumerate(self.data):
+            px = self._data_to_pixel_x(x, self.x_min, self.x_max)
+            py = self._data_to_pixel_y(y, self.y_min, self.y_max)
+            radius = self._bubble_radius(size)
+            color = self.style.get_gradient_color(i, len(self.data))
             
+            # Shadow and bubble grow from their centres
+            for item_tag, offset, options in (
+                ('shadow', 2, {'fill': self.style.create_shadow(color), 'outline': ""}),
+                ('bubble', 0, {'fill': color, 'outline': self.style.adjust_brightness(color, 0.8)}),
+            ):
+                cx, cy = px + offset, py + offset
+                item = self.canvas.create_oval(cx, cy, cx, cy, tags=(item_tag, f'bubble_{i}'), **options)
+                self.bubbles.append(item)
+                tweens.append(Tween(item, (cx, cy, cx, cy), (cx - radius, cy - radius, cx + radius, cy + radius)))
+        
+        def add_labels():
             for i, (x, y, size) in enumerate(self.data):
                 px = self._data_to_pixel_x(x, self.x_min, self.x_max)
                 py = self._data_to_pixel_y(y, self.y_min, self.y_max)
-                # Scale radius based on size
-                if self.size_max == self.size_min:
-                    radius = self.min_radius
-                else:
-                    radius = self.min_radius + (self.max_radius - self.min_radius) * \
-                            (size - self.size_min) / (self.size_max - self.size_min)
-                radius *= progress
-                
-                color = self.style.get_gradient_color(i, len(self.data))
-                
-                # Shadow
-                shadow = self.canvas.create_oval(
-                    px - radius + 2, py - radius + 2,
-                    px + radius + 2, py + radius + 2,
-                    fill=self.style.create_shadow(color),
-                    outline="",
-                    tags=('shadow', f'bubble_{i}')
-                )
-                self.bubbles.append(shadow)
-                
-                # Bubble
-                bubble = self.canvas.create_oval(
-                    px - radius, py - radius,
-                    px + radius, py + radius,
-                    fill=color,
-                    outline=self.style.adjust_brightness(color, 0.8),
-                    tags=('bubble', f'bubble_{i}')
-                )
-                self.bubbles.append(bubble)
-                
-                if progress == 1:
-                    label = self.canvas.create_text(
-                        px, py - radius - 10,
-                        text=f"({x:.1f}, {y:.1f}, {size:.1f})",
-                        font=self.style.VALUE_FONT,
-                        fill=self.style.TEXT,
-                        anchor='s',
-                        tags=('label', f'bubble_{i}')
-                    )
-                    self.bubbles.append(label)
-            
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                self.resource_manager.register_animation(after_id)
-        
-        total_frames = self.animation_duration // 16
-        update_animation(0, total_frames)
+                self.bubbles.append(self.canvas.create_text(
+                    px, py - self._bubble_radius(size) - 10,
+                    text=f"({x:.1f}, {y:.1f}, {size:.1f})",
+                    font=self.style.VALUE_FONT,
+                    fill=self.style.TEXT,
+                    anchor='s',
+                    tags=('label', f'bubble_{i}')
+                ))
+        
+        self.animate(tweens, on_complete=add_labels)
 
     def _add_interactive_effects(self):
         """Add hover effects and tooltips with proper resource management.
@@ -410,12 +391,8 @@ class BubbleChart(Chart):
         style.configure('Tooltip.TLabel', background=self.style.TEXT, foreground=self.style.BACKGROUND,
                        font=self.style.TOOLTIP_FONT)
         
-        current_highlight = None
-        
         def on_motion(event):
             """Handle mouse motion events (Requirements: 7.2)"""
-            nonlocal current_highlight
-            
             # Safety check - ensure data exists
             if not self.data:
                 return
@@ -423,40 +400,21 @@ class BubbleChart(Chart):
             x, y = event.x, event.y
             
             if self.padding <= x <= self.width - self.padding and self.padding <= y <= self.height - self.padding:
-                closest_idx = -1
-                min_dist = float('inf')
-                
-                for i, (dx, dy, size) in enumerate(self.data):
-                    px = self._data_to_pixel_x(dx, self.x_min, self.x_max)
-                    py = self._data_to_pixel_y(dy, self.y_min, self.y_max)
-                    radius = self.min_radius + (self.max_radius - self.min_radius) * \
-                            (size - self.size_min) / (self.size_max - self.size_min) if self.size_max != self.size_min else self.min_radius
-                    dist = math.sqrt((x - px)**2 + (y - py)**2)
-                    if dist < min_dist and dist < radius + 10:  # Within bubble radius + buffer
-                        min_dist = dist
-                        closest_idx = i
+                # Grid lookup only visits the cells around the cursor
+                hit = self._hover_index.nearest(x, y)
+                closest_idx = hit[0] if hit is not None else -1
                 
                 if closest_idx >= 0:
                     px = self._data_to_pixel_x(self.data[closest_idx][0], self.x_min, self.x_max)
                     py = self._data_to_pixel_y(self.data[closest_idx][1], self.y_min, self.y_max)
-                    radius = self.min_radius + (self.max_radius - self.min_radius) * \
-                            (self.data[closest_idx][2] - self.size_min) / (self.size_max - self.size_min) if self.size_max != self.size_min else self.min_radius
-                    
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
+                    radius = self._bubble_radius(self.data[closest_idx][2])
                     
-                    try:
-                        highlight = self.canvas.create_oval(
-                            px - radius * 1.2, py - radius * 1.2,
-                            px + radius * 1.2, py + radius * 1.2,
-                            outline=self.style.ACCENT, width=2, tags=('highlight',)
-                        )
-                        current_highlight = highlight
-                    except tk.TclError:
-                        current_highlight = None
+                    self.show_overlay(
+                        'highlight', 'oval',
+                        (px - radius * 1.2, py - radius * 1.2,
+                         px + radius * 1.2, py + radius * 1.2),
+                        outline=self.style.ACCENT, width=2
+                    )
                     
                     x_val, y_val, size_val = self.data[closest_idx]
                     try:
@@ -467,12 +425,7 @@ class BubbleChart(Chart):
                     except tk.TclError:
                         pass  # Tooltip may have been destroyed
                 else:
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
-                        current_highlight = None
+                    self.hide_overlay('highlight')
                     try:
                         tooltip.withdraw()
                     except tk.TclError:
@@ -480,20 +433,11 @@ class BubbleChart(Chart):
         
         def on_leave(event):
             """Handle mouse leave events"""
-            nonlocal current_highlight
-            if current_highlight:
-                try:
-                    self.canvas.delete(current_highlight)
-                except tk.TclError:
-                    pass
-                current_highlight = None
+            self.hide_overlay('highlight')
             try:
                 tooltip.withdraw()
             except tk.TclError:
                 pass
         
         # Bind events and register with resource manager (Requirements: 3.5)
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
\ No newline at end of file
+        self.bind_hover(on_motion, on_leave)
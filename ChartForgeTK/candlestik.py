@@ -21,6 +21,7 @@ from tkinter import ttk
 import math
 import logging
 from .core import Chart, ChartStyle
+from .animation import Tween
 from .validation import DataValidator
 
 logger = logging.getLogger('ChartForgeTK')
@@ -124,7 +125,7 @@ class CandlestickChart(Chart):
         self.x_label = "Time/Index"
         self.y_label = "Price"
         
-        self.canvas.delete('all')
+        self.clear_layer('data')
         self.elements.clear()
         
         self._draw_axes(self.x_min, self.x_max, self.y_min, self.y_max)
@@ -136,111 +137,71 @@ class CandlestickChart(Chart):
         
         Requirements: 3.2, 3.6, 6.3
         """
-        def ease(t):
-            return t * t * (3 - 2 * t)
-        
         candle_spacing = (self.width - 2 * self.padding) / (len(self.data) if len(self.data) > 1 else 1)
         candle_width = candle_spacing * self.candle_width_factor
         
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
+        self.elements.clear()
+        tweens = []
+        for i, (index, open_price, high, low, close_price) in enumerate(self.data):
+            x = self._data_to_pixel_x(index, self.x_min, self.x_max)
+            y_open = self._data_to_pixel_y(open_price, self.y_min, self.y_max)
+            y_high = self._data_to_pixel_y(high, self.y_min, self.y_max)
+            y_low = self._data_to_pixel_y(low, self.y_min, self.y_max)
+            y_close = self._data_to_pixel_y(close_price, self.y_min, self.y_max)
             
-            progress = ease(frame / total_frames)
+            # Colors: Bullish (green), Bearish (red)
+            fill_color = "#4CAF50" if close_price >= open_price else "#F44336"
+            outline_color = self.style.adjust_brightness(fill_color, 0.8)
             
-            for item in self.elements:
-                try:
-                    self.canvas.delete(item)
-                except tk.TclError:
-                    pass
-            self.elements.clear()
+            # Wick grows from the midpoint of high/low outwards
+            y_mid_wick = (y_high + y_low) / 2
+            wick = self.canvas.create_line(
+                x, y_mid_wick, x, y_mid_wick,
+                fill=self.style.TEXT_SECONDARY,
+                width=self.wick_width,
+                tags=('wick', f'candle_{i}')
+            )
+            self.elements.append(wick)
+            tweens.append(Tween(wick, (x, y_mid_wick, x, y_mid_wick), (x, y_high, x, y_low)))
             
+            # Body grows from the midpoint of open/close (minimum 1px height for flat candles)
+            y_mid = (y_open + y_close) / 2
+            half_height = max(abs(y_close - y_open), 1) / 2
+            for item_tag, offset, options in (
+                ('shadow', 2, {'fill': self.style.create_shadow(fill_color), 'outline': ""}),
+                ('candle', 0, {'fill': fill_color, 'outline': outline_color, 'width': 1}),
+            ):
+                x1, x2 = x - candle_width/2 + offset, x + candle_width/2 + offset
+                start = (x1, y_mid + offset, x2, y_mid + offset)
+                item = self.canvas.create_rectangle(*start, tags=(item_tag, f'candle_{i}'), **options)
+                self.elements.append(item)
+                tweens.append(Tween(item, start, (x1, y_mid - half_height + offset, x2, y_mid + half_height + offset)))
+        
+        def add_labels():
+            if not self.show_labels:
+                return
             for i, (index, open_price, high, low, close_price) in enumerate(self.data):
                 x = self._data_to_pixel_x(index, self.x_min, self.x_max)
-                y_open = self._data_to_pixel_y(open_price, self.y_min, self.y_max)
-                y_high = self._data_to_pixel_y(high, self.y_min, self.y_max)
-                y_low = self._data_to_pixel_y(low, self.y_min, self.y_max)
-                y_close = self._data_to_pixel_y(close_price, self.y_min, self.y_max)
-                
-                # Colors: Bullish (green), Bearish (red)
-                fill_color = "#4CAF50" if close_price >= open_price else "#F44336"
-                outline_color = self.style.adjust_brightness(fill_color, 0.8)
-                
-                # Animate from midpoint of open/close
-                y_mid = (y_open + y_close) / 2
-                candle_height = abs(y_close - y_open) * progress
-                y_top = y_mid - candle_height / 2 if close_price >= open_price else y_mid - candle_height / 2
-                y_bottom = y_mid + candle_height / 2 if close_price >= open_price else y_mid + candle_height / 2
-                
-                # Wick
-                # Calculate midpoint and animate wick from center outwards
-                y_mid_wick = (y_high + y_low) / 2
-                half_wick_length = (y_low - y_high) / 2 * progress
-
-                wick = self.canvas.create_line(
-                    x, y_mid_wick - half_wick_length,
-                    x, y_mid_wick + half_wick_length,
-                    fill=self.style.TEXT_SECONDARY,
-                    width=self.wick_width,
-                    tags=('wick', f'candle_{i}')
-                )
-                self.elements.append(wick)
-                
-                # Candle body (minimum 1px height for flat candles)
-                if candle_height < 1:
-                    candle_height = 1
-                shadow = self.canvas.create_rectangle(
-                    x - candle_width/2 + 2, y_top + 2,
-                    x + candle_width/2 + 2, y_bottom + 2,
-                    fill=self.style.create_shadow(fill_color),
-                    outline="",
-                    tags=('shadow', f'candle_{i}')
-                )
-                self.elements.append(shadow)
-                
-                candle = self.canvas.create_rectangle(
-                    x - candle_width/2, y_top,
-                    x + candle_width/2, y_bottom,
-                    fill=fill_color,
-                    outline=outline_color,
-                    width=1,
-                    tags=('candle', f'candle_{i}')
-                )
-                self.elements.append(candle)
-                
-                if self.show_labels and progress == 1:
-                    # High label above wick
-                    high_label = self.canvas.create_text(
-                        x, y_high - 10,
-                        text=f"{high:.1f}",
-                        font=self.style.VALUE_FONT,
-                        fill=self.style.TEXT,
-                        anchor='s',
-                        tags=('label', f'candle_{i}')
-                    )
-                    self.elements.append(high_label)
-                    # Low label below wick
-                    low_label = self.canvas.create_text(
-                        x, y_low + 10,
-                        text=f"{low:.1f}",
-                        font=self.style.VALUE_FONT,
-                        fill=self.style.TEXT,
-                        anchor='n',
-                        tags=('label', f'candle_{i}')
-                    )
-                    self.elements.append(low_label)
-            
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                after_id = self.canvas.after(20, update_animation, frame + 1, total_frames)
-                self.resource_manager.register_animation(after_id)
+                # High label above wick
+                self.elements.append(self.canvas.create_text(
+                    x, self._data_to_pixel_y(high, self.y_min, self.y_max) - 10,
+                    text=f"{high:.1f}",
+                    font=self.style.VALUE_FONT,
+                    fill=self.style.TEXT,
+                    anchor='s',
+                    tags=('label', f'candle_{i}')
+                ))
+                # Low label below wick
+                self.elements.append(self.canvas.create_text(
+                    x, self._data_to_pixel_y(low, self.y_min, self.y_max) + 10,
+                    text=f"{low:.1f}",
+                    font=self.style.VALUE_FONT,
+                    fill=self.style.TEXT,
+                    anchor='n',
+                    tags=('label', f'candle_{i}')
+                ))
         
-        total_frames = self.animation_duration // 20  # ~50 FPS
-        update_animation(0, total_frames)
+        self.animate(tweens, on_complete=add_labels)
 
     def _add_interactive_effects(self):
         """Add enhanced hover effects and tooltips with proper resource management.
@@ -270,12 +231,8 @@ class CandlestickChart(Chart):
         style.configure('Tooltip.TLabel', background=self.style.TEXT, foreground=self.style.BACKGROUND,
                        font=self.style.TOOLTIP_FONT)
         
-        current_highlight = None
-        
         def on_motion(event):
             """Handle mouse motion events (Requirements: 7.2)"""
-            nonlocal current_highlight
-            
             # Safety check - ensure data exists
             if not self.data:
                 return
@@ -293,25 +250,15 @@ class CandlestickChart(Chart):
                     y_high = self._data_to_pixel_y(high, self.y_min, self.y_max)
                     y_low = self._data_to_pixel_y(low, self.y_min, self.y_max)
                     
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
-                    
                     # Highlight entire candlestick
-                    try:
-                        highlight = self.canvas.create_rectangle(
-                            px - candle_width/2 - 3, y_high - 3,
-                            px + candle_width/2 + 3, y_low + 3,
-                            outline=self.style.ACCENT,
-                            width=2,
-                            dash=(4, 2),  # Dashed outline for subtlety
-                            tags=('highlight',)
-                        )
-                        current_highlight = highlight
-                    except tk.TclError:
-                        current_highlight = None
+                    self.show_overlay(
+                        'highlight', 'rectangle',
+                        (px - candle_width/2 - 3, y_high - 3,
+                         px + candle_width/2 + 3, y_low + 3),
+                        outline=self.style.ACCENT,
+                        width=2,
+                        dash=(4, 2)  # Dashed outline for subtlety
+                    )
                     
                     # Detailed tooltip - handle division by zero
                     change = close_price - open_price
@@ -329,12 +276,7 @@ class CandlestickChart(Chart):
                     except tk.TclError:
                         pass  # Tooltip may have been destroyed
                 else:
-                    if current_highlight:
-                        try:
-                            self.canvas.delete(current_highlight)
-                        except tk.TclError:
-                            pass
-                        current_highlight = None
+                    self.hide_overlay('highlight')
                     try:
                         tooltip.withdraw()
                     except tk.TclError:
@@ -342,20 +284,11 @@ class CandlestickChart(Chart):
         
         def on_leave(event):
             """Handle mouse leave events"""
-            nonlocal current_highlight
-            if current_highlight:
-                try:
-                    self.canvas.delete(current_highlight)
-                except tk.TclError:
-                    pass
-                current_highlight = None
+            self.hide_overlay('highlight')
             try:
                 tooltip.withdraw()
             except tk.TclError:
                 pass
         
         # Bind events and register with resource manager (Requirements: 3.5)
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
+        self.bind_hover(on_motion, on_leave)
@@ -0,0 +1,141 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Colormap module for ChartForgeTK.
+
+Turns a list of color stops into a quantized lookup table built once, so
+mapping a value to a color is an index computation instead of parsing and
+formatting hex strings for every cell.
+"""
+
+import logging
+from typing import List, Sequence, Tuple
+
+from .validation import DataValidator
+
+logger = logging.getLogger('ChartForgeTK')
+
+
+class Colormap:
+    """
+    Lookup table of colors linearly interpolated between color stops.
+
+    Entry k holds the color for the normalized value k / (size - 1), both as
+    a '#rrggbb' string (ready for Tk) and as an (r, g, b) tuple.
+    """
+
+    def __init__(self, colors: Sequence[str], size: int = 256):
+        """
+        Initialize the Colormap.
+
+        Args:
+            colors: Hex color stops (#RGB or #RRGGBB), low to high
+            size: Number of lookup table entries
+
+        Raises:
+            ValueError: If colors is empty, a color is not a hex color or
+                size is less than 2
+        """
+        if not colors:
+            raise ValueError("[ChartForgeTK] Error: Colormap needs at least one color.")
+        if isinstance(size, bool) or not isinstance(size, int) or size < 2:
+            raise ValueError(f"[ChartForgeTK] Error: Colormap size must be an integer >= 2, got {size!r}.")
+
+        stops = []
+        for i, color in enumerate(colors):
+            rgb = DataValidator.parse_hex_color(color)
+            if rgb is None:
+                raise ValueError(
+                    f"[ChartForgeTK] Error: Colormap color {i} ({color!r}) is not a hex color."
+                )
+            stops.append(rgb)
+
+        self.colors = tuple(colors)
+        self.size = size
+        self.rgb: List[Tuple[int, int, int]] = []
+        last = len(stops) - 1
+        for k in range(size):
+            position = k / (size - 1) * last
+            low = min(int(position), last)
+            high = min(low + 1, last)
+            fraction = position - low
+            low_rgb, high_rgb = stops[low], stops[high]
+            self.rgb.append(tuple(
+                int(low_rgb[c] + fraction * (high_rgb[c] - low_rgb[c])) for c in range(3)
+            ))
+        self.hex: List[str] = [f'#{r:02x}{g:02x}{b:02x}' for r, g, b in self.rgb]
+        self._hex_array = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def index(self, value: float) -> int:
+        """Return the table index of a normalized value (clamped to [0, 1])."""
+        if value <= 0.0:
+            return 0
+        if value >= 1.0:
+            return self.size - 1
+        return int(value * (self.size - 1) + 0.5)
+
+    def color(self, value: float) -> str:
+        """Return the '#rrggbb' color of a normalized value."""
+        return self.hex[self.index(value)]
+
+    def rgb_at(self, value: float) -> Tuple[int, int, int]:
+        """Return the (r, g, b) color of a normalized value."""
+        return self.rgb[self.index(value)]
+
+    def map_array(self, values, vmin: float = 0.0, vmax: float = 1.0, rgb: bool = False):
+        """
+        Map a whole array of values to colors in one call.
+
+        Values are normalized from [vmin, vmax] to [0, 1] first; when
+        vmin == vmax every value maps to the middle of the table.
+
+        Args:
+            values: NumPy array (any shape) or nested sequences of numbers
+            vmin, vmax: Value range mapped onto the colormap
+            rgb: Return (r, g, b) colors instead of hex strings
+
+        Returns:
+            With NumPy installed, an array of the same shape holding hex
+            strings (dtype object), or uint8 with a trailing axis of 3 when
+            rgb=True. Otherwise nested lists with the same structure.
+        """
+        np = DataValidator._get_numpy()
+        span = vmax - vmin
+        if np is not None:
+            array = np.asarray(values, dtype=np.float64)
+            if span:
+                scaled = (array - vmin) * ((self.size - 1) / span) + 0.5
+            else:
+                scaled = np.full(array.shape, 0.5 * (self.size - 1) + 0.5)
+            indices = np.clip(scaled, 0, self.size - 1).astype(np.intp)
+            if rgb:
+                return np.asarray(self.rgb, dtype=np.uint8)[indices]
+            if self._hex_array is None:
+                self._hex_array = np.asarray(self.hex, dtype=object)
+            return self._hex_array[indices]
+
+        table = self.rgb if rgb else self.hex
+
+        def convert(item):
+            if isinstance(item, (list, tuple)):
+                return [convert(v) for v in item]
+            return table[self.index((item - vmin) / span if span else 0.5)]
+
+        return convert(values)
@@ -16,14 +16,21 @@
 
 
 import math
+import time
 import logging
-from typing import List, Optional, Union, Tuple, Callable
+from typing import List, Optional, Sequence, Union, Tuple, Callable
 import colorsys
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, font
 
 from .validation import DataValidator
 from .resources import ResourceManager
+from .animation import AnimationEngine, animations_enabled, ease_in_out
+from .export import export_canvas
+from .textmetrics import TextMetrics
 
 logger = logging.getLogger('ChartForgeTK')
 
@@ -426,9 +433,15 @@ class ChartStyle:
         ],
     }
 
+    # Bound on memoized color derivations (least recently used are dropped first)
+    COLOR_CACHE_SIZE = 1024
+
     def __init__(self, theme='light', palette='modern'):
         self.theme = theme
         self.palette_name = palette
+        self._color_cache = OrderedDict()
+        self.color_cache_hits = 0
+        self.color_cache_misses = 0
         self._load_theme(theme)
         self._load_palette(palette)
 
@@ -454,10 +467,41 @@ class ChartStyle:
     def set_theme(self, theme):
         self.theme = theme
         self._load_theme(theme)
+        self.clear_color_cache()
 
     def set_palette(self, palette):
         self.palette_name = palette
         self._load_palette(palette)
+        self.clear_color_cache()
+
+    def clear_color_cache(self):
+        """Forget memoized colors; called whenever the theme or palette changes."""
+        self._color_cache.clear()
+
+    def color_cache_info(self):
+        """Return hit/miss counters and the size of the color memo."""
+        return {
+            'hits': self.color_cache_hits,
+            'misses': self.color_cache_misses,
+            'size': len(self._color_cache),
+            'maxsize': self.COLOR_CACHE_SIZE,
+        }
+
+    def _cached_color(self, key):
+        """Look up a memoized color, counting the hit or miss."""
+        color = self._color_cache.get(key)
+        if color is None:
+            self.color_cache_misses += 1
+            return None
+        self._color_cache.move_to_end(key)
+        self.color_cache_hits += 1
+        return color
+
+    def _store_color(self, key, color):
+        self._color_cache[key] = color
+        if len(self._color_cache) > self.COLOR_CACHE_SIZE:
+            self._color_cache.popitem(last=False)
+        return color
 
     def get_color(self, index):
         return self._palette[index % len(self._palette)]
@@ -475,6 +519,15 @@ class ChartStyle:
         return self.adjust_brightness(color, factor)
 
     def adjust_brightness(self, color, factor):
+        if not isinstance(color, str):
+            return self._compute_brightness(color, factor)
+        key = ('brightness', color, factor)
+        cached = self._cached_color(key)
+        if cached is not None:
+            return cached
+        return self._store_color(key, self._compute_brightness(color, factor))
+
+    def _compute_brightness(self, color, factor):
         try:
             rgb = DataValidator.parse_hex_color(color)
             if rgb is None:
@@ -493,13 +546,27 @@ class ChartStyle:
         except Exception:
             return "#2563EB"
 
+    def create_rgba_from_hex(self, color, alpha):
+        # Tk has no alpha channel: blend the color over the theme background
+        alpha = max(0.0, min(1.0, alpha))
+        return self.blend_colors(self.BACKGROUND, color, alpha)
+
     def validate_custom_color(self, color, default=None):
         if default is None:
             default = self.PRIMARY
         return DataValidator.validate_color_with_fallback(color, default)
 
+    def blend_colors(self, color1, color2, ratio=0.5):
+        if not (isinstance(color1, str) and isinstance(color2, str)):
+            return self._compute_blend(color1, color2, ratio)
+        key = ('blend', color1, color2, ratio)
+        cached = self._cached_color(key)
+        if cached is not None:
+            return cached
+        return self._store_color(key, self._compute_blend(color1, color2, ratio))
+
     @staticmethod
-    def blend_colors(color1, color2, ratio=0.5):
+    def _compute_blend(color1, color2, ratio):
         c1 = DataValidator.parse_hex_color(color1) or (0, 0, 0)
         c2 = DataValidator.parse_hex_color(color2) or (0, 0, 0)
         r = int(c1[0] + (c2[0] - c1[0]) * ratio)
@@ -516,6 +583,63 @@ class ChartStyle:
 
 
 class ChartRenderer:
+    # Gradient images kept per canvas (least recently used are dropped first)
+    GRADIENT_CACHE_SIZE = 512
+    # Distinct shades a gradient strip samples from, whatever its height
+    GRADIENT_LEVELS = 256
+    _gradient_caches = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def gradient_colors(color, height, top_factor, bottom_factor):
+        """Row colors of a vertical gradient scaling the color's RGB from top_factor to bottom_factor."""
+        r, g, b = DataValidator.parse_hex_color(color) or (37, 99, 235)
+        colors = []
+        last = max(1, height - 1)
+        for row in range(height):
+            factor = top_factor + (bottom_factor - top_factor) * row / last
+            colors.append('#%02x%02x%02x' % (
+                DataValidator.clamp_rgb_value(r * factor),
+                DataValidator.clamp_rgb_value(g * factor),
+                DataValidator.clamp_rgb_value(b * factor),
+            ))
+        return tuple(colors)
+
+    @classmethod
+    def gradient_image(cls, canvas, color, width, height, top_factor=1.3, bottom_factor=1.0):
+        """Return a cached width x height PhotoImage filled with a vertical gradient.
+
+        The gradient is built once per (color, height) as a one pixel wide
+        strip and widened with zoom, so bars of equal size share one image.
+        Keep a reference to the image while it is displayed; the cache may
+        drop it once GRADIENT_CACHE_SIZE newer images were requested.
+        """
+        width = max(1, int(round(width)))
+        height = max(1, int(round(height)))
+        cache = cls._gradient_caches.get(canvas)
+        if cache is None:
+            cache = cls._gradient_caches[canvas] = OrderedDict()
+
+        key = (color, width, height, top_factor, bottom_factor)
+        image = cache.get(key)
+        if image is not None:
+            cache.move_to_end(key)
+            return image
+
+        strip_key = (color, 1, height, top_factor, bottom_factor)
+        strip = cache.get(strip_key)
+        if strip is None:
+            levels = cls.gradient_colors(color, cls.GRADIENT_LEVELS, top_factor, bottom_factor)
+            scale = (cls.GRADIENT_LEVELS - 1) / max(1, height - 1)
+            strip = tk.PhotoImage(master=canvas, width=1, height=height)
+            strip.put(' '.join('{%s}' % levels[int(row * scale + 0.5)] for row in range(height)))
+            cache[strip_key] = strip
+        image = strip if width == 1 else strip.zoom(width, 1)
+        cache[key] = image
+        while len(cache) > cls.GRADIENT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return image
+
     @staticmethod
     def create_rounded_rect(canvas, x1, y1, x2, y2, radius=8, **kwargs):
         points = [
@@ -552,24 +676,13 @@ class ChartRenderer:
 
     @staticmethod
     def create_bar_gradient(canvas, x1, y1, x2, y2, color, steps=20):
-        items = []
-        step_height = (y2 - y1) / steps
-        for i in range(steps):
-            ratio = i / steps
-            r, g, b = ChartStyle.hex_to_rgb(color)
-            factor = 0.85 + 0.15 * (1 - ratio)
-            r = min(255, int(r * factor))
-            g = min(255, int(g * factor))
-            b = min(255, int(b * factor))
-            grad_color = f"#{r:02x}{g:02x}{b:02x}"
-            items.append(
-                canvas.create_rectangle(
-                    x1, y1 + i * step_height,
-                    x2, y1 + (i + 1) * step_height + 1,
-                    fill=grad_color, outline="", tags=('gradient',)
-                )
-            )
-        return items
+        # One cached image item instead of a rectangle per step; steps is
+        # kept for compatibility, the image is shaded per pixel row
+        x1, y1 = int(round(x1)), int(round(y1))
+        image = ChartRenderer.gradient_image(
+            canvas, color, int(round(x2)) - x1, int(round(y2)) - y1, 1.0, 0.85
+        )
+        return [canvas.create_image(x1, y1, image=image, anchor='nw', tags=('gradient',))]
 
     @staticmethod
     def create_tooltip_bg(canvas, x, y, width, height, color, radius=8):
@@ -595,6 +708,16 @@ class ChartRenderer:
 
 
 class Chart(tk.Frame):
+    # Minimum interval between two hover updates (one display frame at ~60 FPS)
+    HOVER_FRAME_MS = 16
+    # Charts animating more items than this draw their final frame directly
+    INSTANT_ITEM_THRESHOLD = 2000
+
+    # Scene layers, bottom to top, and the canvas tag of each layer's items;
+    # data items are everything without a layer tag
+    LAYERS = ('background', 'axes', 'data', 'overlay')
+    LAYER_TAGS = {'background': 'layer_background', 'axes': 'layer_axes', 'overlay': 'overlay'}
+
     def __init__(self, parent=None, width: int = 400, height: int = 400, display_mode='frame', theme='light', palette='modern'):
         """Initialize chart with modern styling and enhanced features.
         
@@ -639,6 +762,22 @@ class Chart(tk.Frame):
 
         # Animation state tracking (Requirements: 6.1, 6.3)
         self._animation_in_progress = False
+        # None follows the process-wide animation.set_animations_enabled()
+        self.animations_enabled: Optional[bool] = None
+
+        # Hover coalescing: latest unprocessed <Motion> event and its after() slot
+        self._hover_event = None
+        self._hover_handler = None
+        self._hover_after_id = None
+        self._hover_last_run = 0.0
+
+        # Pooled hover overlays: name -> [item id, kind, visible, options]
+        self._overlay_items = {}
+
+        # Layered axes: (layer, pool) -> [[item id, kind, options], ...] and
+        # layer -> state its items were drawn for (missing means dirty)
+        self._layer_pools = {}
+        self._layer_keys = {}
 
         if display_mode == 'window':
             self._initialize_window()
@@ -651,6 +790,9 @@ class Chart(tk.Frame):
         
         # Initialize TooltipManager for centralized tooltip handling (Requirements: 3.1, 4.2, 7.6)
         self.tooltip_manager = TooltipManager(self)
+        
+        # Shared frame loop for all of this chart's tweened animations
+        self.animator = AnimationEngine(self.canvas)
 
     def _initialize_window(self):
         """Initialize window mode with modern controls and proper event handling.
@@ -721,8 +863,7 @@ class Chart(tk.Frame):
                                background=self.style.BACKGROUND, highlightthickness=0)
         self.canvas.pack(fill='both', expand=True)
 
-        self.canvas.bind("<Motion>", self._on_mouse_move)
-        self.canvas.bind("<Leave>", self._on_mouse_leave)
+        self.bind_hover(self._on_mouse_move, self._on_mouse_leave)
         self.canvas.bind("<Button-1>", self._on_mouse_click)
 
     def _toggle_maximize(self):
@@ -840,6 +981,9 @@ class Chart(tk.Frame):
         try:
             if hasattr(self, 'window') and self.window:
                 self.window.iconify()
+                # Freeze animations now; the scheduler resumes them once the
+                # window is viewable again
+                self.animator.pause()
                 logger.debug("Window minimized")
         except tk.TclError as e:
             logger.warning(f"Error minimizing window: {e}")
@@ -920,6 +1064,37 @@ class Chart(tk.Frame):
         return None  # Child classes override this
 
 
+    def export(self, path, format: Optional[str] = None) -> str:
+        """Write the chart's final frame to an SVG or PNG file.
+        
+        Running animations are finished first, so the file shows the end
+        state. The chart does not have to be mapped: an unpacked chart on a
+        withdrawn root exports the same image. See export.BatchExporter for
+        rendering many charts on one hidden root.
+        
+        Args:
+            path: Output file path (str or os.PathLike), or a binary file
+                object when format is given
+            format: 'svg' or 'png'; taken from the path extension when None
+            
+        Returns:
+            str: The format written
+            
+        Raises:
+            TypeError: If path is neither a path nor a file object
+            ValueError: If the format is not supported
+        """
+        self._finish_pending_render()
+        return export_canvas(self.canvas, path, self.width, self.height, format)
+    
+    def _finish_pending_render(self) -> None:
+        """Bring the canvas to its final state before an export.
+        
+        Charts that draw asynchronously (layout workers, deferred renders)
+        extend this.
+        """
+        self.animator.finish()
+
     def redraw(self):
         """Redraw the chart with current data."""
         self.clear()
@@ -937,6 +1112,9 @@ class Chart(tk.Frame):
         # Cancel pending animations before clearing (Requirements: 3.2, 3.6, 6.1)
         self.cancel_all_animations()
         self.canvas.delete("all")
+        self.reset_overlays()
+        self._layer_pools.clear()
+        self._layer_keys.clear()
     
     def destroy(self):
         """Destroy the chart and clean up all resources.
@@ -950,6 +1128,9 @@ class Chart(tk.Frame):
         """
         # Mark animation as stopped (Requirements: 6.1)
         self._animation_in_progress = False
+
+        # Drop any hover update still waiting for the next frame
+        self._cancel_pending_hover()
         
         # Clean up tooltip manager first (Requirements: 3.1, 7.6)
         if hasattr(self, 'tooltip_manager') and self.tooltip_manager:
@@ -1019,13 +1200,134 @@ class Chart(tk.Frame):
                     new_chart.plot(current_data)
             return new_chart
 
+    def clear_layer(self, layer: str) -> None:
+        """Remove the items of one scene layer and mark it dirty.
+        
+        Clearing 'data' deletes every item without a layer tag and hides the
+        pooled overlays, so a re-plot keeps the grid and axes; _draw_axes()
+        then only touches them when the ranges changed. Clearing 'overlay'
+        only hides the pooled overlays and never redraws the data.
+        
+        Args:
+            layer: One of LAYERS
+            
+        Raises:
+            ValueError: If layer is not a known layer
+        """
+        if layer not in self.LAYERS:
+            raise ValueError(
+                f"[ChartForgeTK] Error: layer must be one of {list(self.LAYERS)}, got {layer!r}."
+            )
+        try:
+            if layer == 'data':
+                self.canvas.delete('!(%s)' % '||'.join(self.LAYER_TAGS.values()))
+            elif layer != 'overlay':
+                self.canvas.delete(self.LAYER_TAGS[layer])
+                for key in [key for key in self._layer_pools if key[0] == layer]:
+                    del self._layer_pools[key]
+        except tk.TclError as e:
+            logger.debug(f"TclError clearing layer '{layer}': {e}")
+        if layer in ('data', 'overlay'):
+            self.hide_overlays()
+        self._layer_keys.pop(layer, None)
+    
+    def invalidate_layer(self, *layers: str) -> None:
+        """Mark layers dirty so the next _draw_axes() refreshes all their items."""
+        for layer in layers:
+            self._layer_keys.pop(layer, None)
+    
+    def _sync_layer_items(self, layer: str, pool: str, specs) -> bool:
+        """Make a pool of layer items match specs, reusing items in place.
+        
+        Args:
+            layer: 'background' or 'axes'
+            pool: Name of the item group within the layer
+            specs: Sequence of (kind, coords, options)
+            
+        Returns:
+            bool: True if new items were created (and need restacking)
+        """
+        entries = self._layer_pools.setdefault((layer, pool), [])
+        return self._sync_items(entries, specs, ('axes', self.LAYER_TAGS[layer]))
+
+    def _sync_items(self, entries: list, specs, tags: tuple) -> bool:
+        """Make a list of pooled items match specs, reusing items in place.
+        
+        Existing items are moved with coords() and reconfigured only when
+        their options changed; items are created for extra specs and the
+        surplus is deleted.
+        
+        Args:
+            entries: The pool, a list of [item, kind, options], updated in place
+            specs: Sequence of (kind, coords, options)
+            tags: Tags given to created items
+            
+        Returns:
+            bool: True if new items were created (and need restacking)
+        """
+        created = False
+        for i, (kind, coords, options) in enumerate(specs):
+            if i < len(entries) and entries[i][1] == kind:
+                entry = entries[i]
+                self.canvas.coords(entry[0], *coords)
+                if options != entry[2]:
+                    self.canvas.itemconfig(entry[0], **options)
+                    entry[2] = options
+                continue
+            item = getattr(self.canvas, f'create_{kind}')(*coords, tags=tags, **options)
+            if i < len(entries):
+                self.canvas.delete(entries[i][0])
+                entries[i] = [item, kind, options]
+            else:
+                entries.append([item, kind, options])
+            created = True
+        if len(entries) > len(specs):
+            self.canvas.delete(*[entry[0] for entry in entries[len(specs):]])
+            del entries[len(specs):]
+        return created
+    
+    def _axes_frame_key(self) -> tuple:
+        """State the static axis items (frame lines, titles) depend on."""
+        style = self.style
+        return (self.width, self.height, self.padding, self.title, self.x_label, self.y_label,
+                style.AXIS_COLOR, style.GRID_COLOR, style.TICK_COLOR, style.TEXT,
+                style.TEXT_SECONDARY, style.TITLE_FONT, style.LABEL_FONT, style.AXIS_FONT)
+
     def _draw_axes(self, x_min: float, x_max: float, y_min: float, y_max: float):
-        """Draw beautiful axes with grid lines, storing ranges for interactivity."""
+        """Draw beautiful axes with grid lines, storing ranges for interactivity.
+        
+        Grid, axes and tick items live in the 'background' and 'axes' layers
+        and are kept across calls: an unchanged frame and range costs no
+        canvas work, a range change moves and relabels the existing items.
+        """
         self.x_min, self.x_max = x_min, x_max
         self.y_min, self.y_max = y_min, y_max
 
-        self._draw_grid(x_min, x_max, y_min, y_max)
+        frame = self._axes_frame_key()
+        view = (frame, x_min, x_max, y_min, y_max)
+        try:
+            # Items deleted behind our back (canvas.delete('all')) are stale
+            if self._layer_pools and not self.canvas.find_withtag(self.LAYER_TAGS['axes']):
+                self._layer_pools.clear()
+                self._layer_keys.clear()
+            if self._layer_keys.get('background') == view and self._layer_keys.get('axes') == view:
+                return
+
+            created = self._draw_grid(x_min, x_max, y_min, y_max)
+            self._layer_keys['background'] = view
+            created = self._draw_axis_lines(x_min, x_max, y_min, y_max, frame) or created
+            created = self._draw_ticks(x_min, x_max, y_min, y_max) or created
+            self._layer_keys['axes'] = view
+
+            if created:
+                # New layer items were created on top; put them back under the data
+                self.canvas.tag_lower(self.LAYER_TAGS['axes'])
+                self.canvas.tag_lower(self.LAYER_TAGS['background'])
+        except tk.TclError as e:
+            logger.debug(f"TclError drawing axes: {e}")
 
+    def _draw_axis_lines(self, x_min: float, x_max: float, y_min: float, y_max: float, frame: tuple) -> bool:
+        """Sync the baseline and, when the frame changed, the axis frame and titles."""
         plot_left = self.padding
         plot_right = self.width - self.padding
         plot_top = self.padding
@@ -1035,58 +1337,54 @@ class Chart(tk.Frame):
         y_zero = 0 if y_min <= 0 <= y_max else y_min
         y_zero_px = self._data_to_pixel_y(y_zero, y_min, y_max)
 
-        # Draw zero-line emphasis if zero is within range
         if y_min <= 0 <= y_max:
-            self.canvas.create_line(
-                plot_left, y_zero_px, plot_right, y_zero_px,
-                fill=self.style.adjust_brightness(self.style.AXIS_COLOR, 0.7),
-                width=self.style.AXIS_WIDTH + 0.5, capstyle=tk.ROUND
-            )
+            # Zero-line emphasis
+            baseline = ('line', (plot_left, y_zero_px, plot_right, y_zero_px), {
+                'fill': self.style.adjust_brightness(self.style.AXIS_COLOR, 0.7),
+                'width': self.style.AXIS_WIDTH + 0.5, 'capstyle': tk.ROUND,
+            })
         else:
             # X-axis at bottom
-            self.canvas.create_line(
-                plot_left, plot_bottom, plot_right, plot_bottom,
-                fill=self.style.AXIS_COLOR, width=self.style.AXIS_WIDTH, capstyle=tk.ROUND
-            )
-
-        # Y-axis (left edge)
-        self.canvas.create_line(
-            plot_left, plot_top, plot_left, plot_bottom,
-            fill=self.style.AXIS_COLOR, width=self.style.AXIS_WIDTH, capstyle=tk.ROUND
-        )
-
-        # Subtle top and right border lines for frame effect
-        self.canvas.create_line(
-            plot_left, plot_top, plot_right, plot_top,
-            fill=self.style.GRID_COLOR, width=1
-        )
-        self.canvas.create_line(
-            plot_right, plot_top, plot_right, plot_bottom,
-            fill=self.style.GRID_COLOR, width=1
-        )
-
-        self._draw_ticks(x_min, x_max, y_min, y_max)
-
+            baseline = ('line', (plot_left, plot_bottom, plot_right, plot_bottom), {
+                'fill': self.style.AXIS_COLOR, 'width': self.style.AXIS_WIDTH, 'capstyle': tk.ROUND,
+            })
+        created = self._sync_layer_items('axes', 'baseline', [baseline])
+
+        if self._layer_keys.get('axes', (None,))[0] == frame and ('axes', 'frame') in self._layer_pools:
+            return created
+
+        specs = [
+            # Y-axis (left edge)
+            ('line', (plot_left, plot_top, plot_left, plot_bottom), {
+                'fill': self.style.AXIS_COLOR, 'width': self.style.AXIS_WIDTH, 'capstyle': tk.ROUND,
+            }),
+            # Subtle top and right border lines for frame effect
+            ('line', (plot_left, plot_top, plot_right, plot_top), {
+                'fill': self.style.GRID_COLOR, 'width': 1,
+            }),
+            ('line', (plot_right, plot_top, plot_right, plot_bottom), {
+                'fill': self.style.GRID_COLOR, 'width': 1,
+            }),
+        ]
         if self.title:
-            self.canvas.create_text(
-                self.width / 2, plot_top / 2.5, text=self.title,
-                font=self.style.TITLE_FONT, fill=self.style.TEXT, anchor='center'
-            )
-
+            specs.append(('text', (self.width / 2, plot_top / 2.5), {
+                'text': self.title, 'font': self.style.TITLE_FONT, 'fill': self.style.TEXT,
+                'anchor': 'center',
+            }))
         if self.x_label:
-            self.canvas.create_text(
-                self.width / 2, self.height - self.padding / 4, text=self.x_label,
-                font=self.style.LABEL_FONT, fill=self.style.TEXT_SECONDARY, anchor='center'
-            )
-
+            specs.append(('text', (self.width / 2, self.height - self.padding / 4), {
+                'text': self.x_label, 'font': self.style.LABEL_FONT,
+                'fill': self.style.TEXT_SECONDARY, 'anchor': 'center',
+            }))
         if self.y_label:
-            self.canvas.create_text(
-                plot_left / 3, self.height / 2, text=self.y_label,
-                font=self.style.LABEL_FONT, fill=self.style.TEXT_SECONDARY, anchor='center', angle=90
-            )
-
-    def _draw_grid(self, x_min, x_max, y_min, y_max):
-        """Draw subtle grid lines."""
+            specs.append(('text', (plot_left / 3, self.height / 2), {
+                'text': self.y_label, 'font': self.style.LABEL_FONT,
+                'fill': self.style.TEXT_SECONDARY, 'anchor': 'center', 'angle': 90,
+            }))
+        return self._sync_layer_items('axes', 'frame', specs) or created
+
+    def _draw_grid(self, x_min, x_max, y_min, y_max) -> bool:
+        """Draw subtle grid lines, reusing the existing grid items."""
         x_interval = self._calculate_tick_interval(x_max - x_min)
         y_interval = self._calculate_tick_interval(y_max - y_min)
 
@@ -1094,8 +1392,10 @@ class Chart(tk.Frame):
         plot_right = self.width - self.padding
         plot_top = self.padding
         plot_bottom = self.height - self.padding
+        options = {'fill': self.style.GRID_COLOR, 'width': self.style.GRID_WIDTH, 'dash': (3, 5)}
+        specs = []
 
-        # Draw horizontal grid lines (subtle)
+        # Horizontal grid lines (subtle)
         y = math.ceil(y_min / y_interval) * y_interval
         while y <= y_max:
             if y == 0:
@@ -1103,25 +1403,25 @@ class Chart(tk.Frame):
                 continue
             py = self._data_to_pixel_y(y, y_min, y_max)
             if plot_top < py < plot_bottom:
-                self.canvas.create_line(
-                    plot_left, py, plot_right, py,
-                    fill=self.style.GRID_COLOR, width=self.style.GRID_WIDTH, dash=(3, 5)
-                )
+                specs.append(('line', (plot_left, py, plot_right, py), options))
             y += y_interval
 
-        # Draw vertical grid lines (subtle)
+        # Vertical grid lines (subtle)
         x = math.ceil(x_min / x_interval) * x_interval
         while x <= x_max:
             px = self._data_to_pixel_x(x, x_min, x_max)
             if plot_left < px < plot_right:
-                self.canvas.create_line(
-                    px, plot_top, px, plot_bottom,
-                    fill=self.style.GRID_COLOR, width=self.style.GRID_WIDTH, dash=(3, 5)
-                )
+                specs.append(('line', (px, plot_top, px, plot_bottom), options))
             x += x_interval
 
-    def _draw_ticks(self, x_min: float, x_max: float, y_min: float, y_max: float):
-        """Draw axis ticks and labels with modern styling, preventing duplicates."""
+        return self._sync_layer_items('background', 'grid', specs)
+
+    def _draw_ticks(self, x_min: float, x_max: float, y_min: float, y_max: float) -> bool:
+        """Draw axis ticks and labels with modern styling, preventing duplicates.
+        
+        Tick items are reused: a range change moves them and updates their
+        text instead of recreating them.
+        """
         x_interval = self._calculate_tick_interval(x_max - x_min)
         y_interval = self._calculate_tick_interval(y_max - y_min)
 
@@ -1133,49 +1433,59 @@ class Chart(tk.Frame):
         y_zero = 0 if y_min <= 0 <= y_max else y_min
         y_zero_px = self._data_to_pixel_y(y_zero, y_min, y_max)
 
+        tick_options = {'fill': self.style.TICK_COLOR, 'width': 1, 'capstyle': tk.ROUND}
+        ticks = []
+        labels = []
+        # Labels that would overlap the previous one are skipped
+        metrics = self.text_metrics
+        label_gap = 4
+        last_right = -math.inf
+
         # X-axis ticks and labels
         x = math.ceil(x_min / x_interval) * x_interval
         drawn_x_labels = set()
         while x <= x_max + 1e-10:
             px = self._data_to_pixel_x(x, x_min, x_max)
             if plot_left < px < plot_right:
-                self.canvas.create_line(
-                    px, y_zero_px, px, y_zero_px + self.style.TICK_LENGTH,
-                    fill=self.style.TICK_COLOR, width=1, capstyle=tk.ROUND
-                )
+                ticks.append(('line', (px, y_zero_px, px, y_zero_px + self.style.TICK_LENGTH), tick_options))
                 label = f"{x:g}"
-                if label not in drawn_x_labels:
-                    self.canvas.create_text(
-                        px, y_zero_px + self.style.TICK_LENGTH + 6, text=label,
-                        font=self.style.AXIS_FONT, fill=self.style.TEXT_SECONDARY, anchor='n'
-                    )
+                half_width = metrics.measure(label, self.style.AXIS_FONT) / 2
+                if label not in drawn_x_labels and px - half_width >= last_right + label_gap:
+                    last_right = px + half_width
+                    labels.append(('text', (px, y_zero_px + self.style.TICK_LENGTH + 6), {
+                        'text': label, 'font': self.style.AXIS_FONT,
+                        'fill': self.style.TEXT_SECONDARY, 'anchor': 'n',
+                    }))
                     drawn_x_labels.add(label)
             x += x_interval
 
         # Y-axis ticks and labels
         y = math.ceil(y_min / y_interval) * y_interval
         drawn_y_labels = set()
+        line_height = metrics.metrics(self.style.AXIS_FONT)['linespace']
+        last_py = math.inf
         while y <= y_max + 1e-10:
             py = self._data_to_pixel_y(y, y_min, y_max)
             if plot_top < py < plot_bottom:
-                self.canvas.create_line(
-                    plot_left - self.style.TICK_LENGTH, py, plot_left, py,
-                    fill=self.style.TICK_COLOR, width=1, capstyle=tk.ROUND
-                )
+                ticks.append(('line', (plot_left - self.style.TICK_LENGTH, py, plot_left, py), tick_options))
                 if abs(y) >= 1000:
                     label = f"{y/1000:g}k"
                 elif y == int(y):
                     label = f"{int(y):,}"
                 else:
                     label = f"{y:g}"
-                if label not in drawn_y_labels:
-                    self.canvas.create_text(
-                        plot_left - self.style.TICK_LENGTH - 6, py, text=label,
-                        font=self.style.AXIS_FONT, fill=self.style.TEXT_SECONDARY, anchor='e'
-                    )
+                if label not in drawn_y_labels and last_py - py >= line_height:
+                    last_py = py
+                    labels.append(('text', (plot_left - self.style.TICK_LENGTH - 6, py), {
+                        'text': label, 'font': self.style.AXIS_FONT,
+                        'fill': self.style.TEXT_SECONDARY, 'anchor': 'e',
+                    }))
                     drawn_y_labels.add(label)
             y += y_interval
 
+        created = self._sync_layer_items('axes', 'ticks', ticks)
+        return self._sync_layer_items('axes', 'tick_labels', labels) or created
+
     def _data_to_pixel_x(self, x: float, x_min: float, x_max: float) -> float:
         """Convert data coordinate to pixel coordinate for x-axis."""
         if x_max == x_min:
@@ -1203,6 +1513,14 @@ class Chart(tk.Frame):
             interval = magnitude      # e.g., 1 for range 5-10+
         return interval
 
+    @property
+    def text_metrics(self) -> TextMetrics:
+        """Cached text measurement shared by all charts of this Tk root."""
+        metrics = getattr(self, '_text_metrics', None)
+        if metrics is None:
+            metrics = self._text_metrics = TextMetrics.for_widget(self.canvas)
+        return metrics
+
     # Animation Management Methods (Requirements: 3.2, 3.6, 6.1, 6.3)
     
     @property
@@ -1214,8 +1532,9 @@ class Chart(tk.Frame):
             
         Requirements: 6.1
         """
-        return self._animation_in_progress
-    
+        animator = getattr(self, 'animator', None)
+        return self._animation_in_progress or (animator is not None and animator.running)
+
     def _widget_exists(self) -> bool:
         """Check if the chart widget and canvas still exist.
         
@@ -1307,6 +1626,63 @@ class Chart(tk.Frame):
             return self.resource_manager.cancel_animations()
         return 0
     
+    def set_animations_enabled(self, enabled: Optional[bool]) -> None:
+        """Turn animations on or off for this chart.
+        
+        Args:
+            enabled: False draws every plot's final frame directly, True
+                animates (up to INSTANT_ITEM_THRESHOLD items) and None
+                follows animation.set_animations_enabled()
+            
+        Raises:
+            TypeError: If enabled is not a bool or None
+        """
+        if enabled is not None and not isinstance(enabled, bool):
+            raise TypeError(
+                f"[ChartForgeTK] Error: enabled must be a bool or None, got {type(enabled).__name__}."
+            )
+        self.animations_enabled = enabled
+    
+    def should_animate(self, item_count: int = 0) -> bool:
+        """Whether a plot of item_count animated items should animate.
+        
+        Heavy plots above INSTANT_ITEM_THRESHOLD always take the instant path.
+        """
+        enabled = self.animations_enabled
+        if enabled is None:
+            enabled = animations_enabled()
+        return enabled and item_count <= self.INSTANT_ITEM_THRESHOLD
+    
+    def animate(self, tweens, duration: Optional[float] = None, easing=ease_in_out,
+                on_frame: Optional[Callable[[float], None]] = None,
+                on_complete: Optional[Callable[[], None]] = None,
+                item_count: Optional[int] = None):
+        """Tween existing canvas items from a start to an end state.
+        
+        Items are created once by the caller; every frame only updates their
+        coords or options. See animation.Tween. When should_animate() says no,
+        the end state is applied and on_complete runs before this returns.
+        
+        Args:
+            tweens: Sequence of Tween objects
+            duration: Milliseconds (defaults to the chart's animation_duration)
+            easing: Maps linear progress to eased progress
+            on_frame: Called with the eased progress after every frame
+            on_complete: Called once after the last frame
+            item_count: Number of animated items (defaults to len(tweens)),
+                for charts that animate through on_frame
+            
+        Returns:
+            Animation: Handle accepted by animator.cancel()/finish()
+        """
+        if item_count is None:
+            item_count = len(tweens)
+        if not self.should_animate(item_count):
+            duration = 0
+        elif duration is None:
+            duration = getattr(self, 'animation_duration', 500)
+        return self.animator.animate(tweens, duration, easing, on_frame, on_complete)
+    
     def start_animation(self) -> None:
         """Mark that an animation is starting.
         
@@ -1463,6 +1839,157 @@ class Chart(tk.Frame):
         
         return safe_handler
     
+    def bind_hover(
+        self,
+        on_motion: Callable[[tk.Event], None],
+        on_leave: Optional[Callable[[tk.Event], None]] = None,
+        widget: Optional[tk.Widget] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Bind hover handlers with <Motion> events coalesced to one per frame.
+
+        Motion events only record the latest pointer event. on_motion runs at
+        most once every HOVER_FRAME_MS: immediately if the previous run is
+        older than that, otherwise from a single pending after() slot with the
+        most recent event. <Leave> drops any pending motion before calling
+        on_leave, so a late frame cannot bring a highlight back.
+
+        Args:
+            on_motion: Hover handler, called with the latest <Motion> event
+            on_leave: Optional <Leave> handler, called immediately
+            widget: The widget to bind to (defaults to canvas)
+
+        Returns:
+            (motion_id, leave_id) function IDs; leave_id is None without on_leave
+
+        Requirements: 3.5, 7.2
+        """
+        target_widget = widget if widget is not None else self.canvas
+
+        def run_hover():
+            self._hover_after_id = None
+            event, handler = self._hover_event, self._hover_handler
+            self._hover_event = None
+            if event is None or handler is None or not self._widget_exists():
+                return
+            self._hover_last_run = time.monotonic()
+            try:
+                handler(event)
+            except tk.TclError as e:
+                logger.debug(f"TclError in <Motion> handler: {e}")
+            except Exception as e:
+                logger.warning(f"Error in <Motion> handler: {e}")
+
+        def record_motion(event):
+            self._hover_event = event
+            self._hover_handler = on_motion
+            if self._hover_after_id is not None:
+                return  # Already scheduled; it will pick up this event
+            elapsed_ms = (time.monotonic() - self._hover_last_run) * 1000
+            if elapsed_ms >= self.HOVER_FRAME_MS:
+                run_hover()
+                return
+            try:
+                self._hover_after_id = target_widget.after(
+                    max(1, int(self.HOVER_FRAME_MS - elapsed_ms)), run_hover
+                )
+            except tk.TclError:
+                self._hover_after_id = None
+
+        def handle_leave(event):
+            self._cancel_pending_hover(target_widget)
+            if on_leave is not None:
+                on_leave(event)
+
+        motion_id = target_widget.bind('<Motion>', record_motion)
+        leave_id = target_widget.bind('<Leave>', handle_leave) if on_leave is not None else None
+
+        # Register with resource manager for cleanup (Requirements: 3.5)
+        if hasattr(self, 'resource_manager') and self.resource_manager:
+            self.resource_manager.register_binding(target_widget, '<Motion>', motion_id)
+            if leave_id is not None:
+                self.resource_manager.register_binding(target_widget, '<Leave>', leave_id)
+
+        return motion_id, leave_id
+
+    def _cancel_pending_hover(self, widget: Optional[tk.Widget] = None):
+        """Drop the pending coalesced <Motion> event, if any."""
+        self._hover_event = None
+        if self._hover_after_id is not None:
+            try:
+                (widget if widget is not None else self.canvas).after_cancel(self._hover_after_id)
+            except tk.TclError:
+                pass
+            self._hover_after_id = None
+
+    def show_overlay(self, name: str, kind: str, coords: Sequence[float], **options) -> Optional[int]:
+        """
+        Show a pooled overlay item (highlight, glow ring, crosshair, ...).
+
+        The first call for a name creates the canvas item, tagged 'overlay'
+        and with its name; later calls only move it with coords() and call
+        itemconfig() when the options differ from the last call, so hover
+        handlers do not delete and recreate items on every mouse move. An
+        item that was hidden is raised above the plot when shown again.
+
+        Args:
+            name: Pool key, unique per chart
+            kind: Canvas item type ('oval', 'rectangle', 'line', 'text', ...)
+            coords: Item coordinates
+            **options: Item options (fill, outline, width, ...)
+
+        Returns:
+            The canvas item ID, or None if the canvas is gone
+        """
+        entry = self._overlay_items.get(name)
+        try:
+            if entry is not None and entry[1] == kind and not entry[2]:
+                # Coming back from hidden: make sure a redraw has not deleted it
+                if not self.canvas.type(entry[0]):
+                    entry = None
+            if entry is None or entry[1] != kind:
+                if entry is not None:
+                    self.canvas.delete(entry[0])
+                create = getattr(self.canvas, f'create_{kind}')
+                item = create(*coords, tags=('overlay', name), **options)
+                self._overlay_items[name] = [item, kind, True, dict(options)]
+                return item
+
+            item = entry[0]
+            self.canvas.coords(item, *coords)
+            if options != entry[3]:
+                self.canvas.itemconfig(item, **options)
+                entry[3] = dict(options)
+            if not entry[2]:
+                self.canvas.itemconfig(item, state='normal')
+                self.canvas.tag_raise(item)
+                entry[2] = True
+            return item
+        except tk.TclError as e:
+            logger.debug(f"TclError showing overlay '{name}': {e}")
+            self._overlay_items.pop(name, None)
+            return None
+
+    def hide_overlay(self, *names: str):
+        """Hide pooled overlay items by name, keeping them for reuse."""
+        for name in names:
+            entry = self._overlay_items.get(name)
+            if entry is None or not entry[2]:
+                continue
+            try:
+                self.canvas.itemconfig(entry[0], state='hidden')
+                entry[2] = False
+            except tk.TclError:
+                self._overlay_items.pop(name, None)
+
+    def hide_overlays(self):
+        """Hide every pooled overlay item."""
+        self.hide_overlay(*list(self._overlay_items))
+
+    def reset_overlays(self):
+        """Forget pooled overlay items after the canvas has been cleared."""
+        self._overlay_items.clear()
+
     def bind_safe_event(
         self, 
         sequence: str, 
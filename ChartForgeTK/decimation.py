@@ -0,0 +1,232 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Downsampling module for ChartForgeTK.
+
+Reduces long series to roughly one bucket per pixel column before they are
+turned into canvas items, while keeping the samples that define the visible
+shape of the line (peaks, troughs, first and last points).
+
+All functions take a sequence of y values whose x coordinate is the position
+in the sequence, and return the sorted positions of the samples to keep, so
+callers can always look the full-resolution values back up.
+
+Available methods:
+    - 'm4': first, min, max and last sample of every bucket
+    - 'minmax': min and max sample of every bucket
+    - 'lttb': Largest-Triangle-Three-Buckets, one sample per bucket
+"""
+
+import logging
+from typing import Callable, Dict, List, Sequence, Union
+
+from .validation import DataValidator
+
+logger = logging.getLogger('ChartForgeTK')
+
+
+def _bucket_bounds(length: int, buckets: int, bucket: int):
+    """Return the [start, stop) positions of a bucket when splitting length items evenly."""
+    return bucket * length // buckets, (bucket + 1) * length // buckets
+
+
+def minmax_indices(values: Sequence[float], buckets: int) -> List[int]:
+    """
+    Keep the minimum and maximum sample of every bucket.
+
+    Args:
+        values: y values, one per x position
+        buckets: Number of buckets (usually the pixel width of the plot)
+
+    Returns:
+        Sorted positions of the kept samples; all positions when the series
+        is already short enough
+    """
+    length = len(values)
+    if buckets < 1 or length <= 2 * buckets:
+        return list(range(length))
+
+    values = list(values)
+    kept = []
+    for bucket in range(buckets):
+        start, stop = _bucket_bounds(length, buckets, bucket)
+        chunk = values[start:stop]
+        low = start + chunk.index(min(chunk))
+        high = start + chunk.index(max(chunk))
+        kept.extend(sorted({low, high}))
+
+    # The ends of the series anchor the line even if they are not extremes
+    if kept[0] != 0:
+        kept.insert(0, 0)
+    if kept[-1] != length - 1:
+        kept.append(length - 1)
+    return kept
+
+
+def m4_indices(values: Sequence[float], buckets: int) -> List[int]:
+    """
+    Keep the first, minimum, maximum and last sample of every bucket (M4).
+
+    With one bucket per pixel column this draws the same polyline as the full
+    series, since every column keeps its entry, exit and vertical extent.
+
+    Args:
+        values: y values, one per x position
+        buckets: Number of buckets (usually the pixel width of the plot)
+
+    Returns:
+        Sorted positions of the kept samples; all positions when the series
+        is already short enough
+    """
+    length = len(values)
+    if buckets < 1 or length <= 4 * buckets:
+        return list(range(length))
+
+    values = list(values)
+    kept = []
+    for bucket in range(buckets):
+        start, stop = _bucket_bounds(length, buckets, bucket)
+        chunk = values[start:stop]
+        low = start + chunk.index(min(chunk))
+        high = start + chunk.index(max(chunk))
+        kept.extend(sorted({start, low, high, stop - 1}))
+    return kept
+
+
+def lttb_indices(values: Sequence[float], buckets: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling to `buckets` samples.
+
+    The first and last samples are always kept; every bucket in between keeps
+    the sample forming the largest triangle with the previously kept sample
+    and the average of the next bucket. Uses numpy for the per-bucket search
+    when it is installed.
+
+    Args:
+        values: y values, one per x position
+        buckets: Number of samples to keep
+
+    Returns:
+        Sorted positions of the kept samples; all positions when the series
+        is already short enough
+    """
+    length = len(values)
+    if buckets < 3 or length <= buckets:
+        return list(range(length))
+
+    np = DataValidator._get_numpy()
+    ys = np.asarray(values, dtype=np.float64) if np is not None else list(values)
+
+    inner = length - 2
+    middle = buckets - 2
+    kept = [0]
+    a = 0
+    for bucket in range(middle):
+        start = 1 + bucket * inner // middle
+        stop = 1 + (bucket + 1) * inner // middle
+
+        # Average point of the next bucket (the last sample for the final bucket)
+        next_start = stop
+        next_stop = 1 + (bucket + 2) * inner // middle if bucket + 1 < middle else length
+        next_count = next_stop - next_start
+        cx = (next_start + next_stop - 1) / 2.0
+        if np is not None:
+            cy = float(ys[next_start:next_stop].mean())
+        else:
+            cy = sum(ys[next_start:next_stop]) / next_count
+
+        ax = a
+        ay = float(ys[a])
+        if np is not None:
+            xs = np.arange(start, stop, dtype=np.float64)
+            areas = np.abs((ax - cx) * (ys[start:stop] - ay) - (ax - xs) * (cy - ay))
+            a = start + int(areas.argmax())
+        else:
+            best_area = -1.0
+            for i in range(start, stop):
+                area = abs((ax - cx) * (ys[i] - ay) - (ax - i) * (cy - ay))
+                if area > best_area:
+                    best_area = area
+                    a = i
+        kept.append(a)
+
+    kept.append(length - 1)
+    return kept
+
+
+DOWNSAMPLERS: Dict[str, Callable[[Sequence[float], int], List[int]]] = {
+    'm4': m4_indices,
+    'minmax': minmax_indices,
+    'lttb': lttb_indices,
+}
+
+
+def validate_downsample_method(method: Union[str, Callable, None]) -> Union[str, Callable, None]:
+    """
+    Validate a downsampling method name or callable.
+
+    Args:
+        method: One of the DOWNSAMPLERS keys, a callable taking
+            (values, buckets) and returning sorted positions, or None to
+            disable downsampling
+
+    Returns:
+        The normalized method (lowercase name, callable or None)
+
+    Raises:
+        ValueError: If method is an unknown name
+        TypeError: If method is neither a string, a callable nor None
+    """
+    if method is None or callable(method):
+        return method
+    if not isinstance(method, str):
+        raise TypeError(
+            f"[ChartForgeTK] Error: downsample must be a string, callable or None, "
+            f"got {type(method).__name__}."
+        )
+    name = method.lower()
+    if name == 'none':
+        return None
+    if name not in DOWNSAMPLERS:
+        raise ValueError(
+            f"[ChartForgeTK] Error: Unknown downsample method '{method}'. "
+            f"Available methods: {sorted(DOWNSAMPLERS)}"
+        )
+    return name
+
+
+def downsample(
+    values: Sequence[float],
+    buckets: int,
+    method: Union[str, Callable, None] = 'm4'
+) -> List[int]:
+    """
+    Return the positions of the samples to draw for a series.
+
+    Args:
+        values: y values, one per x position
+        buckets: Target resolution, usually the pixel width the series covers
+        method: Downsampling method name, callable or None (keep everything)
+
+    Returns:
+        Sorted positions into values
+    """
+    method = validate_downsample_method(method)
+    if method is None:
+        return list(range(len(values)))
+    func = method if callable(method) else DOWNSAMPLERS[method]
+    return func(values, max(1, int(buckets)))
@@ -0,0 +1,845 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Export module for ChartForgeTK.
+
+Replays the items of a chart canvas into an SVG document or a PNG image.
+The scene is read with canvas item queries, which work on a widget that was
+never mapped, so reports can be rendered from a withdrawn root. Arcs,
+smoothed lines and arrowheads are flattened to polygons while capturing,
+so both writers only handle lines, polygons, rectangles, ovals, text and
+images.
+
+PNG files are rasterized in pure Python. Text is drawn into PNGs only when
+Pillow is installed (it is never required); SVG export always includes it.
+"""
+
+import os
+import math
+import zlib
+import base64
+import struct
+import logging
+import tkinter as tk
+from typing import Dict, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger('ChartForgeTK')
+
+EXPORT_FORMATS = ('png', 'svg')
+
+# Segments per quadratic piece of a smoothed line, as Tk's default splinesteps
+SPLINE_STEPS = 12
+
+# Line spacing of multi-line text, relative to the font size
+LINE_SPACING = 1.2
+
+
+# Tk anchors on the top/bottom and left/right edges; every other anchor,
+# including 'center', is centered on that axis
+_TOP_ANCHORS = frozenset(('n', 'ne', 'nw'))
+_BOTTOM_ANCHORS = frozenset(('s', 'se', 'sw'))
+_LEFT_ANCHORS = frozenset(('w', 'nw', 'sw'))
+_RIGHT_ANCHORS = frozenset(('e', 'ne', 'se'))
+
+
+def anchor_fractions(anchor: str) -> Tuple[float, float]:
+    """
+    Return the position of a Tk anchor within a box, as fractions of its size.
+
+    (0, 0) is the top left corner ('nw'), (0.5, 0.5) the center.
+    """
+    fx = 0.0 if anchor in _LEFT_ANCHORS else (1.0 if anchor in _RIGHT_ANCHORS else 0.5)
+    fy = 0.0 if anchor in _TOP_ANCHORS else (1.0 if anchor in _BOTTOM_ANCHORS else 0.5)
+    return fx, fy
+
+
+def resolve_export_format(path, format: Optional[str] = None) -> str:
+    """
+    Return the export format for a path, from format or the file extension.
+
+    path is a str or os.PathLike file name; file objects (anything with a
+    write method) have no extension, so they need an explicit format.
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if format is None:
+        format = '' if hasattr(path, 'write') else os.path.splitext(os.fsdecode(path))[1]
+    format = str(format).lower().lstrip('.')
+    if format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"[ChartForgeTK] Error: export format must be one of {list(EXPORT_FORMATS)}, got {format!r}."
+        )
+    return format
+
+
+class SceneItem:
+    """
+    One drawable item of a captured scene.
+
+    kind is 'line', 'polygon', 'rectangle', 'oval', 'text' or 'image';
+    coords is a flat coordinate list and options holds resolved values
+    ('#rrggbb' colors or None, widths in pixels, ...).
+    """
+
+    __slots__ = ('kind', 'coords', 'options')
+
+    def __init__(self, kind: str, coords: Sequence[float], options: Dict):
+        self.kind = kind
+        self.coords = list(coords)
+        self.options = options
+
+    def __repr__(self) -> str:
+        return f"SceneItem({self.kind!r}, {self.coords!r}, {self.options!r})"
+
+
+def _pairs(coords: Sequence[float]) -> List[Tuple[float, float]]:
+    return [(coords[i], coords[i + 1]) for i in range(0, len(coords) - 1, 2)]
+
+
+def _flatten(points: Sequence[Tuple[float, float]]) -> List[float]:
+    return [value for point in points for value in point]
+
+
+def smooth_points(points: Sequence[Tuple[float, float]], steps: int = SPLINE_STEPS) -> List[Tuple[float, float]]:
+    """
+    Flatten a Tk 'smooth' curve through its control points.
+
+    Like Tk, the curve starts and ends at the first and last points and
+    passes through the midpoints between the inner control points.
+    """
+    if len(points) < 3:
+        return list(points)
+    anchors = [points[0]]
+    for i in range(1, len(points) - 2):
+        anchors.append(((points[i][0] + points[i + 1][0]) / 2, (points[i][1] + points[i + 1][1]) / 2))
+    anchors.append(points[-1])
+
+    curve = [points[0]]
+    for i, control in enumerate(points[1:-1]):
+        (x0, y0), (x2, y2) = anchors[i], anchors[i + 1]
+        for step in range(1, steps + 1):
+            t = step / steps
+            a, b, c = (1 - t) ** 2, 2 * t * (1 - t), t * t
+            curve.append((a * x0 + b * control[0] + c * x2, a * y0 + b * control[1] + c * y2))
+    return curve
+
+
+def arc_points(x1: float, y1: float, x2: float, y2: float, start: float, extent: float) -> List[Tuple[float, float]]:
+    """Sample an arc of the ellipse in bbox (x1, y1, x2, y2); angles in degrees, counterclockwise."""
+    cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+    rx, ry = abs(x2 - x1) / 2, abs(y2 - y1) / 2
+    count = max(2, int(abs(extent) / 4) + 1)
+    points = []
+    for i in range(count + 1):
+        angle = math.radians(start + extent * i / count)
+        points.append((cx + rx * math.cos(angle), cy - ry * math.sin(angle)))
+    return points
+
+
+def arrow_polygon(tip: Tuple[float, float], tail: Tuple[float, float], width: float,
+                  shape: Tuple[float, float, float] = (8, 10, 3)) -> Optional[List[float]]:
+    """Arrowhead at tip for a line coming from tail, using Tk's arrowshape (d1, d2, d3)."""
+    dx, dy = tip[0] - tail[0], tip[1] - tail[1]
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return None
+    ux, uy = dx / length, dy / length
+    nx, ny = -uy, ux
+    d1, d2, d3 = shape
+    wing = d3 + width / 2
+    return [
+        tip[0], tip[1],
+        tip[0] - ux * d2 + nx * wing, tip[1] - uy * d2 + ny * wing,
+        tip[0] - ux * d1, tip[1] - uy * d1,
+        tip[0] - ux * d2 - nx * wing, tip[1] - uy * d2 - ny * wing,
+    ]
+
+
+def _parse_dash(value) -> Optional[Tuple[int, ...]]:
+    """Numeric Tk dash patterns as a tuple; character patterns ('-', '.') are not kept."""
+    if not value:
+        return None
+    try:
+        dash = tuple(int(float(part)) for part in str(value).replace(',', ' ').split())
+    except ValueError:
+        return None
+    return dash or None
+
+
+class _SceneReader:
+    """Reads and normalizes the items of one canvas."""
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self._colors: Dict[str, Optional[str]] = {}
+        self._fonts: Dict[str, Tuple[str, float, str, str]] = {}
+        try:
+            self._points_to_pixels = float(canvas.tk.call('tk', 'scaling'))
+        except (tk.TclError, ValueError):
+            self._points_to_pixels = 96 / 72
+
+    def color(self, value) -> Optional[str]:
+        """Resolve any Tk color (names included) to '#rrggbb', or None for no color."""
+        value = str(value) if value is not None else ''
+        if not value:
+            return None
+        if value not in self._colors:
+            try:
+                r, g, b = self.canvas.winfo_rgb(value)
+                self._colors[value] = f'#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}'
+            except tk.TclError:
+                self._colors[value] = None
+        return self._colors[value]
+
+    def font(self, value) -> Tuple[str, float, str, str]:
+        """Resolve a Tk font to (family, size in pixels, weight, slant)."""
+        value = str(value)
+        if value not in self._fonts:
+            try:
+                actual = self.canvas.tk.splitlist(self.canvas.tk.call('font', 'actual', value))
+                info = dict(zip(actual[::2], actual[1::2]))
+                size = float(info.get('-size', 10))
+                pixels = -size if size < 0 else size * self._points_to_pixels
+                self._fonts[value] = (str(info.get('-family', 'Helvetica')), pixels,
+                                      str(info.get('-weight', 'normal')), str(info.get('-slant', 'roman')))
+            except (tk.TclError, ValueError):
+                self._fonts[value] = ('Helvetica', 13.0, 'normal', 'roman')
+        return self._fonts[value]
+
+    def read(self) -> List[SceneItem]:
+        canvas = self.canvas
+        scene = []
+        for item in canvas.find_all():
+            try:
+                if canvas.itemcget(item, 'state') == 'hidden':
+                    continue
+                kind = canvas.type(item)
+                coords = [float(c) for c in canvas.coords(item)]
+                reader = getattr(self, f'_read_{kind}', None)
+                if reader is None or not coords:
+                    continue  # windows and bitmaps are not exported
+                scene.extend(reader(item, coords))
+            except tk.TclError as e:
+                logger.debug(f"Skipping canvas item {item} during export: {e}")
+        return scene
+
+    def _get(self, item, option):
+        return self.canvas.itemcget(item, option)
+
+    def _read_line(self, item, coords):
+        points = _pairs(coords)
+        if self._get(item, 'smooth') not in ('', '0', 'false'):
+            points = smooth_points(points)
+        color = self.color(self._get(item, 'fill'))
+        if color is None or len(points) < 2:
+            return []
+        width = float(self._get(item, 'width') or 1)
+        items = [SceneItem('line', _flatten(points), {
+            'color': color, 'width': width, 'dash': _parse_dash(self._get(item, 'dash')),
+            'capstyle': self._get(item, 'capstyle') or 'butt',
+        })]
+        arrow = self._get(item, 'arrow')
+        if arrow in ('first', 'last', 'both'):
+            try:
+                shape = tuple(float(v) for v in str(self._get(item, 'arrowshape')).split())
+            except ValueError:
+                shape = ()
+            ends = []
+            if arrow in ('first', 'both'):
+                ends.append((points[0], points[1]))
+            if arrow in ('last', 'both'):
+                ends.append((points[-1], points[-2]))
+            for tip, tail in ends:
+                head = arrow_polygon(tip, tail, width, shape if len(shape) == 3 else (8, 10, 3))
+                if head is not None:
+                    items.append(SceneItem('polygon', head, {'fill': color, 'outline': None, 'width': 0}))
+        return items
+
+    def _shape_options(self, item):
+        outline = self.color(self._get(item, 'outline'))
+        return {
+            'fill': self.color(self._get(item, 'fill')),
+            'outline': outline,
+            'width': float(self._get(item, 'width') or 1) if outline else 0,
+            'dash': _parse_dash(self._get(item, 'dash')),
+        }
+
+    def _read_polygon(self, item, coords):
+        points = _pairs(coords)
+        if self._get(item, 'smooth') not in ('', '0', 'false'):
+            points = smooth_points(points + [points[0]])
+        return [SceneItem('polygon', _flatten(points), self._shape_options(item))]
+
+    def _read_rectangle(self, item, coords):
+        return [SceneItem('rectangle', coords, self._shape_options(item))]
+
+    def _read_oval(self, item, coords):
+        return [SceneItem('oval', coords, self._shape_options(item))]
+
+    def _read_arc(self, item, coords):
+        start = float(self._get(item, 'start') or 0)
+        extent = float(self._get(item, 'extent') or 0)
+        points = arc_points(*coords[:4], start, extent)
+        options = self._shape_options(item)
+        style = self._get(item, 'style')
+        if style == 'arc':
+            if options['outline'] is None:
+                return []
+            return [SceneItem('line', _flatten(points), {
+                'color': options['outline'], 'width': options['width'] or 1,
+                'dash': options['dash'], 'capstyle': 'butt',
+            })]
+        if style != 'chord':
+            points = [((coords[0] + coords[2]) / 2, (coords[1] + coords[3]) / 2)] + points
+        return [SceneItem('polygon', _flatten(points), options)]
+
+    def _read_text(self, item, coords):
+        text = self._get(item, 'text')
+        color = self.color(self._get(item, 'fill'))
+        if not text or color is None:
+            return []
+        family, size, weight, slant = self.font(self._get(item, 'font'))
+        return [SceneItem('text', coords[:2], {
+            'text': text, 'color': color, 'family': family, 'size': size,
+            'weight': weight, 'slant': slant,
+            'anchor': self._get(item, 'anchor') or 'center',
+            'angle': float(self._get(item, 'angle') or 0),
+            'justify': self._get(item, 'justify') or 'left',
+        })]
+
+    def _read_image(self, item, coords):
+        name = self._get(item, 'image')
+        if not name:
+            return []
+        tk_app = self.canvas.tk
+        width = int(tk_app.call('image', 'width', name))
+        height = int(tk_app.call('image', 'height', name))
+        if not width or not height:
+            return []
+        # Rows of '#rrggbb' strings; unmapped images read back the same way
+        rows = tk_app.splitlist(tk_app.call(name, 'data'))
+        pixels = bytearray()
+        for row in rows:
+            pixels.extend(bytes.fromhex(''.join(
+                color[1:] if len(color) == 7 else (self.color(color) or '#000000')[1:]
+                for color in tk_app.splitlist(row)
+            )))
+        x, y = coords[0], coords[1]
+        fx, fy = anchor_fractions(self._get(item, 'anchor') or 'center')
+        x -= width * fx
+        y -= height * fy
+        return [SceneItem('image', (x, y), {
+            'name': name, 'width': width, 'height': height, 'pixels': bytes(pixels),
+        })]
+
+
+def capture_scene(canvas: tk.Canvas) -> List[SceneItem]:
+    """
+    Read every visible item of a canvas, bottom to top.
+
+    Returns:
+        List[SceneItem]: Normalized items with resolved colors and fonts
+    """
+    return _SceneReader(canvas).read()
+
+
+def text_layout(options: Dict, x: float, y: float) -> List[Tuple[str, float, float, str]]:
+    """
+    Position the lines of a text item from its anchor point.
+
+    A single line is aligned exactly on the anchor. For several lines the
+    block width is estimated (about 0.55em per character) and each line is
+    placed by the item's justify option.
+
+    Returns:
+        (line, x, baseline y, align) for every line, before rotation; align
+        is 'start', 'middle' or 'end' and tells what x refers to
+    """
+    lines = str(options['text']).split('\n')
+    size = options['size']
+    height = size * LINE_SPACING * len(lines)
+    fx, fy = anchor_fractions(options['anchor'])
+    top = y - height * fy
+    baselines = [top + size * LINE_SPACING * i + size * 0.9 for i in range(len(lines))]
+
+    if len(lines) == 1:
+        align = {0.0: 'start', 1.0: 'end'}.get(fx, 'middle')
+        return [(lines[0], x, baselines[0], align)]
+
+    block = max(len(line) for line in lines) * size * 0.55
+    left = x - block * fx
+    justify = options.get('justify', 'left')
+    if justify == 'right':
+        line_x, align = left + block, 'end'
+    elif justify == 'center':
+        line_x, align = left + block / 2, 'middle'
+    else:
+        line_x, align = left, 'start'
+    return [(line, line_x, baseline, align) for line, baseline in zip(lines, baselines)]
+
+
+class SVGWriter:
+    """
+    Writes a captured scene as an SVG document.
+    """
+
+    def __init__(self, width: int, height: int, background: Optional[str] = '#ffffff'):
+        self.width = width
+        self.height = height
+        self.background = background
+        self._images: Dict[str, str] = {}
+
+    def render(self, scene: Sequence[SceneItem]) -> str:
+        """Return the SVG document for a scene."""
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+            f'viewBox="0 0 {self.width} {self.height}">',
+        ]
+        if self.background:
+            parts.append(f'<rect width="100%" height="100%" fill="{self.background}"/>')
+        for item in scene:
+            element = getattr(self, f'_{item.kind}')(item)
+            if element:
+                parts.append(element)
+        parts.append('</svg>')
+        return '\n'.join(parts) + '\n'
+
+    @staticmethod
+    def _num(value: float) -> str:
+        return f'{value:.2f}'.rstrip('0').rstrip('.')
+
+    def _points(self, coords) -> str:
+        return ' '.join(f'{self._num(x)},{self._num(y)}' for x, y in _pairs(coords))
+
+    def _stroke(self, color, width, dash) -> str:
+        if color is None or not width:
+            return 'stroke="none"'
+        stroke = f'stroke="{color}" stroke-width="{self._num(width)}"'
+        if dash:
+            stroke += f' stroke-dasharray="{",".join(str(d) for d in dash)}"'
+        return stroke
+
+    def _line(self, item) -> str:
+        o = item.options
+        cap = {'round': 'round', 'projecting': 'square'}.get(o['capstyle'], 'butt')
+        return (f'<polyline points="{self._points(item.coords)}" fill="none" '
+                f'{self._stroke(o["color"], o["width"], o["dash"])} stroke-linecap="{cap}" '
+                f'stroke-linejoin="round"/>')
+
+    def _polygon(self, item) -> str:
+        o = item.options
+        return (f'<polygon points="{self._points(item.coords)}" fill="{o["fill"] or "none"}" '
+                f'fill-rule="evenodd" {self._stroke(o["outline"], o["width"], o.get("dash"))}/>')
+
+    def _rectangle(self, item) -> str:
+        o = item.options
+        x1, y1, x2, y2 = item.coords[:4]
+        return (f'<rect x="{self._num(min(x1, x2))}" y="{self._num(min(y1, y2))}" '
+                f'width="{self._num(abs(x2 - x1))}" height="{self._num(abs(y2 - y1))}" '
+                f'fill="{o["fill"] or "none"}" {self._stroke(o["outline"], o["width"], o["dash"])}/>')
+
+    def _oval(self, item) -> str:
+        o = item.options
+        x1, y1, x2, y2 = item.coords[:4]
+        return (f'<ellipse cx="{self._num((x1 + x2) / 2)}" cy="{self._num((y1 + y2) / 2)}" '
+                f'rx="{self._num(abs(x2 - x1) / 2)}" ry="{self._num(abs(y2 - y1) / 2)}" '
+                f'fill="{o["fill"] or "none"}" {self._stroke(o["outline"], o["width"], o["dash"])}/>')
+
+    def _text(self, item) -> str:
+        o = item.options
+        x, y = item.coords
+        style = f'font-family="{escape(o["family"])}" font-size="{self._num(o["size"])}"'
+        if o['weight'] == 'bold':
+            style += ' font-weight="bold"'
+        if o['slant'] == 'italic':
+            style += ' font-style="italic"'
+        transform = ''
+        if o['angle']:
+            # Tk rotates counterclockwise around the anchor point
+            transform = f' transform="rotate({self._num(-o["angle"])} {self._num(x)} {self._num(y)})"'
+        lines = ''.join(
+            f'<tspan x="{self._num(lx)}" y="{self._num(ly)}" text-anchor="{align}">{escape(line)}</tspan>'
+            for line, lx, ly, align in text_layout(o, x, y)
+        )
+        return f'<text {style} fill="{o["color"]}"{transform}>{lines}</text>'
+
+    def _image(self, item) -> str:
+        o = item.options
+        data = self._images.get(o['name'])
+        if data is None:
+            data = base64.b64encode(encode_png(o['width'], o['height'], o['pixels'])).decode('ascii')
+            self._images[o['name']] = data
+        x, y = item.coords
+        return (f'<image x="{self._num(x)}" y="{self._num(y)}" width="{o["width"]}" '
+                f'height="{o["height"]}" href="data:image/png;base64,{data}"/>')
+
+
+def encode_png(width: int, height: int, pixels: bytes) -> bytes:
+    """
+    Encode packed 8-bit RGB pixels (row-major) as a PNG file.
+
+    Raises:
+        ValueError: If pixels does not hold width * height RGB values
+    """
+    stride = width * 3
+    if len(pixels) != stride * height:
+        raise ValueError(
+            f"[ChartForgeTK] Error: expected {stride * height} bytes of RGB data, got {len(pixels)}."
+        )
+    raw = bytearray()
+    for row in range(height):
+        raw.append(0)  # filter type None
+        raw.extend(pixels[row * stride:(row + 1) * stride])
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(bytes(raw), 6)) + chunk(b'IEND', b''))
+
+
+class PNGRasterizer:
+    """
+    Pure-Python rasterizer for captured scenes.
+
+    Shapes are scan-converted without anti-aliasing; dash patterns are drawn
+    solid. Text needs Pillow and is skipped (with a warning) without it.
+    """
+
+    def __init__(self, width: int, height: int, background: Optional[str] = '#ffffff'):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(bytes.fromhex((background or '#ffffff')[1:]) * (width * height))
+        self.skipped_text = 0
+        self._pil = None
+        self._fonts = {}
+
+    def render(self, scene: Sequence[SceneItem]) -> bytes:
+        """Draw a scene and return it as PNG bytes."""
+        for item in scene:
+            getattr(self, f'_{item.kind}')(item)
+        if self.skipped_text:
+            logger.warning(
+                f"PNG export skipped {self.skipped_text} text items because Pillow is not "
+                f"installed; export to SVG to keep text."
+            )
+        return encode_png(self.width, self.height, bytes(self.pixels))
+
+    @staticmethod
+    def _rgb(color: str) -> bytes:
+        return bytes.fromhex(color[1:])
+
+    def fill_contours(self, contours: Sequence[Sequence[Tuple[float, float]]], color: str):
+        """Fill closed contours with the even-odd rule, sampling pixel centers."""
+        edges = []
+        for points in contours:
+            for i in range(len(points)):
+                x0, y0 = points[i]
+                x1, y1 = points[(i + 1) % len(points)]
+                if y0 == y1:
+                    continue
+                if y0 > y1:
+                    x0, y0, x1, y1 = x1, y1, x0, y0
+                edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0)))
+        if not edges:
+            return
+        top = max(0, int(math.floor(min(e[0] for e in edges))))
+        bottom = min(self.height, int(math.ceil(max(e[1] for e in edges))))
+        rgb = self._rgb(color)
+        width = self.width
+        for y in range(top, bottom):
+            center = y + 0.5
+            xs = sorted(x0 + (center - y0) * slope for y0, y1, x0, slope in edges if y0 <= center < y1)
+            row = y * width
+            for i in range(0, len(xs) - 1, 2):
+                a = max(0, int(math.ceil(xs[i] - 0.5)))
+                b = min(width, int(math.ceil(xs[i + 1] - 0.5)))
+                if b > a:
+                    self.pixels[(row + a) * 3:(row + b) * 3] = rgb * (b - a)
+
+    @staticmethod
+    def _ellipse(cx, cy, rx, ry) -> List[Tuple[float, float]]:
+        count = max(16, min(180, int(2 * math.pi * max(rx, ry) / 2)))
+        return [(cx + rx * math.cos(2 * math.pi * i / count), cy + ry * math.sin(2 * math.pi * i / count))
+                for i in range(count)]
+
+    def _stroke_segments(self, points, color, width, round_caps):
+        half = max(width, 1.0) / 2
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            length = math.hypot(x1 - x0, y1 - y0)
+            if length == 0:
+                continue
+            nx, ny = -(y1 - y0) / length * half, (x1 - x0) / length * half
+            self.fill_contours([[(x0 + nx, y0 + ny), (x1 + nx, y1 + ny),
+                                 (x1 - nx, y1 - ny), (x0 - nx, y0 - ny)]], color)
+        if round_caps and half > 1:
+            for x, y in points:
+                self.fill_contours([self._ellipse(x, y, half, half)], color)
+
+    def _line(self, item):
+        o = item.options
+        self._stroke_segments(_pairs(item.coords), o['color'], o['width'],
+                              o['capstyle'] == 'round' or o['width'] > 2)
+
+    def _polygon(self, item):
+        o = item.options
+        points = _pairs(item.coords)
+        if o['fill']:
+            self.fill_contours([points], o['fill'])
+        if o['outline'] and o['width']:
+            self._stroke_segments(points + points[:1], o['outline'], o['width'], o['width'] > 2)
+
+    def _rectangle(self, item):
+        o = item.options
+        x1, y1, x2, y2 = item.coords[:4]
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        if o['fill']:
+            self.fill_contours([[(x1, y1), (x2, y1), (x2, y2), (x1, y2)]], o['fill'])
+        if o['outline'] and o['width']:
+            h = o['width'] / 2
+            self.fill_contours([
+                [(x1 - h, y1 - h), (x2 + h, y1 - h), (x2 + h, y2 + h), (x1 - h, y2 + h)],
+                [(x1 + h, y1 + h), (x2 - h, y1 + h), (x2 - h, y2 - h), (x1 + h, y2 - h)],
+            ], o['outline'])
+
+    def _oval(self, item):
+        o = item.options
+        x1, y1, x2, y2 = item.coords[:4]
+        cx, cy, rx, ry = (x1 + x2) / 2, (y1 + y2) / 2, abs(x2 - x1) / 2, abs(y2 - y1) / 2
+        if o['fill']:
+            self.fill_contours([self._ellipse(cx, cy, rx, ry)], o['fill'])
+        if o['outline'] and o['width']:
+            h = o['width'] / 2
+            contours = [self._ellipse(cx, cy, rx + h, ry + h)]
+            if rx > h and ry > h:
+                contours.append(self._ellipse(cx, cy, rx - h, ry - h))
+            self.fill_contours(contours, o['outline'])
+
+    def _image(self, item):
+        o = item.options
+        x, y = int(round(item.coords[0])), int(round(item.coords[1]))
+        src_stride = o['width'] * 3
+        a = max(0, x)
+        b = min(self.width, x + o['width'])
+        if b <= a:
+            return
+        for row in range(max(0, y), min(self.height, y + o['height'])):
+            src = (row - y) * src_stride + (a - x) * 3
+            dst = (row * self.width + a) * 3
+            self.pixels[dst:dst + (b - a) * 3] = o['pixels'][src:src + (b - a) * 3]
+
+    def _text(self, item):
+        pil = self._load_pillow()
+        if pil is None:
+            self.skipped_text += 1
+            return
+        Image, ImageDraw, ImageFont = pil
+        o = item.options
+        font = self._font(ImageFont, o)
+        rgb = self._rgb(o['color'])
+        x, y = item.coords
+        ascent = font.getmetrics()[0]
+        for line, lx, ly, align in text_layout(o, x, y):
+            left, top, right, bottom = font.getbbox(line)
+            if right <= left or bottom <= top:
+                continue
+            mask = Image.new('L', (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), line, font=font, fill=255)
+            # Pillow draws from the ascender top; lx/ly are the aligned baseline point
+            advance = font.getlength(line)
+            ox = lx - {'start': 0, 'end': advance}.get(align, advance / 2) + left
+            oy = ly - ascent + top
+            if o['angle']:
+                mask, ox, oy = self._rotate(mask, ox, oy, x, y, o['angle'])
+            self._blend(mask, int(round(ox)), int(round(oy)), rgb)
+
+    @staticmethod
+    def _rotate(mask, ox, oy, px, py, angle):
+        """Rotate a glyph mask placed at (ox, oy) counterclockwise around (px, py)."""
+        w, h = mask.size
+        rotated = mask.rotate(angle, expand=True)
+        theta = math.radians(angle)
+        cx, cy = ox + w / 2 - px, oy + h / 2 - py
+        rx = cx * math.cos(theta) + cy * math.sin(theta)
+        ry = -cx * math.sin(theta) + cy * math.cos(theta)
+        rw, rh = rotated.size
+        return rotated, px + rx - rw / 2, py + ry - rh / 2
+
+    def _blend(self, mask, ox, oy, rgb):
+        w, h = mask.size
+        alpha = mask.tobytes()
+        pixels = self.pixels
+        for row in range(h):
+            y = oy + row
+            if not 0 <= y < self.height:
+                continue
+            for col in range(w):
+                a = alpha[row * w + col]
+                x = ox + col
+                if not a or not 0 <= x < self.width:
+                    continue
+                i = (y * self.width + x) * 3
+                for c in range(3):
+                    pixels[i + c] = (rgb[c] * a + pixels[i + c] * (255 - a)) // 255
+
+    def _load_pillow(self):
+        if self._pil is None:
+            try:
+                from PIL import Image, ImageDraw, ImageFont
+                self._pil = (Image, ImageDraw, ImageFont)
+            except ImportError:
+                self._pil = False
+        return self._pil or None
+
+    def _font(self, ImageFont, options):
+        size = max(1, int(round(options['size'])))
+        bold = options['weight'] == 'bold'
+        key = (options['family'], size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            names = [options['family'] + ('-Bold' if bold else '') + '.ttf',
+                     'DejaVuSans-Bold.ttf' if bold else 'DejaVuSans.ttf']
+            for name in names:
+                try:
+                    font = ImageFont.truetype(name, size)
+                    break
+                except OSError:
+                    continue
+            else:
+                try:
+                    font = ImageFont.load_default(size)
+                except TypeError:
+                    font = ImageFont.load_default()  # Pillow < 10.1 has no sizes
+            self._fonts[key] = font
+        return font
+
+
+def export_canvas(canvas: tk.Canvas, path, width: int, height: int, format: Optional[str] = None) -> str:
+    """
+    Write the current items of a canvas to an SVG or PNG file.
+
+    Args:
+        canvas: Canvas to export; it does not have to be mapped
+        path: Output file path (str or os.PathLike), or a binary file
+            object when format is given
+        width, height: Size of the exported image in pixels
+        format: 'svg' or 'png'; taken from the path extension when None
+
+    Returns:
+        str: The format written
+
+    Raises:
+        TypeError: If path is neither a path nor a file object
+        ValueError: If the format is not supported
+    """
+    if not hasattr(path, 'write'):
+        path = os.fspath(path)
+    format = resolve_export_format(path, format)
+    scene = capture_scene(canvas)
+    try:
+        background = _SceneReader(canvas).color(canvas.cget('background'))
+    except tk.TclError:
+        background = '#ffffff'
+    if format == 'svg':
+        data = SVGWriter(width, height, background).render(scene).encode('utf-8')
+    else:
+        data = PNGRasterizer(width, height, background).render(scene)
+
+    if hasattr(path, 'write'):
+        path.write(data)
+    else:
+        with open(path, 'wb') as handle:
+            handle.write(data)
+    logger.debug(f"Exported {len(scene)} items as {format}")
+    return format
+
+
+class BatchExporter:
+    """
+    Renders many charts to files on one hidden Tk root.
+
+    Charts are created unmapped in a withdrawn root, plotted with animations
+    off, exported and destroyed; the root is reused until close().
+
+    Example:
+        >>> with BatchExporter() as batch:
+        ...     for name, values in reports.items():
+        ...         batch.export(BarChart, f'{name}.svg', values, title=name)
+    """
+
+    def __init__(self):
+        self._root: Optional[tk.Tk] = None
+        self.exported = 0
+
+    @property
+    def root(self) -> tk.Tk:
+        """The hidden root, created on first use."""
+        if self._root is None:
+            self._root = tk.Tk()
+            self._root.withdraw()
+        return self._root
+
+    def export(self, chart_class, path, *plot_args, format: Optional[str] = None,
+               chart_options: Optional[Dict] = None, title: Optional[str] = None,
+               x_label: Optional[str] = None, y_label: Optional[str] = None, **plot_kwargs) -> str:
+        """
+        Create a chart, plot it and export its final frame.
+
+        Args:
+            chart_class: Chart subclass, e.g. BarChart
+            path: Output file (.svg or .png), a str or os.PathLike
+            *plot_args, **plot_kwargs: Passed to chart.plot()
+            format: 'svg' or 'png'; taken from the path extension when None
+            chart_options: Constructor options (width, height, theme, ...)
+            title, x_label, y_label: Set on the chart before plotting
+
+        Returns:
+            str: The format written
+        """
+        format = resolve_export_format(path, format)
+        chart = chart_class(self.root, **(chart_options or {}))
+        try:
+            chart.set_animations_enabled(False)
+            for name, value in (('title', title), ('x_label', x_label), ('y_label', y_label)):
+                if value is not None:
+                    setattr(chart, name, value)
+            chart.plot(*plot_args, **plot_kwargs)
+            written = chart.export(path, format)
+        finally:
+            chart.destroy()
+        self.exported += 1
+        return written
+
+    def close(self):
+        """Destroy the hidden root."""
+        if self._root is not None:
+            try:
+                self._root.destroy()
+            except tk.TclError:
+                pass
+            self._root = None
+
+    def __enter__(self) -> 'BatchExporter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
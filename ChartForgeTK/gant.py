@@ -16,6 +16,7 @@
 
 
 from typing import List, Tuple, Optional
+import math
 import tkinter as tk
 from tkinter import ttk
 import logging
@@ -29,9 +30,28 @@ class GanttChart(Chart):
     """
     Gantt chart implementation with comprehensive input validation and edge case handling.
     
+    Only the tasks, grid lines, dependencies and milestones inside the
+    scrolled viewport (plus a margin) are on the canvas. Their items are
+    pooled and rebound when the view scrolls, pans or zooms, so the item
+    count follows the viewport size rather than the plan size. Vertical grid
+    lines step by days, weeks, months, quarters or years, whichever is the
+    finest unit at least MIN_GRID_SPACING pixels apart.
+    
     Requirements: 1.1, 1.2, 1.3, 2.1, 3.1, 3.2, 3.6, 9.1, 9.2
     """
     
+    # Task rows rendered above and below the viewport
+    OVERSCAN_ROWS = 5
+    # Pixels rendered left and right of the viewport
+    OVERSCAN_PX = 100
+    # Grid units in days, with the number of units between solid lines
+    GRID_UNITS = ((1, 7), (7, 4), (30, 12), (91, 4), (365, 5))
+    MIN_GRID_SPACING = 12
+    # Zoom limit, as the widest a day may get in pixels
+    MAX_DAY_PIXELS = 200
+    # Pools in stacking order, bottom to top
+    POOLS = ('grid', 'rows', 'bars', 'labels', 'side_labels', 'dependencies', 'milestones')
+    
     def __init__(self, parent=None, width: int = 400, height: int = 400, 
                  display_mode='frame', theme='light', palette='modern', max_bar_height=30, min_bar_height=15):
         super().__init__(parent, width=width, height=height, display_mode=display_mode, theme=theme, palette=palette)
@@ -49,13 +69,23 @@ class GanttChart(Chart):
         self.current_scale = 1.0
         self.v_offset = 0
         self.x_offset = 0  # Initialize x_offset for milestones
+        self.bar_height = max_bar_height
+        self.total_height = 0
+        self.max_days = 1
+        # Pooled items per POOLS name, the bar entry of each rendered task,
+        # the viewport last rendered and a pending viewport refresh
+        self._pools = {name: [] for name in self.POOLS}
+        self._bar_entries = {}
+        self._highlighted = None
+        self._viewport_key = None
+        self._viewport_refresh_id = None
         
         # Scrollable canvas setup
         self.container = ttk.Frame(self.parent)
         self.canvas = tk.Canvas(self.container, bg=self.style.BACKGROUND)
         self.scroll_y = ttk.Scrollbar(self.container, orient="vertical", command=self.canvas.yview)
         self.scroll_x = ttk.Scrollbar(self.container, orient="horizontal", command=self.canvas.xview)
-        self.canvas.configure(yscrollcommand=self.scroll_y.set, xscrollcommand=self.scroll_x.set)
+        self.canvas.configure(yscrollcommand=self._on_yscroll, xscrollcommand=self._on_xscroll)
         
         self.container.pack(fill='both', expand=True)
         self.scroll_y.pack(side="right", fill="y")
@@ -67,7 +97,7 @@ class GanttChart(Chart):
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind("<ButtonPress-1>", self._start_pan)
         self.canvas.bind("<B1-Motion>", self._on_pan)
-        self.canvas.bind("<Motion>", self._on_hover)
+        self.bind_hover(self._on_hover, self._on_leave)
 
     def plot(self, data: List[Tuple[str, float, float]], 
             dependencies: Optional[List[Tuple[int, int]]] = None,
@@ -199,6 +229,7 @@ class GanttChart(Chart):
             self.max_days = 1  # Prevent division by zero
         
         # Calculate dynamic bar height
+        self._reset_pools()
         self._calculate_dynamic_layout()
         self._redraw()
 
@@ -218,13 +249,19 @@ class GanttChart(Chart):
         self.total_height = len(self.data) * (self.bar_height + self.bar_spacing) + 2 * self.padding
 
     def _redraw(self):
-        """Redraw the entire Gantt chart."""
-        self.canvas.delete('all')
-        self._draw_grid()
-        self._draw_gantt()
-        self._draw_dependencies()
-        self._draw_milestones()
+        """Fit the scroll region to the plan and render the viewport."""
         self._update_scrollregion()
+        self._render_viewport()
+
+    def _reset_pools(self):
+        """Delete every pooled item, e.g. before plotting new data."""
+        for name, entries in self._pools.items():
+            self.canvas.delete(f'gantt_{name}')
+            entries.clear()
+        self._bar_entries = {}
+        self._highlighted = None
+        self.hide_overlays()
+        self._viewport_key = None
 
     def _update_scrollregion(self):
         """Update the scrollable region of the canvas."""
@@ -232,95 +269,242 @@ class GanttChart(Chart):
         self.canvas.configure(scrollregion=(0, 0, total_width, self.total_height))
 
     def _get_time_scale(self):
-        """Calculate the scaling factor for the timeline."""
-        return (self.canvas.winfo_width() - 2 * self.padding) / max(1, self.max_days)
+        """Calculate the scaling factor for the timeline, in pixels per day."""
+        return self._fit_time_scale() * self.current_scale
 
-    def _draw_grid(self):
-        """Draw the background grid."""
-        time_scale = self._get_time_scale()
-        y_base = self.padding
+    def _fit_time_scale(self):
+        """Pixels per day that fit the whole timeline into the canvas width."""
+        return max(1, self.canvas.winfo_width() - 2 * self.padding) / max(1, self.max_days)
+
+    def _grid_unit(self, time_scale: float) -> Tuple[int, int]:
+        """Finest grid unit (days, units per solid line) with lines MIN_GRID_SPACING apart."""
+        for unit, major in self.GRID_UNITS:
+            if unit * time_scale >= self.MIN_GRID_SPACING:
+                return unit, major
+        return self.GRID_UNITS[-1]
+
+    def _visible_region(self) -> Tuple[float, float, float, float]:
+        """Canvas coordinates of the scrolled viewport, widened by the overscan margin."""
+        x0 = self.canvas.canvasx(0) - self.OVERSCAN_PX
+        y0 = self.canvas.canvasy(0)
+        x1 = self.canvas.canvasx(self.canvas.winfo_width()) + self.OVERSCAN_PX
+        y1 = self.canvas.canvasy(self.canvas.winfo_height())
+        return x0, y0, x1, y1
+
+    def _visible_tasks(self, y0: float, y1: float) -> range:
+        """Indices of the tasks whose rows intersect [y0, y1], plus overscan."""
+        row_height = self.bar_height + self.bar_spacing
+        first = int((y0 - self.padding) // row_height) - self.OVERSCAN_ROWS
+        last = int((y1 - self.padding) // row_height) + 1 + self.OVERSCAN_ROWS
+        return range(max(0, first), min(len(self.data), last))
+
+    def _task_geometry(self, idx: int, time_scale: float) -> Tuple[float, float, float]:
+        """x start, x end and top y of a task bar."""
+        _, start, duration = self.data[idx]
+        x_start = self.padding + start * time_scale
+        return x_start, x_start + duration * time_scale, self.padding + idx * (self.bar_height + self.bar_spacing)
+
+    def _render_viewport(self, force: bool = False):
+        """Bind the pooled items to what is inside the viewport.
         
-        # Vertical grid lines
-        for day in range(0, int(self.max_days) + 1):
-            x = self.padding + day * time_scale
-            dash = (2, 2) if day % 5 != 0 else None
-            self.canvas.create_line(x, y_base, x, self.total_height, 
-                                   fill=self.style.SECONDARY, dash=dash)
-            
-        # Horizontal lines
-        for i in range(len(self.data) + 1):
-            y = y_base + i * (self.bar_height + self.bar_spacing)
-            self.canvas.create_line(self.padding, y, 
-                                  self.padding + self.max_days * time_scale, y,
-                                  fill=self.style.SECONDARY, dash=(2, 2))
-    def _draw_dependencies(self):
-        """Draw dependency arrows between tasks."""
+        Does nothing when the viewport, scale and layout are unchanged.
+        """
+        self._cancel_viewport_refresh()
+        if not self.data:
+            return
+        time_scale = self._get_time_scale()
+        x0, y0, x1, y1 = self._visible_region()
+        tasks = self._visible_tasks(y0, y1)
+        key = (x0, x1, tasks.start, tasks.stop, time_scale, self.bar_height, self.total_height)
+        if key == self._viewport_key and not force:
+            return
+        self._viewport_key = key
+
+        created = False
+        for name, specs in (
+            ('grid', self._grid_specs(x0, x1, time_scale)),
+            ('rows', self._row_line_specs(tasks, time_scale)),
+        ) + self._task_specs(tasks, x0, x1, time_scale) + (
+            ('dependencies', self._dependency_specs(tasks, time_scale)),
+            ('milestones', self._milestone_specs(x0, x1, time_scale)),
+        ):
+            created = self._sync_items(self._pools[name], specs, ('gantt', f'gantt_{name}')) or created
+
+        # Bar pool entries follow the rendered tasks in order
+        visible_bars = [idx for idx in tasks if self._bar_visible(idx, x0, x1, time_scale)]
+        self._bar_entries = dict(zip(visible_bars, self._pools['bars']))
+        if created:
+            for name in self.POOLS:
+                self.canvas.tag_raise(f'gantt_{name}')
+            self.canvas.tag_raise('overlay')
+
+    def _grid_specs(self, x0: float, x1: float, time_scale: float) -> list:
+        """Vertical grid lines inside [x0, x1] at the zoom's grid unit."""
+        unit, major = self._grid_unit(time_scale)
+        first = max(0, math.ceil((x0 - self.padding) / time_scale / unit))
+        last = min(int(self.max_days // unit), math.floor((x1 - self.padding) / time_scale / unit))
+        specs = []
+        for k in range(first, last + 1):
+            x = self.padding + k * unit * time_scale
+            specs.append(('line', (x, self.padding, x, self.total_height), {
+                'fill': self.style.SECONDARY, 'dash': '' if k % major == 0 else (2, 2),
+            }))
+        return specs
+
+    def _row_line_specs(self, tasks: range, time_scale: float) -> list:
+        """Horizontal lines above and below each rendered task row."""
+        row_height = self.bar_height + self.bar_spacing
+        x_end = self.padding + self.max_days * time_scale
+        options = {'fill': self.style.SECONDARY, 'dash': (2, 2)}
+        return [
+            ('line', (self.padding, self.padding + i * row_height, x_end, self.padding + i * row_height), options)
+            for i in range(tasks.start, min(len(self.data), tasks.stop) + 1)
+        ]
+
+    def _bar_visible(self, idx: int, x0: float, x1: float, time_scale: float) -> bool:
+        x_start, x_end, _ = self._task_geometry(idx, time_scale)
+        return x_end >= x0 and x_start <= x1
+
+    def _task_specs(self, tasks: range, x0: float, x1: float, time_scale: float) -> tuple:
+        """Bars, bar labels and side labels of the rendered tasks."""
+        font = ('Arial', max(8, int(self.bar_height / 2)))
+        metrics = self.text_metrics
+        bars, labels, side_labels = [], [], []
+        for idx in tasks:
+            task = self.data[idx][0]
+            x_start, x_end, y = self._task_geometry(idx, time_scale)
+            side_labels.append(('text', (self.padding - 10, y + self.bar_height / 2), {
+                'text': task, 'anchor': 'e', 'font': font, 'fill': self.style.TEXT,
+            }))
+            if not self._bar_visible(idx, x0, x1, time_scale):
+                continue
+            highlighted = idx == self._highlighted
+            bars.append(('rectangle', (x_start, y, x_end, y + self.bar_height), {
+                'fill': self.colors[idx % len(self.colors)],
+                'outline': self.style.ACCENT if highlighted else self.style.BACKGROUND,
+                'width': 2 if highlighted else 1,
+            }))
+
+            # Draw label, shortened to the bar, if space permits
+            label = metrics.fit(task, font, x_end - x_start - 10)
+            if label and label != metrics.ELLIPSIS:
+                labels.append(('text', (x_start + 5, y + self.bar_height / 2), {
+                    'text': label, 'anchor': 'w', 'font': font, 'fill': self.style.BACKGROUND,
+                }))
+        return ('bars', bars), ('labels', labels), ('side_labels', side_labels)
+
+    def _dependency_specs(self, tasks: range, time_scale: float) -> list:
+        """Arrows of the dependencies with an end in, or spanning, the rendered rows."""
+        specs = []
         for src, dest in self.dependencies:
-            if 0 <= src < len(self.data) and 0 <= dest < len(self.data):
-                self._draw_dependency_arrow(src, dest)
-    def _draw_milestones(self):
-        """Draw milestone markers."""
+            if max(src, dest) < tasks.start or min(src, dest) >= tasks.stop:
+                continue
+            _, src_end, src_y = self._task_geometry(src, time_scale)
+            dest_start, _, dest_y = self._task_geometry(dest, time_scale)
+            src_y += self.bar_height / 2
+            dest_y += self.bar_height / 2
+            elbow = src_end + 8
+            specs.append(('line', (src_end, src_y, elbow, src_y, elbow, dest_y, dest_start, dest_y), {
+                'fill': self.style.TEXT_SECONDARY, 'width': 1, 'arrow': tk.LAST, 'arrowshape': (6, 8, 3),
+            }))
+        return specs
+
+    def _milestone_specs(self, x0: float, x1: float, time_scale: float) -> list:
+        """Markers and names of the milestones inside [x0, x1]."""
+        specs = []
+        y = self.padding + 30
         for name, day in self.milestones:
-            x = self.padding + (day - self.x_offset) * ((self.width - 2*self.padding) / self.max_days)
-            y = self.padding + 30
-            self.canvas.create_polygon(
-                x, y-10, x+10, y, x, y+10, x-10, y,
-                fill='#e74c3c', outline=self.style.BACKGROUND
-            )
-            self.canvas.create_text(
-                x, y+15, text=name,
-                font=('Arial', 8, 'bold'), fill='#e74c3c',
-                anchor='n'
-            )
-    def _draw_gantt(self):
-        """Draw the Gantt bars and labels."""
-        time_scale = self._get_time_scale()
-        y_base = self.padding
-        
-        for idx, (task, start, duration) in enumerate(self.data):
-            y = y_base + idx * (self.bar_height + self.bar_spacing)
-            x_start = self.padding + start * time_scale
-            x_end = x_start + duration * time_scale
-            
-            # Draw bar
-            color = self.colors[idx % len(self.colors)]
-            bar = self.canvas.create_rectangle(
-                x_start, y, x_end, y + self.bar_height,
-                fill=color, outline=self.style.BACKGROUND,
-                tags=('task', f'task_{idx}')
-            )
-            
-            # Draw label if space permits
-            if x_end - x_start > 50:
-                self.canvas.create_text(
-                    x_start + 5, y + self.bar_height / 2,
-                    text=task, anchor='w',
-                    font=('Arial', max(8, int(self.bar_height / 2))),
-                    fill=self.style.BACKGROUND
-                )
+            x = self.padding + (day - self.x_offset) * time_scale
+            if not x0 - 10 <= x <= x1 + 10:
+                continue
+            specs.append(('polygon', (x, y - 10, x + 10, y, x, y + 10, x - 10, y), {
+                'fill': '#e74c3c', 'outline': self.style.BACKGROUND,
+            }))
+            specs.append(('text', (x, y + 15), {
+                'text': name, 'font': ('Arial', 8, 'bold'), 'fill': '#e74c3c', 'anchor': 'n',
+            }))
+        return specs
+
+    def _on_xscroll(self, first, last):
+        """Follow horizontal view changes: move the scrollbar and refresh the viewport."""
+        self.scroll_x.set(first, last)
+        self._schedule_viewport_refresh()
+
+    def _on_yscroll(self, first, last):
+        """Follow vertical view changes: move the scrollbar and refresh the viewport."""
+        self.scroll_y.set(first, last)
+        self._schedule_viewport_refresh()
+
+    def _schedule_viewport_refresh(self):
+        """Render the viewport when idle, once for any number of view changes."""
+        if self._viewport_refresh_id is not None:
+            return
+        try:
+            self._viewport_refresh_id = self.canvas.after_idle(self._render_viewport)
+            self.resource_manager.register_animation(self._viewport_refresh_id)
+        except tk.TclError:
+            self._viewport_refresh_id = None
 
-        # Left-side task labels
-        self._draw_side_labels()
-
-    def _draw_side_labels(self):
-        """Draw task labels on the left side."""
-        y_base = self.padding
-        for idx, (task, _, _) in enumerate(self.data):
-            y = y_base + idx * (self.bar_height + self.bar_spacing)
-            self.canvas.create_text(
-                self.padding - 10, y + self.bar_height / 2,
-                text=task, anchor='e',
-                font=('Arial', max(8, int(self.bar_height / 2))),
-                fill=self.style.TEXT
+    def _cancel_viewport_refresh(self):
+        """Drop a scheduled viewport refresh."""
+        if self._viewport_refresh_id is not None:
+            try:
+                self.canvas.after_cancel(self._viewport_refresh_id)
+            except tk.TclError:
+                pass
+            self._viewport_refresh_id = None
+
+    def _finish_pending_render(self):
+        """Render a scheduled viewport refresh right away."""
+        if self._viewport_refresh_id is not None:
+            self._render_viewport()
+        super()._finish_pending_render()
+
+    def zoom(self, factor: float, anchor_x: Optional[float] = None):
+        """
+        Zoom the timeline, keeping the day under anchor_x in place.
+
+        The zoom ranges from the whole plan fitting the canvas width to a day
+        being MAX_DAY_PIXELS wide.
+
+        Args:
+            factor: Scale multiplier; above 1 zooms in
+            anchor_x: Widget x coordinate to zoom around, default the center
+
+        Raises:
+            ValueError: If factor is not a positive number
+        """
+        if isinstance(factor, bool) or not isinstance(factor, (int, float)) or not factor > 0:
+            raise ValueError(
+                f"[ChartForgeTK] Error: zoom factor must be a positive number, got {factor!r}."
             )
+        if not self.data:
+            return
+        if anchor_x is None:
+            anchor_x = self.canvas.winfo_width() / 2
+        old_scale = self._get_time_scale()
+        day = (self.canvas.canvasx(anchor_x) - self.padding) / old_scale
+        max_zoom = max(1.0, self.MAX_DAY_PIXELS / self._fit_time_scale())
+        self.current_scale = min(max_zoom, max(1.0, self.current_scale * factor))
+        self._update_scrollregion()
+        total_width = self.padding * 2 + self.max_days * self._get_time_scale()
+        left = self.padding + day * self._get_time_scale() - anchor_x
+        self.canvas.xview_moveto(max(0.0, left) / total_width)
+        self._render_viewport()
 
     def _on_canvas_configure(self, event):
         """Handle canvas resize events."""
+        if not self.data:
+            return
         self._calculate_dynamic_layout()
         self._redraw()
 
     def _on_mousewheel(self, event):
-        """Handle mouse wheel scrolling."""
+        """Handle mouse wheel scrolling, and zooming with Control held."""
+        if event.state & 0x0004:
+            self.zoom(1.25 ** (event.delta / 120), event.x)
+            return
+        
         # Vertical scrolling
         self.canvas.yview_scroll(-1 * (event.delta // 120), "units")
         
@@ -339,22 +523,17 @@ class GanttChart(Chart):
     def _on_hover(self, event):
         """Handle hover events for task highlighting and tooltips.
         
+        The task is found from the row under the cursor, so hovering costs
+        the same for any number of tasks.
+        
         Requirements: 7.2
         """
         try:
             x, y = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
-            task_id = self.canvas.find_overlapping(x, y, x, y)
-            
-            if task_id and 'task' in self.canvas.gettags(task_id[0]):
-                tags = self.canvas.gettags(task_id[0])
-                # Find the task index tag
-                for tag in tags:
-                    if tag.startswith('task_'):
-                        idx = int(tag.split('_')[1])
-                        if 0 <= idx < len(self.data):
-                            self._highlight_task(idx)
-                            self._show_tooltip(x, y, idx)
-                        break
+            idx = self._task_at(x, y)
+            if idx is not None:
+                self._highlight_task(idx)
+                self._show_tooltip(x, y, idx)
             else:
                 self._clear_highlights()
                 self._hide_tooltip()
@@ -363,33 +542,62 @@ class GanttChart(Chart):
         except Exception as e:
             logger.warning(f"Error in Gantt hover: {e}")
 
+    def _on_leave(self, event):
+        """Drop the highlight and tooltip when the pointer leaves the canvas."""
+        self._clear_highlights()
+        self._hide_tooltip()
+
+    def _task_at(self, x: float, y: float) -> Optional[int]:
+        """Index of the task bar at canvas coordinates (x, y), if any."""
+        row_height = self.bar_height + self.bar_spacing
+        idx = int((y - self.padding) // row_height)
+        if not 0 <= idx < len(self.data):
+            return None
+        x_start, x_end, top = self._task_geometry(idx, self._get_time_scale())
+        if x_start <= x <= x_end and top <= y <= top + self.bar_height:
+            return idx
+        return None
+
+    def _set_bar_outline(self, idx, highlighted: bool):
+        """Restyle a rendered bar, keeping its pool entry in sync."""
+        entry = self._bar_entries.get(idx)
+        if entry is None:
+            return
+        options = dict(entry[2],
+                       outline=self.style.ACCENT if highlighted else self.style.BACKGROUND,
+                       width=2 if highlighted else 1)
+        if options != entry[2]:
+            self.canvas.itemconfig(entry[0], outline=options['outline'], width=options['width'])
+            entry[2] = options
+
     def _highlight_task(self, idx):
         """Highlight a task bar."""
-        self.canvas.itemconfig(f'task_{idx}', outline=self.style.ACCENT, width=2)
+        if idx != self._highlighted:
+            self._clear_highlights()
+        self._highlighted = idx
+        self._set_bar_outline(idx, True)
 
     def _clear_highlights(self):
-        """Clear all task highlights."""
-        for item in self.canvas.find_withtag('task'):
-            self.canvas.itemconfig(item, outline=self.style.BACKGROUND, width=1)
+        """Clear the task highlight."""
+        if self._highlighted is not None:
+            self._set_bar_outline(self._highlighted, False)
+            self._highlighted = None
 
     def _show_tooltip(self, x, y, idx):
-        """Show a tooltip for a task."""
+        """Show a tooltip for a task, moving the pooled overlay items."""
         task, start, duration = self.data[idx]
         end = start + duration
         tooltip_text = f"{task}\nStart: {start}\nEnd: {end}\nDuration: {duration}"
         
-        self.canvas.delete('tooltip')
-        self.canvas.create_rectangle(
-            x + 15, y - 15, x + 200, y + 40,
-            fill=self.style.BACKGROUND, outline=self.style.ACCENT,
-            tags='tooltip'
+        self.show_overlay(
+            'tooltip_bg', 'rectangle', (x + 15, y - 15, x + 200, y + 40),
+            fill=self.style.BACKGROUND, outline=self.style.ACCENT
         )
-        self.canvas.create_text(
-            x + 20, y - 10, text=tooltip_text,
-            anchor='nw', fill=self.style.TEXT,
-            font=self.style.TOOLTIP_FONT, tags='tooltip'
+        self.show_overlay(
+            'tooltip_text', 'text', (x + 20, y - 10), text=tooltip_text,
+            anchor='nw', fill=self.style.TEXT, font=self.style.TOOLTIP_FONT
         )
 
     def _hide_tooltip(self):
-        """Hide the tooltip."""
-        self.canvas.delete('tooltip')
\ No newline at end of file
+        """Hide the tooltip, keeping its items for the next hover."""
+        self.hide_overlays()
\ No newline at end of file
@@ -21,6 +21,8 @@ import math
 import logging
 from .core import Chart, ChartStyle
 from .validation import DataValidator
+from .colormap import Colormap
+from .tiles import POOLING_METHODS, TiledMatrix
 
 logger = logging.getLogger('ChartForgeTK')
 
@@ -31,12 +33,40 @@ class HeatMap(Chart):
     
     Requirements: 1.1, 1.2, 1.3, 2.1, 2.2, 3.1, 3.2, 3.6, 9.1, 9.2
     """
+
+    # 'auto' rendering switches from one rectangle per cell to a single
+    # PhotoImage above this many cells
+    RASTER_CELL_THRESHOLD = 2500
+    # Minimum spacing in pixels between axis labels in raster mode
+    RASTER_LABEL_SPACING = 14
+    # Number of entries in the color lookup table built from color_scale
+    COLORMAP_SIZE = 1024
+    # 'auto' switches to the tiled, zoomable viewport above this many cells
+    TILED_CELL_THRESHOLD = 250000
+    # Tile edge in cells and LRU bound on cached tiles in tiled mode
+    TILE_SIZE = 256
+    TILE_CACHE_SIZE = 64
+    # Wheel zoom factor and the fewest cells a zoomed-in viewport may span
+    ZOOM_FACTOR = 1.25
+    MIN_VISIBLE_CELLS = 2
     
     def __init__(self, parent=None, width: int = 800, height: int = 600, display_mode='frame', theme='light', palette='modern'):
         super().__init__(parent, width=width, height=height, display_mode=display_mode, theme=theme, palette=palette)
         self.cell_padding = 2
         self.interactive_cells = {}
         self._hover_tag = None
+        self._raster_image = None  # Keeps the PhotoImage alive while shown
+        self._raster_grid = None   # (x0, y0, cell_width, cell_height) in raster mode
+        self.render_mode = 'vector'
+        self._colormap = None
+        self._colormap_key = None
+        self._tiles = None          # TiledMatrix in tiled mode
+        self._view = None           # [row0, col0, rows, cols] visible in tiled mode
+        self._tile_area = None      # (x0, y0, width, height) of the viewport image
+        self._tile_range = (0.0, 1.0)
+        self._tile_render_id = None
+        self._pan_start = None
+        self._zoom_pan_bound = False
         self.color_scale = [
             "#053061",  # Dark blue
             "#2166ac",  # Blue
@@ -52,18 +82,29 @@ class HeatMap(Chart):
     def plot(self, data: List[List[float]], 
             row_labels: Optional[List[str]] = None,
             col_labels: Optional[List[str]] = None,
-            title: Optional[str] = None):
+            title: Optional[str] = None,
+            render: str = 'auto',
+            pooling: str = 'mean'):
         """Plot a heatmap.
         
         Args:
-            data: 2D list of values to plot
+            data: 2D list of values to plot, or a 2D NumPy array (a
+                numpy.memmap is read lazily in tiled mode and never copied)
             row_labels: Optional list of row labels
             col_labels: Optional list of column labels
             title: Optional title for the heatmap
+            render: 'vector' (one canvas rectangle per cell), 'raster' (one
+                PhotoImage for the whole matrix), 'tiled' (zoomable viewport
+                that only renders visible tiles) or 'auto' (tiled for arrays
+                and above TILED_CELL_THRESHOLD cells, raster above
+                RASTER_CELL_THRESHOLD cells, vector otherwise)
+            pooling: How tiled mode aggregates cells when zoomed out,
+                'mean' or 'max'
             
         Raises:
             TypeError: If data is None or contains non-numeric values
-            ValueError: If data is empty or has inconsistent row lengths
+            ValueError: If data is empty, has inconsistent row lengths or
+                render is unknown
             
         Requirements: 1.1, 1.2, 1.3, 2.1, 2.2, 3.1, 3.2, 3.6, 9.1, 9.2, 9.3, 9.4
         """
@@ -74,15 +115,46 @@ class HeatMap(Chart):
                 "Please provide a 2D list of numeric values."
             )
         
+        if render not in ('auto', 'vector', 'raster', 'tiled'):
+            raise ValueError(
+                f"[ChartForgeTK] Error: render must be 'auto', 'vector', 'raster' or 'tiled', "
+                f"got {render!r}."
+            )
+        if pooling not in POOLING_METHODS:
+            raise ValueError(
+                f"[ChartForgeTK] Error: pooling must be one of {list(POOLING_METHODS)}, "
+                f"got {pooling!r}."
+            )
+        
+        # NumPy arrays are only checked for shape and dtype here; tiled mode
+        # scans their values in chunks (Requirements: 1.3)
+        np = DataValidator._get_numpy()
+        is_array = np is not None and isinstance(data, np.ndarray)
+        if is_array:
+            if data.ndim != 2 or data.size == 0:
+                raise ValueError(
+                    f"[ChartForgeTK] Error: data must be a non-empty 2D array, "
+                    f"got shape {data.shape}."
+                )
+            if not np.issubdtype(data.dtype, np.number):
+                raise TypeError(
+                    f"[ChartForgeTK] Error: data must hold numbers, got dtype {data.dtype}."
+                )
+            if render not in ('auto', 'tiled'):
+                data = data.tolist()
+                is_array = False
+        
         # Validate data is a list (Requirements: 1.3)
-        if not isinstance(data, (list, tuple)):
+        if is_array:
+            pass
+        elif not isinstance(data, (list, tuple)):
             raise TypeError(
                 f"[ChartForgeTK] Error: data must be a 2D list, "
                 f"got {type(data).__name__}."
             )
         
         # Validate data is not empty (Requirements: 1.2)
-        if not data or not data[0]:
+        if not is_array and (not data or not data[0]):
             raise ValueError(
                 "[ChartForgeTK] Error: data cannot be empty. "
                 "Please provide a non-empty 2D list of numeric values."
@@ -90,7 +162,7 @@ class HeatMap(Chart):
         
         # Validate each row is a list and has consistent length
         num_cols = len(data[0])
-        for i, row in enumerate(data):
+        for i, row in enumerate(() if is_array else data):
             if not isinstance(row, (list, tuple)):
                 raise TypeError(
                     f"[ChartForgeTK] Error: data[{i}] must be a list, "
@@ -119,6 +191,23 @@ class HeatMap(Chart):
                         f"Infinite values are not allowed."
                     )
         
+        # Create copies for immutability (Requirements: 9.1, 9.2)
+        # Arrays are kept by reference so large memory-mapped matrices are
+        # not loaded
+        matrix = data if is_array else [[float(val) for val in row] for row in data]
+        num_rows = len(matrix)
+        
+        # Tiled mode scans array values for NaN and infinity here, before the
+        # previous chart is cleared (Requirements: 1.3)
+        if render == 'auto' and (is_array or num_rows * num_cols > self.TILED_CELL_THRESHOLD):
+            render = 'tiled'
+        tiles = None
+        if render == 'tiled':
+            tiles = TiledMatrix(
+                matrix, tile_size=self.TILE_SIZE, pooling=pooling, max_tiles=self.TILE_CACHE_SIZE
+            )
+            tile_range = tiles.value_range()
+        
         # Cancel pending animations before redrawing (Requirements: 3.2, 3.6)
         self.resource_manager.cancel_animations()
         
@@ -127,13 +216,14 @@ class HeatMap(Chart):
         
         self.clear()
         self.interactive_cells.clear()
+        self._raster_image = None
+        self._raster_grid = None
+        self._hover_tag = None
+        self._cancel_tile_render()
+        self._tiles = None
+        self._view = None
         
-        # Create copies for immutability (Requirements: 9.1, 9.2)
-        # Store internal copy of data
-        self._data = [[float(val) for val in row] for row in data]
-        
-        num_rows = len(self._data)
-        num_cols = len(self._data[0])
+        self._data = matrix
         
         # Handle edge case: single data point (Requirements: 2.1)
         if num_rows == 1 and num_cols == 1:
@@ -173,6 +263,11 @@ class HeatMap(Chart):
         if title:
             self.title = str(title)
         
+        if render == 'tiled':
+            self.render_mode = render
+            self._plot_tiled(tiles, tile_range)
+            return
+        
         # Find data range for color scaling
         all_values = [val for row in self._data for val in row]
         data_min = min(all_values)
@@ -182,14 +277,26 @@ class HeatMap(Chart):
         if data_min == data_max:
             logger.debug(f"All heatmap values identical ({data_min}), using default color range")
         
+        if render == 'auto':
+            render = 'raster' if num_rows * num_cols > self.RASTER_CELL_THRESHOLD else 'vector'
+        self.render_mode = render
+        
         # Calculate cell size
         available_width = self.width - 2 * self.padding - 100  # Extra space for labels
         available_height = self.height - 2 * self.padding - 100  # Extra space for labels
         cell_width = available_width / num_cols
         cell_height = available_height / num_rows
         
+        # In raster mode cells can be thinner than text; skip labels that would overlap
+        col_step = row_step = 1
+        if render == 'raster':
+            col_step = max(1, math.ceil(self.RASTER_LABEL_SPACING / cell_width))
+            row_step = max(1, math.ceil(self.RASTER_LABEL_SPACING / cell_height))
+        
         # Draw column labels
         for j, label in enumerate(self._col_labels):
+            if j % col_step:
+                continue
             x = self.padding + 100 + j * cell_width + cell_width/2
             y = self.padding + 50
             self.canvas.create_text(
@@ -202,6 +309,8 @@ class HeatMap(Chart):
         
         # Draw row labels
         for i, label in enumerate(self._row_labels):
+            if i % row_step:
+                continue
             x = self.padding + 80
             y = self.padding + 100 + i * cell_height + cell_height/2
             self.canvas.create_text(
@@ -212,15 +321,20 @@ class HeatMap(Chart):
                 anchor='e'
             )
         
+        if render == 'raster':
+            self._draw_raster(self.padding + 100, self.padding + 100,
+                              available_width, available_height, data_min, data_max)
+            self._draw_color_scale(data_min, data_max)
+            self._add_raster_interactivity()
+            return
+        
         # Draw cells
         for i in range(num_rows):
             for j in range(num_cols):
                 value = self._data[i][j]
                 
                 # Calculate color based on value
-                color_idx = (value - data_min) / (data_max - data_min) if data_max != data_min else 0.5
-                color_idx = min(1.0, max(0.0, color_idx))  # Clamp to [0, 1]
-                color = self._get_color(color_idx)
+                color = self._value_color(value, data_min, data_max)
                 
                 # Calculate cell position
                 x1 = self.padding + 100 + j * cell_width
@@ -251,30 +365,343 @@ class HeatMap(Chart):
         self._draw_color_scale(data_min, data_max)
         self._add_interactivity()
     
+    def _get_colormap(self) -> Colormap:
+        """Return the lookup table for color_scale, rebuilding it if color_scale changed."""
+        colors = tuple(self.color_scale)
+        if self._colormap is None or self._colormap_key != colors:
+            try:
+                self._colormap = Colormap(colors, self.COLORMAP_SIZE)
+            except ValueError as e:
+                logger.warning(f"Invalid HeatMap color_scale, using the theme primary color: {e}")
+                self._colormap = Colormap([self.style.PRIMARY], self.COLORMAP_SIZE)
+            self._colormap_key = colors
+        return self._colormap
+
+    def _value_color(self, value: float, data_min: float, data_max: float) -> str:
+        """Get the color of a data value within [data_min, data_max]."""
+        color_idx = (value - data_min) / (data_max - data_min) if data_max != data_min else 0.5
+        return self._get_colormap().color(color_idx)
+
+    def _draw_raster(self, x0: float, y0: float, width: float, height: float,
+                     data_min: float, data_max: float):
+        """Draw the matrix as one PhotoImage filled with a single put() call.
+
+        Every image pixel takes the color of the cell under it, so matrices
+        larger than the plot area are sampled (nearest cell) rather than
+        turned into sub-pixel canvas items.
+        """
+        num_rows = len(self._data)
+        num_cols = len(self._data[0])
+        img_width = max(1, int(round(width)))
+        img_height = max(1, int(round(height)))
+
+        # Cell column shown by each pixel column; colors are only computed for these
+        pixel_cols = [min(num_cols - 1, px * num_cols // img_width) for px in range(img_width)]
+        sampled_cols = sorted(set(pixel_cols))
+
+        # Matrix row shown by each pixel row
+        pixel_rows = [min(num_rows - 1, py * num_rows // img_height) for py in range(img_height)]
+        sampled_rows = sorted(set(pixel_rows))
+
+        colormap = self._get_colormap()
+        np = DataValidator._get_numpy()
+        if np is not None:
+            # One lookup for every sampled cell at once
+            block = np.array([self._data[i] for i in sampled_rows], dtype=np.float64)[:, pixel_cols]
+            hex_rows = colormap.map_array(block, data_min, data_max)
+            row_strings = {i: '{' + ' '.join(hex_rows[k]) + '}' for k, i in enumerate(sampled_rows)}
+        else:
+            row_strings = {}
+            for i in sampled_rows:
+                values = self._data[i]
+                colors = {j: self._value_color(values[j], data_min, data_max) for j in sampled_cols}
+                row_strings[i] = '{' + ' '.join(colors[j] for j in pixel_cols) + '}'
+        rows = [row_strings[i] for i in pixel_rows]
+
+        image = tk.PhotoImage(master=self.canvas, width=img_width, height=img_height)
+        image.put(' '.join(rows))
+        self.canvas.create_image(x0, y0, image=image, anchor='nw', tags=('cells',))
+        self._raster_image = image
+        self._raster_grid = (x0, y0, width / num_cols, height / num_rows)
+
+    def _cell_at(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """Map a canvas position to (row, col) in raster or tiled mode, or None outside the matrix."""
+        if self._view is not None:
+            x0, y0, width, height = self._tile_area
+            row0, col0, rows, cols = self._view
+            if not (x0 <= x < x0 + width and y0 <= y < y0 + height):
+                return None
+            row = math.floor(row0 + (y - y0 + 0.5) * rows / height)
+            col = math.floor(col0 + (x - x0 + 0.5) * cols / width)
+        elif self._raster_grid is not None:
+            x0, y0, cell_width, cell_height = self._raster_grid
+            col = math.floor((x - x0) / cell_width)
+            row = math.floor((y - y0) / cell_height)
+        else:
+            return None
+        if 0 <= row < len(self._data) and 0 <= col < len(self._data[0]):
+            return row, col
+        return None
+
+    def _cell_bounds(self, row: int, col: int) -> Tuple[float, float, float, float]:
+        """Canvas rectangle (x1, y1, x2, y2) of a cell in raster or tiled mode."""
+        if self._view is not None:
+            x0, y0, width, height = self._tile_area
+            row0, col0, rows, cols = self._view
+            cell_width, cell_height = width / cols, height / rows
+            x1 = x0 + (col - col0) * cell_width
+            y1 = y0 + (row - row0) * cell_height
+        else:
+            x0, y0, cell_width, cell_height = self._raster_grid
+            x1 = x0 + col * cell_width
+            y1 = y0 + row * cell_height
+        return x1, y1, x1 + max(cell_width, 1), y1 + max(cell_height, 1)
+
+    def _add_raster_interactivity(self):
+        """Hover for raster and tiled mode: pointer position maps to a cell arithmetically.
+
+        Requirements: 3.5, 7.2
+        """
+        def on_motion(event):
+            cell = self._cell_at(event.x, event.y)
+            if cell is None:
+                self.hide_overlays()
+                return
+            row, col = cell
+            x1, y1, x2, y2 = self._cell_bounds(row, col)
+            self.show_overlay(
+                'cell_highlight', 'rectangle', (x1, y1, x2, y2),
+                outline=self.style.ACCENT, width=2
+            )
+
+            tooltip_x = (x1 + x2) / 2
+            tooltip_y = y1 - 5
+            self.show_overlay(
+                'tooltip_bg', 'rectangle',
+                (tooltip_x - 70, tooltip_y - 44, tooltip_x + 70, tooltip_y - 5),
+                fill=self.style.BACKGROUND, outline=self.style.ACCENT, width=1
+            )
+            self.show_overlay(
+                'tooltip_text', 'text', (tooltip_x, tooltip_y - 24),
+                text=f"{self._row_labels[row]}, {self._col_labels[col]}\n"
+                     f"Value: {float(self._data[row][col]):.2f}",
+                anchor='center', fill=self.style.TEXT, font=self.style.TOOLTIP_FONT
+            )
+
+        def on_leave(event):
+            self.hide_overlays()
+
+        self.bind_hover(on_motion, on_leave)
+
+    def _plot_tiled(self, tiles: TiledMatrix, value_range: Tuple[float, float]):
+        """Set up tiled mode: a viewport image that only renders the visible tiles.
+
+        Args:
+            tiles: Tiled view of the validated data
+            value_range: Minimum and maximum of the data, already scanned
+
+        Requirements: 2.2, 3.5
+        """
+        self._tiles = tiles
+        data_min, data_max = value_range
+        if data_min == data_max:
+            logger.debug(f"All heatmap values identical ({data_min}), using default color range")
+        self._tile_range = (data_min, data_max)
+
+        x0 = y0 = self.padding + 100
+        width = max(1, int(round(self.width - 2 * self.padding - 100)))
+        height = max(1, int(round(self.height - 2 * self.padding - 100)))
+        self._tile_area = (x0, y0, width, height)
+        self._view = [0.0, 0.0, float(self._tiles.rows), float(self._tiles.cols)]
+
+        self._raster_image = tk.PhotoImage(master=self.canvas, width=width, height=height)
+        self.canvas.create_image(x0, y0, image=self._raster_image, anchor='nw', tags=('cells',))
+        self._draw_color_scale(data_min, data_max)
+        self._render_tiles()
+        self._add_raster_interactivity()
+        self._add_zoom_pan()
+
+    def _render_tiles(self):
+        """Fill the viewport image from the tiles of the level matching the zoom."""
+        self._tile_render_id = None
+        if self._tiles is None:
+            return
+        tiles = self._tiles
+        x0, y0, width, height = self._tile_area
+        row0, col0, rows, cols = self._view
+
+        # Coarsest level that still has at least one pooled cell per pixel
+        cells_per_pixel = max(rows / height, cols / width)
+        level = 0
+        if cells_per_pixel > 1:
+            level = min(tiles.max_level, int(math.log2(cells_per_pixel)))
+        factor = 1 << level
+        level_rows, level_cols = tiles.level_shape(level)
+
+        pixel_rows = [min(level_rows - 1, int(row0 + (py + 0.5) * rows / height) // factor)
+                      for py in range(height)]
+        pixel_cols = [min(level_cols - 1, int(col0 + (px + 0.5) * cols / width) // factor)
+                      for px in range(width)]
+        r0, c0 = pixel_rows[0], pixel_cols[0]
+        block = tiles.region(level, r0, pixel_rows[-1] + 1, c0, pixel_cols[-1] + 1)
+
+        colormap = self._get_colormap()
+        data_min, data_max = self._tile_range
+        sampled_rows = sorted(set(pixel_rows))
+        local_cols = [c - c0 for c in pixel_cols]
+        np = DataValidator._get_numpy()
+        if np is not None:
+            hex_rows = colormap.map_array(block[[r - r0 for r in sampled_rows]][:, local_cols],
+                                          data_min, data_max)
+            row_strings = {r: '{' + ' '.join(hex_rows[k]) + '}' for k, r in enumerate(sampled_rows)}
+        else:
+            row_strings = {}
+            for r in sampled_rows:
+                values = block[r - r0]
+                row_strings[r] = '{' + ' '.join(
+                    self._value_color(values[c], data_min, data_max) for c in local_cols) + '}'
+        self._raster_image.put(' '.join(row_strings[r] for r in pixel_rows))
+        self._draw_tile_labels()
+
+    def _draw_tile_labels(self):
+        """Draw the row and column labels of the visible part of the matrix."""
+        self.canvas.delete('tile_label')
+        x0, y0, width, height = self._tile_area
+        row0, col0, rows, cols = self._view
+        cell_width, cell_height = width / cols, height / rows
+
+        col_step = max(1, math.ceil(self.RASTER_LABEL_SPACING / cell_width))
+        first = math.floor(col0) // col_step * col_step
+        for j in range(first, min(len(self._col_labels), math.ceil(col0 + cols)), col_step):
+            x = x0 + (j + 0.5 - col0) * cell_width
+            if x0 <= x <= x0 + width:
+                label = self._col_labels[j]
+                self.canvas.create_text(
+                    x, self.padding + 50, text=label, fill=self.style.TEXT,
+                    font=self.style.LABEL_FONT, angle=45 if len(label) > 3 else 0,
+                    tags=('tile_label',)
+                )
+
+        row_step = max(1, math.ceil(self.RASTER_LABEL_SPACING / cell_height))
+        first = math.floor(row0) // row_step * row_step
+        for i in range(first, min(len(self._row_labels), math.ceil(row0 + rows)), row_step):
+            y = y0 + (i + 0.5 - row0) * cell_height
+            if y0 <= y <= y0 + height:
+                self.canvas.create_text(
+                    self.padding + 80, y, text=self._row_labels[i], fill=self.style.TEXT,
+                    font=self.style.LABEL_FONT, anchor='e', tags=('tile_label',)
+                )
+
+    def _schedule_tile_render(self):
+        """Render the viewport on the next frame, once for any number of zoom/pan events."""
+        if self._tile_render_id is not None:
+            return
+        try:
+            self._tile_render_id = self.after(self.HOVER_FRAME_MS, self._render_tiles)
+            self.resource_manager.register_animation(self._tile_render_id)
+        except tk.TclError:
+            self._tile_render_id = None
+
+    def _finish_pending_render(self):
+        """Render a scheduled viewport update right away."""
+        if self._tile_render_id is not None:
+            self._cancel_tile_render()
+            self._render_tiles()
+        super()._finish_pending_render()
+
+    def _cancel_tile_render(self):
+        """Drop a scheduled viewport render."""
+        if self._tile_render_id is not None:
+            try:
+                self.after_cancel(self._tile_render_id)
+            except tk.TclError:
+                pass
+            self._tile_render_id = None
+
+    def _clamp_view(self):
+        """Keep the viewport inside the matrix."""
+        view = self._view
+        view[2] = min(float(self._tiles.rows), view[2])
+        view[3] = min(float(self._tiles.cols), view[3])
+        view[0] = max(0.0, min(self._tiles.rows - view[2], view[0]))
+        view[1] = max(0.0, min(self._tiles.cols - view[3], view[1]))
+
+    def zoom(self, factor: float, x: Optional[float] = None, y: Optional[float] = None):
+        """Zoom the tiled viewport around a canvas point (its center by default).
+
+        Args:
+            factor: Values above 1 zoom in, below 1 zoom out
+            x, y: Canvas position that stays fixed
+        """
+        if self._view is None or factor <= 0:
+            return
+        x0, y0, width, height = self._tile_area
+        fx = 0.5 if x is None else min(1.0, max(0.0, (x - x0) / width))
+        fy = 0.5 if y is None else min(1.0, max(0.0, (y - y0) / height))
+        row0, col0, rows, cols = self._view
+
+        new_rows = max(min(self.MIN_VISIBLE_CELLS, self._tiles.rows), rows / factor)
+        new_cols = max(min(self.MIN_VISIBLE_CELLS, self._tiles.cols), cols / factor)
+        self._view = [row0 + fy * (rows - new_rows), col0 + fx * (cols - new_cols), new_rows, new_cols]
+        self._clamp_view()
+        self.hide_overlays()
+        self._schedule_tile_render()
+
+    def _add_zoom_pan(self):
+        """Bind wheel zoom and drag pan for tiled mode, once per chart.
+
+        The handlers do nothing while no tiled viewport is shown.
+
+        Requirements: 3.5
+        """
+        if self._zoom_pan_bound:
+            return
+        self._zoom_pan_bound = True
+
+        def on_wheel(event, direction=None):
+            if direction is None:
+                direction = 1 if event.delta > 0 else -1
+            self.zoom(self.ZOOM_FACTOR if direction > 0 else 1 / self.ZOOM_FACTOR, event.x, event.y)
+
+        def on_press(event):
+            if self._view is not None and self._cell_at(event.x, event.y) is not None:
+                self._pan_start = (event.x, event.y, self._view[0], self._view[1])
+
+        def on_drag(event):
+            if self._pan_start is None or self._view is None:
+                return
+            start_x, start_y, row0, col0 = self._pan_start
+            _, _, width, height = self._tile_area
+            self._view[0] = row0 - (event.y - start_y) * self._view[2] / height
+            self._view[1] = col0 - (event.x - start_x) * self._view[3] / width
+            self._clamp_view()
+            self.hide_overlays()
+            self._schedule_tile_render()
+
+        def on_release(event):
+            self._pan_start = None
+
+        bindings = [
+            ('<MouseWheel>', on_wheel),
+            ('<Button-4>', lambda e: on_wheel(e, 1)),
+            ('<Button-5>', lambda e: on_wheel(e, -1)),
+            ('<ButtonPress-1>', on_press),
+            ('<B1-Motion>', on_drag),
+            ('<ButtonRelease-1>', on_release),
+        ]
+        for sequence, handler in bindings:
+            # Added next to the base class bindings, such as the <Button-1>
+            # click handler, instead of replacing them
+            func_id = self.canvas.bind(sequence, handler, add='+')
+            self.resource_manager.register_binding(self.canvas, sequence, func_id)
+
     def _get_color(self, value: float) -> str:
-        """Get color for a value in [0, 1]."""
+        """Get color for a value in [0, 1] from the color lookup table."""
         if value >= 1.0:
             return self.color_scale[-1]
         elif value <= 0.0:
             return self.color_scale[0]
-        
-        idx = value * (len(self.color_scale) - 1)
-        low_idx = int(idx)
-        high_idx = min(low_idx + 1, len(self.color_scale) - 1)
-        fraction = idx - low_idx
-        
-        try:
-            # Interpolate between colors
-            low_color = self._hex_to_rgb(self.color_scale[low_idx])
-            high_color = self._hex_to_rgb(self.color_scale[high_idx])
-            
-            r = int(low_color[0] + fraction * (high_color[0] - low_color[0]))
-            g = int(low_color[1] + fraction * (high_color[1] - low_color[1]))
-            b = int(low_color[2] + fraction * (high_color[2] - low_color[2]))
-            
-            return f'#{r:02x}{g:02x}{b:02x}'
-        except Exception:
-            return self.color_scale[0]  # Fallback to first color
+        return self._get_colormap().color(value)
     
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple."""
@@ -21,6 +21,7 @@ from tkinter import ttk, filedialog
 import math
 import logging
 from .core import Chart, ChartStyle
+from .animation import Tween
 from .validation import DataValidator
 
 logger = logging.getLogger('ChartForgeTK')
@@ -133,7 +134,7 @@ class Histogram(Chart):
         self._add_padding()
         self._set_labels()
         
-        self.canvas.delete('all')
+        self.clear_layer('data')
         self.bars.clear()
         
         self._draw_axes(self.x_min, self.x_max, self.y_min, self.y_max)
@@ -254,77 +255,45 @@ class Histogram(Chart):
         
         Requirements: 3.2, 3.6
         """
-        def ease(t):
-            return t * t * (3 - 2 * t)
-        
         # Handle edge case: single bin (Requirements: 2.1)
         if self.bins == 1:
             bar_width = (self.width - 2 * self.padding) / 2  # Center the single bar
         else:
             bar_width = (self.width - 2 * self.padding) / self.bins 
         
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
-            
-            progress = ease(frame / total_frames)
-            
-            # Clear previous bars
-            for item in self.bars:
-                try:
-                    self.canvas.delete(item)
-                except tk.TclError:
-                    pass
-            self.bars.clear()
-            
-            for i, freq in enumerate(self.frequencies):
-                x_left = self._data_to_pixel_x(self.bin_edges[i], self.x_min, self.x_max)
-                x_right = self._data_to_pixel_x(self.bin_edges[i + 1], self.x_min, self.x_max)
-                y_base = self._data_to_pixel_y(self.y_min, self.y_min, self.y_max)
-                y_top = self._data_to_pixel_y(freq, self.y_min, self.y_max)
-                y_current = y_base - (y_base - y_top) * progress
-                
-                color = self.style.get_histogram_color(i, self.bins)
-                
-                # Draw bar even if freq is 0 (will be zero-height) (Requirements: 2.4)
-                if freq > 0:
-                    try:
-                        bar = self.canvas.create_rectangle(
-                            x_left, y_current,
-                            x_right, y_base,
-                            fill=color,
-                            outline="",  # Remove the outline to make bars contiguous
-                            tags=('bar', f'bar_{i}')
-                        )
-                        self.bars.append(bar)
-                    except tk.TclError:
-                        pass
-                
-                    if progress == 1 and freq > 0:
-                        try:
-                            label = self.canvas.create_text(
-                                (x_left + x_right) / 2, y_top - 10,
-                                text=f"{freq}",
-                                font=self.style.VALUE_FONT,
-                                fill=self.style.TEXT,
-                                anchor='s',
-                                tags=('label', f'bar_{i}')
-                            )
-                            self.bars.append(label)
-                        except tk.TclError:
-                            pass
-            
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                self.resource_manager.register_animation(after_id)
-        
-        total_frames = self.animation_duration // 16
-        update_animation(0, total_frames)
+        self.bars.clear()
+        y_base = self._data_to_pixel_y(self.y_min, self.y_min, self.y_max)
+        tweens = []
+        tops = []
+        for i, freq in enumerate(self.frequencies):
+            # Zero-frequency bins get no bar (Requirements: 2.4)
+            if freq <= 0:
+                continue
+            x_left = self._data_to_pixel_x(self.bin_edges[i], self.x_min, self.x_max)
+            x_right = self._data_to_pixel_x(self.bin_edges[i + 1], self.x_min, self.x_max)
+            y_top = self._data_to_pixel_y(freq, self.y_min, self.y_max)
+            bar = self.canvas.create_rectangle(
+                x_left, y_base, x_right, y_base,
+                fill=self.style.get_histogram_color(i, self.bins),
+                outline="",  # Remove the outline to make bars contiguous
+                tags=('bar', f'bar_{i}')
+            )
+            self.bars.append(bar)
+            tweens.append(Tween(bar, (x_left, y_base, x_right, y_base), (x_left, y_top, x_right, y_base)))
+            tops.append((i, freq, (x_left + x_right) / 2, y_top))
+        
+        def add_labels():
+            for i, freq, x, y_top in tops:
+                self.bars.append(self.canvas.create_text(
+                    x, y_top - 10,
+                    text=f"{freq}",
+                    font=self.style.VALUE_FONT,
+                    fill=self.style.TEXT,
+                    anchor='s',
+                    tags=('label', f'bar_{i}')
+                ))
+        
+        self.animate(tweens, on_complete=add_labels)
 
     def _add_interactive_effects(self):
         """
@@ -378,25 +347,13 @@ class Histogram(Chart):
                     y_base = self._data_to_pixel_y(self.y_min, self.y_min, self.y_max)
                     y_top = self._data_to_pixel_y(self.frequencies[bar_index], self.y_min, self.y_max)
                     
-                    # Remove previous highlight
-                    if self.current_highlight:
-                        try:
-                            self.canvas.delete(self.current_highlight)
-                        except tk.TclError:
-                            pass
-                    
-                    # Create highlight effect
-                    try:
-                        highlight = self.canvas.create_rectangle(
-                            x_left - 2, y_top - 2,
-                            x_right + 2, y_base + 2,
-                            outline=self.style.ACCENT,
-                            width=2,
-                            tags=('highlight',)
-                        )
-                        self.current_highlight = highlight
-                    except tk.TclError:
-                        self.current_highlight = None
+                    # Move the pooled highlight onto the bar
+                    self.current_highlight = self.show_overlay(
+                        'highlight', 'rectangle',
+                        (x_left - 2, y_top - 2, x_right + 2, y_base + 2),
+                        outline=self.style.ACCENT,
+                        width=2
+                    )
                     
                     # Update tooltip
                     try:
@@ -407,12 +364,8 @@ class Histogram(Chart):
                     except tk.TclError:
                         pass  # Tooltip may have been destroyed
                 else:
-                    if self.current_highlight:
-                        try:
-                            self.canvas.delete(self.current_highlight)
-                        except tk.TclError:
-                            pass
-                        self.current_highlight = None
+                    self.hide_overlay('highlight')
+                    self.current_highlight = None
                     try:
                         tooltip.withdraw()
                     except tk.TclError:
@@ -420,22 +373,15 @@ class Histogram(Chart):
         
         def on_leave(event):
             """Handle mouse leave events"""
-            if self.current_highlight:
-                try:
-                    self.canvas.delete(self.current_highlight)
-                except tk.TclError:
-                    pass
-                self.current_highlight = None
+            self.hide_overlay('highlight')
+            self.current_highlight = None
             try:
                 tooltip.withdraw()
             except tk.TclError:
                 pass
         
         # Bind events and register with resource manager (Requirements: 3.5)
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
+        self.bind_hover(on_motion, on_leave)
     def _add_statistics(self):
         """
         Display statistical information with edge case handling.
@@ -496,7 +442,8 @@ class Histogram(Chart):
 
     def _redraw(self):
         """Redraw the histogram with the current zoom and pan settings"""
-        self.canvas.delete('all')
+        self.animator.cancel()
+        self.clear_layer('data')
         self._draw_axes(self.x_min * self.zoom_level + self.pan_offset, self.x_max * self.zoom_level + self.pan_offset, self.y_min, self.y_max)
         self._animate_bars()
 
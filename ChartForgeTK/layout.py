@@ -0,0 +1,337 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Force-directed layout module for ChartForgeTK.
+
+Implements the Fruchterman-Reingold model used by NetworkGraph (repulsion
+k²/d between every pair of nodes, attraction d²/k along edges) over flat,
+index-based coordinate arrays. Repulsion can be computed exactly or
+approximated so that large graphs settle in reasonable time:
+
+    - 'exact': all pairs, O(n²) per iteration
+    - 'barnes_hut': quadtree approximation, O(n log n) per iteration
+    - 'grid': only nodes in neighbouring cells of a 2k grid repel, O(n)
+
+Each iteration moves nodes by at most the current temperature, which cools
+geometrically; the layout stops once the largest move falls below a
+tolerance or the iteration limit is reached.
+"""
+
+import math
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('ChartForgeTK')
+
+LAYOUT_METHODS = ('exact', 'barnes_hut', 'grid')
+
+# 'auto' switches from the exact O(n²) repulsion to the grid above this size
+AUTO_EXACT_LIMIT = 200
+
+# Quadtree cells stop splitting at this depth so coincident nodes terminate
+_MAX_TREE_DEPTH = 24
+
+
+def validate_layout_method(method: str) -> str:
+    """
+    Validate a layout method name.
+
+    Args:
+        method: 'auto' or one of LAYOUT_METHODS
+
+    Returns:
+        The lowercase method name
+
+    Raises:
+        TypeError: If method is not a string
+        ValueError: If method is an unknown name
+    """
+    if not isinstance(method, str):
+        raise TypeError(
+            f"[ChartForgeTK] Error: layout must be a string, "
+            f"got {type(method).__name__}."
+        )
+    name = method.lower()
+    if name != 'auto' and name not in LAYOUT_METHODS:
+        raise ValueError(
+            f"[ChartForgeTK] Error: Unknown layout '{method}'. "
+            f"Available layouts: {['auto'] + sorted(LAYOUT_METHODS)}"
+        )
+    return name
+
+
+def _build_quadtree(xs: List[float], ys: List[float]) -> list:
+    """
+    Build a Barnes-Hut quadtree over all nodes.
+
+    Cells are lists [mass, com_x, com_y, size, children, bodies]; inner cells
+    have a list of child cells and bodies None, leaves the reverse.
+    """
+    x0, x1 = min(xs), max(xs)
+    y0, y1 = min(ys), max(ys)
+    size = max(x1 - x0, y1 - y0, 1e-9)
+
+    def build(indices, left, top, size, depth):
+        mass = len(indices)
+        com_x = sum(xs[i] for i in indices) / mass
+        com_y = sum(ys[i] for i in indices) / mass
+        if mass == 1 or depth >= _MAX_TREE_DEPTH:
+            return [mass, com_x, com_y, size, None, indices]
+
+        half = size / 2
+        mid_x, mid_y = left + half, top + half
+        quadrants = ([], [], [], [])
+        for i in indices:
+            quadrants[(xs[i] >= mid_x) + 2 * (ys[i] >= mid_y)].append(i)
+        children = []
+        for q, members in enumerate(quadrants):
+            if members:
+                children.append(build(members, left + half * (q & 1), top + half * (q >> 1), half, depth + 1))
+        return [mass, com_x, com_y, size, children, None]
+
+    return build(list(range(len(xs))), x0, y0, size, 0)
+
+
+class ForceLayout:
+    """
+    Force-directed layout over index-based position arrays.
+
+    Positions live in two flat lists (xs, ys) indexed like the node list and
+    are clamped to the bounds after every iteration.
+    """
+
+    def __init__(
+        self,
+        positions: Sequence[Tuple[float, float]],
+        edges: Sequence[Tuple[int, int]],
+        bounds: Tuple[float, float, float, float],
+        method: str = 'auto',
+        theta: float = 0.8,
+        cooling: float = 0.92,
+        tolerance: float = 0.01,
+        max_iterations: int = 300
+    ):
+        """
+        Initialize the ForceLayout.
+
+        Args:
+            positions: Initial (x, y) of every node
+            edges: (source index, target index) pairs
+            bounds: (left, top, right, bottom) box nodes are kept inside
+            method: 'auto' or one of LAYOUT_METHODS
+            theta: Barnes-Hut opening angle; larger is faster and coarser
+            cooling: Factor applied to the temperature after each iteration
+            tolerance: Converged once the largest move is below tolerance * k
+            max_iterations: Hard limit on iterations
+
+        Raises:
+            ValueError: If positions is empty, bounds are empty or a
+                parameter is out of range
+        """
+        if not positions:
+            raise ValueError("[ChartForgeTK] Error: layout needs at least one node.")
+        left, top, right, bottom = bounds
+        if right < left or bottom < top:
+            raise ValueError(f"[ChartForgeTK] Error: Invalid layout bounds {bounds}.")
+        if not 0 < cooling < 1:
+            raise ValueError(f"[ChartForgeTK] Error: cooling must be in (0, 1), got {cooling}.")
+        if theta < 0:
+            raise ValueError(f"[ChartForgeTK] Error: theta must be non-negative, got {theta}.")
+
+        self.xs: List[float] = [float(x) for x, _ in positions]
+        self.ys: List[float] = [float(y) for _, y in positions]
+        self.edges = [(int(a), int(b)) for a, b in edges]
+        self.bounds = (left, top, right, bottom)
+
+        n = len(self.xs)
+        method = validate_layout_method(method)
+        if method == 'auto':
+            method = 'exact' if n <= AUTO_EXACT_LIMIT else 'grid'
+        self.method = method
+        self.theta = theta
+        self.cooling = cooling
+        self.max_iterations = max_iterations
+
+        area = max((right - left) * (bottom - top), 1.0)
+        self.k = math.sqrt(area / n)
+        self.temperature = self.k
+        self.threshold = tolerance * self.k
+        self.iterations = 0
+        self.converged = n == 1
+
+    @property
+    def done(self) -> bool:
+        """True once the layout converged or hit max_iterations."""
+        return self.converged or self.iterations >= self.max_iterations
+
+    def positions(self) -> List[Tuple[float, float]]:
+        """Return the current (x, y) of every node."""
+        return list(zip(self.xs, self.ys))
+
+    def step(self) -> float:
+        """
+        Run one iteration.
+
+        Returns:
+            float: The largest distance a node moved
+        """
+        if self.done:
+            return 0.0
+
+        n = len(self.xs)
+        fx = [0.0] * n
+        fy = [0.0] * n
+        if self.method == 'barnes_hut':
+            self._repulse_barnes_hut(fx, fy)
+        elif self.method == 'grid':
+            self._repulse_grid(fx, fy)
+        else:
+            self._repulse_exact(fx, fy)
+        self._attract(fx, fy)
+
+        left, top, right, bottom = self.bounds
+        xs, ys = self.xs, self.ys
+        limit = self.temperature
+        largest = 0.0
+        for i in range(n):
+            dx, dy = fx[i], fy[i]
+            mag = math.hypot(dx, dy)
+            if mag > limit:
+                dx, dy = dx * limit / mag, dy * limit / mag
+            new_x = min(right, max(left, xs[i] + dx))
+            new_y = min(bottom, max(top, ys[i] + dy))
+            moved = math.hypot(new_x - xs[i], new_y - ys[i])
+            if moved > largest:
+                largest = moved
+            xs[i], ys[i] = new_x, new_y
+
+        self.iterations += 1
+        self.temperature *= self.cooling
+        if largest < self.threshold or self.temperature < self.threshold:
+            self.converged = True
+        return largest
+
+    def run(self, max_iterations: Optional[int] = None) -> int:
+        """
+        Iterate until the layout is done.
+
+        Args:
+            max_iterations: Optional limit for this call
+
+        Returns:
+            int: Number of iterations run
+        """
+        start = self.iterations
+        while not self.done:
+            if max_iterations is not None and self.iterations - start >= max_iterations:
+                break
+            self.step()
+        return self.iterations - start
+
+    def _repulse_exact(self, fx: List[float], fy: List[float]):
+        """All-pairs repulsion."""
+        xs, ys = self.xs, self.ys
+        k2 = self.k * self.k
+        n = len(xs)
+        for i in range(n):
+            xi, yi = xs[i], ys[i]
+            for j in range(i + 1, n):
+                dx, dy = xi - xs[j], yi - ys[j]
+                d2 = max(dx * dx + dy * dy, 1e-4)
+                scale = k2 / d2
+                fx[i] += dx * scale
+                fy[i] += dy * scale
+                fx[j] -= dx * scale
+                fy[j] -= dy * scale
+
+    def _repulse_grid(self, fx: List[float], fy: List[float]):
+        """Repulsion from nodes within the 3x3 block of 2k grid cells."""
+        xs, ys = self.xs, self.ys
+        k2 = self.k * self.k
+        cell = 2 * self.k
+        cutoff2 = cell * cell
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for i in range(len(xs)):
+            cells.setdefault((int(xs[i] // cell), int(ys[i] // cell)), []).append(i)
+
+        for (col, row), members in cells.items():
+            neighbours = []
+            for dc in (-1, 0, 1):
+                for dr in (-1, 0, 1):
+                    neighbours.extend(cells.get((col + dc, row + dr), ()))
+            # A node's own entry has dx = dy = 0 and so adds no force
+            others = [(xs[j], ys[j]) for j in neighbours]
+            for i in members:
+                xi, yi = xs[i], ys[i]
+                sx = sy = 0.0
+                for xj, yj in others:
+                    dx, dy = xi - xj, yi - yj
+                    d2 = dx * dx + dy * dy
+                    if d2 >= cutoff2:
+                        continue
+                    scale = k2 / max(d2, 1e-4)
+                    sx += dx * scale
+                    sy += dy * scale
+                fx[i] += sx
+                fy[i] += sy
+
+    def _repulse_barnes_hut(self, fx: List[float], fy: List[float]):
+        """Quadtree repulsion; distant cells act as one body at their centre of mass."""
+        xs, ys = self.xs, self.ys
+        k2 = self.k * self.k
+        theta2 = self.theta * self.theta
+        root = _build_quadtree(xs, ys)
+
+        for i in range(len(xs)):
+            xi, yi = xs[i], ys[i]
+            sx = sy = 0.0
+            stack = [root]
+            while stack:
+                mass, cx, cy, size, children, bodies = stack.pop()
+                if bodies is not None:
+                    for j in bodies:
+                        if j == i:
+                            continue
+                        dx, dy = xi - xs[j], yi - ys[j]
+                        scale = k2 / max(dx * dx + dy * dy, 1e-4)
+                        sx += dx * scale
+                        sy += dy * scale
+                    continue
+                dx, dy = xi - cx, yi - cy
+                d2 = dx * dx + dy * dy
+                if size * size < theta2 * d2:
+                    scale = mass * k2 / d2
+                    sx += dx * scale
+                    sy += dy * scale
+                else:
+                    stack.extend(children)
+            fx[i] += sx
+            fy[i] += sy
+
+    def _attract(self, fx: List[float], fy: List[float]):
+        """Spring attraction along edges."""
+        xs, ys = self.xs, self.ys
+        k = self.k
+        for a, b in self.edges:
+            if a == b:
+                continue
+            dx, dy = xs[a] - xs[b], ys[a] - ys[b]
+            scale = math.hypot(dx, dy) / k
+            fx[a] -= dx * scale
+            fy[a] -= dy * scale
+            fx[b] += dx * scale
+            fy[b] += dy * scale
@@ -5,6 +5,9 @@ import math
 import logging
 from .core import Chart, ChartStyle
 from .validation import DataValidator
+from . import decimation
+from .streaming import RingBuffer
+from .spatial import PointGrid
 import sys
 sys.setrecursionlimit(10**8)
 
@@ -17,12 +20,23 @@ class LineChart(Chart):
     
     Supports single datasets (list of floats) or multiple datasets (list of dicts).
     Each dataset can have different lengths and will be rendered independently.
+    Long datasets are downsampled to the plot width before drawing (see the
+    ``downsample`` argument); hover tooltips still read the full data.
     
     Requirements: 1.1, 1.2, 1.3, 2.1, 2.2, 2.6, 3.1, 3.2, 3.5, 3.6, 9.1, 9.2
     """
+
+    # Point labels: all points up to this count, then every Nth data index
+    MAX_POINTS_FOR_FULL_LABELS = 50
+    LABEL_DECIMATION_FACTOR = 10
+    # append() keeps per-point markers only while a dataset shows at most this many points
+    STREAM_MARKER_LIMIT = 200
+    # Hover hit-testing distance in pixels
+    HOVER_RADIUS = 20
     
     def __init__(self, parent=None, width: int = 800, height: int = 600, display_mode='frame', 
-                 theme='light', palette='modern', use_container_width_height: bool = False, show_point_labels: bool = True):
+                 theme='light', palette='modern', use_container_width_height: bool = False, show_point_labels: bool = True,
+                 downsample: Optional[Union[str, Any]] = 'm4'):
         super().__init__(parent, width=width, height=height, display_mode=display_mode, theme=theme, palette=palette)
         self.datasets = []
         self.points = {}  # Now stores (x_pixel, y_pixel, data_index) tuples
@@ -40,6 +54,14 @@ class LineChart(Chart):
         self.use_container_width_height = use_container_width_height
         self.show_point_labels = show_point_labels
         self._tooltip = None  # Tooltip window reference
+        # Downsampling between self.datasets and self.points ('m4', 'minmax', 'lttb', callable or None)
+        self.downsample = decimation.validate_downsample_method(downsample)
+        self._decimated = set()  # Dataset indices drawn from a downsampled subset
+        self._view_range = None  # (x_min, x_max, y_min, y_max) of the last plot
+        self._line_items = {}  # Dataset index -> canvas items of its line, shadow, dots and labels
+        self._hover_index = {}  # Dataset index -> PointGrid over self._hover_points[idx] for hit-testing
+        self._hover_points = {}  # Dataset index -> (x_pixel, y_pixel, data_index) hover candidates
+        self._lines_animation_done = False
 
         if self.use_container_width_height and self.parent:
             self.parent.bind('<Configure>', self._on_parent_resize)
@@ -74,7 +96,8 @@ class LineChart(Chart):
              x_min: Optional[float] = None, x_max: Optional[float] = None, 
              y_min: Optional[float] = None, y_max: Optional[float] = None,
              y_columns: Optional[List[str]] = None,
-             label_column: Optional[str] = None):
+             label_column: Optional[str] = None,
+             capacity: Optional[int] = None):
         """
         Plot the line chart with the given data.
         
@@ -93,6 +116,10 @@ class LineChart(Chart):
                 If not specified, uses the first numeric column for a single series.
             label_column: Column name for x-axis labels when data is a DataFrame.
                 If not specified, uses the DataFrame index.
+            capacity: Optional fixed number of samples kept per dataset. When set,
+                each dataset is stored in a ring buffer and append() drops the
+                oldest samples once it is full. A dataset dict may also carry
+                its own 'capacity' key.
             
         Raises:
             TypeError: If data is None or contains non-numeric values
@@ -108,32 +135,10 @@ class LineChart(Chart):
                 extracted_columns, labels = DataValidator.extract_dataframe_columns(
                     data,
                     columns=y_columns,
-                    param_name="data"
+                    param_name="data",
+                    label_column=label_column
                 )
-                # Handle label_column if specified
-                if label_column is not None:
-                    if label_column not in data.columns:
-                        available_columns = list(data.columns)
-                        raise ValueError(
-                            f"[ChartForgeTK] Error: Column '{label_column}' not found in DataFrame. "
-                            f"Available columns: {available_columns}"
-                        )
-                    # Re-extract with label column
-                    labels = [str(val) for val in data[label_column].tolist()]
-                    # Filter labels to match valid rows (same filtering as extract_dataframe_columns)
-                    import math as _math
-                    valid_indices = []
-                    for i in range(len(data)):
-                        row_valid = True
-                        for col in y_columns:
-                            val = float(data[col].iloc[i])
-                            if _math.isnan(val) or _math.isinf(val):
-                                row_valid = False
-                                break
-                        if row_valid:
-                            valid_indices.append(i)
-                    labels = [str(data[label_column].iloc[i]) for i in valid_indices]
-                
+
                 # Convert to multi-dataset format
                 colors = ['#2563EB', '#DC2626', '#059669', '#D97706', '#7C3AED', '#DB2777']
                 data = []
@@ -170,15 +175,18 @@ class LineChart(Chart):
                 "Please provide a list of numeric values or a list of dataset dictionaries."
             )
         
+        # Array-backed data (numpy, array.array) is a single dataset
+        is_array_data = DataValidator.is_numeric_array(data)
+
         # Validate data is a list/tuple (Requirements: 1.3)
-        if not isinstance(data, (list, tuple)):
+        if not isinstance(data, (list, tuple)) and not is_array_data:
             raise TypeError(
                 f"[LineChart] Error: data must be a list, got {type(data).__name__}. "
                 "Please provide a list of numeric values or a list of dataset dictionaries."
             )
         
         # Check for empty data (Requirements: 1.2)
-        if not data:
+        if len(data) == 0:
             raise ValueError(
                 "[LineChart] Error: data cannot be empty. "
                 "Please provide at least one data point."
@@ -191,7 +199,7 @@ class LineChart(Chart):
         self.resource_manager.cleanup_tooltips()
 
         # Determine if single dataset (list of numbers) or multiple datasets (list of dicts)
-        if isinstance(data, (list, tuple)) and len(data) > 0 and all(isinstance(x, (int, float)) for x in data):
+        if is_array_data or all(isinstance(x, (int, float)) for x in data):
             # Single dataset - validate using DataValidator (Requirements: 1.1, 1.2, 1.3)
             validated_data = DataValidator.validate_numeric_list(
                 data,
@@ -203,7 +211,7 @@ class LineChart(Chart):
             )
             # Create copy for immutability (Requirements: 9.1, 9.2)
             self.datasets = [{
-                'data': validated_data.copy(),
+                'data': self._make_storage(validated_data, capacity),
                 'color': self._clamp_color(self.style.ACCENT),
                 'shape': 'circle',
                 'label': 'Line 1'
@@ -226,9 +234,17 @@ class LineChart(Chart):
                         "Each dataset dictionary must have a 'data' key with numeric values."
                     )
                 
+                # Re-plotting streamed datasets keeps their ring buffer capacity
+                source = dataset['data']
+                dataset_capacity = dataset.get('capacity', capacity)
+                if isinstance(source, RingBuffer):
+                    if dataset_capacity is None:
+                        dataset_capacity = source.capacity
+                    source = source.tolist()
+
                 # Validate the dataset's data using DataValidator (Requirements: 1.1, 1.2, 1.3)
                 validated_dataset_data = DataValidator.validate_numeric_list(
-                    dataset['data'],
+                    source,
                     allow_empty=False,
                     allow_negative=True,
                     allow_nan=False,
@@ -238,26 +254,277 @@ class LineChart(Chart):
                 
                 # Create copy for immutability (Requirements: 9.1, 9.2)
                 self.datasets.append({
-                    'data': validated_dataset_data.copy(),
+                    'data': self._make_storage(validated_dataset_data, dataset_capacity),
                     'color': self._clamp_color(dataset.get('color', self.style.ACCENT)),
                     'shape': dataset.get('shape', 'circle') if dataset.get('shape') in self.shapes else 'circle',
                     'label': str(dataset.get('label', f'Line {len(self.datasets) + 1}'))
                 })
 
-        # Collect all data points for range calculation
-        all_data = [x for ds in self.datasets for x in ds['data']]
-        
+        full_x_min, full_x_max, full_y_min, full_y_max = self._full_data_range()
+
+        if x_min is None or x_max is None or y_min is None or y_max is None:
+            x_min, x_max, y_min, y_max = self._zoomed_view(
+                full_x_min, full_x_max, full_y_min, full_y_max
+            )
+
+        self.clear_layer('data')
+        self._draw_axes(x_min, x_max, y_min, y_max)
+
+        # Store pixel coordinates with original data indices, downsampled to the
+        # plot width for the current zoom level
+        self._view_range = (x_min, x_max, y_min, y_max)
+        self._decimated = set()
+        self.points = {}
+        self._hover_points = {}
+        self._hover_index = {}
+        for idx in range(len(self.datasets)):
+            self._compute_points(idx)
+
+        self._animate_lines(y_min, y_max)
+        self._add_interactive_effects()
+        self._redraw_bars()
+
+    def append(self, dataset_idx: int, values: Union[float, List[float], Any]):
+        """
+        Append samples to a plotted dataset without re-plotting it.
+
+        The new samples extend the existing line items through canvas.coords
+        instead of rebuilding the chart, and the value range is tracked
+        incrementally. The axes are only redrawn when the data leaves the
+        current tick grid. Datasets plotted with a capacity drop their oldest
+        samples once full.
+
+        Args:
+            dataset_idx: Index of the dataset to extend
+            values: A number, or a list/tuple/array of numbers
+
+        Raises:
+            ValueError: If nothing is plotted yet or dataset_idx is out of range
+            TypeError: If values contain non-numeric data
+        """
+        if not self.datasets:
+            raise ValueError(
+                "[LineChart] Error: Cannot append before plotting data. Call plot() first."
+            )
+        if (isinstance(dataset_idx, bool) or not isinstance(dataset_idx, int)
+                or not 0 <= dataset_idx < len(self.datasets)):
+            raise ValueError(
+                f"[LineChart] Error: dataset_idx must be an integer between 0 and "
+                f"{len(self.datasets) - 1}, got {dataset_idx!r}."
+            )
+        if not isinstance(values, (list, tuple)) and not DataValidator.is_numeric_array(values):
+            values = [values]
+        validated = DataValidator.validate_numeric_list(
+            values, allow_empty=True, param_name="values"
+        )
+        if not validated:
+            return
+
+        storage = self.datasets[dataset_idx]['data']
+        old_length = len(storage)
+        if isinstance(storage, RingBuffer):
+            evicted = storage.extend(validated)
+        else:
+            storage.extend(validated)
+            evicted = 0
+
+        full_sync = evicted > 0 or dataset_idx in self._decimated
+        if not self._lines_animation_done:
+            # Stop the intro animation; the items are brought up to date below
+            self.resource_manager.cancel_animations()
+            self._lines_animation_done = True
+            full_sync = True
+
+        # Crossing the label threshold changes which points carry labels
+        if old_length <= self.MAX_POINTS_FOR_FULL_LABELS < len(storage):
+            full_sync = True
+
+        view = self._stream_view_range()
+        view_changed = view != self._view_range
+        if view_changed:
+            self._view_range = view
+            self._redraw_axes()
+            self._redraw_bars()
+
+        plot_width = max(1, self.width - 2 * self.padding)
+        targets = range(len(self.datasets)) if view_changed else (dataset_idx,)
+        for idx in targets:
+            points_before = len(self.points.get(idx, ()))
+            if (full_sync or view_changed
+                    or (self.downsample is not None and points_before + len(validated) > plot_width)):
+                self._compute_points(idx)
+                self._sync_line_items(idx)
+            else:
+                self._compute_points(idx, start=old_length)
+                self._sync_line_items(idx, start=points_before)
+
+    def _stream_view_range(self) -> Tuple[float, float, float, float]:
+        """
+        Return the axis ranges to use after append().
+
+        Keeps the current ranges while the data still fits and fills a
+        reasonable part of them. Otherwise the y range is snapped outward to
+        the tick interval, and a growing x range gets 25% headroom, so the
+        next appends don't move the ticks again.
+        """
+        full_x_min, full_x_max, full_y_min, full_y_max = self._full_data_range()
+        if self.zoom_level != 1.0 or self._view_range is None:
+            return self._zoomed_view(full_x_min, full_x_max, full_y_min, full_y_max)
+
+        x_min, x_max, y_min, y_max = self._view_range
+        extents = [self._dataset_extent(ds['data']) for ds in self.datasets if len(ds['data'])]
+        data_min = min(low for low, _ in extents)
+        data_max = max(high for _, high in extents)
+
+        fits = y_min <= data_min and data_max <= y_max and x_min <= full_x_min and full_x_max <= x_max
+        # Tighten the range again once the data only fills a small part of it
+        snug = data_max - data_min >= 0.5 * (y_max - y_min)
+        if fits and snug:
+            return self._view_range
+
+        y_interval = self._calculate_tick_interval(full_y_max - full_y_min)
+        y_min = math.floor(full_y_min / y_interval) * y_interval
+        y_max = math.ceil(full_y_max / y_interval) * y_interval
+
+        if full_x_max > x_max or full_x_min < x_min:
+            x_min = full_x_min
+            x_max = full_x_max + (full_x_max - full_x_min) * 0.25
+            x_interval = self._calculate_tick_interval(x_max - x_min)
+            x_max = math.ceil(x_max / x_interval) * x_interval
+
+        return x_min, x_max, y_min, y_max
+
+    def _redraw_axes(self):
+        """Move and relabel the grid and tick items for the current view range."""
+        self._draw_axes(*self._view_range)
+
+    def _redraw_bars(self):
+        """Redraw the reference bars so they match the current axis ranges."""
+        for bar in self.bars:
+            self.canvas.delete(bar['id'])
+            if bar['label_id']:
+                self.canvas.delete(bar['label_id'])
+            self._draw_bar(bar, self._view_range)
+
+    def _sync_line_items(self, idx: int, start: int = 0):
+        """
+        Bring the canvas items of a dataset in line with self.points[idx].
+
+        Existing line, shadow, marker and label items are moved with
+        canvas.coords and reused; items are only created for new points and
+        deleted when there are fewer points than before.
+
+        Args:
+            idx: Dataset index
+            start: Position in self.points[idx] of the first point that changed
+        """
+        dataset = self.datasets[idx]
+        points = self.points[idx]
+        items = self._line_items.setdefault(
+            idx, {'line': None, 'shadow': None, 'dots': [], 'labels': []}
+        )
+
+        try:
+            if len(points) >= 2:
+                flat = [coord for x, y, _ in points for coord in (x, y)]
+                if items['line'] is None:
+                    items['shadow'] = self.canvas.create_line(
+                        *flat, fill=self.style.create_shadow(dataset['color']),
+                        width=self.line_width + 2, tags=('shadow',)
+                    )
+                    items['line'] = self.canvas.create_line(
+                        *flat, fill=dataset['color'], width=self.line_width, tags=('line',)
+                    )
+                else:
+                    self.canvas.coords(items['shadow'], *flat)
+                    self.canvas.coords(items['line'], *flat)
+            elif items['line'] is not None:
+                self.canvas.delete(items['shadow'], items['line'])
+                items['line'] = items['shadow'] = None
+
+            # Point markers are only kept while they stay readable
+            marker_points = points if len(points) <= self.STREAM_MARKER_LIMIT else []
+            dots = items['dots']
+            fill_color = self._clamp_color(self.style.adjust_brightness(dataset['color'], 1.2))
+            outline_color = self._clamp_color(self.style.adjust_brightness(dataset['color'], 0.8))
+            for i in range(start, len(marker_points)):
+                x, y, _ = marker_points[i]
+                if i < len(dots):
+                    self.canvas.coords(dots[i], *self._shape_coords(x, y, dataset['shape'], self.dot_radius))
+                else:
+                    dots.append(self._create_shape(
+                        x, y, dataset['shape'], self.dot_radius, fill_color, outline_color
+                    ))
+            for item in dots[len(marker_points):]:
+                self.canvas.delete(item)
+            del dots[len(marker_points):]
+
+            labels = items['labels']
+            label_points = []
+            if self.show_point_labels:
+                label_all = len(dataset['data']) <= self.MAX_POINTS_FOR_FULL_LABELS
+                label_points = [
+                    (i, point) for i, point in enumerate(marker_points)
+                    if label_all or point[2] % self.LABEL_DECIMATION_FACTOR == 0
+                ]
+            for n, (i, (x, y, data_idx)) in enumerate(label_points):
+                if i < start:
+                    continue
+                text = f"{dataset['data'][data_idx]:,.2f}"
+                if n < len(labels):
+                    self.canvas.coords(labels[n], x, y - 15)
+                    self.canvas.itemconfig(labels[n], text=text)
+                else:
+                    labels.append(self.canvas.create_text(
+                        x, y - 15, text=text,
+                        font=self.style.VALUE_FONT, fill=self.style.TEXT,
+                        anchor='s', tags=('label', f'point_{idx}_{i}')
+                    ))
+            for item in labels[len(label_points):]:
+                self.canvas.delete(item)
+            del labels[len(label_points):]
+        except tk.TclError:
+            pass  # Widget may have been destroyed
+
+    def _make_storage(self, values: List[float], capacity: Optional[int]):
+        """Return the container a dataset's values are kept in: a list copy or a ring buffer."""
+        if capacity is None:
+            return values  # validate_numeric_list already returned a fresh list
+        return RingBuffer(capacity, values)
+
+    @staticmethod
+    def _dataset_extent(values) -> Tuple[float, float]:
+        """Return (min, max) of a dataset, in O(1) for ring buffers."""
+        if isinstance(values, RingBuffer):
+            return values.min(), values.max()
+        return min(values), max(values)
+
+    def _full_data_range(self) -> Tuple[float, float, float, float]:
+        """
+        Compute the unzoomed axis ranges covering every dataset.
+
+        Ring-buffered datasets span their full capacity on the x-axis so the
+        axis stays put while they fill up.
+
+        Returns:
+            (x_min, x_max, y_min, y_max) including the y-axis padding
+        """
         # Handle edge case: single data point (Requirements: 2.1)
-        max_dataset_length = max(len(ds['data']) for ds in self.datasets)
+        max_dataset_length = max(
+            max(len(ds['data']), ds['data'].capacity if isinstance(ds['data'], RingBuffer) else 0)
+            for ds in self.datasets
+        )
         if max_dataset_length == 1:
             # Single point - create a meaningful x-axis range
             full_x_min, full_x_max = -0.5, 0.5
             logger.debug("Single data point detected, using x-axis range [-0.5, 0.5]")
         else:
             full_x_min, full_x_max = 0, max_dataset_length - 1
-        
-        full_y_min, full_y_max = min(all_data), max(all_data)
-        
+
+        extents = [self._dataset_extent(ds['data']) for ds in self.datasets if len(ds['data'])]
+        full_y_min = min(low for low, _ in extents)
+        full_y_max = max(high for _, high in extents)
+
         # Handle edge case: all values are identical (Requirements: 2.2)
         if full_y_min == full_y_max:
             # All values identical - create meaningful y-axis range
@@ -277,63 +544,123 @@ class LineChart(Chart):
             full_y_min -= padding
             full_y_max += padding
 
-        if x_min is None or x_max is None or y_min is None or y_max is None:
-            x_range = (full_x_max - full_x_min) / self.zoom_level
-            y_range = (full_y_max - full_y_min) / self.zoom_level
-            if self.zoom_center_x is None:
-                self.zoom_center_x = (full_x_max + full_x_min) / 2
-            if self.zoom_center_y is None:
-                self.zoom_center_y = (full_y_max + full_y_min) / 2
-            
-            x_min = max(full_x_min, self.zoom_center_x - x_range / 2)
-            x_max = min(full_x_max, self.zoom_center_x + x_range / 2)
-            y_min = max(full_y_min, self.zoom_center_y - y_range / 2)
-            y_max = min(full_y_max, self.zoom_center_y + y_range / 2)
-
-        self.canvas.delete('label')
-        self.canvas.delete('all')
-        self._draw_axes(x_min, x_max, y_min, y_max)
+        return full_x_min, full_x_max, full_y_min, full_y_max
+
+    def _zoomed_view(self, full_x_min: float, full_x_max: float,
+                     full_y_min: float, full_y_max: float) -> Tuple[float, float, float, float]:
+        """Return the visible ranges for the current zoom level and center."""
+        x_range = (full_x_max - full_x_min) / self.zoom_level
+        y_range = (full_y_max - full_y_min) / self.zoom_level
+        if self.zoom_center_x is None:
+            self.zoom_center_x = (full_x_max + full_x_min) / 2
+        if self.zoom_center_y is None:
+            self.zoom_center_y = (full_y_max + full_y_min) / 2
+
+        x_min = max(full_x_min, self.zoom_center_x - x_range / 2)
+        x_max = min(full_x_max, self.zoom_center_x + x_range / 2)
+        y_min = max(full_y_min, self.zoom_center_y - y_range / 2)
+        y_max = min(full_y_max, self.zoom_center_y + y_range / 2)
+        return x_min, x_max, y_min, y_max
+
+    def _compute_points(self, idx: int, start: int = 0):
+        """
+        Fill self.points[idx] with the pixel positions of a dataset's visible samples.
 
-        # Store pixel coordinates with original data indices
-        self.points = {}
-        for idx, dataset in enumerate(self.datasets):
+        Args:
+            idx: Dataset index
+            start: First data index to compute; earlier points are kept as they
+                are (used when appending to a dataset that is not downsampled)
+        """
+        x_min, x_max, y_min, y_max = self._view_range
+        values = self.datasets[idx]['data']
+        self._decimated.discard(idx)
+        if start == 0:
             self.points[idx] = []
-            for i, y in enumerate(dataset['data']):
-                if x_min <= i <= x_max and y_min <= y <= y_max:
-                    x = self._data_to_pixel_x(i, x_min, x_max)
-                    y_pixel = self._data_to_pixel_y(y, y_min, y_max)
-                    self.points[idx].append((x, y_pixel, i))  # Store (x_pixel, y_pixel, data_index)
+            self._hover_points[idx] = self.points[idx]
+            self._hover_index[idx] = PointGrid(self.HOVER_RADIUS)
+            indices = self._visible_indices(idx, values, x_min, x_max)
+        else:
+            indices = range(start, min(len(values) - 1, math.floor(x_max)) + 1)
+
+        points = self.points[idx]
+        grid = self._hover_index[idx]
+        for i in indices:
+            y = values[i]
+            if y_min <= y <= y_max:
+                x = self._data_to_pixel_x(i, x_min, x_max)
+                y_pixel = self._data_to_pixel_y(y, y_min, y_max)
+                grid.add(x, y_pixel, len(points))
+                points.append((x, y_pixel, i))  # Store (x_pixel, y_pixel, data_index)
+
+        if idx in self._decimated and self.downsample not in ('m4', 'minmax'):
+            self._index_hover_extremes(idx, values)
+
+    def _index_hover_extremes(self, idx: int, values: List[float]):
+        """
+        Index the minimum and maximum sample of every pixel column for hover.
 
-        self._animate_lines(y_min, y_max)
-        self._add_interactive_effects()
+        M4 and min/max downsampling already keep these samples, so their drawn
+        points serve hover directly. Other methods (LTTB, callables) can drop
+        a column's extremes; hover then uses this separate index so tooltips
+        still report the real peaks under the cursor.
+        """
+        x_min, x_max, y_min, y_max = self._view_range
+        first = max(0, math.ceil(x_min))
+        last = min(len(values) - 1, math.floor(x_max))
+        plot_width = max(1, self.width - 2 * self.padding)
+        buckets = max(1, round(plot_width * (last - first) / (x_max - x_min)))
+        candidates = []
+        grid = PointGrid(self.HOVER_RADIUS)
+        for i in decimation.minmax_indices(values[first:last + 1], buckets):
+            i += first
+            y = values[i]
+            if y_min <= y <= y_max:
+                x = self._data_to_pixel_x(i, x_min, x_max)
+                y_pixel = self._data_to_pixel_y(y, y_min, y_max)
+                grid.add(x, y_pixel, len(candidates))
+                candidates.append((x, y_pixel, i))
+        self._hover_points[idx] = candidates
+        self._hover_index[idx] = grid
+
+    def _visible_indices(self, idx: int, values: List[float], x_min: float, x_max: float) -> List[int]:
+        """
+        Return the data indices of a dataset to draw for the x range.
 
-        for bar in self.bars[:]:
-            self.canvas.delete(bar['id'])
-            if bar['label_id']:
-                self.canvas.delete(bar['label_id'])
-            self.add_bar(bar['orientation'], bar['value'], bar['color'], bar['width'], bar['dash'], bar['label'])
+        Indices outside [x_min, x_max] are skipped; the rest are downsampled
+        to about one bucket per pixel column the dataset covers.
+        """
+        first = max(0, math.ceil(x_min))
+        last = min(len(values) - 1, math.floor(x_max))
+        if first > last:
+            return []
+        if self.downsample is None or x_max <= x_min:
+            return list(range(first, last + 1))
+
+        plot_width = max(1, self.width - 2 * self.padding)
+        buckets = max(1, round(plot_width * (last - first) / (x_max - x_min)))
+        kept = decimation.downsample(values[first:last + 1], buckets, self.downsample)
+        if len(kept) < last - first + 1:
+            self._decimated.add(idx)
+        return [first + i for i in kept]
+
+    @staticmethod
+    def _shape_coords(x: float, y: float, shape: str, radius: float) -> Tuple[float, ...]:
+        """Return the canvas coordinates of a point marker centred on (x, y)."""
+        if shape == 'triangle':
+            return (x, y - radius, x - radius, y + radius, x + radius, y + radius)
+        elif shape == 'diamond':
+            return (x, y - radius, x + radius, y, x, y + radius, x - radius, y)
+        # square and circle share a bounding box
+        return (x - radius, y - radius, x + radius, y + radius)
 
     def _create_shape(self, x: float, y: float, shape: str, radius: float, fill: str, outline: str) -> int:
+        coords = self._shape_coords(x, y, shape, radius)
         if shape == 'square':
-            return self.canvas.create_rectangle(
-                x - radius, y - radius, x + radius, y + radius,
-                fill=fill, outline=outline, tags=('dot',)
-            )
-        elif shape == 'triangle':
-            return self.canvas.create_polygon(
-                x, y - radius, x - radius, y + radius, x + radius, y + radius,
-                fill=fill, outline=outline, tags=('dot',)
-            )
-        elif shape == 'diamond':
-            return self.canvas.create_polygon(
-                x, y - radius, x + radius, y, x, y + radius, x - radius, y,
-                fill=fill, outline=outline, tags=('dot',)
-            )
+            return self.canvas.create_rectangle(*coords, fill=fill, outline=outline, tags=('dot',))
+        elif shape in ('triangle', 'diamond'):
+            return self.canvas.create_polygon(*coords, fill=fill, outline=outline, tags=('dot',))
         else:  # circle
-            return self.canvas.create_oval(
-                x - radius, y - radius, x + radius, y + radius,
-                fill=fill, outline=outline, tags=('dot',)
-            )
+            return self.canvas.create_oval(*coords, fill=fill, outline=outline, tags=('dot',))
 
     def _animate_lines(self, y_min: float, y_max: float):
         """
@@ -346,12 +673,14 @@ class LineChart(Chart):
         
         Requirements: 3.2, 3.6
         """
-        MAX_POINTS_FOR_FULL_LABELS = 50
-        LABEL_DECIMATION_FACTOR = 10
+        MAX_POINTS_FOR_FULL_LABELS = self.MAX_POINTS_FOR_FULL_LABELS
+        LABEL_DECIMATION_FACTOR = self.LABEL_DECIMATION_FACTOR
         lines = {}
         shadows = {}
         dots = {}
         labels = {}
+        self._line_items = {}
+        self._lines_animation_done = False
 
         for idx, dataset in enumerate(self.datasets):
             if idx in self.points and len(self.points[idx]) >= 2:
@@ -391,19 +720,17 @@ class LineChart(Chart):
                 dots[idx] = []
                 labels[idx] = []
 
-        def ease(t):
-            return t * t * (3 - 2 * t)
-
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
-            
-            progress = ease(frame / total_frames)
-            
+            # Shared with append(), which reuses these items
+            self._line_items[idx] = {
+                'line': lines.get(idx),
+                'shadow': shadows.get(idx),
+                'dots': dots[idx],
+                'labels': labels[idx],
+            }
+
+        # Lines grow point by point, so the per-segment progress is computed
+        # in on_frame instead of a plain coords tween
+        def update_frame(progress: float):
             for idx, dataset in enumerate(self.datasets):
                 if idx not in lines:
                     continue
@@ -419,59 +746,46 @@ class LineChart(Chart):
                         current_points.extend([interp_x, interp_y])
                     
                     if i < len(dots[idx]) and progress * len(self.points[idx]) >= i + 1:
-                        try:
-                            self.canvas.coords(dots[idx][i], x1 - self.dot_radius, y1 - self.dot_radius,
-                                               x1 + self.dot_radius, y1 + self.dot_radius)
-                            self.canvas.itemconfig(dots[idx][i], state='normal')
-                            if self.show_point_labels and i < len(labels[idx]):
-                                self.canvas.coords(labels[idx][i], x1, y1 - 15)
-                                self.canvas.itemconfig(labels[idx][i], state='normal')
-                        except tk.TclError:
-                            pass  # Widget may have been destroyed
+                        self.canvas.coords(dots[idx][i], x1 - self.dot_radius, y1 - self.dot_radius,
+                                           x1 + self.dot_radius, y1 + self.dot_radius)
+                        self.canvas.itemconfig(dots[idx][i], state='normal')
+                        if self.show_point_labels and i < len(labels[idx]):
+                            self.canvas.coords(labels[idx][i], x1, y1 - 15)
+                            self.canvas.itemconfig(labels[idx][i], state='normal')
 
-                try:
-                    self.canvas.coords(shadows[idx], *current_points)
-                    self.canvas.coords(lines[idx], *current_points)
-                except tk.TclError:
-                    pass  # Widget may have been destroyed
-
-                if frame == total_frames:
-                    for i, (x, y, data_idx) in enumerate(self.points[idx]):
-                        if i >= len(dots[idx]):
-                            fill_color = self._clamp_color(self.style.adjust_brightness(dataset['color'], 1.2))
-                            outline_color = self._clamp_color(self.style.adjust_brightness(dataset['color'], 0.8))
-                            try:
-                                dot = self._create_shape(x, y, dataset['shape'], self.dot_radius, fill_color, outline_color)
-                                dots[idx].append(dot)
-                                if self.show_point_labels:
-                                    if len(dataset['data']) > MAX_POINTS_FOR_FULL_LABELS:
-                                        if data_idx % LABEL_DECIMATION_FACTOR == 0:
-                                            label = self.canvas.create_text(
-                                                x, y - 15, text=f"{dataset['data'][data_idx]:,.2f}",
-                                                font=self.style.VALUE_FONT, fill=self.style.TEXT,
-                                                anchor='s', tags=('label', f'point_{idx}_{i}')
-                                            )
-                                            labels[idx].append(label)
-                                    else:
-                                        label = self.canvas.create_text(
-                                            x, y - 15, text=f"{dataset['data'][data_idx]:,.2f}",
-                                            font=self.style.VALUE_FONT, fill=self.style.TEXT,
-                                            anchor='s', tags=('label', f'point_{idx}_{i}')
-                                        )
-                                        labels[idx].append(label)
-                            except tk.TclError:
-                                pass  # Widget may have been destroyed
-
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                try:
-                    after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                    self.resource_manager.register_animation(after_id)
-                except tk.TclError:
-                    pass  # Widget may have been destroyed
+                self.canvas.coords(shadows[idx], *current_points)
+                self.canvas.coords(lines[idx], *current_points)
 
-        total_frames = self.animation_duration // 16
-        update_animation(0, total_frames)
+        def finish():
+            for idx, dataset in enumerate(self.datasets):
+                if idx not in lines:
+                    continue
+                for i, (x, y, data_idx) in enumerate(self.points[idx]):
+                    if i >= len(dots[idx]):
+                        fill_color = self._clamp_color(self.style.adjust_brightness(dataset['color'], 1.2))
+                        outline_color = self._clamp_color(self.style.adjust_brightness(dataset['color'], 0.8))
+                        dot = self._create_shape(x, y, dataset['shape'], self.dot_radius, fill_color, outline_color)
+                        dots[idx].append(dot)
+                        if self.show_point_labels:
+                            if len(dataset['data']) > MAX_POINTS_FOR_FULL_LABELS:
+                                if data_idx % LABEL_DECIMATION_FACTOR == 0:
+                                    label = self.canvas.create_text(
+                                        x, y - 15, text=f"{dataset['data'][data_idx]:,.2f}",
+                                        font=self.style.VALUE_FONT, fill=self.style.TEXT,
+                                        anchor='s', tags=('label', f'point_{idx}_{i}')
+                                    )
+                                    labels[idx].append(label)
+                            else:
+                                label = self.canvas.create_text(
+                                    x, y - 15, text=f"{dataset['data'][data_idx]:,.2f}",
+                                    font=self.style.VALUE_FONT, fill=self.style.TEXT,
+                                    anchor='s', tags=('label', f'point_{idx}_{i}')
+                                )
+                                labels[idx].append(label)
+            self._lines_animation_done = True
+
+        self.animate([], on_frame=update_frame, on_complete=finish,
+                     item_count=sum(len(points) for points in self.points.values()))
 
     def add_bar(self, orientation: str, value: float, color: str = '#808080', width: int = 1, 
                 dash: Optional[Tuple[int, int]] = None, label: Optional[str] = None):
@@ -481,65 +795,62 @@ class LineChart(Chart):
         if not self.datasets:
             raise ValueError("Cannot add bar before plotting data")
         
-        all_data = [x for ds in self.datasets for x in ds['data']]
-        x_min, x_max = 0, max(len(ds['data']) for ds in self.datasets) - 1
-        y_min, y_max = min(all_data), max(all_data)
-        padding = (y_max - y_min) * 0.1 or 1
-        y_min -= padding
-        y_max += padding
-
-        if orientation == 'vertical':
-            if not (x_min <= value <= x_max):
-                raise ValueError(f"Vertical bar value {value} is outside x-axis range [{x_min}, {x_max}]")
+        # Bars follow the axes on screen, which append() may have widened
+        x_min, x_max, y_min, y_max = self._view_range
+        if orientation == 'vertical' and not (x_min <= value <= x_max):
+            raise ValueError(f"Vertical bar value {value} is outside x-axis range [{x_min}, {x_max}]")
+
+        bar = {
+            'id': None,
+            'label_id': None,
+            'orientation': orientation,
+            'value': value,
+            'color': color,
+            'width': width,
+            'dash': dash,
+            'label': label
+        }
+        self._draw_bar(bar, self._view_range)
+        self.bars.append(bar)
+
+    def _draw_bar(self, bar: dict, view: Tuple[float, float, float, float]):
+        """Create the line and label items of a reference bar for the axis ranges in view."""
+        x_min, x_max, y_min, y_max = view
+        value = bar['value']
+        if bar['orientation'] == 'vertical':
             x_pixel = self._data_to_pixel_x(value, x_min, x_max)
-            bar = self.canvas.create_line(
-                x_pixel, self.padding, x_pixel, self.height - self.padding,
-                fill=self._clamp_color(color),
-                width=width,
-                dash=dash,
-                tags=('static_bar',)
-            )
+            coords = (x_pixel, self.padding, x_pixel, self.height - self.padding)
         else:
             y_pixel = self._data_to_pixel_y(value, y_min, y_max)
-            bar = self.canvas.create_line(
-                self.padding, y_pixel, self.width - self.padding, y_pixel,
-                fill=self._clamp_color(color),
-                width=width,
-                dash=dash,
-                tags=('static_bar',)
-            )
-        
-        label_id = None
-        if label:
-            if orientation == 'vertical':
-                label_id = self.canvas.create_text(
+            coords = (self.padding, y_pixel, self.width - self.padding, y_pixel)
+        bar['id'] = self.canvas.create_line(
+            *coords,
+            fill=self._clamp_color(bar['color']),
+            width=bar['width'],
+            dash=bar['dash'],
+            tags=('static_bar',)
+        )
+
+        bar['label_id'] = None
+        if bar['label']:
+            if bar['orientation'] == 'vertical':
+                bar['label_id'] = self.canvas.create_text(
                     x_pixel, self.padding + 10,
-                    text=label,
+                    text=bar['label'],
                     font=self.style.VALUE_FONT,
                     fill=self.style.TEXT,
                     anchor='s',
                     tags=('static_bar_label',)
                 )
             else:
-                label_id = self.canvas.create_text(
+                bar['label_id'] = self.canvas.create_text(
                     self.padding + 10, y_pixel - 10 if value >= 0 else y_pixel + 10,
-                    text=label,
+                    text=bar['label'],
                     font=self.style.VALUE_FONT,
                     fill=self.style.TEXT,
                     anchor='sw' if value >= 0 else 'nw',
                     tags=('static_bar_label',)
                 )
-        
-        self.bars.append({
-            'id': bar,
-            'label_id': label_id,
-            'orientation': orientation,
-            'value': value,
-            'color': color,
-            'width': width,
-            'dash': dash,
-            'label': label
-        })
 
     def _add_interactive_effects(self):
         """
@@ -547,13 +858,7 @@ class LineChart(Chart):
         
         Requirements: 3.1, 3.5, 7.1, 7.2, 7.6
         """
-        current_highlight = None
-        v_bar = None
-        h_bar = None
-        
         def on_motion(event):
-            nonlocal current_highlight, v_bar, h_bar
-            
             if not self.datasets:
                 return
             
@@ -564,55 +869,39 @@ class LineChart(Chart):
                 closest_dataset = -1
                 min_dist = float('inf')
                 
-                for dataset_idx, points in self.points.items():
-                    for i, (px, py, _) in enumerate(points):
-                        dist = math.sqrt((x - px)**2 + (y - py)**2)
-                        if dist < min_dist and dist < 20:
-                            min_dist = dist
-                            closest_idx = i
-                            closest_dataset = dataset_idx
+                closest_point = None
+
+                for dataset_idx, points in self._hover_points.items():
+                    # Grid lookup only visits the cells around the cursor; on
+                    # downsampled datasets it holds each pixel column's extremes
+                    hit = self._hover_index[dataset_idx].nearest(x, y, self.HOVER_RADIUS)
+                    if hit is not None and hit[1] < min_dist:
+                        i, min_dist = hit
+                        closest_idx = i
+                        closest_dataset = dataset_idx
+                        closest_point = points[i]
                 
-                try:
-                    if v_bar:
-                        self.canvas.coords(v_bar, x, self.padding, x, self.height - self.padding)
-                    else:
-                        v_bar = self.canvas.create_line(
-                            x, self.padding, x, self.height - self.padding,
-                            fill=self.style.TICK_COLOR,
-                            width=1, dash=(3, 4),
-                            tags=('tracking',)
-                        )
-                    
-                    if h_bar:
-                        self.canvas.coords(h_bar, self.padding, y, self.width - self.padding, y)
-                    else:
-                        h_bar = self.canvas.create_line(
-                            self.padding, y, self.width - self.padding, y,
-                            fill=self.style.TICK_COLOR,
-                            width=1, dash=(3, 4),
-                            tags=('tracking',)
-                        )
-                except tk.TclError:
-                    pass
+                self.show_overlay(
+                    'crosshair_v', 'line',
+                    (x, self.padding, x, self.height - self.padding),
+                    fill=self.style.TICK_COLOR, width=1, dash=(3, 4)
+                )
+                self.show_overlay(
+                    'crosshair_h', 'line',
+                    (self.padding, y, self.width - self.padding, y),
+                    fill=self.style.TICK_COLOR, width=1, dash=(3, 4)
+                )
                 
                 if closest_idx >= 0:
-                    px, py, data_idx = self.points[closest_dataset][closest_idx]
+                    px, py, data_idx = closest_point
                     
                     try:
-                        if current_highlight:
-                            self.canvas.delete(current_highlight)
-                        
-                        color = self.datasets[closest_dataset]['color']
-                        highlight = self.canvas.create_oval(
-                            px - self.dot_radius - 3,
-                            py - self.dot_radius - 3,
-                            px + self.dot_radius + 3,
-                            py + self.dot_radius + 3,
-                            outline=color,
-                            width=2.5,
-                            tags=('highlight',)
+                        r = self.dot_radius + 3
+                        self.show_overlay(
+                            'highlight', 'oval', (px - r, py - r, px + r, py + r),
+                            outline=self.datasets[closest_dataset]['color'],
+                            width=2.5
                         )
-                        current_highlight = highlight
                         
                         value = self.datasets[closest_dataset]['data'][data_idx]
                         self.show_tooltip(
@@ -624,39 +913,20 @@ class LineChart(Chart):
                         pass
                 else:
                     try:
-                        if current_highlight:
-                            self.canvas.delete(current_highlight)
-                            current_highlight = None
+                        self.hide_overlay('highlight')
                         self.hide_tooltip()
                     except tk.TclError:
                         pass
             else:
                 try:
-                    if v_bar:
-                        self.canvas.delete(v_bar)
-                        v_bar = None
-                    if h_bar:
-                        self.canvas.delete(h_bar)
-                        h_bar = None
-                    if current_highlight:
-                        self.canvas.delete(current_highlight)
-                        current_highlight = None
+                    self.hide_overlays()
                     self.hide_tooltip()
                 except tk.TclError:
                     pass
         
         def on_leave(event):
-            nonlocal current_highlight, v_bar, h_bar
             try:
-                if current_highlight:
-                    self.canvas.delete(current_highlight)
-                    current_highlight = None
-                if v_bar:
-                    self.canvas.delete(v_bar)
-                    v_bar = None
-                if h_bar:
-                    self.canvas.delete(h_bar)
-                    h_bar = None
+                self.hide_overlays()
                 self.hide_tooltip()
             except tk.TclError:
                 pass
@@ -671,34 +941,9 @@ class LineChart(Chart):
                 new_zoom = max(self.min_zoom, min(self.max_zoom, new_zoom))
 
                 if new_zoom != self.zoom_level:
-                    all_data = [x for ds in self.datasets for x in ds['data']]
-                    
-                    max_dataset_length = max(len(ds['data']) for ds in self.datasets)
-                    if max_dataset_length == 1:
-                        full_x_min, full_x_max = -0.5, 0.5
-                    else:
-                        full_x_min, full_x_max = 0, max_dataset_length - 1
-                    
-                    full_y_min, full_y_max = min(all_data), max(all_data)
-                    
-                    if full_y_min == full_y_max:
-                        if full_y_min == 0:
-                            full_y_min, full_y_max = -1, 1
-                        else:
-                            padding_val = abs(full_y_min) * 0.2 if full_y_min != 0 else 1
-                            full_y_min -= padding_val
-                            full_y_max += padding_val
-                    else:
-                        padding = (full_y_max - full_y_min) * 0.1
-                        full_y_min -= padding
-                        full_y_max += padding
-
-                    x_range = (full_x_max - full_x_min) / self.zoom_level
-                    y_range = (full_y_max - full_y_min) / self.zoom_level
-                    current_x_min = max(full_x_min, self.zoom_center_x - x_range / 2)
-                    current_x_max = min(full_x_max, self.zoom_center_x + x_range / 2)
-                    current_y_min = max(full_y_min, self.zoom_center_y - y_range / 2)
-                    current_y_max = min(full_y_max, self.zoom_center_y + y_range / 2)
+                    current_x_min, current_x_max, current_y_min, current_y_max = self._zoomed_view(
+                        *self._full_data_range()
+                    )
 
                     data_x = current_x_min + (event.x - self.padding) * (current_x_max - current_x_min) / (self.width - 2 * self.padding)
                     data_y = current_y_max - (event.y - self.padding) * (current_y_max - current_y_min) / (self.height - 2 * self.padding)
@@ -708,12 +953,9 @@ class LineChart(Chart):
                     self.zoom_center_y = data_y
                     self.plot(self.datasets)
 
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
+        self.bind_hover(on_motion, on_leave)
         wheel_id = self.canvas.bind('<MouseWheel>', on_mouse_wheel)
         
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
         self.resource_manager.register_binding(self.canvas, '<MouseWheel>', wheel_id)
         
         button4_id = self.canvas.bind('<Button-4>', lambda e: on_mouse_wheel(type('Event', (), {'delta': 120, 'x': e.x, 'y': e.y})()))
@@ -17,12 +17,15 @@
 
 from typing import List, Tuple, Optional
 import math
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
 import random
 import logging
 from .core import Chart
 from .validation import DataValidator
+from .layout import ForceLayout, validate_layout_method
 
 logger = logging.getLogger('ChartForgeTK')
 
@@ -33,6 +36,11 @@ class NetworkGraph(Chart):
     
     Requirements: 1.1, 1.2, 1.3, 2.1, 3.1, 3.2, 3.6, 9.1, 9.2
     """
+
+    # Layout iterations between two position snapshots while animating
+    LAYOUT_STEPS_PER_FRAME = 2
+    # Interval at which the Tk loop polls the layout worker for snapshots
+    LAYOUT_POLL_MS = 20
     
     def __init__(self, parent=None, width: int = 800, height: int = 600, display_mode='frame', theme='light', palette='modern'):
         super().__init__(parent, width=width, height=height, display_mode=display_mode, theme=theme, palette=palette)
@@ -49,13 +57,21 @@ class NetworkGraph(Chart):
         self.interactive_elements = {}
         self.pinned_tooltips = {}
         self._drag_data = None
+        self._layout = None
+        self.layout_method = 'auto'
+        self._layout_thread = None
+        self._layout_stop = None
+        self._layout_queue = None
+        self._scene_positions = None  # Node positions the canvas items are drawn at
+        self._node_edges = []         # Edge indices touching each node
         self.title = ""
         self._tooltip = None  # Tooltip window reference
 
     def plot(self, nodes: List[str], edges: List[Tuple[str, str]], 
              node_values: Optional[List[float]] = None,
              edge_values: Optional[List[float]] = None,
-             title: str = "", animate: bool = True, show_edge_labels: bool = False):
+             title: str = "", animate: bool = True, show_edge_labels: bool = False,
+             layout: str = 'auto'):
         """Plot a network graph with nodes and edges.
         
         Args:
@@ -66,10 +82,13 @@ class NetworkGraph(Chart):
             title: Optional chart title
             animate: Whether to animate the layout
             show_edge_labels: Whether to show edge labels
+            layout: Repulsion algorithm: 'exact', 'barnes_hut', 'grid', or
+                'auto' (exact for small graphs, grid for large ones)
             
         Raises:
             TypeError: If nodes or edges are None or have invalid types
-            ValueError: If nodes is empty or edges reference non-existent nodes
+            ValueError: If nodes is empty, edges reference non-existent nodes
+                or layout is unknown
             
         Requirements: 1.1, 1.2, 1.3, 2.1, 3.1, 3.2, 3.6, 9.1, 9.2, 9.3, 9.4
         """
@@ -163,8 +182,11 @@ class NetworkGraph(Chart):
                         f"[ChartForgeTK] Error: edge_values[{i}] must be a number."
                     )
         
+        layout = validate_layout_method(layout)
+        
         # Cancel pending animations before redrawing (Requirements: 3.2, 3.6)
         self.resource_manager.cancel_animations()
+        self._stop_layout_worker()
         
         # Clean up previous tooltips (Requirements: 3.1)
         self.resource_manager.cleanup_tooltips()
@@ -184,6 +206,8 @@ class NetworkGraph(Chart):
         self.edge_values = [float(v) for v in edge_values] if edge_values else [1.0] * len(self.edges)
         self.title = str(title)
         self.show_edge_labels = show_edge_labels
+        self.layout_method = layout
+        self._scene_positions = None
         
         # Handle edge case: single node (Requirements: 2.1)
         if len(self.nodes) == 1:
@@ -195,87 +219,191 @@ class NetworkGraph(Chart):
         
         self._initialize_layout()
         if animate:
-            self._animate_layout(0)
+            self._start_layout_worker()
         else:
-            self._calculate_layout(iterations=50)
+            self._calculate_layout()
             self.redraw_chart()
             self._add_interactivity()
 
     def _initialize_layout(self):
-        """Initialize random node positions."""
+        """Initialize random node positions and the layout engine."""
         padding = self.padding + self.node_radius
         width = self.width - 2 * padding
         height = self.height - 2 * padding
         self.node_positions = {node: [padding + random.random() * width, padding + random.random() * height] for node in self.nodes}
 
-    def _calculate_layout(self, iterations: int = 1):
-        """Perform force-directed layout for one or more iterations."""
-        k = math.sqrt((self.width * self.height) / len(self.nodes))
-        forces = {node: [0, 0] for node in self.nodes}
-        
-        for _ in range(iterations):
-            for i, node1 in enumerate(self.nodes):
-                pos1 = self.node_positions[node1]
-                for node2 in self.nodes[i+1:]:
-                    pos2 = self.node_positions[node2]
-                    dx, dy = pos1[0] - pos2[0], pos1[1] - pos2[1]
-                    dist = max(math.sqrt(dx*dx + dy*dy), 0.01)
-                    force = k * k / dist
-                    fx, fy = force * dx / dist, force * dy / dist
-                    forces[node1][0] += fx
-                    forces[node1][1] += fy
-                    forces[node2][0] -= fx
-                    forces[node2][1] -= fy
-
-            for edge in self.edges:
-                pos1, pos2 = self.node_positions[edge[0]], self.node_positions[edge[1]]
-                dx, dy = pos1[0] - pos2[0], pos1[1] - pos2[1]
-                dist = max(math.sqrt(dx*dx + dy*dy), 0.01)
-                force = dist * dist / k
-                fx, fy = force * dx / dist, force * dy / dist
-                forces[edge[0]][0] -= fx
-                forces[edge[0]][1] -= fy
-                forces[edge[1]][0] += fx
-                forces[edge[1]][1] += fy
-
-            padding = self.padding + self.node_radius
-            for node in self.nodes:
-                fx, fy = forces[node]
-                mag = math.sqrt(fx*fx + fy*fy)
-                if mag > k:
-                    fx, fy = fx * k / mag, fy * k / mag
-                self.node_positions[node][0] = max(padding, min(self.width - padding, self.node_positions[node][0] + fx))
-                self.node_positions[node][1] = max(padding, min(self.height - padding, self.node_positions[node][1] + fy))
-
-    def _animate_layout(self, step: int):
-        """Animate the force-directed layout.
-        
+        index = {node: i for i, node in enumerate(self.nodes)}
+        self._layout = ForceLayout(
+            [self.node_positions[node] for node in self.nodes],
+            [(index[source], index[target]) for source, target in self.edges],
+            (padding, padding, self.width - padding, self.height - padding),
+            method=self.layout_method
+        )
+
+    def _calculate_layout(self, iterations: Optional[int] = None):
+        """Run the force-directed layout for some iterations, or until it settles."""
+        if self._layout is None:
+            self._initialize_layout()
+        self._layout.run(iterations)
+        self._sync_layout_positions(self._layout.xs, self._layout.ys)
+        if self._layout.done:
+            logger.debug(
+                f"NetworkGraph layout '{self._layout.method}': "
+                f"{self._layout.iterations} iterations, converged={self._layout.converged}"
+            )
+
+    def _sync_layout_positions(self, xs: List[float], ys: List[float]):
+        """Copy layout positions into node_positions."""
+        for node, x, y in zip(self.nodes, xs, ys):
+            self.node_positions[node] = [x, y]
+
+    def _start_layout_worker(self):
+        """Run the layout in a worker thread and poll it for snapshots.
+
+        The worker owns the layout engine and posts a copy of the positions
+        every LAYOUT_STEPS_PER_FRAME iterations to a one-slot queue, replacing
+        a snapshot the UI has not taken yet; the Tk loop shows the newest
+        snapshot per poll through redraw_chart(), which moves the existing
+        canvas items, so the UI stays responsive while large graphs settle and
+        never replays stale layouts.
+
         Requirements: 3.2, 3.6, 6.3
         """
-        max_steps = 50
-        if step >= max_steps:
-            self.redraw_chart()
-            self._add_interactivity()
-            return
-        
+        stop = threading.Event()
+        snapshots = queue.Queue(maxsize=1)
+        self._layout_stop = stop
+        self._layout_queue = snapshots
+        self._layout_thread = threading.Thread(
+            target=self._run_layout, args=(self._layout, stop, snapshots),
+            name='ChartForgeTK-layout', daemon=True
+        )
+        self._layout_thread.start()
+        self._poll_layout()
+
+    def _run_layout(self, layout: ForceLayout, stop: threading.Event, snapshots: queue.Queue):
+        """Worker thread body: step the layout and post snapshots until it is done or stopped.
+
+        Unless stopped first, the last snapshot posted is flagged done.
+        """
+        try:
+            while not stop.is_set():
+                layout.run(self.LAYOUT_STEPS_PER_FRAME)
+                self._post_snapshot(snapshots, (list(layout.xs), list(layout.ys), layout.done))
+                if layout.done:
+                    return
+        except Exception as e:
+            logger.warning(f"NetworkGraph layout failed: {e}")
+            self._post_snapshot(snapshots, (list(layout.xs), list(layout.ys), True))
+
+    @staticmethod
+    def _post_snapshot(snapshots: queue.Queue, snapshot: tuple):
+        """Put a snapshot in the one-slot queue, replacing one the UI has not taken yet."""
+        # Single producer: after dropping the pending snapshot the put succeeds
+        while True:
+            try:
+                snapshots.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    snapshots.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _poll_layout(self):
+        """Show the next layout snapshot, then reschedule until the layout is done.
+
+        Requirements: 3.2, 3.6, 6.3
+        """
+        if self._layout_queue is None:
+            return  # Worker was stopped by a new plot() or destroy()
+
         # Check if widget still exists before updating (Requirements: 6.3)
         try:
             if not self.canvas.winfo_exists():
+                self._stop_layout_worker()
                 return
         except tk.TclError:
+            self._stop_layout_worker()
             return
-        
-        self._calculate_layout(iterations=1)
-        self.redraw_chart()
-        
+
+        done = False
+        try:
+            xs, ys, done = self._layout_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self._sync_layout_positions(xs, ys)
+            self.redraw_chart()
+
+        if done:
+            self._layout_thread = None
+            self._layout_stop = None
+            self._layout_queue = None
+            logger.debug(
+                f"NetworkGraph layout '{self._layout.method}': "
+                f"{self._layout.iterations} iterations, converged={self._layout.converged}"
+            )
+            self._add_interactivity()
+            return
+
         # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-        after_id = self.after(20, lambda: self._animate_layout(step + 1))
+        after_id = self.after(self.LAYOUT_POLL_MS, self._poll_layout)
         self.resource_manager.register_animation(after_id)
 
+    def _stop_layout_worker(self):
+        """Ask a running layout worker to stop and forget its snapshots."""
+        if self._layout_stop is not None:
+            self._layout_stop.set()
+        self._layout_thread = None
+        self._layout_stop = None
+        self._layout_queue = None
+
+    def _finish_pending_render(self):
+        """Wait for a running layout worker and show its final positions."""
+        thread = self._layout_thread
+        if thread is not None and self._layout_queue is not None:
+            thread.join()
+            # The queue now holds the final snapshot, flagged done
+            if not self._layout_queue.empty():
+                self._poll_layout()
+        super()._finish_pending_render()
+
+    def destroy(self):
+        """Stop the layout worker, then destroy the chart."""
+        self._stop_layout_worker()
+        super().destroy()
+
     def redraw_chart(self):
-        """Redraw the network graph efficiently."""
+        """Redraw the network graph efficiently.
+
+        The scene is retained: node gradient stacks, outlines, labels and
+        edges are created once per plot() and afterwards only moved to the
+        current node_positions. It is rebuilt if the canvas was cleared.
+        """
+        if self._scene_positions is None or not self.canvas.find_withtag('node_0'):
+            self._build_scene()
+            return
+
+        moved = [i for i in range(len(self.nodes)) if self._move_node_items(i)]
+        if len(moved) * 4 < len(self.nodes):
+            # Only a few nodes moved: touch just the edges attached to them
+            edges = sorted({e for i in moved for e in self._node_edges[i]})
+        else:
+            edges = range(len(self.edges))
+        self._move_edge_items(edges)
+
+    def _build_scene(self):
+        """Create every canvas item of the graph at the current node_positions."""
         self.canvas.delete("all")
+        self.reset_overlays()
         self._draw_title()
+
+        self._node_edges = [[] for _ in self.nodes]
+        index = {node: i for i, node in enumerate(self.nodes)}
+        for i, (source, target) in enumerate(self.edges):
+            self._node_edges[index[source]].append(i)
+            if target != source:
+                self._node_edges[index[target]].append(i)
         
         for i, (source, target) in enumerate(self.edges):
             start, end = self.node_positions[source], self.node_positions[target]
@@ -290,14 +418,18 @@ class NetworkGraph(Chart):
                 self.canvas.create_text(mid_x, mid_y, text=f"{self.edge_values[i]:.2f}",
                                        font=self.font, fill=self.style.TEXT, tags=('edge_label', f'elabel_{i}'))
 
+        gradients = {}
         for i, node in enumerate(self.nodes):
             x, y = self.node_positions[node]
             radius = self.node_radius * self.scaled_node_values[i]
             color = self.style.get_gradient_color(i, len(self.nodes))
-            
-            for r in range(int(radius), 0, -1):
-                alpha = r / radius
-                gradient_color = self.style.create_rgba_from_hex(color, alpha * 0.8)
+
+            # Nodes of the same color and size share one list of ring colors
+            key = (color, radius)
+            if key not in gradients:
+                gradients[key] = [self.style.create_rgba_from_hex(color, r / radius * 0.8)
+                                  for r in range(int(radius), 0, -1)]
+            for r, gradient_color in zip(range(int(radius), 0, -1), gradients[key]):
                 self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=gradient_color, outline="", tags=('node', f'node_{i}'))
             
             node_id = self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius,
@@ -307,6 +439,30 @@ class NetworkGraph(Chart):
                                    tags=('label', f'label_{i}', node))
             self.interactive_elements[node] = node_id
 
+        self._scene_positions = [tuple(self.node_positions[node]) for node in self.nodes]
+
+    def _move_node_items(self, i: int) -> bool:
+        """Shift node i's items to its position in node_positions; return True if it moved."""
+        x, y = self.node_positions[self.nodes[i]]
+        old_x, old_y = self._scene_positions[i]
+        dx, dy = x - old_x, y - old_y
+        if not (dx or dy):
+            return False
+        # One move per tag shifts the whole gradient stack and outline together
+        self.canvas.move(f'node_{i}', dx, dy)
+        self.canvas.move(f'label_{i}', dx, dy)
+        self._scene_positions[i] = (x, y)
+        return True
+
+    def _move_edge_items(self, edges):
+        """Set edge (and edge label) coordinates from node_positions."""
+        for i in edges:
+            source, target = self.edges[i]
+            start, end = self.node_positions[source], self.node_positions[target]
+            self.canvas.coords(f'edge_{i}', start[0], start[1], end[0], end[1])
+            if self.show_edge_labels:
+                self.canvas.coords(f'elabel_{i}', (start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
+
     def _draw_title(self):
         """Draw the chart title."""
         if self.title:
@@ -340,13 +496,17 @@ class NetworkGraph(Chart):
         style.configure('Tooltip.TFrame', background=self.style.TEXT, relief='solid', borderwidth=0)
         style.configure('Tooltip.TLabel', background=self.style.TEXT, foreground=self.style.BACKGROUND)
 
-        current_highlight = None
+        glow_rings = ('glow_0', 'glow_1', 'glow_2')
 
         def on_enter(event):
             """Handle mouse enter events (Requirements: 7.2)"""
-            nonlocal current_highlight
             try:
                 items = self.canvas.find_closest(event.x, event.y)
+                # Look past the glow rings to the node or edge underneath
+                for _ in glow_rings:
+                    if not items or 'overlay' not in self.canvas.gettags(items[0]):
+                        break
+                    items = self.canvas.find_closest(event.x, event.y, 0, items[0])
                 if not items:
                     return
                 item = items[0]
@@ -354,13 +514,7 @@ class NetworkGraph(Chart):
                 if not tags:  # No tags, ignore
                     return
 
-                if current_highlight:
-                    for h in current_highlight:
-                        try:
-                            self.canvas.delete(h)
-                        except tk.TclError:
-                            pass
-                    current_highlight = None
+                self.hide_overlay(*glow_rings)
 
                 if 'node' in tags and len(tags) >= 3:  # Ensure node tag has label
                     node = tags[2]
@@ -371,16 +525,14 @@ class NetworkGraph(Chart):
                         return
                     x, y = self.node_positions[node]
                     radius = self.node_radius * self.scaled_node_values[idx]
-                    highlight_items = []
-                    for i in range(3):
+                    for i, ring in enumerate(glow_rings):
                         offset = i * 2
                         alpha = 0.3 - i * 0.1
                         glow_color = self.style.create_rgba_from_hex(self.style.SECONDARY, alpha)
-                        glow = self.canvas.create_oval(x - radius - offset, y - radius - offset,
-                                                      x + radius + offset, y + radius + offset,
-                                                      outline=glow_color, width=2, tags='highlight')
-                        highlight_items.append(glow)
-                    current_highlight = highlight_items
+                        self.show_overlay(ring, 'oval',
+                                          (x - radius - offset, y - radius - offset,
+                                           x + radius + offset, y + radius + offset),
+                                          outline=glow_color, width=2)
                     tooltip_text = f"Node: {node}\nValue: {self.node_values[idx]:.2f}"
                     label.config(text=tooltip_text)
                     tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root - 30}")
@@ -405,20 +557,13 @@ class NetworkGraph(Chart):
 
         def on_leave(event):
             """Handle mouse leave events"""
-            nonlocal current_highlight
             try:
                 if not self._drag_data:
                     items = self.canvas.find_closest(event.x, event.y)
                     if items:
                         item = items[0]
                         tags = self.canvas.gettags(item)
-                        if current_highlight:
-                            for h in current_highlight:
-                                try:
-                                    self.canvas.delete(h)
-                                except tk.TclError:
-                                    pass
-                            current_highlight = None
+                        self.hide_overlay(*glow_rings)
                         if 'edge' in tags:
                             try:
                                 self.canvas.itemconfig(item, fill=self.edge_color, width=self.edge_width)
@@ -481,15 +626,12 @@ class NetworkGraph(Chart):
                     self.pinned_tooltips[item] = pinned
 
         # Bind events and register with resource manager (Requirements: 3.5)
-        motion_id = self.canvas.bind('<Motion>', on_enter)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
+        self.bind_hover(on_enter, on_leave)
         press_id = self.canvas.bind('<ButtonPress-1>', on_drag_start)
         drag_id = self.canvas.bind('<B1-Motion>', on_drag)
         release_id = self.canvas.bind('<ButtonRelease-1>', on_drag_stop)
         click_id = self.canvas.bind('<Button-1>', on_click)
         
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
         self.resource_manager.register_binding(self.canvas, '<ButtonPress-1>', press_id)
         self.resource_manager.register_binding(self.canvas, '<B1-Motion>', drag_id)
         self.resource_manager.register_binding(self.canvas, '<ButtonRelease-1>', release_id)
@@ -497,15 +639,8 @@ class NetworkGraph(Chart):
 
     def _update_node_and_edges(self, node: str):
         """Update the position of a dragged node and its connected edges."""
-        x, y = self.node_positions[node]
-        radius = self.node_radius * self.scaled_node_values[self.nodes.index(node)]
-        self.canvas.coords(f'node_{self.nodes.index(node)}', x - radius, y - radius, x + radius, y + radius)
-        self.canvas.coords(f'label_{self.nodes.index(node)}', x, y)
-        
-        for i, (source, target) in enumerate(self.edges):
-            if source == node or target == node:
-                start = self.node_positions[source]
-                end = self.node_positions[target]
-                self.canvas.coords(f'edge_{i}', start[0], start[1], end[0], end[1])
-                if self.show_edge_labels:
-                    self.canvas.coords(f'elabel_{i}', (start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
\ No newline at end of file
+        if self._scene_positions is None:
+            return
+        idx = self.nodes.index(node)
+        if self._move_node_items(idx):
+            self._move_edge_items(self._node_edges[idx])
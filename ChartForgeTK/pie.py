@@ -21,6 +21,7 @@ from tkinter import ttk
 import math
 import logging
 from .core import Chart, ChartStyle
+from .animation import Tween, linear
 from .validation import DataValidator
 
 logger = logging.getLogger('ChartForgeTK')
@@ -50,6 +51,7 @@ class PieChart(Chart):
         self.thickness = 30 if is_3d else 0  # Thickness for 3D effect, 0 for 2D
         self.tilt_factor = 0.5 if is_3d else 1  # Tilt factor for 3D, 1 for flat 2D
         self.original_colors = []  # Store original colors for slices
+        self._explosion = None  # Running enlarge animation of the selected slice
         self._tooltip = None  # Tooltip window reference
 
     def plot(
@@ -145,6 +147,7 @@ class PieChart(Chart):
         
         # Clear previous content
         self.canvas.delete('all')
+        self.reset_overlays()
         
         # Reset stored colors
         self.original_colors = []
@@ -165,9 +168,6 @@ class PieChart(Chart):
         
         Requirements: 3.2, 3.6
         """
-        def ease(t):
-            return t * t * (3 - 2 * t)  # Ease-in-out
-        
         self.slices = []  # Reset slices list
         self.slice_angles = []  # Reset slice angles list
         self.label_items = []  # Reset label items list
@@ -178,123 +178,87 @@ class PieChart(Chart):
         if is_single_point:
             logger.debug("Single data point detected, rendering full circle")
         
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
-            
-            progress = ease(frame / total_frames)
-            current_angle = 0
-            
-            # Clear previous slices and labels
-            for item in self.slices + self.label_items:
-                try:
-                    self.canvas.delete(item)
-                except tk.TclError:
-                    pass
-            self.slices.clear()
-            self.slice_angles.clear()
-            self.label_items.clear()
-            
-            # Draw the "sides" of the pie chart (only if 3D)
-            if self.is_3d:
-                for i, value in enumerate(self.data):
-                    angle = (value / self.total) * 2 * math.pi * progress
-                    end_angle = current_angle + angle
-                    color = self.style.get_gradient_color(i, len(self.data))
-                    if frame == 0:  # Store original colors only once
-                        self.original_colors.append(color)
-                    
-                    # Draw the side of the slice (darker shade for depth)
-                    if progress > 0:  # Only draw sides when there's an angle
-                        shadow_color = self.style.create_shadow(color)
-                        for depth in range(self.thickness):
-                            y_offset = depth * self.tilt_factor
-                            try:
-                                side = self.canvas.create_arc(
-                                    self.center_x - self.radius,
-                                    self.center_y - self.radius + y_offset,
-                                    self.center_x + self.radius,
-                                    self.center_y + self.radius + y_offset,
-                                    start=math.degrees(current_angle),
-                                    extent=math.degrees(angle),
-                                    fill=shadow_color,
-                                    outline="",
-                                    style=tk.PIESLICE,
-                                    tags=('side', f'slice_{i}')
-                                )
-                                self.slices.append(side)
-                            except tk.TclError:
-                                pass
-                    
-                    current_angle = end_angle
-            
-            # Draw the top of the slices (over the sides if 3D, flat if 2D)
-            current_angle = 0
+        # Every arc is created once with zero extent; the animation sweeps
+        # start and extent from 0 to the slice's final angles
+        tweens = []
+        closed = {'start': 0.0, 'extent': 0.0}
+        current_angle = 0
+        for value in self.data:
+            angle = (value / self.total) * 2 * math.pi
+            self.slice_angles.append((current_angle, current_angle + angle))
+            current_angle += angle
+        
+        # Draw the "sides" of the pie chart (only if 3D)
+        for i in range(len(self.data)):
+            color = self.style.get_gradient_color(i, len(self.data))
+            self.original_colors.append(color)
+            if not self.is_3d:
+                continue
+            start_angle, end_angle = self.slice_angles[i]
+            opened = {'start': math.degrees(start_angle), 'extent': math.degrees(end_angle - start_angle)}
+            # Draw the side of the slice (darker shade for depth)
+            shadow_color = self.style.create_shadow(color)
+            for depth in range(self.thickness):
+                y_offset = depth * self.tilt_factor
+                side = self.canvas.create_arc(
+                    self.center_x - self.radius,
+                    self.center_y - self.radius + y_offset,
+                    self.center_x + self.radius,
+                    self.center_y + self.radius + y_offset,
+                    start=0, extent=0,
+                    fill=shadow_color,
+                    outline="",
+                    style=tk.PIESLICE,
+                    tags=('side', f'slice_{i}')
+                )
+                self.slices.append(side)
+                tweens.append(Tween(side, closed, opened))
+        
+        # Draw the top of the slices (over the sides if 3D, flat if 2D)
+        for i in range(len(self.data)):
+            start_angle, end_angle = self.slice_angles[i]
+            color = self.original_colors[i]
+            # Draw the top surface (elliptical for 3D, circular for 2D)
+            slice_item = self.canvas.create_arc(
+                self.center_x - self.radius,
+                self.center_y - self.radius,
+                self.center_x + self.radius,
+                self.center_y + self.radius - (self.thickness * self.tilt_factor if self.is_3d else 0),
+                start=0, extent=0,
+                fill=color,
+                outline=self.style.adjust_brightness(color, 1.1),
+                width=1,
+                style=tk.PIESLICE,
+                tags=('slice', f'slice_{i}')
+            )
+            self.slices.append(slice_item)
+            tweens.append(Tween(
+                slice_item, closed,
+                {'start': math.degrees(start_angle), 'extent': math.degrees(end_angle - start_angle)}
+            ))
+        
+        def add_labels():
+            # Add labels once the slices are fully drawn
             for i, value in enumerate(self.data):
-                angle = (value / self.total) * 2 * math.pi * progress
-                end_angle = current_angle + angle
-                self.slice_angles.append((current_angle, end_angle))  # Store slice angles
-                color = self.style.get_gradient_color(i, len(self.data))
-                if frame == 0 and not self.is_3d:  # Store colors for 2D case
-                    self.original_colors.append(color)
-                
-                # Draw the top surface (elliptical for 3D, circular for 2D)
-                try:
-                    slice_item = self.canvas.create_arc(
-                        self.center_x - self.radius,
-                        self.center_y - self.radius,
-                        self.center_x + self.radius,
-                        self.center_y + self.radius - (self.thickness * self.tilt_factor if self.is_3d else 0),
-                        start=math.degrees(current_angle),
-                        extent=math.degrees(angle),
-                        fill=color,
-                        outline=self.style.adjust_brightness(color, 1.1),
-                        width=1,
-                        style=tk.PIESLICE,
-                        tags=('slice', f'slice_{i}')
-                    )
-                    self.slices.append(slice_item)
-                except tk.TclError:
-                    pass
-                
-                # Add label when slice is fully drawn
-                if progress == 1:
-                    mid_angle = current_angle + angle / 2
-                    label_radius = self.radius * 1.2
-                    lx = self.center_x + label_radius * math.cos(mid_angle)
-                    ly = self.center_y - label_radius * math.sin(mid_angle) - (self.thickness * self.tilt_factor / 2 if self.is_3d else 0)
-                    percentage = (value / self.total) * 100
-                    label_text = f"{self.labels[i]}\n{percentage:.1f}%"
-                    
-                    try:
-                        label = self.canvas.create_text(
-                            lx, ly,
-                            text=label_text,
-                            font=self.style.VALUE_FONT,
-                            fill=self.style.TEXT,
-                            justify='center',
-                            tags=('label', f'slice_{i}')
-                        )
-                        self.label_items.append(label)
-                    except tk.TclError:
-                        pass
+                start_angle, end_angle = self.slice_angles[i]
+                mid_angle = (start_angle + end_angle) / 2
+                label_radius = self.radius * 1.2
+                lx = self.center_x + label_radius * math.cos(mid_angle)
+                ly = self.center_y - label_radius * math.sin(mid_angle) - (self.thickness * self.tilt_factor / 2 if self.is_3d else 0)
+                percentage = (value / self.total) * 100
+                label_text = f"{self.labels[i]}\n{percentage:.1f}%"
                 
-                current_angle = end_angle
-            
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                try:
-                    after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                    self.resource_manager.register_animation(after_id)
-                except tk.TclError:
-                    pass
+                label = self.canvas.create_text(
+                    lx, ly,
+                    text=label_text,
+                    font=self.style.VALUE_FONT,
+                    fill=self.style.TEXT,
+                    justify='center',
+                    tags=('label', f'slice_{i}')
+                )
+                self.label_items.append(label)
         
-        total_frames = self.animation_duration // 16  # ~60 FPS
-        update_animation(0, total_frames)
+        self.animate(tweens, on_complete=add_labels)
 
     def _add_interactive_effects(self):
         """
@@ -302,11 +266,7 @@ class PieChart(Chart):
         
         Requirements: 3.1, 3.5, 7.1, 7.2, 7.6
         """
-        current_highlight = None
-        
         def on_motion(event):
-            nonlocal current_highlight
-            
             if not self.data:
                 return
             
@@ -324,23 +284,18 @@ class PieChart(Chart):
                     slice_angle = (value / self.total) * 2 * math.pi
                     if current_angle <= angle < current_angle + slice_angle:
                         try:
-                            if current_highlight:
-                                self.canvas.delete(current_highlight)
-                            
-                            color = self.style.get_color(i)
-                            highlight = self.canvas.create_arc(
-                                self.center_x - self.radius * 1.1,
-                                self.center_y - self.radius * 1.1,
-                                self.center_x + self.radius * 1.1,
-                                self.center_y + self.radius * 1.1 - (self.thickness * self.tilt_factor if self.is_3d else 0),
+                            self.show_overlay(
+                                'highlight', 'arc',
+                                (self.center_x - self.radius * 1.1,
+                                 self.center_y - self.radius * 1.1,
+                                 self.center_x + self.radius * 1.1,
+                                 self.center_y + self.radius * 1.1 - (self.thickness * self.tilt_factor if self.is_3d else 0)),
                                 start=math.degrees(current_angle),
                                 extent=math.degrees(slice_angle),
-                                outline=color,
+                                outline=self.style.get_color(i),
                                 width=3,
-                                style=tk.PIESLICE,
-                                tags=('highlight',)
+                                style=tk.PIESLICE
                             )
-                            current_highlight = highlight
                             
                             percentage = (value / self.total) * 100
                             self.show_tooltip(
@@ -353,19 +308,14 @@ class PieChart(Chart):
                     current_angle += slice_angle
             else:
                 try:
-                    if current_highlight:
-                        self.canvas.delete(current_highlight)
-                        current_highlight = None
+                    self.hide_overlay('highlight')
                     self.hide_tooltip()
                 except tk.TclError:
                     pass
         
         def on_leave(event):
-            nonlocal current_highlight
             try:
-                if current_highlight:
-                    self.canvas.delete(current_highlight)
-                    current_highlight = None
+                self.hide_overlay('highlight')
                 self.hide_tooltip()
             except tk.TclError:
                 pass
@@ -393,11 +343,8 @@ class PieChart(Chart):
                         break
                     current_angle += slice_angle
         
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
+        self.bind_hover(on_motion, on_leave)
         click_id = self.canvas.bind('<Button-1>', on_click)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
         self.resource_manager.register_binding(self.canvas, '<Button-1>', click_id)
 
     def _enlarge_slice(self, slice_index: int):
@@ -425,86 +372,73 @@ class PieChart(Chart):
         except tk.TclError:
             pass
         
+        # Safety check for original_colors
+        if slice_index >= len(self.original_colors):
+            return
+        
         # Animation parameters
         explosion_offset = 20  # Maximum explosion distance
-        frames = 5  # Number of animation frames
-        delay = 16  # Delay between frames (ms)
+        duration = 80  # ms
+        mid_angle = current_angle + slice_angle / 2
+        offset_x = explosion_offset * math.cos(mid_angle)
+        offset_y = -explosion_offset * math.sin(mid_angle)
+        lift = self.thickness * self.tilt_factor if self.is_3d else 0
         
-        def animate_explosion(frame):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
-            
-            progress = frame / frames
-            offset = explosion_offset * progress
-            offset_x = offset * math.cos(current_angle + slice_angle / 2)
-            offset_y = -offset * math.sin(current_angle + slice_angle / 2)
-            
-            # Safety check for original_colors
-            if slice_index >= len(self.original_colors):
-                return
-            
-            color = self.original_colors[slice_index]
-            shadow_color = self.style.create_shadow(color)
+        color = self.original_colors[slice_index]
+        shadow_color = self.style.create_shadow(color)
+        
+        def moved(box):
+            return tuple(v + (offset_x if k % 2 == 0 else offset_y) for k, v in enumerate(box))
+        
+        # The enlarged slice is created once at the center and slid outward
+        tweens = []
+        try:
+            # Draw the sides of the enlarged slice (only if 3D)
+            if self.is_3d:
+                for depth in range(self.thickness):
+                    y_offset = depth * self.tilt_factor
+                    box = (
+                        self.center_x - self.radius * 1.2, self.center_y - self.radius * 1.2 + y_offset,
+                        self.center_x + self.radius * 1.2, self.center_y + self.radius * 1.2 + y_offset,
+                    )
+                    enlarged_side = self.canvas.create_arc(
+                        *box,
+                        start=math.degrees(current_angle),
+                        extent=math.degrees(slice_angle),
+                        fill=shadow_color,
+                        outline="",
+                        style=tk.PIESLICE,
+                        tags=('enlarged_side',)
+                    )
+                    tweens.append(Tween(enlarged_side, box, moved(box)))
             
-            try:
-                # Clear previous enlarged slice
-                self.canvas.delete('enlarged_slice')
-                self.canvas.delete('enlarged_side')
-                
-                # Draw the sides of the enlarged slice (only if 3D)
-                if self.is_3d:
-                    for depth in range(self.thickness):
-                        y_offset = depth * self.tilt_factor
-                        enlarged_side = self.canvas.create_arc(
-                            self.center_x - self.radius * 1.2 + offset_x,
-                            self.center_y - self.radius * 1.2 + offset_y + y_offset,
-                            self.center_x + self.radius * 1.2 + offset_x,
-                            self.center_y + self.radius * 1.2 + offset_y + y_offset,
-                            start=math.degrees(current_angle),
-                            extent=math.degrees(slice_angle),
-                            fill=shadow_color,
-                            outline="",
-                            style=tk.PIESLICE,
-                            tags=('enlarged_side',)
-                        )
-                
-                # Draw the top of the enlarged slice (elliptical for 3D, circular for 2D)
-                enlarged_slice = self.canvas.create_arc(
-                    self.center_x - self.radius * 1.2 + offset_x,
-                    self.center_y - self.radius * 1.2 + offset_y,
-                    self.center_x + self.radius * 1.2 + offset_x,
-                    self.center_y + self.radius * 1.2 + offset_y - (self.thickness * self.tilt_factor if self.is_3d else 0),
-                    start=math.degrees(current_angle),
-                    extent=math.degrees(slice_angle),
-                    fill=color,
-                    outline=self.style.adjust_brightness(color, 1.1),
-                    width=1,
-                    style=tk.PIESLICE,
-                    tags=('enlarged_slice',)
-                )
-                
-                # Move the label outward (with safety check)
-                if slice_index < len(self.label_items):
-                    label_radius = self.radius * 1.4
-                    lx = self.center_x + label_radius * math.cos(current_angle + slice_angle / 2) + offset_x
-                    ly = self.center_y - label_radius * math.sin(current_angle + slice_angle / 2) + offset_y - (self.thickness * self.tilt_factor / 2 if self.is_3d else 0)
-                    self.canvas.coords(self.label_items[slice_index], lx, ly)
-            except tk.TclError:
-                pass  # Widget may have been destroyed
+            # Draw the top of the enlarged slice (elliptical for 3D, circular for 2D)
+            box = (
+                self.center_x - self.radius * 1.2, self.center_y - self.radius * 1.2,
+                self.center_x + self.radius * 1.2, self.center_y + self.radius * 1.2 - lift,
+            )
+            enlarged_slice = self.canvas.create_arc(
+                *box,
+                start=math.degrees(current_angle),
+                extent=math.degrees(slice_angle),
+                fill=color,
+                outline=self.style.adjust_brightness(color, 1.1),
+                width=1,
+                style=tk.PIESLICE,
+                tags=('enlarged_slice',)
+            )
+            tweens.append(Tween(enlarged_slice, box, moved(box)))
             
-            if frame < frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                try:
-                    after_id = self.canvas.after(delay, animate_explosion, frame + 1)
-                    self.resource_manager.register_animation(after_id)
-                except tk.TclError:
-                    pass
+            # Move the label outward (with safety check)
+            if slice_index < len(self.label_items):
+                label_radius = self.radius * 1.4
+                lx = self.center_x + label_radius * math.cos(mid_angle)
+                ly = self.center_y - label_radius * math.sin(mid_angle) - lift / 2
+                tweens.append(Tween(self.label_items[slice_index], (lx, ly), (lx + offset_x, ly + offset_y)))
+        except tk.TclError:
+            return  # Widget may have been destroyed
         
-        animate_explosion(0)
+        self._explosion = self.animate(tweens, duration, easing=linear)
 
     def _reset_slice(self, slice_index: int):
         """Reset the slice and its label to their original positions and restore original color."""
@@ -514,6 +448,9 @@ class PieChart(Chart):
         if not self.original_colors or slice_index >= len(self.original_colors):
             return
         
+        if self._explosion is not None:
+            self.animator.cancel(self._explosion)
+            self._explosion = None
         try:
             self.canvas.delete('enlarged_slice')
             self.canvas.delete('enlarged_side')
@@ -238,6 +238,11 @@ class ResourceManager:
                 logger.warning(f"Error cancelling animation {after_id}: {e}")
         
         self._animation_ids.clear()
+        
+        # Tweened animations run on the shared scheduler, not on the ids above
+        animator = getattr(self._chart, 'animator', None)
+        if animator is not None:
+            animator.clear()
         logger.debug(f"Cancelled {cancelled_count} animations")
         return cancelled_count
     
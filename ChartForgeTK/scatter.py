@@ -27,6 +27,7 @@ import math
 import logging
 from .core import Chart
 from .validation import DataValidator
+from .spatial import PointGrid
 
 logger = logging.getLogger('ChartForgeTK')
 
@@ -37,6 +38,9 @@ class ScatterPlot(Chart):
     
     Requirements: 1.1, 1.2, 1.3, 2.1, 2.2, 2.3, 3.1, 3.2, 3.6, 9.1, 9.2
     """
+
+    # Hover hit-testing distance in pixels
+    HOVER_RADIUS = 20
     
     def __init__(self, parent=None, width: int = 800, height: int = 600, display_mode='frame', theme='light', palette='modern'):
         super().__init__(parent, width=width, height=height, display_mode=display_mode, theme=theme, palette=palette)
@@ -45,6 +49,7 @@ class ScatterPlot(Chart):
         self.animation_duration = 500
         self.points = []
         self._tooltip = None  # Tooltip window reference
+        self._hover_index = PointGrid(self.HOVER_RADIUS)  # Pixel positions of self.data for hit-testing
         # Initialize range variables
         self.x_min = self.x_max = self.y_min = self.y_max = 0
 
@@ -309,14 +314,23 @@ class ScatterPlot(Chart):
                 if y_outliers:
                     logger.debug(f"Detected {len(y_outliers)} y-axis outliers, all points will be visible")
         
-        # Clear previous content
-        self.canvas.delete('all')
+        # Clear previous content; grid and axes are updated in place
+        self.clear_layer('data')
         self.points.clear()
         
         self._draw_axes(self.x_min, self.x_max, self.y_min, self.y_max)
+        self._build_hover_index()
         self._animate_points(self.x_min, self.x_max, self.y_min, self.y_max)
         self._add_interactive_effects()
 
+    def _build_hover_index(self):
+        """Index the pixel position of every point once per render for hover hit-testing."""
+        self._hover_index = PointGrid(self.HOVER_RADIUS)
+        for i, (x, y) in enumerate(self.data):
+            px = self._data_to_pixel_x(x, self.x_min, self.x_max)
+            py = self._data_to_pixel_y(y, self.y_min, self.y_max)
+            self._hover_index.add(px, py, i)
+
 
     def _animate_points(self, x_min: float, x_max: float, y_min: float, y_max: float):
         """
@@ -329,79 +343,47 @@ class ScatterPlot(Chart):
         
         Requirements: 3.2, 3.6
         """
-        def ease(t):
-            return t * t * (3 - 2 * t)
-        
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
-            
-            progress = ease(frame / total_frames)
-            
-            # Clear previous points
-            for item in self.points:
-                try:
-                    self.canvas.delete(item)
-                except tk.TclError:
-                    pass
-            self.points.clear()
+        # Points are drawn once; their labels follow when the animation ends
+        self.points.clear()
+        for i, (x, y) in enumerate(self.data):
+            px = self._data_to_pixel_x(x, x_min, x_max)
+            py = self._data_to_pixel_y(y, y_min, y_max)
+            color = self.style.get_gradient_color(i, len(self.data))
             
+            # Draw shadow
+            self.points.append(self.canvas.create_oval(
+                px - self.point_radius + 2,
+                py - self.point_radius + 2,
+                px + self.point_radius + 2,
+                py + self.point_radius + 2,
+                fill=self.style.create_shadow(color),
+                outline="",
+                tags=('shadow', f'point_{i}')
+            ))
+            self.points.append(self.canvas.create_oval(
+                px - self.point_radius,
+                py - self.point_radius,
+                px + self.point_radius,
+                py + self.point_radius,
+                fill=color,
+                outline=self.style.adjust_brightness(color, 0.8),
+                tags=('point', f'point_{i}')
+            ))
+        
+        def add_labels():
             for i, (x, y) in enumerate(self.data):
                 px = self._data_to_pixel_x(x, x_min, x_max)
                 py = self._data_to_pixel_y(y, y_min, y_max)
-                color = self.style.get_gradient_color(i, len(self.data))
-                
-                # Draw shadow
-                try:
-                    shadow = self.canvas.create_oval(
-                        px - self.point_radius + 2,
-                        py - self.point_radius + 2,
-                        px + self.point_radius + 2,
-                        py + self.point_radius + 2,
-                        fill=self.style.create_shadow(color),
-                        outline="",
-                        tags=('shadow', f'point_{i}')
-                    )
-                    self.points.append(shadow)
-                    
-                    point = self.canvas.create_oval(
-                        px - self.point_radius,
-                        py - self.point_radius,
-                        px + self.point_radius,
-                        py + self.point_radius,
-                        fill=color,
-                        outline=self.style.adjust_brightness(color, 0.8),
-                        tags=('point', f'point_{i}')
-                    )
-                    self.points.append(point)
-                    
-                    if progress == 1:
-                        label = self.canvas.create_text(
-                            px, py - 15,
-                            text=f"({x:.1f}, {y:.1f})",
-                            font=self.style.VALUE_FONT,
-                            fill=self.style.TEXT,
-                            anchor='s',
-                            tags=('label', f'point_{i}')
-                        )
-                        self.points.append(label)
-                except tk.TclError:
-                    pass  # Widget may have been destroyed
-            
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                try:
-                    after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                    self.resource_manager.register_animation(after_id)
-                except tk.TclError:
-                    pass  # Widget may have been destroyed
-        
-        total_frames = self.animation_duration // 16
-        update_animation(0, total_frames)
+                self.points.append(self.canvas.create_text(
+                    px, py - 15,
+                    text=f"({x:.1f}, {y:.1f})",
+                    font=self.style.VALUE_FONT,
+                    fill=self.style.TEXT,
+                    anchor='s',
+                    tags=('label', f'point_{i}')
+                ))
+        
+        self.animate([], on_complete=add_labels, item_count=len(self.data))
 
     def _add_interactive_effects(self):
         """
@@ -409,47 +391,28 @@ class ScatterPlot(Chart):
         
         Requirements: 3.1, 3.5, 7.1, 7.2, 7.6
         """
-        current_highlight = None
-        
         def on_motion(event):
-            nonlocal current_highlight
-            
             if not self.data:
                 return
             
             x, y = event.x, event.y
             
             if self.padding <= x <= self.width - self.padding and self.padding <= y <= self.height - self.padding:
-                closest_idx = -1
-                min_dist = float('inf')
-                
-                for i, (dx, dy) in enumerate(self.data):
-                    px = self._data_to_pixel_x(dx, self.x_min, self.x_max)
-                    py = self._data_to_pixel_y(dy, self.y_min, self.y_max)
-                    dist = math.sqrt((x - px)**2 + (y - py)**2)
-                    if dist < min_dist and dist < 20:
-                        min_dist = dist
-                        closest_idx = i
+                # Grid lookup only visits the cells around the cursor
+                hit = self._hover_index.nearest(x, y, self.HOVER_RADIUS)
+                closest_idx = hit[0] if hit is not None else -1
                 
                 if closest_idx >= 0:
                     px = self._data_to_pixel_x(self.data[closest_idx][0], self.x_min, self.x_max)
                     py = self._data_to_pixel_y(self.data[closest_idx][1], self.y_min, self.y_max)
                     
                     try:
-                        if current_highlight:
-                            self.canvas.delete(current_highlight)
-                        
-                        color = self.style.get_color(closest_idx)
-                        highlight = self.canvas.create_oval(
-                            px - self.point_radius - 4,
-                            py - self.point_radius - 4,
-                            px + self.point_radius + 4,
-                            py + self.point_radius + 4,
-                            outline=color,
-                            width=2.5,
-                            tags=('highlight',)
+                        r = self.point_radius + 4
+                        self.show_overlay(
+                            'highlight', 'oval', (px - r, py - r, px + r, py + r),
+                            outline=self.style.get_color(closest_idx),
+                            width=2.5
                         )
-                        current_highlight = highlight
                         
                         x_val, y_val = self.data[closest_idx]
                         self.show_tooltip(
@@ -460,24 +423,16 @@ class ScatterPlot(Chart):
                         pass
                 else:
                     try:
-                        if current_highlight:
-                            self.canvas.delete(current_highlight)
-                            current_highlight = None
+                        self.hide_overlay('highlight')
                         self.hide_tooltip()
                     except tk.TclError:
                         pass
         
         def on_leave(event):
-            nonlocal current_highlight
             try:
-                if current_highlight:
-                    self.canvas.delete(current_highlight)
-                    current_highlight = None
+                self.hide_overlay('highlight')
                 self.hide_tooltip()
             except tk.TclError:
                 pass
         
-        motion_id = self.canvas.bind('<Motion>', on_motion)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
+        self.bind_hover(on_motion, on_leave)
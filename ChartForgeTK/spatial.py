@@ -0,0 +1,140 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Spatial indexing module for ChartForgeTK.
+
+Provides a uniform grid over pixel space for hover hit-testing. Charts build
+the grid once per render (and rebuild it on zoom or resize); each mouse move
+then only inspects the few cells around the cursor instead of every point.
+"""
+
+import math
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger('ChartForgeTK')
+
+
+class PointGrid:
+    """
+    Uniform grid of points in pixel space for nearest-point queries.
+
+    Each point carries a key (returned by queries) and an optional reach,
+    the largest distance at which it can still be hit (e.g. a bubble's radius
+    plus a margin). Ties are broken in insertion order, so a query returns
+    the same point a linear scan with a strict ``<`` comparison would.
+    """
+
+    def __init__(self, cell_size: float = 20.0):
+        """
+        Initialize the PointGrid.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels. Matching it
+                to the typical query radius keeps queries to a 3x3 block.
+
+        Raises:
+            ValueError: If cell_size is not positive
+        """
+        if not cell_size > 0:
+            raise ValueError(
+                f"[ChartForgeTK] Error: cell_size must be positive, got {cell_size}."
+            )
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, Any, Optional[float], int]]] = {}
+        self._count = 0
+        self._max_reach = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        """Remove all points."""
+        self._cells.clear()
+        self._count = 0
+        self._max_reach = 0.0
+
+    def add(self, x: float, y: float, key: Any, reach: Optional[float] = None):
+        """
+        Add a point.
+
+        Args:
+            x, y: Pixel position
+            key: Value returned by nearest() for this point
+            reach: Optional per-point hit distance; queries use their own
+                max_dist for points without one
+        """
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            bucket = self._cells[cell] = []
+        bucket.append((x, y, key, reach, self._count))
+        self._count += 1
+        if reach is not None and reach > self._max_reach:
+            self._max_reach = reach
+
+    def extend(self, points: Iterable[Tuple[float, float, Any]]):
+        """Add (x, y, key) points."""
+        for x, y, key in points:
+            self.add(x, y, key)
+
+    def nearest(self, x: float, y: float, max_dist: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """
+        Find the nearest point that can be hit from (x, y).
+
+        A point is a candidate when its distance is strictly less than its
+        reach, or than max_dist for points added without a reach.
+
+        Args:
+            x, y: Query position in pixels
+            max_dist: Hit distance for points without their own reach
+
+        Returns:
+            (key, distance) of the nearest candidate, or None
+        """
+        radius = max(max_dist or 0.0, self._max_reach)
+        if radius <= 0 or not self._cells:
+            return None
+
+        size = self.cell_size
+        col_lo = math.floor((x - radius) / size)
+        col_hi = math.floor((x + radius) / size)
+        row_lo = math.floor((y - radius) / size)
+        row_hi = math.floor((y + radius) / size)
+
+        best = None
+        best_dist = math.inf
+        best_seq = -1
+        cells = self._cells
+        for col in range(col_lo, col_hi + 1):
+            for row in range(row_lo, row_hi + 1):
+                bucket = cells.get((col, row))
+                if not bucket:
+                    continue
+                for px, py, key, reach, seq in bucket:
+                    dist = math.hypot(x - px, y - py)
+                    limit = max_dist if reach is None else reach
+                    if limit is None or dist >= limit:
+                        continue
+                    if dist < best_dist or (dist == best_dist and seq < best_seq):
+                        best = key
+                        best_dist = dist
+                        best_seq = seq
+
+        if best is None:
+            return None
+        return best, best_dist
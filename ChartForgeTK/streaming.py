@@ -0,0 +1,167 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Streaming storage for ChartForgeTK.
+
+Provides a fixed-capacity ring buffer for live series. Appends are O(1),
+the oldest samples are evicted once the buffer is full, and the running
+minimum and maximum are tracked incrementally so charts can update their
+value range without rescanning the data.
+"""
+
+import logging
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger('ChartForgeTK')
+
+
+class RingBuffer:
+    """
+    Fixed-capacity sequence of floats that drops its oldest values when full.
+
+    Supports len(), iteration, integer and slice indexing (position 0 is the
+    oldest retained sample), so it can stand in for the plain lists charts
+    store their data in.
+    """
+
+    def __init__(self, capacity: int, values: Iterable[float] = ()):
+        """
+        Initialize the RingBuffer.
+
+        Args:
+            capacity: Maximum number of samples kept
+            values: Initial samples (only the newest `capacity` are kept)
+
+        Raises:
+            TypeError: If capacity is not an integer
+            ValueError: If capacity is less than 1
+        """
+        if isinstance(capacity, bool) or not isinstance(capacity, int):
+            raise TypeError(
+                f"[ChartForgeTK] Error: capacity must be an integer, "
+                f"got {type(capacity).__name__}."
+            )
+        if capacity < 1:
+            raise ValueError(
+                f"[ChartForgeTK] Error: capacity must be at least 1, got {capacity}."
+            )
+
+        self._capacity = capacity
+        self._items: List[float] = [0.0] * capacity
+        self._start = 0    # Slot of the oldest sample
+        self._size = 0
+        self._total = 0    # Number of samples ever appended
+
+        # Monotonic queues of (sequence number, value) for sliding min/max
+        self._min_queue = deque()
+        self._max_queue = deque()
+
+        self.extend(values)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples kept."""
+        return self._capacity
+
+    @property
+    def total_appended(self) -> int:
+        """Number of samples appended since creation, including evicted ones."""
+        return self._total
+
+    def append(self, value: float) -> bool:
+        """
+        Append a sample, evicting the oldest one if the buffer is full.
+
+        Returns:
+            bool: True if a sample was evicted
+        """
+        evicted = self._size == self._capacity
+        if evicted:
+            self._items[self._start] = value
+            self._start = (self._start + 1) % self._capacity
+        else:
+            self._items[(self._start + self._size) % self._capacity] = value
+            self._size += 1
+
+        seq = self._total
+        self._total += 1
+        oldest = self._total - self._size
+
+        while self._min_queue and self._min_queue[-1][1] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((seq, value))
+        while self._min_queue[0][0] < oldest:
+            self._min_queue.popleft()
+
+        while self._max_queue and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((seq, value))
+        while self._max_queue[0][0] < oldest:
+            self._max_queue.popleft()
+
+        return evicted
+
+    def extend(self, values: Iterable[float]) -> int:
+        """
+        Append several samples.
+
+        Returns:
+            int: Number of samples evicted
+        """
+        evicted = 0
+        for value in values:
+            if self.append(value):
+                evicted += 1
+        return evicted
+
+    def min(self) -> Optional[float]:
+        """Smallest retained sample, or None when empty."""
+        return self._min_queue[0][1] if self._size else None
+
+    def max(self) -> Optional[float]:
+        """Largest retained sample, or None when empty."""
+        return self._max_queue[0][1] if self._size else None
+
+    def tolist(self) -> List[float]:
+        """Return the retained samples, oldest first, as a new list."""
+        end = self._start + self._size
+        if end <= self._capacity:
+            return self._items[self._start:end]
+        return self._items[self._start:] + self._items[:end - self._capacity]
+
+    def copy(self) -> 'RingBuffer':
+        """Return an independent buffer with the same capacity and samples."""
+        return RingBuffer(self._capacity, self.tolist())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.tolist())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, List[float]]:
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return self._items[(self._start + index) % self._capacity]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self._capacity}, size={self._size})"
@@ -15,12 +15,14 @@
 # GitHub: https://github.com/ghassenTn
 
 
-from typing import List, Dict, Union, Optional
+from typing import Any, List, Dict, Union, Optional, Sequence
 import tkinter as tk
 from tkinter import ttk
 import math
 import logging
 from .core import Chart, ChartStyle
+from .animation import Tween
+from .tablestore import TableStore
 from .validation import DataValidator
 
 logger = logging.getLogger('ChartForgeTK')
@@ -38,7 +40,7 @@ class TableauChart(Chart):
         height (int): The height of the chart.
         display_mode (str): The display mode ('frame' or 'canvas').
         theme (str): The theme of the chart ('dark' or 'light').
-        data (List[Dict[str, Union[str, float, int]]]): The data to be displayed.
+        data (TableStore): The displayed data, stored column by column.
         columns (List[str]): The columns to be displayed.
         sort_column (Optional[str]): The column currently used for sorting.
         sort_ascending (bool): The sorting order (ascending or descending).
@@ -46,8 +48,24 @@ class TableauChart(Chart):
         animation_duration (int): The duration of the animation in milliseconds.
         elements (List[int]): The canvas elements.
         column_widths (Dict[str, int]): The calculated widths of the columns.
+    
+    Rows are virtualized: only one screen of row items plus OVERSCAN_ROWS on
+    each side exists on the canvas. Scrolling moves these items and rebinds
+    the ones leaving the window to the rows entering it, so the number of
+    canvas items does not depend on the number of rows.
     """
     
+    ROW_HEIGHT = 60
+    HEADER_HEIGHT = 60
+    # Rows kept bound above and below the viewport
+    OVERSCAN_ROWS = 2
+    # Pixels scrolled per mouse wheel notch
+    SCROLL_STEP = 30
+    # Column widths fit this share of up to WIDTH_SAMPLE_SIZE sampled values;
+    # longer values are shortened with an ellipsis
+    WIDTH_SAMPLE_SIZE = 1000
+    WIDTH_PERCENTILE = 0.95
+    
     def __init__(self, parent: Optional[tk.Widget] = None, width: int = 800, height: int = 600, 
                  display_mode: str = 'frame', theme: str = 'dark', palette: str = 'modern'):
         """
@@ -63,7 +81,7 @@ class TableauChart(Chart):
         """
         super().__init__(parent, width=width, height=height, display_mode=display_mode, theme=theme, palette=palette)
         self.parent = parent
-        self.data = []
+        self.data = TableStore()
         self.columns = []
         self.sort_column = None
         self.sort_ascending = True
@@ -71,17 +89,30 @@ class TableauChart(Chart):
         self.animation_duration = 300
         self.elements = []
         self.column_widths = {}
+        # Indices of the filtered and sorted rows, and the recycled row slots
+        # showing a window of them: [view position, [(background, text) per column]]
+        self._view = []
+        self._row_slots = []
+        self._header_items = {}
+        self._scroll_offset = 0.0
+        self._scroll_drag = None
         
-    def plot(self, data: List[Dict[str, Union[str, float, int]]], columns: Optional[List[str]] = None):
+    def plot(self, data: Union[List[Dict[str, Union[str, float, int]]], Dict[str, Sequence], Any],
+             columns: Optional[List[str]] = None):
         """
         Plot a Tableau-style table with given data and optional column subset.
 
+        The data is stored column by column (see TableStore): numeric columns
+        in typed or NumPy arrays, text columns dictionary-encoded. Row dicts
+        are only built for the rows on screen.
+
         Args:
-            data (List[Dict[str, Union[str, float, int]]]): The data to be displayed.
+            data: The data to be displayed: a list of row dictionaries, a
+                dictionary of equal-length columns, or a pandas DataFrame.
             columns (Optional[List[str]]): The columns to be displayed.
 
         Raises:
-            TypeError: If data is None or not a list of dictionaries
+            TypeError: If data is None or not one of the accepted forms
             ValueError: If data is empty or if specified columns do not exist in data.
             
         Requirements: 1.1, 1.2, 1.3, 2.1, 3.1, 3.2, 3.6, 9.1, 9.2, 9.3, 9.4
@@ -93,37 +124,44 @@ class TableauChart(Chart):
                 "Please provide a list of dictionaries."
             )
         
-        # Validate data is a list (Requirements: 1.3)
-        if not isinstance(data, (list, tuple)):
+        # Build the column store; it copies the input (Requirements: 9.1, 9.2)
+        if isinstance(data, TableStore):
+            store = data
+        elif DataValidator.is_pandas_dataframe(data):
+            store = TableStore.from_dataframe(data)
+        elif isinstance(data, dict):
+            store = TableStore.from_columns(data)
+        elif isinstance(data, (list, tuple)):
+            # Validate all items are dictionaries
+            for i, row in enumerate(data):
+                if not isinstance(row, dict):
+                    raise TypeError(
+                        f"[ChartForgeTK] Error: data[{i}] must be a dictionary, "
+                        f"got {type(row).__name__}."
+                    )
+            store = TableStore.from_rows(data)
+        else:
+            # Validate data is a list (Requirements: 1.3)
             raise TypeError(
-                f"[ChartForgeTK] Error: data must be a list, "
-                f"got {type(data).__name__}."
+                f"[ChartForgeTK] Error: data must be a list of dictionaries, a dictionary of columns "
+                f"or a DataFrame, got {type(data).__name__}."
             )
         
         # Validate data is not empty (Requirements: 1.2)
-        if not data:
+        if not len(store) or not store.columns:
             raise ValueError(
                 "[ChartForgeTK] Error: data cannot be empty. "
                 "Please provide at least one row of data."
             )
         
-        # Validate all items are dictionaries
-        for i, row in enumerate(data):
-            if not isinstance(row, dict):
-                raise TypeError(
-                    f"[ChartForgeTK] Error: data[{i}] must be a dictionary, "
-                    f"got {type(row).__name__}."
-                )
-        
         # Cancel pending animations before redrawing (Requirements: 3.2, 3.6)
         self.resource_manager.cancel_animations()
         
         # Clean up previous tooltips (Requirements: 3.1)
         self.resource_manager.cleanup_tooltips()
         
-        # Create deep copy for immutability (Requirements: 9.1, 9.2)
-        self.data = [dict(row) for row in data]
-        available_columns = list(self.data[0].keys())
+        self.data = store
+        available_columns = store.columns
         
         # Validate and copy columns list (Requirements: 9.3)
         if columns is not None:
@@ -159,18 +197,27 @@ class TableauChart(Chart):
         self.canvas.delete('all')
         self.elements.clear()
         self.filters.clear()
+        self._row_slots.clear()
+        self._header_items.clear()
 
     def _calculate_column_widths(self):
-        """Calculate dynamic column widths based on content."""
+        """Calculate column widths from the measured header and a sample of the values."""
+        metrics = self.text_metrics
         self.column_widths = {}
         for col in self.columns:
-            max_len = max(len(str(col)), max([len(str(row.get(col, ''))) for row in self.data]) + 2)
-            self.column_widths[col] = min(max_len * 8, (self.width - 2 * self.padding) // len(self.columns))
+            widths = sorted(
+                metrics.measure(value, self.style.VALUE_FONT)
+                for value in self.data.sample_values(col, self.WIDTH_SAMPLE_SIZE)
+            )
+            content = widths[int(self.WIDTH_PERCENTILE * (len(widths) - 1))]
+            header = metrics.measure(f"{col} ↑", self.style.TITLE_FONT)
+            self.column_widths[col] = min(max(header, content) + 16, (self.width - 2 * self.padding) // len(self.columns))
 
     def _draw_table_header(self):
         """Draw the table header with sortable columns."""
         x_start = self.padding
-        header_height = 60
+        header_height = self.HEADER_HEIGHT
+        self._header_items.clear()
         
         for col in self.columns:
             width = self.column_widths[col] + 40
@@ -187,84 +234,220 @@ class TableauChart(Chart):
             tags=('header', f'col_{col}')
         )
         self.elements.append(header_bg)
+        self._header_items[col] = [header_bg, None]
 
     def _draw_header_text(self, x_start: int, header_height: int, width: int, col: str):
         """Draw the text of the header."""
         header_text = self.canvas.create_text(
             x_start + width / 2, self.padding + header_height / 2,
-            text=f"{col} {'↑' if self.sort_ascending and col == self.sort_column else '↓' if col == self.sort_column else ''}",
+            text=self._header_label(col),
             font=self.style.TITLE_FONT,
             fill=self.style.TEXT,
             anchor='center',
             tags=('header_text', f'col_{col}')
         )
         self.elements.append(header_text)
+        self._header_items[col][1] = header_text
+
+    def _header_label(self, col: str) -> str:
+        """Header text with the sort direction arrow, fitted to the column."""
+        label = f"{col} {'↑' if self.sort_ascending and col == self.sort_column else '↓' if col == self.sort_column else ''}"
+        return self.text_metrics.fit(label, self.style.TITLE_FONT, self.column_widths[col] + 30)
+
+    def _refresh_header(self):
+        """Update header colors and sort arrows in place."""
+        for col, (header_bg, header_text) in self._header_items.items():
+            self.canvas.itemconfig(header_bg, fill=self.style.ACCENT if col == self.sort_column else self.style.PRIMARY)
+            self.canvas.itemconfig(header_text, text=self._header_label(col))
 
     def _animate_rows(self):
-        """Draw rows with smooth animation.
+        """Draw the first window of rows and slide it into place.
         
         Requirements: 3.2, 3.6, 6.3
         """
-        def ease(t):
-            return t * t * (3 - 2 * t)
-        
-        row_height = 60
-        max_rows = (self.height - self.padding * 3 - 40) // row_height
-        filtered_data = self._apply_filters_and_sort()
-        
-        def update_animation(frame: int, total_frames: int):
-            # Check if widget still exists before updating (Requirements: 6.3)
-            try:
-                if not self.canvas.winfo_exists():
-                    return
-            except tk.TclError:
-                return
-            
-            progress = ease(frame / total_frames)
-            y_start = self.padding + 60
-            
-            self._clear_rows()
-            self._draw_rows(filtered_data, max_rows, y_start, row_height, progress)
-            
-            if frame < total_frames:
-                # Register animation callback with resource manager (Requirements: 3.2, 3.6)
-                after_id = self.canvas.after(16, update_animation, frame + 1, total_frames)
-                self.resource_manager.register_animation(after_id)
-        
-        total_frames = self.animation_duration // 16
-        update_animation(0, total_frames)
+        self._view = self._apply_filters_and_sort()
+        self._scroll_offset = 0.0
+        self.animate(self._draw_rows(slide_in=True))
+
+    def _body_bounds(self):
+        """Top and bottom y of the scrolling row area."""
+        top = self.padding + self.HEADER_HEIGHT
+        return top, max(top + self.ROW_HEIGHT, self.height - self.padding)
+
+    def _slot_count(self) -> int:
+        """Number of row slots: one screen plus overscan, at most one per row."""
+        top, bottom = self._body_bounds()
+        visible = math.ceil((bottom - top) / self.ROW_HEIGHT) + 1
+        return min(len(self._view), visible + 2 * self.OVERSCAN_ROWS)
+
+    def _max_scroll(self) -> float:
+        top, bottom = self._body_bounds()
+        return max(0.0, len(self._view) * self.ROW_HEIGHT - (bottom - top))
 
     def _clear_rows(self):
         """Clear existing rows."""
-        for item in self.elements:
-            if 'row' in self.canvas.gettags(item):
-                self.canvas.delete(item)
+        self.canvas.delete('row')
+        row_items = {item for _, cells in self._row_slots for cell in cells for item in cell}
+        self.elements = [item for item in self.elements if item not in row_items]
+        self._row_slots.clear()
 
-    def _draw_rows(self, filtered_data: List[Dict[str, Union[str, float, int]]], max_rows: int, y_start: int, row_height: int, progress: float):
-        """Draw rows with animation."""
-        for i, row in enumerate(filtered_data[:max_rows]):
+    def _draw_rows(self, slide_in: bool = False) -> List[Tween]:
+        """Create the row slots for the current scroll window.
+        
+        Returns:
+            List[Tween]: With slide_in, tweens moving the visible rows from
+            the top of the table into place
+        """
+        self._clear_rows()
+        top, bottom = self._body_bounds()
+        tweens = []
+        for k in range(self._slot_count()):
+            cells = []
             x_start = self.padding
-            y_pos = y_start + i * row_height * progress
-            
             for col in self.columns:
                 width = self.column_widths[col] + 40
-                value = row.get(col, '')
-                self._draw_row_background(x_start, y_pos, width, row_height, i)
-                self._draw_row_text(x_start, y_pos, width, row_height, value, i)  # Pass row_index here
+                row_bg = self._draw_row_background(x_start, top, width, self.ROW_HEIGHT, k)
+                row_text = self._draw_row_text(x_start, top, width, self.ROW_HEIGHT, '', k)
+                cells.append((row_bg, row_text))
                 x_start += width
+            slot = [None, cells]
+            self._row_slots.append(slot)
+        self._rebind_window(force=True)
+
+        if slide_in:
+            for row_index, cells in self._row_slots:
+                y = top + row_index * self.ROW_HEIGHT - self._scroll_offset
+                if top < y < bottom:
+                    for item in (item for cell in cells for item in cell):
+                        coords = self.canvas.coords(item)
+                        start = [v - (y - top) if k % 2 else v for k, v in enumerate(coords)]
+                        tweens.append(Tween(item, start, coords))
+
+        self._draw_table_chrome()
+        return tweens
+
+    def _bind_slot(self, slot, row_index: int):
+        """Show row row_index of the view in a slot, at its scrolled position."""
+        top, _ = self._body_bounds()
+        y = top + row_index * self.ROW_HEIGHT - self._scroll_offset
+        row = self.data.row(self._view[row_index])
+        metrics = self.text_metrics
+        fill = self.style.BACKGROUND if row_index % 2 == 0 else self.style.SECONDARY
+        x_start = self.padding
+        for col, (row_bg, row_text) in zip(self.columns, slot[1]):
+            width = self.column_widths[col] + 40
+            self.canvas.coords(row_bg, x_start, y, x_start + width, y + self.ROW_HEIGHT)
+            self.canvas.coords(row_text, x_start + width / 2, y + self.ROW_HEIGHT / 2)
+            if slot[0] is None or slot[0] % 2 != row_index % 2:
+                self.canvas.itemconfig(row_bg, fill=fill)
+            self.canvas.itemconfig(row_text, text=metrics.fit(row.get(col, ''), self.style.VALUE_FONT, width - 10))
+            x_start += width
+        slot[0] = row_index
 
-    def _draw_row_background(self, x_start: int, y_pos: int, width: int, row_height: int, row_index: int):
+    def _rebind_window(self, force: bool = False):
+        """Rebind the slots that left the row window to the rows that entered it."""
+        slots = self._row_slots
+        if not slots:
+            return
+        first = int(self._scroll_offset // self.ROW_HEIGHT) - self.OVERSCAN_ROWS
+        first = max(0, min(first, len(self._view) - len(slots)))
+        window = range(first, first + len(slots))
+        if force:
+            for slot, row_index in zip(slots, window):
+                slot[0] = None
+                self._bind_slot(slot, row_index)
+            return
+        bound = {slot[0] for slot in slots}
+        missing = (row_index for row_index in window if row_index not in bound)
+        for slot in slots:
+            if not first <= slot[0] < first + len(slots):
+                self._bind_slot(slot, next(missing))
+
+    def _draw_table_chrome(self):
+        """Draw the masks hiding overscan rows and the scrollbar, above the rows."""
+        top, bottom = self._body_bounds()
+        if not self.canvas.find_withtag('table_mask'):
+            for y1, y2 in ((0, top), (bottom, self.height)):
+                self.canvas.create_rectangle(
+                    0, y1, self.width, y2, fill=self.style.BACKGROUND, outline='',
+                    tags=('table_mask',)
+                )
+        if self._max_scroll() <= 0:
+            self.canvas.delete('scrollbar')
+        elif not self.canvas.find_withtag('scrollbar'):
+            x = self._table_right() + 6
+            self.canvas.create_rectangle(
+                x, top, x + 8, bottom, fill=self.style.SECONDARY, outline='',
+                tags=('scrollbar', 'scroll_track')
+            )
+            self.canvas.create_rectangle(
+                x, top, x + 8, top, fill=self.style.PRIMARY, outline='',
+                tags=('scrollbar', 'scroll_thumb')
+            )
+        self._update_scrollbar()
+        for tag in ('table_mask', 'header', 'header_text', 'scrollbar'):
+            self.canvas.tag_raise(tag)
+
+    def _table_right(self) -> float:
+        return self.padding + sum(self.column_widths[col] + 40 for col in self.columns)
+
+    def _thumb_bounds(self):
+        """Top y and height of the scrollbar thumb."""
+        top, bottom = self._body_bounds()
+        track = bottom - top
+        total = len(self._view) * self.ROW_HEIGHT
+        thumb = max(24.0, track * track / total) if total else track
+        max_scroll = self._max_scroll()
+        y = top + (self._scroll_offset / max_scroll * (track - thumb) if max_scroll else 0)
+        return y, thumb
+
+    def _update_scrollbar(self):
+        y, thumb = self._thumb_bounds()
+        x = self._table_right() + 6
+        self.canvas.coords('scroll_thumb', x, y, x + 8, y + thumb)
+
+    def scroll_to(self, row_index: int):
+        """Scroll so that row row_index of the filtered, sorted view is at the top.
+        
+        Raises:
+            TypeError: If row_index is not an integer
+        """
+        if isinstance(row_index, bool) or not isinstance(row_index, int):
+            raise TypeError(
+                f"[ChartForgeTK] Error: row_index must be an integer, got {type(row_index).__name__}."
+            )
+        self._scroll_by(row_index * self.ROW_HEIGHT - self._scroll_offset)
+
+    def visible_row_range(self) -> range:
+        """Indices of the view rows currently bound to row items."""
+        indices = [slot[0] for slot in self._row_slots]
+        return range(min(indices), max(indices) + 1) if indices else range(0)
+
+    def _scroll_by(self, pixels: float):
+        """Scroll the rows by pixels: one move of all rows, then rebind the edges."""
+        offset = max(0.0, min(self._max_scroll(), self._scroll_offset + pixels))
+        delta = offset - self._scroll_offset
+        if not delta or not self._row_slots:
+            return
+        self.animator.finish()
+        self._scroll_offset = offset
+        self.canvas.move('row', 0, -delta)
+        self._rebind_window()
+        self._update_scrollbar()
+
+    def _draw_row_background(self, x_start: int, y_pos: int, width: int, row_height: int, row_index: int) -> int:
         """Draw the background of a row."""
         bg_color = self.style.BACKGROUND if row_index % 2 == 0 else self.style.SECONDARY
         row_bg = self.canvas.create_rectangle(
             x_start, y_pos, x_start + width, y_pos + row_height,
             fill=bg_color,
             outline=self.style.BACKGROUND,
-            tags=('row', f'row_{row_index}')
+            tags=('row', f'slot_{row_index}')
         )
         self.elements.append(row_bg)
+        return row_bg
 
-    def _draw_row_text(self, x_start: int, y_pos: int, width: int, row_height: int, value: str, row_index: int):
+    def _draw_row_text(self, x_start: int, y_pos: int, width: int, row_height: int, value: str, row_index: int) -> int:
         """Draw the text of a row."""
         row_text = self.canvas.create_text(
             x_start + width / 2, y_pos + row_height / 2,
@@ -272,22 +455,19 @@ class TableauChart(Chart):
             font=self.style.VALUE_FONT,
             fill=self.style.TEXT,
             anchor='center',
-            tags=('row', f'row_{row_index}')
+            tags=('row', f'slot_{row_index}')
         )
         self.elements.append(row_text)
+        return row_text
 
-    def _apply_filters_and_sort(self) -> List[Dict[str, Union[str, float, int]]]:
-        """Apply filters and sorting to the data."""
-        filtered_data = self.data[:]
-        
-        for col, filter_val in self.filters.items():
-            if filter_val:
-                filtered_data = [row for row in filtered_data if str(row.get(col, '')).lower().startswith(filter_val.lower())]
+    def _apply_filters_and_sort(self) -> Sequence[int]:
+        """Apply filters and sorting to the data.
         
-        if self.sort_column:
-            filtered_data.sort(key=lambda x: x.get(self.sort_column, ''), reverse=not self.sort_ascending)
-        
-        return filtered_data
+        Returns:
+            Sequence[int]: Indices of the matching rows in display order,
+            served from the store's cached sort orders and prefix indexes
+        """
+        return self.data.query(self.filters, self.sort_column or None, self.sort_ascending)
 
     def _add_interactive_effects(self):
         """Add sorting and filtering interactivity.
@@ -297,6 +477,8 @@ class TableauChart(Chart):
         def on_header_click(event):
             """Handle header click events (Requirements: 7.3)"""
             try:
+                if self._scrollbar_press(event):
+                    return
                 col = self._get_clicked_column(event)
                 if col:
                     self._update_sort_column(col)
@@ -331,13 +513,53 @@ class TableauChart(Chart):
             except Exception:
                 pass
         
+        def on_wheel(event, direction=None):
+            if direction is None:
+                direction = 1 if event.delta > 0 else -1
+            self._scroll_by(-direction * self.SCROLL_STEP)
+
+        def on_drag(event):
+            if self._scroll_drag is None:
+                return
+            start_y, start_offset = self._scroll_drag
+            top, bottom = self._body_bounds()
+            _, thumb = self._thumb_bounds()
+            travel = max(1.0, (bottom - top) - thumb)
+            target = start_offset + (event.y - start_y) * self._max_scroll() / travel
+            self._scroll_by(target - self._scroll_offset)
+
+        def on_release(event):
+            self._scroll_drag = None
+
         # Bind events and register with resource manager (Requirements: 3.5)
-        click_id = self.canvas.bind('<Button-1>', on_header_click)
-        motion_id = self.canvas.bind('<Motion>', on_hover)
-        leave_id = self.canvas.bind('<Leave>', on_leave)
-        self.resource_manager.register_binding(self.canvas, '<Button-1>', click_id)
-        self.resource_manager.register_binding(self.canvas, '<Motion>', motion_id)
-        self.resource_manager.register_binding(self.canvas, '<Leave>', leave_id)
+        bindings = [
+            ('<Button-1>', on_header_click),
+            ('<MouseWheel>', on_wheel),
+            ('<Button-4>', lambda e: on_wheel(e, 1)),
+            ('<Button-5>', lambda e: on_wheel(e, -1)),
+            ('<B1-Motion>', on_drag),
+            ('<ButtonRelease-1>', on_release),
+        ]
+        for sequence, handler in bindings:
+            func_id = self.canvas.bind(sequence, handler)
+            self.resource_manager.register_binding(self.canvas, sequence, func_id)
+        self.bind_hover(on_hover, on_leave)
+
+    def _scrollbar_press(self, event) -> bool:
+        """Start a thumb drag or page the rows when the scrollbar is clicked."""
+        if self._max_scroll() <= 0:
+            return False
+        x = self._table_right() + 6
+        top, bottom = self._body_bounds()
+        if not (x - 4 <= event.x <= x + 12 and top <= event.y <= bottom):
+            return False
+        y, thumb = self._thumb_bounds()
+        if y <= event.y <= y + thumb:
+            self._scroll_drag = (event.y, self._scroll_offset)
+        else:
+            page = bottom - top - self.ROW_HEIGHT
+            self._scroll_by(page if event.y > y else -page)
+        return True
 
     def _get_clicked_column(self, event) -> Optional[str]:
         """Get the column clicked by the user."""
@@ -356,11 +578,21 @@ class TableauChart(Chart):
             self.sort_ascending = True
 
     def _redraw_table(self):
-        """Redraw the table with updated data."""
-        self.canvas.delete('all')
-        self.elements.clear()
-        self._draw_table_header()
-        self._animate_rows()
+        """Show the table for a new sort order or filter, reusing its items.
+        
+        The header is updated in place and the row slots are rebound from
+        the top of the new view; items are only recreated when the number of
+        slots changes.
+        """
+        self.animator.finish()
+        self._refresh_header()
+        self._view = self._apply_filters_and_sort()
+        self._scroll_offset = 0.0
+        if len(self._row_slots) == self._slot_count():
+            self._rebind_window(force=True)
+            self._draw_table_chrome()
+        else:
+            self._draw_rows()
 
     def _get_column_from_item(self, item) -> Optional[str]:
         """Get the column from the canvas item."""
@@ -0,0 +1,348 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Table data store module for ChartForgeTK.
+
+Holds TableauChart's data column by column: integer and float columns in
+typed arrays (or the NumPy arrays a DataFrame already holds), text columns
+dictionary-encoded as small integer codes into one list of distinct strings.
+Row dicts are only built for the rows being displayed.
+
+Sorting and filtering use per-column caches built on first use: lowercase
+string keys, a sort permutation per (column, direction) and a prefix index
+(the row indices ordered by lowercase key) that answers a filter-as-you-type
+query with two binary searches.
+"""
+
+import bisect
+import logging
+from array import array
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .validation import DataValidator
+
+logger = logging.getLogger('ChartForgeTK')
+
+# Sorts after every character, so prefix + _PREFIX_END bounds all keys
+# starting with prefix
+_PREFIX_END = '\U0010ffff'
+
+
+class DictColumn:
+    """
+    Dictionary-encoded text column: one code per row into a list of distinct values.
+
+    The code array uses the smallest unsigned type that fits the number of
+    distinct values, so a column of repeated labels costs one or two bytes
+    per row.
+    """
+
+    __slots__ = ('codes', 'categories')
+
+    def __init__(self, codes: array, categories: List[Any]):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def encode(cls, values: Sequence[Any]) -> 'DictColumn':
+        """Encode values, sharing one object per distinct value."""
+        lookup: Dict[Any, int] = {}
+        codes = [lookup.setdefault(value, len(lookup)) for value in values]
+        typecode = 'B' if len(lookup) <= 0xff else 'H' if len(lookup) <= 0xffff else 'L'
+        return cls(array(typecode, codes), list(lookup))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.categories[self.codes[index]]
+
+
+def encode_column(values: Any) -> Sequence[Any]:
+    """
+    Return a compact column holding values.
+
+    NumPy numeric arrays are kept as they are, all-int and all-float columns
+    become typed arrays, all-string columns a DictColumn. Anything else (mixed
+    types, None) stays a list.
+    """
+    np = DataValidator._get_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind in 'biuf':
+            return values
+        values = values.tolist()
+    values = list(values)
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        try:
+            return array('q', values)
+        except OverflowError:
+            return values
+    if kinds == {float}:
+        return array('d', values)
+    if kinds == {str}:
+        return DictColumn.encode(values)
+    return values
+
+
+class TableStore:
+    """
+    Columnar, indexed, read-only table.
+
+    Rows are addressed by their position in the input. query() returns the
+    row indices matching a set of prefix filters in sort order; the
+    sequences it returns are shared with the caches and must not be
+    modified.
+    """
+
+    def __init__(self, columns: Optional[Mapping[str, Sequence[Any]]] = None):
+        """
+        Initialize the TableStore.
+
+        Args:
+            columns: Column name to equal-length column, as built by
+                encode_column(); use the from_* constructors for raw data
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        self._columns: Dict[str, Sequence[Any]] = dict(columns or {})
+        lengths = {len(column) for column in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"[ChartForgeTK] Error: all columns must have the same length, "
+                f"got lengths {sorted(lengths)}."
+            )
+        self._length = lengths.pop() if lengths else 0
+        self._lower: Dict[str, List[str]] = {}
+        self._orders: Dict[Tuple[str, bool], Sequence[int]] = {}
+        self._ranks: Dict[Tuple[str, bool], Sequence[int]] = {}
+        self._prefix_index: Dict[str, Tuple[List[str], Sequence[int]]] = {}
+        # Last (prefix, lo, hi) range found per column, refined in place
+        # while a filter string grows
+        self._last_range: Dict[str, Tuple[str, int, int]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Mapping[str, Any]]) -> 'TableStore':
+        """Build a store from row dicts; a row missing a column reads as ''."""
+        names: Dict[Any, None] = {}
+        for row in rows:
+            for key in row:
+                if key not in names:
+                    names[key] = None
+        return cls({
+            str(name): encode_column([row.get(name, '') for row in rows])
+            for name in names
+        })
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[Any, Any]) -> 'TableStore':
+        """
+        Build a store from a mapping of column name to sequence of values.
+
+        pandas Series and NumPy arrays are accepted as columns.
+
+        Raises:
+            TypeError: If a column is not a sequence
+            ValueError: If the columns differ in length
+        """
+        encoded = {}
+        for name, values in columns.items():
+            if DataValidator.is_pandas_series(values):
+                values = cls._series_values(values)
+            elif isinstance(values, (str, bytes)) or not hasattr(values, '__len__'):
+                raise TypeError(
+                    f"[ChartForgeTK] Error: column '{name}' must be a sequence of values, "
+                    f"got {type(values).__name__}."
+                )
+            encoded[str(name)] = encode_column(values)
+        return cls(encoded)
+
+    @classmethod
+    def from_dataframe(cls, df: Any) -> 'TableStore':
+        """Build a store from a pandas DataFrame, keeping numeric columns as NumPy arrays."""
+        return cls({str(name): encode_column(cls._series_values(df[name])) for name in df.columns})
+
+    @staticmethod
+    def _series_values(series: Any) -> Any:
+        """NumPy array of a numeric Series (a view when possible), else a list."""
+        np = DataValidator._get_numpy()
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+            return series.to_numpy(copy=False)
+        return series.tolist()
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in input order."""
+        return list(self._columns)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Build the row dict at index."""
+        return {name: column[index] for name, column in self._columns.items()}
+
+    def values(self, column: str) -> Sequence[Any]:
+        """Return the values of a column, '' throughout for an unknown column."""
+        values = self._columns.get(column)
+        if values is None:
+            values = DictColumn(array('B', bytes(self._length)), [''])
+        return values
+
+    def sample_values(self, column: str, limit: int) -> List[Any]:
+        """
+        Return up to limit values of a column spread evenly over the rows.
+
+        A dictionary-encoded column samples its distinct values instead.
+        """
+        values = self.values(column)
+        if isinstance(values, DictColumn):
+            values = values.categories
+        step = max(1, -(-len(values) // limit))
+        return [values[i] for i in range(0, len(values), step)]
+
+    def lower_keys(self, column: str) -> List[str]:
+        """Return the lowercase string keys filters of a column match against."""
+        keys = self._lower.get(column)
+        if keys is None:
+            values = self.values(column)
+            if isinstance(values, DictColumn):
+                lowered = [str(value).lower() for value in values.categories]
+                keys = [lowered[code] for code in values.codes]
+            else:
+                np = DataValidator._get_numpy()
+                if np is not None and isinstance(values, np.ndarray):
+                    values = values.tolist()
+                keys = [str(value).lower() for value in values]
+            self._lower[column] = keys
+        return keys
+
+    def sort_order(self, column: str, ascending: bool = True) -> Sequence[int]:
+        """
+        Return the row indices sorted by a column.
+
+        The sort is stable in both directions, like sorted() with
+        reverse=not ascending over the rows.
+        """
+        key = (column, bool(ascending))
+        order = self._orders.get(key)
+        if order is None:
+            values = self.values(column)
+            np = DataValidator._get_numpy()
+            if np is not None and isinstance(values, np.ndarray):
+                if ascending:
+                    order = np.argsort(values, kind='stable')
+                else:
+                    # Stable descending: sort the reversed column and map back
+                    order = (len(values) - 1 - np.argsort(values[::-1], kind='stable'))[::-1]
+            else:
+                if isinstance(values, DictColumn):
+                    # Compare category ranks instead of the values themselves
+                    ranked = sorted(range(len(values.categories)), key=values.categories.__getitem__)
+                    category_rank = [0] * len(ranked)
+                    for position, category in enumerate(ranked):
+                        category_rank[category] = position
+                    values = [category_rank[code] for code in values.codes]
+                order = array('q', sorted(range(len(values)), key=values.__getitem__, reverse=not ascending))
+            self._orders[key] = order
+        return order
+
+    def _rank(self, column: str, ascending: bool) -> Sequence[int]:
+        """Position of each row in sort_order(column, ascending)."""
+        key = (column, bool(ascending))
+        rank = self._ranks.get(key)
+        if rank is None:
+            order = self.sort_order(column, ascending)
+            np = DataValidator._get_numpy()
+            if np is not None and isinstance(order, np.ndarray):
+                rank = np.empty_like(order)
+                rank[order] = np.arange(len(order))
+            else:
+                rank = array('q', bytes(8 * len(order)))
+                for position, index in enumerate(order):
+                    rank[index] = position
+            self._ranks[key] = rank
+        return rank
+
+    def _index(self, column: str) -> Tuple[List[str], Sequence[int]]:
+        """Prefix index of a column: sorted lowercase keys and their row indices."""
+        index = self._prefix_index.get(column)
+        if index is None:
+            lower = self.lower_keys(column)
+            order = array('q', sorted(range(len(lower)), key=lower.__getitem__))
+            index = ([lower[i] for i in order], order)
+            self._prefix_index[column] = index
+        return index
+
+    def prefix_range(self, column: str, prefix: str) -> Tuple[int, int]:
+        """
+        Return the (lo, hi) slice of the prefix index whose keys start with prefix.
+
+        prefix must already be lowercase. When it extends the previous
+        prefix searched on the column, only the previous range is searched.
+        """
+        keys, _ = self._index(column)
+        lo, hi = 0, len(keys)
+        last = self._last_range.get(column)
+        if last is not None and prefix.startswith(last[0]):
+            lo, hi = last[1], last[2]
+        lo = bisect.bisect_left(keys, prefix, lo, hi)
+        hi = bisect.bisect_left(keys, prefix + _PREFIX_END, lo, hi)
+        self._last_range[column] = (prefix, lo, hi)
+        return lo, hi
+
+    def query(self, filters: Optional[Mapping[str, str]] = None,
+              sort_column: Optional[str] = None, ascending: bool = True) -> Sequence[int]:
+        """
+        Return the indices of the rows matching all filters, in sort order.
+
+        A row matches a filter when its lowercase value starts with the
+        lowercase filter string. Rows keep their input order when
+        sort_column is None.
+
+        Args:
+            filters: Column to filter string; empty strings match every row
+            sort_column: Column to sort by, or None
+            ascending: Sort direction
+
+        Returns:
+            Sequence[int]: Row indices into the input rows
+        """
+        active = [(column, str(value).lower()) for column, value in (filters or {}).items() if value]
+        if not active:
+            if sort_column is None:
+                return range(self._length)
+            return self.sort_order(sort_column, ascending)
+
+        # Scan the narrowest filter's index range and check the others per row
+        ranges = []
+        for column, prefix in active:
+            lo, hi = self.prefix_range(column, prefix)
+            ranges.append((hi - lo, lo, hi, column))
+        _, lo, hi, narrowest = min(ranges)
+        matched = self._index(narrowest)[1][lo:hi].tolist()
+        for column, prefix in active:
+            if column != narrowest and matched:
+                lower = self.lower_keys(column)
+                matched = [i for i in matched if lower[i].startswith(prefix)]
+
+        if sort_column is None:
+            matched.sort()
+        else:
+            matched.sort(key=self._rank(sort_column, ascending).__getitem__)
+        return matched
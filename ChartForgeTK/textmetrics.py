@@ -0,0 +1,140 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Text metrics module for ChartForgeTK.
+
+Tk measures text with a round trip into the font engine per call, which
+adds up when sizing table columns or checking axis labels for overlap.
+TextMetrics answers font measure/metrics queries from an LRU cache shared
+by all charts of a Tk root.
+"""
+
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+logger = logging.getLogger('ChartForgeTK')
+
+
+def _font_key(font: Any) -> Hashable:
+    """Hashable form of a Tk font description."""
+    if isinstance(font, list):
+        return tuple(font)
+    return font
+
+
+class TextMetrics:
+    """
+    LRU-cached text measurement for one Tk root.
+
+    measure() results are cached per (font, text), up to MAX_ENTRIES entries,
+    least recently used first out; metrics() results per font.
+    """
+
+    MAX_ENTRIES = 4096
+    ELLIPSIS = '…'
+
+    _services = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_widget(cls, widget) -> 'TextMetrics':
+        """Return the service shared by all widgets of the widget's Tk root."""
+        root = widget._root() if hasattr(widget, '_root') else widget
+        service = cls._services.get(root)
+        if service is None:
+            service = cls._services[root] = cls(root)
+        return service
+
+    def __init__(self, widget, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize the TextMetrics.
+
+        Args:
+            widget: Widget whose display fonts are measured on
+            max_entries: Number of measurements kept
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(
+                f"[ChartForgeTK] Error: max_entries must be positive, got {max_entries}."
+            )
+        self.widget = widget
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._widths: 'OrderedDict[Tuple[Hashable, str], int]' = OrderedDict()
+        self._metrics: Dict[Hashable, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._widths)
+
+    def measure(self, text: Any, font: Any) -> int:
+        """Return the width in pixels of text drawn in font."""
+        text = str(text)
+        key = (_font_key(font), text)
+        width = self._widths.get(key)
+        if width is not None:
+            self.hits += 1
+            self._widths.move_to_end(key)
+            return width
+        self.misses += 1
+        width = int(self.widget.tk.call('font', 'measure', font, '-displayof', self.widget, text))
+        self._widths[key] = width
+        if len(self._widths) > self.max_entries:
+            self._widths.popitem(last=False)
+        return width
+
+    def metrics(self, font: Any) -> Dict[str, int]:
+        """Return the ascent, descent, linespace and fixed metrics of font."""
+        key = _font_key(font)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            values = self.widget.tk.splitlist(
+                self.widget.tk.call('font', 'metrics', font, '-displayof', self.widget)
+            )
+            metrics = {str(name).lstrip('-'): int(value) for name, value in zip(values[::2], values[1::2])}
+            self._metrics[key] = metrics
+        return metrics
+
+    def fit(self, text: Any, font: Any, width: float) -> str:
+        """
+        Return text, shortened with an ellipsis if needed, to fit in width pixels.
+
+        Returns an empty string when not even the ellipsis fits.
+        """
+        text = str(text)
+        if self.measure(text, font) <= width:
+            return text
+        if self.measure(self.ELLIPSIS, font) > width:
+            return ''
+        # Longest prefix that still fits with the ellipsis
+        lo, hi = 0, len(text) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.measure(text[:mid] + self.ELLIPSIS, font) <= width:
+                lo = mid
+            else:
+                hi = mid - 1
+        return text[:lo].rstrip() + self.ELLIPSIS
+
+    def clear(self):
+        """Drop all cached measurements, e.g. after fonts are reconfigured."""
+        self._widths.clear()
+        self._metrics.clear()
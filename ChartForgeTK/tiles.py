@@ -0,0 +1,297 @@
+# Copyright (c) Ghassen Saidi (2024-2025) - ChartForgeTK
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# GitHub: https://github.com/ghassenTn
+
+"""
+Tiled matrix module for ChartForgeTK.
+
+Splits a large 2D matrix into square tiles and builds a level-of-detail
+pyramid on demand: level 0 holds the original cells, and every cell of level
+L pools a 2x2 block of level L-1 (mean or max). Tiles are only computed when
+a viewport asks for them and are kept in a bounded LRU cache, so a matrix
+backed by a NumPy memory map is read lazily, one tile at a time.
+"""
+
+import math
+import logging
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from .validation import DataValidator
+
+logger = logging.getLogger('ChartForgeTK')
+
+POOLING_METHODS = ('mean', 'max')
+
+# Approximate number of cells read per chunk when scanning an array's value range
+_RANGE_CHUNK_CELLS = 1 << 20
+
+
+class TileCache:
+    """
+    Least-recently-used cache with a fixed number of entries.
+    """
+
+    def __init__(self, max_tiles: int = 64):
+        """
+        Initialize the TileCache.
+
+        Args:
+            max_tiles: Maximum number of tiles kept
+
+        Raises:
+            ValueError: If max_tiles is less than 1
+        """
+        if isinstance(max_tiles, bool) or not isinstance(max_tiles, int) or max_tiles < 1:
+            raise ValueError(
+                f"[ChartForgeTK] Error: max_tiles must be a positive integer, got {max_tiles!r}."
+            )
+        self.max_tiles = max_tiles
+        self._tiles: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tiles
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached tile and mark it as recently used, or None."""
+        tile = self._tiles.get(key)
+        if tile is None:
+            self.misses += 1
+            return None
+        self._tiles.move_to_end(key)
+        self.hits += 1
+        return tile
+
+    def put(self, key: Hashable, tile: Any):
+        """Store a tile, evicting the least recently used one when full."""
+        self._tiles[key] = tile
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+
+    def clear(self):
+        """Drop every tile."""
+        self._tiles.clear()
+
+
+class TiledMatrix:
+    """
+    Lazily pooled, tiled view of a 2D matrix.
+
+    The source can be a list of rows or a 2D NumPy array, including a
+    numpy.memmap; it is never copied as a whole. With NumPy installed tiles
+    are float64 arrays, otherwise lists of rows.
+    """
+
+    def __init__(self, source, tile_size: int = 256, pooling: str = 'mean', max_tiles: int = 64):
+        """
+        Initialize the TiledMatrix.
+
+        Args:
+            source: 2D list of numbers or 2D NumPy array
+            tile_size: Width and height of a tile in (pooled) cells
+            pooling: How a cell of a coarser level combines its 2x2 block,
+                'mean' or 'max'
+            max_tiles: LRU bound on cached tiles
+
+        Raises:
+            ValueError: If the source is empty or not 2D, or a parameter is
+                out of range
+        """
+        if pooling not in POOLING_METHODS:
+            raise ValueError(
+                f"[ChartForgeTK] Error: pooling must be one of {list(POOLING_METHODS)}, "
+                f"got {pooling!r}."
+            )
+        if isinstance(tile_size, bool) or not isinstance(tile_size, int) or tile_size < 1:
+            raise ValueError(
+                f"[ChartForgeTK] Error: tile_size must be a positive integer, got {tile_size!r}."
+            )
+
+        self._np = DataValidator._get_numpy()
+        if self._np is not None and not isinstance(source, self._np.ndarray):
+            source = self._np.asarray(source, dtype=self._np.float64)
+        if self._np is not None:
+            if source.ndim != 2 or source.size == 0:
+                raise ValueError("[ChartForgeTK] Error: tiled data must be a non-empty 2D matrix.")
+            self.rows, self.cols = source.shape
+        else:
+            if not source or not source[0]:
+                raise ValueError("[ChartForgeTK] Error: tiled data must be a non-empty 2D matrix.")
+            self.rows, self.cols = len(source), len(source[0])
+
+        self.source = source
+        self.tile_size = tile_size
+        self.pooling = pooling
+        self.cache = TileCache(max_tiles)
+        longest = max(self.rows, self.cols)
+        self.max_level = max(0, math.ceil(math.log2(longest / tile_size))) if longest > tile_size else 0
+
+    def level_shape(self, level: int) -> Tuple[int, int]:
+        """Number of (pooled) rows and columns at a level."""
+        factor = 1 << level
+        return -(-self.rows // factor), -(-self.cols // factor)
+
+    def value(self, row: int, col: int) -> float:
+        """Return one original cell."""
+        return float(self.source[row][col])
+
+    def value_range(self) -> Tuple[float, float]:
+        """
+        Scan the whole matrix once for its minimum and maximum.
+
+        Arrays are scanned in row chunks so memory maps are not loaded at
+        once.
+
+        Raises:
+            ValueError: If the matrix holds NaN or infinite values
+        """
+        np = self._np
+        low, high = math.inf, -math.inf
+        if np is not None:
+            step = max(1, _RANGE_CHUNK_CELLS // self.cols)
+            for start in range(0, self.rows, step):
+                chunk = np.asarray(self.source[start:start + step], dtype=np.float64)
+                if not np.isfinite(chunk).all():
+                    raise ValueError(
+                        "[ChartForgeTK] Error: data contains NaN or infinite values, "
+                        "which are not allowed."
+                    )
+                low = min(low, float(chunk.min()))
+                high = max(high, float(chunk.max()))
+            return low, high
+
+        for row in self.source:
+            for value in row:
+                if math.isnan(value) or math.isinf(value):
+                    raise ValueError(
+                        "[ChartForgeTK] Error: data contains NaN or infinite values, "
+                        "which are not allowed."
+                    )
+            low = min(low, min(row))
+            high = max(high, max(row))
+        return float(low), float(high)
+
+    def tile(self, level: int, tile_row: int, tile_col: int):
+        """
+        Return one tile of a level, computing and caching it if needed.
+
+        Level 0 tiles are read from the source; coarser tiles pool the four
+        tiles below them, which are fetched (and cached) the same way.
+        """
+        key = (level, tile_row, tile_col)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        size = self.tile_size
+        if level == 0:
+            r0, c0 = tile_row * size, tile_col * size
+            r1, c1 = min(r0 + size, self.rows), min(c0 + size, self.cols)
+            if self._np is not None:
+                tile = self._np.array(self.source[r0:r1, c0:c1], dtype=self._np.float64)
+            else:
+                tile = [[float(v) for v in row[c0:c1]] for row in self.source[r0:r1]]
+        else:
+            finer_rows, finer_cols = self.level_shape(level - 1)
+            children = [[None, None], [None, None]]
+            for dr in (0, 1):
+                for dc in (0, 1):
+                    child_row, child_col = 2 * tile_row + dr, 2 * tile_col + dc
+                    if child_row * size < finer_rows and child_col * size < finer_cols:
+                        children[dr][dc] = self.tile(level - 1, child_row, child_col)
+            tile = self._pool(children)
+
+        self.cache.put(key, tile)
+        return tile
+
+    def region(self, level: int, row0: int, row1: int, col0: int, col1: int):
+        """
+        Assemble rows [row0, row1) and columns [col0, col1) of a level from its tiles.
+
+        Returns:
+            A float64 array with NumPy, otherwise a list of rows
+        """
+        size = self.tile_size
+        tile_rows = range(row0 // size, (row1 - 1) // size + 1)
+        tile_cols = range(col0 // size, (col1 - 1) // size + 1)
+        bands = []
+        for tr in tile_rows:
+            band = [self.tile(level, tr, tc) for tc in tile_cols]
+            bands.append(band)
+
+        top = tile_rows[0] * size
+        left = tile_cols[0] * size
+        if self._np is not None:
+            np = self._np
+            block = np.vstack([np.hstack(band) for band in bands])
+            return block[row0 - top:row1 - top, col0 - left:col1 - left]
+
+        block = []
+        for band in bands:
+            for i in range(len(band[0])):
+                merged = []
+                for tile in band:
+                    merged.extend(tile[i])
+                block.append(merged)
+        return [row[col0 - left:col1 - left] for row in block[row0 - top:row1 - top]]
+
+    def _pool(self, children):
+        """Pool a 2x2 arrangement of child tiles (None where outside the matrix) by 2x2 blocks."""
+        if self._np is not None:
+            np = self._np
+            top = np.hstack([t for t in children[0] if t is not None])
+            rows = [top]
+            if children[1][0] is not None:
+                rows.append(np.hstack([t for t in children[1] if t is not None]))
+            block = np.vstack(rows)
+            h, w = block.shape
+            padded = np.full((h + h % 2, w + w % 2), np.nan)
+            padded[:h, :w] = block
+            quads = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2)
+            # Every 2x2 block holds at least one real cell, so no all-NaN warnings
+            if self.pooling == 'max':
+                return np.nanmax(quads, axis=(1, 3))
+            return np.nanmean(quads, axis=(1, 3))
+
+        block = []
+        for pair in children:
+            present = [t for t in pair if t is not None]
+            if not present:
+                continue
+            for i in range(len(present[0])):
+                merged = []
+                for tile in present:
+                    merged.extend(tile[i])
+                block.append(merged)
+
+        combine = max if self.pooling == 'max' else (lambda vals: sum(vals) / len(vals))
+        pooled = []
+        for i in range(0, len(block), 2):
+            upper = block[i]
+            lower = block[i + 1] if i + 1 < len(block) else None
+            row = []
+            for j in range(0, len(upper), 2):
+                vals = upper[j:j + 2]
+                if lower is not None:
+                    vals = vals + lower[j:j + 2]
+                row.append(combine(vals))
+            pooled.append(row)
+        return pooled
@@ -23,11 +23,19 @@ ensuring type safety and proper error handling.
 
 import math
 import re
+import array
 import logging
 from typing import List, Optional, Tuple, Any, Union
 
 logger = logging.getLogger('ChartForgeTK')
 
+# Sentinel for the lazily imported numpy module (None once known to be missing)
+_NUMPY_UNSET = object()
+_numpy_module = _NUMPY_UNSET
+
+# struct format codes that describe plain numeric buffer items
+_NUMERIC_BUFFER_FORMATS = frozenset('bBhHiIlLqQnNefd?')
+
 
 class DataValidator:
     """Validates chart data inputs with comprehensive type and value checking."""
@@ -37,6 +45,8 @@ class DataValidator:
     MAX_DIMENSION = 10000
     MAX_REASONABLE_VALUE = 1e15
     MIN_REASONABLE_VALUE = -1e15
+    # Lists at least this long are validated with numpy masks when available
+    NUMPY_FAST_PATH_THRESHOLD = 1000
 
     @staticmethod
     def validate_numeric_list(
@@ -50,6 +60,11 @@ class DataValidator:
         """
         Validate and sanitize a list of numeric values.
 
+        Lists and tuples are checked element by element. NumPy arrays,
+        ``array.array`` instances and other numeric buffers are accepted too
+        and go through the mask-based path of validate_numeric_array(). Long
+        lists of plain ints/floats use the same path when numpy is installed.
+
         Args:
             data: Input data to validate
             allow_empty: Whether empty lists are allowed
@@ -72,6 +87,12 @@ class DataValidator:
                 f"Please provide a list of numeric values."
             )
 
+        # Array-backed input is validated with masks, then handed back as a list
+        if not isinstance(data, (list, tuple)) and DataValidator.is_numeric_array(data):
+            return DataValidator.validate_numeric_array(
+                data, allow_empty, allow_negative, allow_nan, allow_inf, param_name
+            ).tolist()
+
         # Check if it's a list or tuple
         if not isinstance(data, (list, tuple)):
             raise TypeError(
@@ -79,9 +100,6 @@ class DataValidator:
                 f"got {type(data).__name__}. Please provide a list of numeric values."
             )
 
-        # Convert to list if tuple
-        data = list(data)
-
         # Check for empty
         if not data and not allow_empty:
             raise ValueError(
@@ -89,9 +107,40 @@ class DataValidator:
                 f"Please provide at least one data point."
             )
 
-        # Validate each element
+        # Long lists of plain ints/floats are converted once and checked with masks
+        np = DataValidator._get_numpy()
+        if (np is not None and len(data) >= DataValidator.NUMPY_FAST_PATH_THRESHOLD
+                and set(map(type, data)) <= {int, float}):
+            values = np.asarray(data, dtype=np.float64)
+            return DataValidator._validate_float64_ndarray(
+                values, allow_empty, allow_negative, allow_nan, allow_inf, param_name
+            ).tolist()
+
         result = []
-        for i, value in enumerate(data):
+        DataValidator._validate_numeric_values(
+            data, result, allow_negative, allow_nan, allow_inf, param_name
+        )
+
+        # Final empty check after filtering
+        if not result and not allow_empty:
+            raise ValueError(
+                f"[ChartForgeTK] Error: {param_name} is empty after filtering invalid values. "
+                f"Please provide valid numeric data."
+            )
+
+        return result
+
+    @staticmethod
+    def _validate_numeric_values(
+        values: Any,
+        result: Any,
+        allow_negative: bool,
+        allow_nan: bool,
+        allow_inf: bool,
+        param_name: str
+    ) -> None:
+        """Check values one by one and append the accepted ones to result."""
+        for i, value in enumerate(values):
             # Type check
             if not isinstance(value, (int, float)):
                 raise TypeError(
@@ -99,52 +148,255 @@ class DataValidator:
                     f"got {type(value).__name__}. All data points must be numeric."
                 )
 
-            # Convert to float
             value = float(value)
+            if DataValidator._check_numeric_value(
+                value, i, allow_negative, allow_nan, allow_inf, param_name
+            ):
+                result.append(value)
 
-            # Check for NaN
-            if math.isnan(value):
-                if not allow_nan:
-                    raise ValueError(
-                        f"[ChartForgeTK] Error: {param_name}[{i}] is NaN. "
-                        f"NaN values are not allowed. Please filter or replace NaN values."
-                    )
-                logger.warning(f"NaN value found at {param_name}[{i}], filtering out")
-                continue
+    @staticmethod
+    def _check_numeric_value(
+        value: float,
+        index: int,
+        allow_negative: bool,
+        allow_nan: bool,
+        allow_inf: bool,
+        param_name: str
+    ) -> bool:
+        """
+        Apply the NaN/infinity/negative/extreme checks to a single float.
 
-            # Check for infinity
-            if math.isinf(value):
-                if not allow_inf:
-                    raise ValueError(
-                        f"[ChartForgeTK] Error: {param_name}[{i}] is infinity. "
-                        f"Infinite values are not allowed. Please use finite values."
-                    )
-                logger.warning(f"Infinite value found at {param_name}[{i}], filtering out")
-                continue
+        Shared by the per-element loop and the mask-based array path so both
+        raise and log identical messages.
 
-            # Check for negative values
-            if value < 0 and not allow_negative:
+        Returns:
+            bool: True if the value should be kept, False if it is filtered out
+        """
+        # Check for NaN
+        if math.isnan(value):
+            if not allow_nan:
                 raise ValueError(
-                    f"[ChartForgeTK] Error: {param_name}[{i}] is negative ({value}). "
-                    f"Negative values are not allowed for this chart type."
+                    f"[ChartForgeTK] Error: {param_name}[{index}] is NaN. "
+                    f"NaN values are not allowed. Please filter or replace NaN values."
                 )
+            logger.warning(f"NaN value found at {param_name}[{index}], filtering out")
+            return False
 
-            # Check for extreme values (handle gracefully)
-            if value > DataValidator.MAX_REASONABLE_VALUE:
-                logger.warning(
-                    f"Extremely large value at {param_name}[{i}]: {value}. "
-                    f"This may cause rendering issues."
+        # Check for infinity
+        if math.isinf(value):
+            if not allow_inf:
+                raise ValueError(
+                    f"[ChartForgeTK] Error: {param_name}[{index}] is infinity. "
+                    f"Infinite values are not allowed. Please use finite values."
                 )
-            elif value < DataValidator.MIN_REASONABLE_VALUE:
-                logger.warning(
-                    f"Extremely small value at {param_name}[{i}]: {value}. "
-                    f"This may cause rendering issues."
+            logger.warning(f"Infinite value found at {param_name}[{index}], filtering out")
+            return False
+
+        # Check for negative values
+        if value < 0 and not allow_negative:
+            raise ValueError(
+                f"[ChartForgeTK] Error: {param_name}[{index}] is negative ({value}). "
+                f"Negative values are not allowed for this chart type."
+            )
+
+        # Check for extreme values (handle gracefully)
+        if value > DataValidator.MAX_REASONABLE_VALUE:
+            logger.warning(
+                f"Extremely large value at {param_name}[{index}]: {value}. "
+                f"This may cause rendering issues."
+            )
+        elif value < DataValidator.MIN_REASONABLE_VALUE:
+            logger.warning(
+                f"Extremely small value at {param_name}[{index}]: {value}. "
+                f"This may cause rendering issues."
+            )
+
+        return True
+
+    @staticmethod
+    def is_numeric_array(obj: Any) -> bool:
+        """
+        Check if object is an array-backed numeric container.
+
+        Recognizes NumPy arrays (without importing numpy), ``array.array``
+        instances and objects exposing a numeric buffer (e.g. memoryview).
+        Strings, bytes and bytearrays are never treated as numeric arrays.
+
+        Args:
+            obj: Object to check
+
+        Returns:
+            bool: True if obj can be passed to validate_numeric_array()
+        """
+        if isinstance(obj, (str, bytes, bytearray, list, tuple)) or obj is None:
+            return False
+        if isinstance(obj, array.array):
+            return obj.typecode != 'u'
+        obj_type = type(obj)
+        if getattr(obj_type, '__module__', '') == 'numpy' and obj_type.__name__ == 'ndarray':
+            return True
+        try:
+            view = memoryview(obj)
+        except TypeError:
+            return False
+        return view.format.lstrip('@=<>!') in _NUMERIC_BUFFER_FORMATS
+
+    @staticmethod
+    def validate_numeric_array(
+        data: Any,
+        allow_empty: bool = False,
+        allow_negative: bool = True,
+        allow_nan: bool = False,
+        allow_inf: bool = False,
+        param_name: str = "data"
+    ) -> Any:
+        """
+        Validate array-backed numeric data without going through a Python list.
+
+        NaN, infinity, negative and extreme-value checks are done with masks
+        over the whole array. Errors and warnings carry the same index-specific
+        messages as validate_numeric_list().
+
+        Args:
+            data: NumPy array, array.array or other one-dimensional numeric buffer
+            allow_empty: Whether empty arrays are allowed
+            allow_negative: Whether negative values are allowed
+            allow_nan: Whether NaN values are allowed (they are filtered out)
+            allow_inf: Whether infinity values are allowed (they are filtered out)
+            param_name: Name of the parameter for error messages
+
+        Returns:
+            A compact float64 buffer that never aliases the input: a numpy
+            ndarray when numpy is installed, otherwise an ``array.array('d')``.
+
+        Raises:
+            TypeError: If data is not a numeric array or not one-dimensional
+            ValueError: If data violates validation rules
+        """
+        if data is None:
+            raise TypeError(
+                f"[ChartForgeTK] Error: {param_name} cannot be None. "
+                f"Please provide a list of numeric values."
+            )
+
+        if not DataValidator.is_numeric_array(data):
+            raise TypeError(
+                f"[ChartForgeTK] Error: {param_name} must be a numeric array, "
+                f"got {type(data).__name__}. Please provide a list of numeric values."
+            )
+
+        np = DataValidator._get_numpy()
+        if np is None:
+            # Without numpy, check element by element straight off the buffer
+            if isinstance(data, array.array):
+                values = data
+            else:
+                values = memoryview(data)
+                if values.ndim != 1:
+                    raise TypeError(
+                        f"[ChartForgeTK] Error: {param_name} must be one-dimensional, "
+                        f"got {values.ndim} dimensions."
+                    )
+            if len(values) == 0 and not allow_empty:
+                raise ValueError(
+                    f"[ChartForgeTK] Error: {param_name} cannot be empty. "
+                    f"Please provide at least one data point."
                 )
+            result = array.array('d')
+            DataValidator._validate_numeric_values(
+                (float(v) for v in values), result,
+                allow_negative, allow_nan, allow_inf, param_name
+            )
+            if not result and not allow_empty:
+                raise ValueError(
+                    f"[ChartForgeTK] Error: {param_name} is empty after filtering invalid values. "
+                    f"Please provide valid numeric data."
+                )
+            return result
 
-            result.append(value)
+        values = np.asarray(data)
+        if values.ndim != 1:
+            raise TypeError(
+                f"[ChartForgeTK] Error: {param_name} must be one-dimensional, "
+                f"got {values.ndim} dimensions."
+            )
 
-        # Final empty check after filtering
-        if not result and not allow_empty:
+        if values.dtype.kind not in 'biuf':
+            # Object/string/complex arrays: let the scalar checks report the bad index
+            result = []
+            DataValidator._validate_numeric_values(
+                values.tolist(), result, allow_negative, allow_nan, allow_inf, param_name
+            )
+            if not result and not allow_empty:
+                raise ValueError(
+                    f"[ChartForgeTK] Error: {param_name} is empty after filtering invalid values. "
+                    f"Please provide valid numeric data."
+                )
+            return np.asarray(result, dtype=np.float64)
+
+        if values.size == 0 and not allow_empty:
+            raise ValueError(
+                f"[ChartForgeTK] Error: {param_name} cannot be empty. "
+                f"Please provide at least one data point."
+            )
+
+        values = values.astype(np.float64, copy=False)
+        return DataValidator._validate_float64_ndarray(
+            values, allow_empty, allow_negative, allow_nan, allow_inf, param_name
+        )
+
+    @staticmethod
+    def _validate_float64_ndarray(
+        values: Any,
+        allow_empty: bool,
+        allow_negative: bool,
+        allow_nan: bool,
+        allow_inf: bool,
+        param_name: str
+    ) -> Any:
+        """
+        Mask-based equivalent of _validate_numeric_values() for float64 arrays.
+
+        The first offending index is located with masks and reported with the
+        same message the scalar loop would raise; warnings are only logged for
+        indices before it, in index order, exactly as the loop would.
+        """
+        np = DataValidator._get_numpy()
+        size = values.size
+
+        nan_mask = np.isnan(values)
+        inf_mask = np.isinf(values)
+        finite_mask = ~(nan_mask | inf_mask)
+
+        error_mask = np.zeros(size, dtype=bool)
+        if not allow_nan:
+            error_mask |= nan_mask
+        if not allow_inf:
+            error_mask |= inf_mask
+        if not allow_negative:
+            with np.errstate(invalid='ignore'):
+                error_mask |= finite_mask & (values < 0)
+
+        error_positions = np.flatnonzero(error_mask)
+        stop = int(error_positions[0]) if error_positions.size else size
+
+        # Replay the scalar checks only where they would log or raise, in index order
+        with np.errstate(invalid='ignore'):
+            flagged = error_mask | nan_mask | inf_mask | (
+                finite_mask & ((values > DataValidator.MAX_REASONABLE_VALUE)
+                               | (values < DataValidator.MIN_REASONABLE_VALUE))
+            )
+        for i in np.flatnonzero(flagged[:stop + 1]).tolist():
+            DataValidator._check_numeric_value(
+                float(values[i]), i, allow_negative, allow_nan, allow_inf, param_name
+            )
+
+        if finite_mask.all():
+            result = values.copy()
+        else:
+            result = values[finite_mask]
+
+        if result.size == 0 and not allow_empty:
             raise ValueError(
                 f"[ChartForgeTK] Error: {param_name} is empty after filtering invalid values. "
                 f"Please provide valid numeric data."
@@ -152,7 +404,6 @@ class DataValidator:
 
         return result
 
-
     @staticmethod
     def validate_tuple_list(
         data: Any,
@@ -1033,6 +1284,106 @@ class DataValidator:
                 "Install with: pip install pandas"
             )
 
+    @staticmethod
+    def _get_numpy():
+        """
+        Lazily import numpy if available.
+
+        numpy is optional: callers fall back to pure-Python code when this
+        returns None. The import is attempted only once per process.
+
+        Returns:
+            numpy module, or None when numpy is not installed
+        """
+        global _numpy_module
+        if _numpy_module is _NUMPY_UNSET:
+            try:
+                import numpy
+                _numpy_module = numpy
+            except ImportError:
+                _numpy_module = None
+        return _numpy_module
+
+
+    @staticmethod
+    def _column_to_float64(column: Any) -> Any:
+        """
+        Return the values of a numeric Series as a float64 numpy array.
+
+        Plain numpy-backed float64 columns come back as a view without copying;
+        nullable extension dtypes map missing values to NaN.
+        """
+        np = DataValidator._get_numpy()
+        if isinstance(column.dtype, np.dtype):
+            return column.to_numpy(dtype=np.float64, copy=False)
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    @staticmethod
+    def _format_labels(source: Any, keep: Any) -> List[str]:
+        """
+        Convert the kept entries of an Index or Series to label strings in one batch.
+
+        Produces the same strings as calling str() on each element, including
+        for datetime indexes, without per-row pandas indexing.
+        """
+        np = DataValidator._get_numpy()
+        pd = DataValidator._get_pandas()
+        selected = source[keep]
+        dtype = selected.dtype
+
+        if isinstance(dtype, np.dtype):
+            if dtype.kind in 'biuf':
+                return list(map(str, selected.to_numpy().tolist()))
+            if dtype.kind == 'M':
+                stamps = selected.to_numpy().view('i8')
+                # Whole-second, NaT-free timestamps print as "YYYY-MM-DD HH:MM:SS"
+                unit = np.datetime_data(dtype)[0]
+                per_second = {'s': 1, 'ms': 10**3, 'us': 10**6, 'ns': 10**9}.get(unit)
+                if (per_second is not None and stamps.size
+                        and not np.any(stamps == np.iinfo(np.int64).min)
+                        and not np.any(stamps % per_second)):
+                    return pd.Index(selected).strftime('%Y-%m-%d %H:%M:%S').tolist()
+
+        return list(map(str, selected))
+
+    @staticmethod
+    def _filter_invalid_rows(
+        block: Any,
+        param_name: str
+    ) -> Any:
+        """
+        Compute the mask of rows without NaN/infinity in a 2-D float64 block.
+
+        Logs the same filtered-value warnings as the row-by-row converters: a
+        dropped row counts once, as NaN or infinity according to its first bad
+        column.
+
+        Returns:
+            Boolean numpy array, True for rows that are kept
+        """
+        np = DataValidator._get_numpy()
+        finite = np.isfinite(block)
+        keep = finite.all(axis=1)
+
+        bad_rows = np.flatnonzero(~keep)
+        nan_count = 0
+        if bad_rows.size:
+            first_bad = np.argmin(finite[bad_rows], axis=1)
+            nan_count = int(np.isnan(block[bad_rows, first_bad]).sum())
+        inf_count = int(bad_rows.size) - nan_count
+
+        # Log warnings for filtered values
+        if nan_count > 0:
+            logger.warning(
+                f"[ChartForgeTK] Warning: {nan_count} NaN value(s) filtered from {param_name}."
+            )
+
+        if inf_count > 0:
+            logger.warning(
+                f"[ChartForgeTK] Warning: {inf_count} infinity value(s) filtered from {param_name}."
+            )
+
+        return keep
 
     @staticmethod
     def convert_series_to_list(
@@ -1080,40 +1431,10 @@ class DataValidator:
                 f"Expected numeric values for plotting."
             )
 
-        values = []
-        labels = []
-        nan_count = 0
-        inf_count = 0
-
-        for idx, value in series.items():
-            # Convert value to float
-            float_val = float(value)
-
-            # Check for NaN
-            if math.isnan(float_val):
-                nan_count += 1
-                continue
-
-            # Check for infinity
-            if math.isinf(float_val):
-                inf_count += 1
-                continue
-
-            values.append(float_val)
-
-            # Convert index to string (handles datetime index)
-            labels.append(str(idx))
-
-        # Log warnings for filtered values
-        if nan_count > 0:
-            logger.warning(
-                f"[ChartForgeTK] Warning: {nan_count} NaN value(s) filtered from {param_name}."
-            )
-
-        if inf_count > 0:
-            logger.warning(
-                f"[ChartForgeTK] Warning: {inf_count} infinity value(s) filtered from {param_name}."
-            )
+        # Filter NaN/infinity with one mask over the column (Requirements: 3.1, 3.2)
+        column = DataValidator._column_to_float64(series)
+        keep = DataValidator._filter_invalid_rows(column.reshape(-1, 1), param_name)
+        values = column[keep].tolist()
 
         # Check if all values were filtered
         if not values:
@@ -1122,6 +1443,9 @@ class DataValidator:
                 f"Please provide valid numeric data."
             )
 
+        # Convert index to strings (handles datetime index)
+        labels = DataValidator._format_labels(series.index, keep)
+
         return (values, labels)
 
 
@@ -1206,47 +1530,13 @@ class DataValidator:
                     f"Available columns: {available_columns}"
                 )
             label_source = df[label_column]
-            use_label_column = True
         else:
             label_source = df.index
-            use_label_column = False
-
-        values = []
-        label_list = []
-        nan_count = 0
-        inf_count = 0
-
-        for i, (idx, row) in enumerate(df.iterrows()):
-            float_val = float(row[val_col])
-
-            # Check for NaN
-            if math.isnan(float_val):
-                nan_count += 1
-                continue
 
-            # Check for infinity
-            if math.isinf(float_val):
-                inf_count += 1
-                continue
-
-            values.append(float_val)
-
-            # Get label (convert to string, handles datetime)
-            if use_label_column:
-                label_list.append(str(row[label_column]))
-            else:
-                label_list.append(str(idx))
-
-        # Log warnings for filtered values
-        if nan_count > 0:
-            logger.warning(
-                f"[ChartForgeTK] Warning: {nan_count} NaN value(s) filtered from {param_name}."
-            )
-
-        if inf_count > 0:
-            logger.warning(
-                f"[ChartForgeTK] Warning: {inf_count} infinity value(s) filtered from {param_name}."
-            )
+        # Filter NaN/infinity with one mask over the column (Requirements: 3.1, 3.2)
+        column = DataValidator._column_to_float64(df[val_col])
+        keep = DataValidator._filter_invalid_rows(column.reshape(-1, 1), param_name)
+        values = column[keep].tolist()
 
         # Check if all values were filtered
         if not values:
@@ -1255,6 +1545,9 @@ class DataValidator:
                 f"Please provide valid numeric data."
             )
 
+        # Get labels (convert to string, handles datetime)
+        label_list = DataValidator._format_labels(label_source, keep)
+
         labels = label_list if label_list else None
         return (values, labels)
 
@@ -1263,21 +1556,24 @@ class DataValidator:
     def extract_dataframe_columns(
         df: Any,
         columns: List[str],
-        param_name: str = "data"
+        param_name: str = "data",
+        label_column: Optional[str] = None
     ) -> Tuple[List[List[float]], List[str]]:
         """
         Extract multiple columns from a DataFrame for multi-series charts.
 
         Validates all specified columns exist and are numeric. Returns one list
         per column, each containing the exact values from that column in order.
+        Rows with NaN or infinity in any of the columns are dropped from all of them.
 
         Args:
             df: pandas DataFrame to extract from
             columns: List of column names to extract
             param_name: Name of the parameter for error messages
+            label_column: Optional column name for labels (defaults to index)
 
         Returns:
-            Tuple of (list of value lists (one per column), labels list from index)
+            Tuple of (list of value lists (one per column), labels list)
 
         Raises:
             TypeError: If df is not a DataFrame or columns contain non-numeric data
@@ -1321,54 +1617,27 @@ class DataValidator:
                     f"Expected numeric values for plotting."
                 )
 
-        # Extract values from each column
-        result_columns = []
-        labels = []
-        nan_count = 0
-        inf_count = 0
-
-        # Build a mask for valid rows (no NaN or inf in any specified column)
-        valid_mask = [True] * len(df)
-        for i, (idx, row) in enumerate(df.iterrows()):
-            for col in columns:
-                float_val = float(row[col])
-                if math.isnan(float_val) or math.isinf(float_val):
-                    if math.isnan(float_val):
-                        nan_count += 1
-                    else:
-                        inf_count += 1
-                    valid_mask[i] = False
-                    break
-
-        # Extract valid rows
-        for col in columns:
-            col_values = []
-            for i, (idx, row) in enumerate(df.iterrows()):
-                if valid_mask[i]:
-                    col_values.append(float(row[col]))
-            result_columns.append(col_values)
-
-        # Extract labels from valid rows
-        for i, (idx, row) in enumerate(df.iterrows()):
-            if valid_mask[i]:
-                labels.append(str(idx))
-
-        # Log warnings for filtered values
-        if nan_count > 0:
-            logger.warning(
-                f"[ChartForgeTK] Warning: {nan_count} NaN value(s) filtered from {param_name}."
+        if label_column is not None and label_column not in df.columns:
+            raise ValueError(
+                f"[ChartForgeTK] Error: Column '{label_column}' not found in DataFrame. "
+                f"Available columns: {available_columns}"
             )
 
-        if inf_count > 0:
-            logger.warning(
-                f"[ChartForgeTK] Warning: {inf_count} infinity value(s) filtered from {param_name}."
-            )
+        # Stack the columns and drop rows with NaN or inf in any of them using one mask
+        np = DataValidator._get_numpy()
+        block = np.column_stack([DataValidator._column_to_float64(df[col]) for col in columns])
+        keep = DataValidator._filter_invalid_rows(block, param_name)
+        kept = block[keep]
 
         # Check if all values were filtered
-        if not result_columns[0]:
+        if kept.shape[0] == 0:
             raise ValueError(
                 f"[ChartForgeTK] Error: {param_name} is empty after filtering NaN/infinity values. "
                 f"Please provide valid numeric data."
             )
 
+        result_columns = kept.T.tolist()
+        label_source = df[label_column] if label_column is not None else df.index
+        labels = DataValidator._format_labels(label_source, keep)
+
         return (result_columns, labels)
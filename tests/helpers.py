@@ -0,0 +1,233 @@
+"""Display-free stand-ins shared by the chart tests.
+
+make_headless() runs a chart's real __init__ with the Tk widgets swapped
+for a FakeCanvas, so tests see the same state a live chart starts with.
+"""
+from unittest import mock
+from ChartForgeTK.core import Chart
+from ChartForgeTK.textmetrics import TextMetrics
+
+
+class MeasureTk:
+    """Font engine stand-in: 7 pixels per character, 12 pixel lines; counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        if args[:2] == ('font', 'measure'):
+            return 7 * len(args[-1])
+        if args[:2] == ('font', 'metrics'):
+            return ('-ascent', 9, '-descent', 3, '-linespace', 12, '-fixed', 0)
+        raise AssertionError(args)
+
+    def splitlist(self, value):
+        return value
+
+
+class MeasureWidget:
+    def __init__(self):
+        self.tk = MeasureTk()
+
+
+class FakeCanvas:
+    """Minimal scrolled canvas: tagged items, counting creations and deletions."""
+
+    def __init__(self, width=400, height=400):
+        self.width, self.height = width, height
+        self.view_x = self.view_y = 0
+        self.scrollregion = None
+        self.items = {}
+        self.bindings = {}
+        self.timers = {}
+        self.created = 0
+        self.deleted = 0
+        self._next = 0
+
+    def _create(self, kind, *coords, tags=(), **options):
+        self._next += 1
+        self.created += 1
+        self.items[self._next] = {'kind': kind, 'coords': list(coords), 'tags': set(tags), 'options': options}
+        return self._next
+
+    def create_line(self, *coords, **options):
+        return self._create('line', *coords, **options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', *coords, **options)
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', *coords, **options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create('polygon', *coords, **options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', *coords, **options)
+
+    def create_image(self, *coords, **options):
+        return self._create('image', *coords, **options)
+
+    def type(self, item):
+        return self.items[item]['kind'] if item in self.items else ''
+
+    def _matches(self, spec):
+        if isinstance(spec, int):
+            return [spec] if spec in self.items else []
+        if spec.startswith('!(') and spec.endswith(')'):
+            excluded = set(spec[2:-1].split('||'))
+            return [i for i, item in self.items.items() if not item['tags'] & excluded]
+        return [i for i, item in self.items.items() if spec in item['tags']]
+
+    def find_withtag(self, spec):
+        return self._matches(spec)
+
+    def coords(self, spec, *coords):
+        items = self._matches(spec)
+        if not coords:
+            return list(self.items[items[0]]['coords']) if items else []
+        for item in items:
+            self.items[item]['coords'] = list(coords)
+
+    def itemconfig(self, item, **options):
+        self.items[item]['options'].update(options)
+
+    def move(self, spec, dx, dy):
+        for item in self._matches(spec):
+            coords = self.items[item]['coords']
+            self.items[item]['coords'] = [v + (dy if k % 2 else dx) for k, v in enumerate(coords)]
+
+    def delete(self, *specs):
+        for spec in specs:
+            for item in self._matches(spec):
+                del self.items[item]
+                self.deleted += 1
+
+    def tag_raise(self, tag):
+        pass
+
+    def tag_lower(self, tag):
+        pass
+
+    def bind(self, sequence, handler, add=None):
+        self.bindings.setdefault(sequence, []).append(handler)
+        return f'{sequence}-{len(self.bindings[sequence])}'
+
+    def bind_all(self, sequence, handler, add=None):
+        return self.bind(sequence, handler, add)
+
+    def tag_bind(self, tag, sequence, handler, add=None):
+        return self.bind(f'{tag} {sequence}', handler, add)
+
+    def pack(self, **options):
+        pass
+
+    def winfo_exists(self):
+        return 1
+
+    def after(self, ms, func, *args):
+        self._next += 1
+        timer_id = f'after#{self._next}'
+        self.timers[timer_id] = (func, args)
+        return timer_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, timer_id):
+        self.timers.pop(timer_id, None)
+
+    def run_timers(self):
+        """Run the callbacks scheduled so far, as one turn of the event loop."""
+        timers, self.timers = self.timers, {}
+        for func, args in timers.values():
+            func(*args)
+
+    def configure(self, **options):
+        if 'scrollregion' in options:
+            self.scrollregion = options['scrollregion']
+
+    config = configure
+
+    def xview(self, *args):
+        pass
+
+    def yview(self, *args):
+        pass
+
+    def xview_moveto(self, fraction):
+        self.view_x = fraction * self.scrollregion[2]
+
+    def canvasx(self, x):
+        return self.view_x + x
+
+    def canvasy(self, y):
+        return self.view_y + y
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def tagged(self, tag):
+        return [item for item in self.items.values() if tag in item['tags']]
+
+    def texts(self):
+        return sorted(item['options']['text'] for item in self.items.values() if item['kind'] == 'text')
+
+
+class FakePhotoImage:
+    """Stand-in for tk.PhotoImage keeping the last put() data."""
+
+    created = 0
+
+    def __init__(self, master=None, width=0, height=0):
+        FakePhotoImage.created += 1
+        self.width, self.height, self.data = width, height, None
+
+    def put(self, data):
+        self.data = data
+
+    def zoom(self, x, y=1):
+        image = FakePhotoImage(width=self.width * x, height=self.height * y)
+        image.data = self.data
+        return image
+
+
+class _Widget:
+    """Stand-in for the frames and scrollbars a chart packs around its canvas."""
+
+    def __init__(self, *args, **options):
+        pass
+
+    def pack(self, **options):
+        pass
+
+    def set(self, *args):
+        pass
+
+
+def make_headless(chart_class, canvas=None, **options):
+    """
+    Build a chart through its real __init__ without a display.
+
+    Tk widget construction is patched out: the chart draws on canvas (a new
+    FakeCanvas by default) and measures text with MeasureWidget. The chart's
+    after() timers go to the canvas; run them with canvas.run_timers().
+    """
+    canvas = canvas if canvas is not None else FakeCanvas()
+
+    def initialize_canvas(chart):
+        chart.canvas = canvas
+
+    with mock.patch('tkinter.Frame.__init__', lambda self, *args, **kwargs: None), \
+            mock.patch.object(Chart, '_initialize_canvas', initialize_canvas), \
+            mock.patch('tkinter.Canvas', lambda *args, **kwargs: canvas), \
+            mock.patch('tkinter.ttk.Frame', _Widget), \
+            mock.patch('tkinter.ttk.Scrollbar', _Widget):
+        chart = chart_class(**options)
+    chart.after, chart.after_idle, chart.after_cancel = canvas.after, canvas.after_idle, canvas.after_cancel
+    chart._text_metrics = TextMetrics(MeasureWidget())
+    return chart
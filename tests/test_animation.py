@@ -0,0 +1,197 @@
+import unittest
+from ChartForgeTK import Chart, animations_enabled, set_animations_enabled
+from ChartForgeTK.animation import AnimationEngine, AnimationScheduler, Tween, interpolate_value, linear
+
+
+class RecordingCanvas:
+    """Minimal canvas: records item state and queues after() callbacks."""
+
+    def __init__(self):
+        self.coords_of = {}
+        self.options_of = {}
+        self.pending = {}
+        self.viewable = True
+        self._next = 0
+
+    def coords(self, item, *coords):
+        self.coords_of[item] = list(coords)
+
+    def itemconfig(self, item, **options):
+        self.options_of.setdefault(item, {}).update(options)
+
+    def after(self, ms, callback):
+        self._next += 1
+        after_id = f'after#{self._next}'
+        self.pending[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_viewable(self):
+        return self.viewable
+
+    def run_pending(self):
+        for after_id, callback in list(self.pending.items()):
+            del self.pending[after_id]
+            callback()
+
+
+class TestAnimationEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.canvas = RecordingCanvas()
+        self.engine = AnimationEngine(self.canvas, clock=lambda: self.now)
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+        self.canvas.run_pending()
+
+    def test_progress_follows_elapsed_time(self):
+        self.engine.animate([Tween(1, (0, 0), (100, 10))], 100, easing=linear)
+        self.assertEqual(self.canvas.coords_of[1], [0, 0])
+        self.advance(25)
+        self.assertEqual(self.canvas.coords_of[1], [25, 2.5])
+        # A late frame jumps ahead and counts the frames it skipped
+        self.advance(55)
+        self.assertEqual(self.canvas.coords_of[1], [80, 8])
+        self.assertEqual(self.engine.dropped_frames, 2)
+        self.advance(50)
+        self.assertEqual(self.canvas.coords_of[1], [100, 10])
+        self.assertFalse(self.engine.running)
+        self.assertEqual(self.canvas.pending, {})
+
+    def test_single_frame_loop_and_completion(self):
+        done = []
+        self.engine.animate([Tween(1, (0,), (1,))], 50, on_complete=lambda: done.append('a'))
+        self.engine.animate([Tween(2, {'width': 1}, {'width': 5})], 20, on_complete=lambda: done.append('b'))
+        self.assertEqual(len(self.canvas.pending), 1)
+        self.advance(30)
+        self.assertEqual(done, ['b'])
+        self.assertEqual(self.canvas.options_of[2], {'width': 5})
+        self.advance(30)
+        self.assertEqual(done, ['b', 'a'])
+
+    def test_cancel_and_finish(self):
+        done = []
+        first = self.engine.animate([Tween(1, (0,), (10,))], 100, on_complete=lambda: done.append(1))
+        self.engine.animate([Tween(2, (0,), (10,))], 100, on_complete=lambda: done.append(2))
+        self.engine.cancel(first)
+        self.engine.finish()
+        self.assertEqual(done, [2])
+        self.assertEqual(self.canvas.coords_of[2], [10])
+        self.assertEqual(self.canvas.coords_of[1], [0])
+        self.assertEqual(self.canvas.pending, {})
+
+    def test_zero_duration_applies_end_state(self):
+        done = []
+        self.engine.animate([Tween(1, (0, 0), (3, 4))], 0, on_complete=lambda: done.append(True))
+        self.assertEqual(self.canvas.coords_of[1], [3, 4])
+        self.assertEqual(done, [True])
+        self.assertFalse(self.engine.running)
+
+    def test_tween_validation_and_values(self):
+        with self.assertRaises(TypeError):
+            Tween(1, (0, 0), {'width': 1})
+        with self.assertRaises(ValueError):
+            Tween(1, (0, 0), (1, 1, 1))
+        with self.assertRaises(ValueError):
+            Tween(1, {'width': 1}, {'fill': '#000000'})
+        self.assertEqual(interpolate_value('#000000', '#ffffff', 0.5), '#7f7f7f')
+        self.assertEqual(interpolate_value('a', 'b', 0.5), 'a')
+        self.assertEqual(interpolate_value('a', 'b', 1.0), 'b')
+
+
+class TestAnimationScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.root = RecordingCanvas()
+        self.scheduler = AnimationScheduler.for_widget(self.root)
+        self.scheduler.clock = lambda: self.now
+
+    def engine(self):
+        # Every chart canvas of the root shares the root's scheduler
+        canvas = RecordingCanvas()
+        engine = AnimationEngine(canvas, clock=lambda: self.now)
+        engine._scheduler = self.scheduler
+        return engine
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+        self.root.run_pending()
+
+    def test_one_timer_for_all_charts(self):
+        first, second = self.engine(), self.engine()
+        first.animate([Tween(1, (0,), (10,))], 100, easing=linear)
+        second.animate([Tween(1, (0,), (10,))], 50, easing=linear)
+        self.assertEqual(len(self.root.pending), 1)
+        self.assertEqual(first.canvas.pending, {})
+        self.advance(50)
+        self.assertEqual(first.canvas.coords_of[1], [5])
+        self.assertEqual(self.scheduler.engines, [first])
+        self.advance(50)
+        self.assertEqual(self.scheduler.engines, [])
+        self.assertEqual(self.root.pending, {})
+
+    def test_frame_budget_defers_and_rotates(self):
+        self.scheduler.FRAME_BUDGET_MS = 0
+        first, second = self.engine(), self.engine()
+        first.animate([Tween(1, (0,), (10,))], 100, easing=linear)
+        second.animate([Tween(1, (0,), (10,))], 100, easing=linear)
+        self.advance(20)
+        self.assertEqual((first.frames, second.frames), (1, 0))
+        self.assertEqual(self.scheduler.deferred, 1)
+        self.advance(20)
+        self.assertEqual((first.frames, second.frames), (1, 1))
+        self.assertEqual(second.canvas.coords_of[1], [4])
+
+    def test_hidden_chart_pauses_and_resumes(self):
+        engine = self.engine()
+        engine.animate([Tween(1, (0,), (10,))], 100, easing=linear)
+        self.advance(20)
+        engine.canvas.viewable = False
+        self.advance(20)
+        self.assertTrue(engine.paused)
+        self.advance(500)
+        self.assertEqual(engine.canvas.coords_of[1], [2])
+        engine.canvas.viewable = True
+        self.advance(30)
+        self.assertFalse(engine.paused)
+        self.assertAlmostEqual(engine.canvas.coords_of[1][0], 4)
+
+
+class TestAnimationSwitch(unittest.TestCase):
+
+    def setUp(self):
+        # should_animate() only reads plain attributes, no Tk needed
+        self.chart = Chart.__new__(Chart)
+        self.chart.animations_enabled = None
+        self.addCleanup(set_animations_enabled, True)
+
+    def test_global_and_per_chart_setting(self):
+        self.assertTrue(self.chart.should_animate(10))
+        set_animations_enabled(False)
+        self.assertFalse(animations_enabled())
+        self.assertFalse(self.chart.should_animate(10))
+        self.chart.set_animations_enabled(True)
+        self.assertTrue(self.chart.should_animate(10))
+        with self.assertRaises(TypeError):
+            set_animations_enabled('no')
+        with self.assertRaises(TypeError):
+            self.chart.set_animations_enabled(0)
+
+    def test_heavy_plots_skip_animation(self):
+        limit = Chart.INSTANT_ITEM_THRESHOLD
+        self.assertTrue(self.chart.should_animate(limit))
+        self.assertFalse(self.chart.should_animate(limit + 1))
+        self.chart.set_animations_enabled(True)
+        self.assertFalse(self.chart.should_animate(limit + 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from ChartForgeTK.colormap import Colormap
+from ChartForgeTK.validation import DataValidator
+
+
+def interpolate(stops, value):
+    """Reference interpolation matching HeatMap's original per-cell math."""
+    rgb = [DataValidator.parse_hex_color(c) for c in stops]
+    idx = value * (len(rgb) - 1)
+    low = min(int(idx), len(rgb) - 1)
+    high = min(low + 1, len(rgb) - 1)
+    fraction = idx - low
+    r, g, b = (int(rgb[low][c] + fraction * (rgb[high][c] - rgb[low][c])) for c in range(3))
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+class TestColormap(unittest.TestCase):
+
+    stops = ["#053061", "#4393c3", "#f7f7f7", "#d6604d", "#67001f"]
+
+    def test_table_matches_interpolation(self):
+        cmap = Colormap(self.stops, 257)
+        for k in range(257):
+            self.assertEqual(cmap.hex[k], interpolate(self.stops, k / 256))
+            self.assertEqual(cmap.hex[k], '#%02x%02x%02x' % cmap.rgb[k])
+        self.assertEqual(cmap.color(0.0), "#053061")
+        self.assertEqual(cmap.color(1.0), "#67001f")
+        self.assertEqual(cmap.color(-3), "#053061")
+        self.assertEqual(cmap.color(7), "#67001f")
+        self.assertEqual(cmap.index(0.5), 128)
+
+    def test_single_color_and_validation(self):
+        cmap = Colormap(["#abc"], 4)
+        self.assertEqual(set(cmap.hex), {"#aabbcc"})
+        with self.assertRaises(ValueError):
+            Colormap([])
+        with self.assertRaises(ValueError):
+            Colormap(["red"])
+        with self.assertRaises(ValueError):
+            Colormap(self.stops, size=1)
+
+    def test_map_array_matches_scalar_lookup(self):
+        cmap = Colormap(self.stops, 64)
+        values = [[-5.0, 0.0, 2.5], [5.0, 7.5, 15.0]]
+        expected = [[cmap.color((v - 0.0) / 10.0) for v in row] for row in values]
+        result = cmap.map_array(values, 0.0, 10.0)
+        self.assertEqual([list(row) for row in result], expected)
+
+        rgb = cmap.map_array(values, 0.0, 10.0, rgb=True)
+        self.assertEqual([[tuple(int(c) for c in px) for px in row] for row in rgb],
+                         [[cmap.rgb_at(v / 10.0) for v in row] for row in values])
+
+        flat = cmap.map_array([1.0, 1.0], 1.0, 1.0)
+        self.assertEqual(list(flat), [cmap.color(0.5)] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import math
+import unittest
+from ChartForgeTK.decimation import downsample, m4_indices, minmax_indices, lttb_indices
+
+
+class TestDecimation(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [math.sin(i / 50.0) for i in range(10000)]
+        self.values[1234] = 50.0   # Single-sample spike
+        self.values[8765] = -50.0  # Single-sample dip
+
+    def test_short_series_untouched(self):
+        values = [1.0, 2.0, 3.0]
+        for method in ('m4', 'minmax', 'lttb', None):
+            self.assertEqual(downsample(values, 100, method), [0, 1, 2])
+
+    def test_m4_keeps_extremes_and_ends(self):
+        kept = m4_indices(self.values, 500)
+        self.assertLessEqual(len(kept), 4 * 500)
+        self.assertEqual(kept, sorted(kept))
+        self.assertIn(1234, kept)
+        self.assertIn(8765, kept)
+        self.assertEqual((kept[0], kept[-1]), (0, 9999))
+
+    def test_minmax_keeps_extremes_and_ends(self):
+        kept = minmax_indices(self.values, 500)
+        self.assertLessEqual(len(kept), 2 * 500 + 2)
+        self.assertIn(1234, kept)
+        self.assertIn(8765, kept)
+        self.assertEqual((kept[0], kept[-1]), (0, 9999))
+
+    def test_lttb(self):
+        kept = lttb_indices(self.values, 500)
+        self.assertEqual(len(kept), 500)
+        self.assertEqual(kept, sorted(kept))
+        self.assertIn(1234, kept)
+        self.assertIn(8765, kept)
+        self.assertEqual((kept[0], kept[-1]), (0, 9999))
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            downsample(self.values, 100, 'bogus')
+        with self.assertRaises(TypeError):
+            downsample(self.values, 100, 42)
+        self.assertEqual(downsample([5.0, 6.0], 1, lambda values, buckets: [1]), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import io
+import zlib
+import struct
+import pathlib
+import tempfile
+import unittest
+from ChartForgeTK.export import (
+    PNGRasterizer, SVGWriter, SceneItem, anchor_fractions, arc_points, capture_scene, encode_png,
+    export_canvas, resolve_export_format, smooth_points, text_layout,
+)
+
+
+def decode_png(data):
+    """Return (width, height, rgb bytes) of a PNG written by encode_png."""
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    stream = io.BytesIO(data[8:])
+    chunks = {}
+    while True:
+        length, = struct.unpack('>I', stream.read(4))
+        tag = stream.read(4)
+        body = stream.read(length)
+        crc, = struct.unpack('>I', stream.read(4))
+        assert crc == zlib.crc32(tag + body) & 0xffffffff
+        chunks[tag] = body
+        if tag == b'IEND':
+            break
+    width, height = struct.unpack('>II', chunks[b'IHDR'][:8])
+    raw = zlib.decompress(chunks[b'IDAT'])
+    stride = width * 3 + 1
+    rows = [raw[r * stride + 1:(r + 1) * stride] for r in range(height)]
+    return width, height, b''.join(rows)
+
+
+def pixel(rgb, width, x, y):
+    i = (y * width + x) * 3
+    return '#%02x%02x%02x' % tuple(rgb[i:i + 3])
+
+
+class TestPNG(unittest.TestCase):
+
+    def test_encode_round_trip(self):
+        pixels = bytes(range(2 * 3 * 3))
+        width, height, rgb = decode_png(encode_png(3, 2, pixels))
+        self.assertEqual((width, height, rgb), (3, 2, pixels))
+        with self.assertRaises(ValueError):
+            encode_png(3, 2, b'\x00')
+
+    def test_rasterizer_draws_in_stacking_order(self):
+        scene = [
+            SceneItem('rectangle', (2, 2, 8, 8), {'fill': '#ff0000', 'outline': None, 'width': 0, 'dash': None}),
+            SceneItem('oval', (4, 4, 6, 6), {'fill': '#0000ff', 'outline': None, 'width': 0, 'dash': None}),
+            SceneItem('line', (0, 9.5, 10, 9.5), {'color': '#00ff00', 'width': 1, 'dash': None, 'capstyle': 'butt'}),
+            SceneItem('image', (0, 0), {'name': 'img', 'width': 1, 'height': 1, 'pixels': b'\x01\x02\x03'}),
+        ]
+        width, height, rgb = decode_png(PNGRasterizer(10, 10, '#ffffff').render(scene))
+        self.assertEqual(pixel(rgb, width, 3, 3), '#ff0000')
+        self.assertEqual(pixel(rgb, width, 5, 5), '#0000ff')
+        self.assertEqual(pixel(rgb, width, 5, 9), '#00ff00')
+        self.assertEqual(pixel(rgb, width, 0, 0), '#010203')
+        self.assertEqual(pixel(rgb, width, 9, 0), '#ffffff')
+        self.assertEqual(pixel(rgb, width, 8, 5), '#ffffff')
+
+    def test_outline_ring_keeps_interior(self):
+        scene = [SceneItem('rectangle', (2, 2, 12, 12), {'fill': None, 'outline': '#000000', 'width': 2, 'dash': None})]
+        width, _, rgb = decode_png(PNGRasterizer(14, 14).render(scene))
+        self.assertEqual(pixel(rgb, width, 2, 6), '#000000')
+        self.assertEqual(pixel(rgb, width, 7, 7), '#ffffff')
+
+
+class TestSVG(unittest.TestCase):
+
+    def test_items_and_escaping(self):
+        scene = [
+            SceneItem('polygon', (0, 0, 10, 0, 5, 5), {'fill': '#123456', 'outline': None, 'width': 0}),
+            SceneItem('text', (50, 20), {
+                'text': 'A & B', 'color': '#000000', 'family': 'Helvetica', 'size': 12,
+                'weight': 'bold', 'slant': 'roman', 'anchor': 'e', 'angle': 90, 'justify': 'left',
+            }),
+        ]
+        svg = SVGWriter(100, 50, '#fafafa').render(scene)
+        self.assertTrue(svg.startswith('<?xml'))
+        self.assertIn('width="100" height="50"', svg)
+        self.assertIn('<polygon points="0,0 10,0 5,5" fill="#123456"', svg)
+        self.assertIn('A &amp; B', svg)
+        self.assertIn('text-anchor="end"', svg)
+        self.assertIn('rotate(-90 50 20)', svg)
+        self.assertIn('font-weight="bold"', svg)
+
+
+class FakeTk:
+    """Answers the Tcl commands the scene reader issues."""
+
+    def call(self, *args):
+        if args[:2] == ('tk', 'scaling'):
+            return 1.0
+        if args[:2] == ('font', 'actual'):
+            return ('-family', 'Helvetica', '-size', 10, '-weight', 'bold', '-slant', 'roman')
+        if args[0] == 'image':
+            return 2 if args[1] == 'width' else 1
+        if args[1:] == ('data',):
+            return ('{#ff0000 #00ff00}',)
+        raise AssertionError(args)
+
+    def splitlist(self, value):
+        if isinstance(value, tuple):
+            return value
+        return tuple(value.strip('{}').split())
+
+
+class FakeCanvas:
+    """Read-only canvas with a fixed set of items."""
+
+    def __init__(self, items):
+        self.items = items
+        self.tk = FakeTk()
+
+    def find_all(self):
+        return tuple(range(1, len(self.items) + 1))
+
+    def type(self, item):
+        return self.items[item - 1][0]
+
+    def coords(self, item):
+        return self.items[item - 1][1]
+
+    def itemcget(self, item, option):
+        return self.items[item - 1][2].get(option, '')
+
+    def winfo_rgb(self, color):
+        return {'red': (65535, 0, 0), '#00ff00': (0, 65535, 0)}[color]
+
+
+class TestCapture(unittest.TestCase):
+
+    def test_items_are_normalized(self):
+        canvas = FakeCanvas([
+            ('rectangle', [0, 0, 5, 5], {'fill': 'red', 'state': 'hidden'}),
+            ('arc', [0, 0, 10, 10], {'fill': 'red', 'start': '0', 'extent': '90', 'style': 'pieslice'}),
+            ('line', [0, 0, 10, 0], {'fill': '#00ff00', 'width': '2', 'arrow': 'last', 'arrowshape': '8 10 3'}),
+            ('text', [5, 5], {'text': 'hi', 'fill': 'red', 'font': 'TkDefaultFont', 'anchor': 'n'}),
+            ('image', [0, 0], {'image': 'img1', 'anchor': 'nw'}),
+            ('window', [0, 0], {}),
+        ])
+        scene = capture_scene(canvas)
+        self.assertEqual([item.kind for item in scene], ['polygon', 'line', 'polygon', 'text', 'image'])
+        pie = scene[0]
+        self.assertEqual(pie.coords[:2], [5, 5])
+        self.assertEqual(pie.options['fill'], '#ff0000')
+        self.assertEqual(scene[2].coords[:2], [10, 0])
+        self.assertEqual(scene[3].options['size'], 10)
+        self.assertEqual(scene[3].options['weight'], 'bold')
+        self.assertEqual(scene[4].options['pixels'], b'\xff\x00\x00\x00\xff\x00')
+
+    def test_export_targets(self):
+        canvas = FakeCanvas([('rectangle', [0, 0, 5, 5], {'fill': 'red'})])
+        canvas.cget = lambda option: 'red'
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder) / 'chart.v1.svg'
+            self.assertEqual(export_canvas(canvas, path, 10, 10), 'svg')
+            self.assertIn(b'<svg', path.read_bytes())
+        buffer = io.BytesIO()
+        self.assertEqual(export_canvas(canvas, buffer, 10, 10, 'png'), 'png')
+        self.assertEqual(decode_png(buffer.getvalue())[:2], (10, 10))
+        with self.assertRaises(ValueError):
+            export_canvas(canvas, io.BytesIO(), 10, 10)
+        with self.assertRaises(TypeError):
+            export_canvas(canvas, 42, 10, 10, 'svg')
+
+
+class TestGeometry(unittest.TestCase):
+
+    def test_format_resolution(self):
+        self.assertEqual(resolve_export_format('chart.PNG'), 'png')
+        self.assertEqual(resolve_export_format('chart', 'svg'), 'svg')
+        self.assertEqual(resolve_export_format(pathlib.Path('out.v2') / 'chart.svg'), 'svg')
+        with self.assertRaises(ValueError):
+            resolve_export_format('chart.pdf')
+
+    def test_smooth_and_arc_points(self):
+        curve = smooth_points([(0, 0), (10, 10), (20, 0)])
+        self.assertEqual(curve[0], (0, 0))
+        self.assertEqual(curve[-1], (20, 0))
+        self.assertAlmostEqual(max(y for _, y in curve), 5)
+        arc = arc_points(0, 0, 20, 20, 0, 90)
+        self.assertAlmostEqual(arc[0][0], 20)
+        self.assertAlmostEqual(arc[-1][1], 0)
+
+    def test_text_layout_anchors(self):
+        options = {'text': 'x', 'size': 10, 'anchor': 'nw', 'justify': 'left'}
+        (_, x, baseline, align), = text_layout(options, 5, 5)
+        self.assertEqual((x, align), (5, 'start'))
+        self.assertAlmostEqual(baseline, 14)
+        options = dict(options, text='a\nb', anchor='s')
+        lines = text_layout(options, 0, 100)
+        self.assertEqual(len(lines), 2)
+        self.assertLess(lines[1][2], 100)
+        # 'center' is Tk's default anchor and contains both 'n' and 'e'
+        (_, x, baseline, align), = text_layout(dict(options, text='Hi', anchor='center'), 100, 100)
+        self.assertEqual((x, align), (100, 'middle'))
+        self.assertAlmostEqual(baseline, 100 - 6 + 9)
+        lines = text_layout(dict(options, text='ab\ncd', anchor='center', justify='center'), 100, 100)
+        self.assertEqual([line[1] for line in lines], [100, 100])
+        self.assertAlmostEqual((lines[0][2] + lines[1][2]) / 2, 100 - 12 + 6 + 9)
+        self.assertEqual(anchor_fractions('center'), (0.5, 0.5))
+        self.assertEqual(anchor_fractions('ne'), (1.0, 0.0))
+        self.assertEqual(anchor_fractions('sw'), (0.0, 1.0))
+
+    def test_centered_image_placement(self):
+        canvas = FakeCanvas([('image', [10, 10], {'image': 'img1', 'anchor': 'center'})])
+        image, = capture_scene(canvas)
+        self.assertEqual(list(image.coords), [9, 9.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
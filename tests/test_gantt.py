@@ -0,0 +1,104 @@
+import unittest
+from types import SimpleNamespace
+from ChartForgeTK.gant import GanttChart
+from tests.helpers import FakeCanvas, make_headless
+
+
+def make_gantt(tasks, days):
+    chart = make_headless(GanttChart, canvas=FakeCanvas(840, 600))
+    chart.padding = 20
+    chart.colors = ['#4E79A7', '#F28E2B']
+    chart.data = [(f'Task {i}', float(i * days // tasks), 10.0) for i in range(tasks)]
+    chart.dependencies = [(i, i + 1) for i in range(tasks - 1)]
+    chart.milestones = [('Kickoff', 0.0), ('Launch', float(days - 5))]
+    chart.max_days = max(start + duration for _, start, duration in chart.data)
+    chart._calculate_dynamic_layout()
+    chart._redraw()
+    return chart
+
+
+class TestGanttViewport(unittest.TestCase):
+
+    def test_item_count_follows_the_viewport(self):
+        small = make_gantt(200, 1000)
+        large = make_gantt(20000, 1000)
+        self.assertEqual(len(large.canvas.tagged('gantt_bars')), len(small.canvas.tagged('gantt_bars')))
+        # 600px of 20px rows plus overscan, not 20000 rows
+        self.assertLess(len(large.canvas.items), 200)
+
+    def test_scrolling_rebinds_pooled_items(self):
+        chart = make_gantt(20000, 1000)
+        canvas = chart.canvas
+        canvas.view_y = 1000
+        chart._render_viewport()
+        created = canvas.created
+        canvas.view_y = 200000
+        chart._render_viewport()
+        names = {item['options']['text'] for item in canvas.tagged('gantt_side_labels')}
+        self.assertIn('Task 10000', names)
+        self.assertNotIn('Task 0', names)
+        self.assertEqual(canvas.created, created)
+        # Unchanged view: no canvas work at all
+        chart._pools['bars'][0][2] = None
+        chart._render_viewport()
+        self.assertIsNone(chart._pools['bars'][0][2])
+
+    def test_grid_adapts_to_zoom(self):
+        chart = make_gantt(100, 1000)
+        # 800px for 1010 days: monthly lines
+        self.assertEqual(chart._grid_unit(chart._get_time_scale()), (30, 12))
+        months = len(chart.canvas.tagged('gantt_grid'))
+        self.assertLess(months, 40)
+        chart.current_scale = 20
+        chart._redraw()
+        self.assertEqual(chart._grid_unit(chart._get_time_scale()), (1, 7))
+        self.assertLess(len(chart.canvas.tagged('gantt_grid')), 80)
+
+    def test_zoom_keeps_anchor_day_in_place(self):
+        chart = make_gantt(100, 1000)
+        day = lambda: (chart.canvas.canvasx(300) - chart.padding) / chart._get_time_scale()
+        before = day()
+        chart.zoom(4, 300)
+        self.assertEqual(chart.current_scale, 4)
+        self.assertAlmostEqual(day(), before)
+        chart.zoom(1000, 300)
+        self.assertAlmostEqual(chart._get_time_scale(), chart.MAX_DAY_PIXELS)
+        chart.zoom(1e-6)
+        self.assertEqual(chart.current_scale, 1)
+        with self.assertRaises(ValueError):
+            chart.zoom(0)
+
+    def test_task_at_and_highlight(self):
+        chart = make_gantt(10, 100)
+        scale = chart._get_time_scale()
+        x_start, x_end, top = chart._task_geometry(3, scale)
+        self.assertEqual(chart._task_at((x_start + x_end) / 2, top + 1), 3)
+        self.assertIsNone(chart._task_at(x_end + 50, top + 1))
+        chart._highlight_task(3)
+        bar = chart.canvas.items[chart._bar_entries[3][0]]
+        self.assertEqual(bar['options']['width'], 2)
+        chart._clear_highlights()
+        self.assertEqual(bar['options']['width'], 1)
+
+    def test_tooltip_overlay_is_reused(self):
+        chart = make_gantt(10, 100)
+        canvas = chart.canvas
+        x_start, x_end, top = chart._task_geometry(3, chart._get_time_scale())
+        chart._on_hover(SimpleNamespace(x=x_start + 2, y=top + 1))
+        created = canvas.created
+        tooltip = canvas.tagged('tooltip_text')
+        self.assertEqual(len(tooltip), 1)
+        self.assertTrue(tooltip[0]['options']['text'].startswith('Task 3'))
+
+        chart._on_hover(SimpleNamespace(x=x_start + 4, y=top + 2))
+        self.assertEqual(canvas.created, created)
+        chart._on_leave(None)
+        self.assertIsNone(chart._highlighted)
+        self.assertEqual(tooltip[0]['options']['state'], 'hidden')
+        chart._on_hover(SimpleNamespace(x=x_start + 2, y=top + 1))
+        self.assertEqual(canvas.created, created)
+        self.assertEqual(tooltip[0]['options']['state'], 'normal')
+
+
+if __name__ == '__main__':
+    unittest.main()
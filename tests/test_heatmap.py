@@ -0,0 +1,78 @@
+import math
+import unittest
+from unittest import mock
+from ChartForgeTK.heatmap import HeatMap
+from tests.helpers import FakePhotoImage, make_headless
+
+
+def matrix(rows, cols):
+    return [[float(r * cols + c) for c in range(cols)] for r in range(rows)]
+
+
+@mock.patch('ChartForgeTK.heatmap.tk.PhotoImage', FakePhotoImage)
+class TestHeatMapCells(unittest.TestCase):
+
+    def make_heatmap(self, data, render='auto'):
+        chart = make_headless(HeatMap, width=500, height=400)
+        chart.set_animations_enabled(False)
+        chart.plot(data, render=render)
+        return chart
+
+    def test_auto_picks_raster_above_the_vector_threshold(self):
+        side = int(math.sqrt(HeatMap.RASTER_CELL_THRESHOLD))
+        self.assertEqual(self.make_heatmap(matrix(side, side)).render_mode, 'vector')
+        chart = self.make_heatmap(matrix(side + 1, side))
+        self.assertEqual(chart.render_mode, 'raster')
+        self.assertEqual(len(chart.canvas.tagged('cells')), 1)
+
+    def test_raster_cell_at_corners_and_edges(self):
+        chart = self.make_heatmap(matrix(4, 5), render='raster')
+        x0, y0, cell_width, cell_height = chart._raster_grid
+        self.assertEqual(chart._cell_at(x0, y0), (0, 0))
+        self.assertEqual(chart._cell_at(x0 + cell_width - 0.01, y0 + cell_height - 0.01), (0, 0))
+        self.assertEqual(chart._cell_at(x0 + cell_width, y0 + cell_height), (1, 1))
+        self.assertEqual(chart._cell_at(x0 + 5 * cell_width - 0.01, y0 + 4 * cell_height - 0.01), (3, 4))
+        for row in range(4):
+            for col in range(5):
+                x1, y1, _, _ = chart._cell_bounds(row, col)
+                self.assertEqual(chart._cell_at(x1, y1), (row, col))
+
+        # Just outside the matrix on every side
+        self.assertIsNone(chart._cell_at(x0 - 0.01, y0))
+        self.assertIsNone(chart._cell_at(x0, y0 - 0.01))
+        self.assertIsNone(chart._cell_at(x0 + 5 * cell_width, y0))
+        self.assertIsNone(chart._cell_at(x0, y0 + 4 * cell_height))
+
+    def test_tiled_cell_at_matches_the_rendered_pixels(self):
+        chart = self.make_heatmap(matrix(40, 30), render='tiled')
+        x0, y0, width, height = chart._tile_area
+        self.assertEqual(chart._cell_at(x0, y0), (0, 0))
+        self.assertEqual(chart._cell_at(x0 + width - 1, y0 + height - 1), (39, 29))
+
+        # A fractional view: hover uses the pixel-center sampling of _render_tiles
+        chart._view = [2.5, 1.25, 7.0, 9.0]
+        row0, col0, rows, cols = chart._view
+        for py in range(0, height, 7):
+            for px in range(0, width, 11):
+                self.assertEqual(
+                    chart._cell_at(x0 + px, y0 + py),
+                    (int(row0 + (py + 0.5) * rows / height), int(col0 + (px + 0.5) * cols / width)),
+                )
+        row, col = chart._cell_at(x0, y0)
+        x1, y1, x2, y2 = chart._cell_bounds(row, col)
+        self.assertTrue(x1 <= x0 < x2 and y1 <= y0 < y2)
+
+        # The viewport edges are exclusive
+        self.assertIsNone(chart._cell_at(x0 - 1, y0))
+        self.assertIsNone(chart._cell_at(x0, y0 - 1))
+        self.assertIsNone(chart._cell_at(x0 + width, y0))
+        self.assertIsNone(chart._cell_at(x0, y0 + height))
+
+    def test_vector_mode_has_no_arithmetic_mapping(self):
+        chart = self.make_heatmap(matrix(3, 3))
+        self.assertEqual(chart.render_mode, 'vector')
+        self.assertIsNone(chart._cell_at(200, 200))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from ChartForgeTK.core import Chart
+from tests.helpers import make_headless
+
+
+class TestHoverCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = make_headless(Chart)
+        self.canvas = self.chart.canvas
+        self.moves, self.leaves = [], []
+        self.chart.bind_hover(self.moves.append, self.leaves.append)
+        self.motion = self.canvas.bindings['<Motion>'][-1]
+        self.leave = self.canvas.bindings['<Leave>'][-1]
+        # Freeze the clock inside the frame that just ran a hover update
+        clock = mock.patch('ChartForgeTK.core.time.monotonic', return_value=100.0)
+        clock.start()
+        self.addCleanup(clock.stop)
+        self.chart._hover_last_run = 100.0
+
+    def test_one_handler_call_per_frame(self):
+        events = [SimpleNamespace(x=i, y=i) for i in range(5)]
+        for event in events:
+            self.motion(event)
+        self.assertEqual(self.moves, [])
+        self.assertEqual(len(self.canvas.timers), 1)
+
+        self.canvas.run_timers()
+        self.assertEqual(self.moves, [events[-1]])
+        self.canvas.run_timers()
+        self.assertEqual(len(self.moves), 1)
+
+    def test_first_motion_after_a_frame_runs_immediately(self):
+        self.chart._hover_last_run = 100.0 - self.chart.HOVER_FRAME_MS / 1000
+        event = SimpleNamespace(x=1, y=2)
+        self.motion(event)
+        self.assertEqual(self.moves, [event])
+        self.assertEqual(self.canvas.timers, {})
+
+    def test_leave_cancels_the_pending_motion(self):
+        self.motion(SimpleNamespace(x=1, y=1))
+        self.motion(SimpleNamespace(x=2, y=2))
+        leave = SimpleNamespace(x=-1, y=-1)
+        self.leave(leave)
+        self.assertEqual(self.leaves, [leave])
+        self.assertEqual(self.canvas.timers, {})
+        self.canvas.run_timers()
+        self.assertEqual(self.moves, [])
+
+
+class TestOverlayPool(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = make_headless(Chart)
+        self.canvas = self.chart.canvas
+
+    def test_items_are_created_once_and_reused(self):
+        chart, canvas = self.chart, self.canvas
+        ring = chart.show_overlay('ring', 'oval', (0, 0, 10, 10), outline='red')
+        label = chart.show_overlay('label', 'text', (5, 5), text='a')
+        created = canvas.created
+        for step in range(1, 20):
+            chart.hide_overlays()
+            self.assertEqual(canvas.items[ring]['options']['state'], 'hidden')
+            self.assertEqual(chart.show_overlay('ring', 'oval', (step, 0, step + 10, 10), outline='red'), ring)
+            self.assertEqual(chart.show_overlay('label', 'text', (step, 5), text=str(step)), label)
+        self.assertEqual(canvas.created, created)
+        self.assertEqual(canvas.items[ring]['coords'], [19, 0, 29, 10])
+        self.assertEqual(canvas.items[ring]['options']['state'], 'normal')
+        self.assertEqual(canvas.items[label]['options']['text'], '19')
+        self.assertEqual(canvas.tagged('overlay'), [canvas.items[ring], canvas.items[label]])
+
+    def test_unchanged_options_skip_itemconfig(self):
+        self.chart.show_overlay('ring', 'oval', (0, 0, 10, 10), outline='red')
+        with mock.patch.object(self.canvas, 'itemconfig') as itemconfig:
+            self.chart.show_overlay('ring', 'oval', (1, 1, 11, 11), outline='red')
+            itemconfig.assert_not_called()
+            self.chart.show_overlay('ring', 'oval', (1, 1, 11, 11), outline='blue')
+            itemconfig.assert_called_once()
+
+    def test_deleted_or_reset_items_are_recreated(self):
+        chart, canvas = self.chart, self.canvas
+        ring = chart.show_overlay('ring', 'oval', (0, 0, 10, 10))
+        chart.hide_overlays()
+        canvas.delete(ring)
+        again = chart.show_overlay('ring', 'oval', (0, 0, 10, 10))
+        self.assertNotEqual(again, ring)
+        self.assertIn(again, canvas.items)
+
+        # A changed kind replaces the item
+        line = chart.show_overlay('ring', 'line', (0, 0, 10, 10))
+        self.assertNotIn(again, canvas.items)
+        self.assertEqual(canvas.items[line]['kind'], 'line')
+
+        chart.reset_overlays()
+        self.assertEqual(chart._overlay_items, {})
+        self.assertNotEqual(chart.show_overlay('ring', 'line', (0, 0, 10, 10)), line)
+
+
+if __name__ == '__main__':
+    unittest.main()
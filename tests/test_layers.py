@@ -0,0 +1,80 @@
+import unittest
+from ChartForgeTK.core import Chart
+from tests.helpers import make_headless
+
+
+def make_chart():
+    chart = make_headless(Chart, width=400, height=300)
+    chart.padding = 50
+    chart.title, chart.x_label, chart.y_label = 'Sales', 'Month', 'Units'
+    return chart
+
+
+class TestLayeredAxes(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = make_chart()
+        self.canvas = self.chart.canvas
+
+    def test_unchanged_range_leaves_axes_alone(self):
+        self.chart._draw_axes(0, 10, 0, 100)
+        created = self.canvas.created
+        self.assertIn('Sales', self.canvas.texts())
+        data = self.canvas.create_line(0, 0, 1, 1, tags=('bar',))
+
+        self.chart.clear_layer('data')
+        self.assertNotIn(data, self.canvas.items)
+        self.chart._draw_axes(0, 10, 0, 100)
+        self.assertEqual(self.canvas.created, created + 1)
+        self.assertEqual(self.canvas.deleted, 1)
+
+    def test_range_change_updates_ticks_in_place(self):
+        self.chart._draw_axes(0, 10, 0, 100)
+        ids = set(self.canvas.items)
+        # More ticks: existing items are kept and only the extra ones created
+        self.chart._draw_axes(0, 10, 0, 200)
+        self.assertTrue(ids < set(self.canvas.items))
+        self.assertIn('180', self.canvas.texts())
+
+        # Fewer ticks: the surplus items are deleted, nothing is recreated
+        self.chart._draw_axes(0, 10, 0, 100)
+        self.assertEqual(set(self.canvas.items), ids)
+        self.assertNotIn('180', self.canvas.texts())
+
+        # Shifted range: same items, moved and relabelled
+        self.chart._draw_axes(0, 10, 100, 200)
+        self.assertEqual(set(self.canvas.items), ids)
+        self.assertIn('180', self.canvas.texts())
+
+    def test_frame_change_and_external_clear(self):
+        self.chart._draw_axes(0, 10, 0, 100)
+        self.chart.title = 'Revenue'
+        self.chart._draw_axes(0, 10, 0, 100)
+        self.assertIn('Revenue', self.canvas.texts())
+        self.assertNotIn('Sales', self.canvas.texts())
+
+        self.canvas.delete(*list(self.canvas.items))
+        self.chart._draw_axes(0, 10, 0, 100)
+        self.assertIn('Revenue', self.canvas.texts())
+
+    def test_colliding_tick_labels_are_skipped(self):
+        self.chart._draw_axes(0, 1000, 0, 100)
+        wide = [t for t in self.canvas.texts() if t.isdigit()]
+        self.chart.width, self.chart.height = 160, 140
+        self.chart._draw_axes(0, 1000, 0, 100)
+        narrow = [t for t in self.canvas.texts() if t.isdigit()]
+        self.assertLess(len(narrow), len(wide))
+        labels = sorted(
+            item['coords'][0] for item in self.canvas.items.values()
+            if item['kind'] == 'text' and item['options'].get('anchor') == 'n'
+        )
+        # 7px per character: "1000" is 28px wide
+        self.assertTrue(all(b - a >= 28 + 4 for a, b in zip(labels, labels[1:])))
+
+    def test_clear_layer_validation(self):
+        with self.assertRaises(ValueError):
+            self.chart.clear_layer('labels')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import math
+import random
+import unittest
+from ChartForgeTK.layout import ForceLayout, validate_layout_method
+
+
+class TestForceLayout(unittest.TestCase):
+
+    def make(self, n, method, seed=1):
+        rng = random.Random(seed)
+        positions = [(rng.uniform(40, 760), rng.uniform(40, 560)) for _ in range(n)]
+        edges = [(i, rng.randrange(n)) for i in range(n)]
+        return ForceLayout(positions, edges, (40, 40, 760, 560), method=method)
+
+    def test_barnes_hut_approximates_exact_repulsion(self):
+        exact = self.make(300, 'exact')
+        approx = self.make(300, 'barnes_hut')
+        ex, ey = [0.0] * 300, [0.0] * 300
+        ax, ay = [0.0] * 300, [0.0] * 300
+        exact._repulse_exact(ex, ey)
+        approx._repulse_barnes_hut(ax, ay)
+        error = sum(math.hypot(ex[i] - ax[i], ey[i] - ay[i]) for i in range(300))
+        total = sum(math.hypot(ex[i], ey[i]) for i in range(300))
+        self.assertLess(error / total, 0.05)
+
+    def test_theta_zero_is_exact(self):
+        layout = self.make(50, 'barnes_hut')
+        layout.theta = 0.0
+        ex, ey = [0.0] * 50, [0.0] * 50
+        ax, ay = [0.0] * 50, [0.0] * 50
+        layout._repulse_exact(ex, ey)
+        layout._repulse_barnes_hut(ax, ay)
+        for i in range(50):
+            self.assertAlmostEqual(ex[i], ax[i], places=6)
+            self.assertAlmostEqual(ey[i], ay[i], places=6)
+
+    def test_converges_inside_bounds(self):
+        for method in ('exact', 'barnes_hut', 'grid'):
+            layout = self.make(120, method)
+            iterations = layout.run()
+            self.assertTrue(layout.converged, method)
+            self.assertLess(iterations, layout.max_iterations)
+            for x, y in layout.positions():
+                self.assertTrue(40 <= x <= 760 and 40 <= y <= 560)
+
+    def test_auto_method_and_validation(self):
+        self.assertEqual(self.make(10, 'auto').method, 'exact')
+        self.assertEqual(self.make(500, 'AUTO').method, 'grid')
+        self.assertEqual(validate_layout_method('Barnes_Hut'), 'barnes_hut')
+        with self.assertRaises(ValueError):
+            validate_layout_method('spring')
+        with self.assertRaises(TypeError):
+            validate_layout_method(None)
+
+    def test_degenerate_inputs(self):
+        single = ForceLayout([(5, 5)], [], (0, 0, 10, 10))
+        self.assertTrue(single.done)
+        self.assertEqual(single.run(), 0)
+
+        # Coincident nodes and self-loops must not produce NaN
+        stacked = ForceLayout([(5, 5)] * 4, [(0, 0), (0, 1)], (0, 0, 10, 10), method='barnes_hut')
+        stacked.run()
+        for x, y in stacked.positions():
+            self.assertFalse(math.isnan(x) or math.isnan(y))
+
+        with self.assertRaises(ValueError):
+            ForceLayout([], [], (0, 0, 10, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
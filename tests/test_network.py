@@ -0,0 +1,112 @@
+import queue
+import threading
+import unittest
+from unittest import mock
+from ChartForgeTK.layout import ForceLayout
+from ChartForgeTK.network import NetworkGraph
+from tests.helpers import make_headless
+
+
+def make_layout(count=6):
+    positions = [(50 + 40 * i, 50 + 25 * (i % 3)) for i in range(count)]
+    edges = [(i, i + 1) for i in range(count - 1)]
+    return ForceLayout(positions, edges, (20, 20, 380, 280))
+
+
+class TestLayoutWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = make_headless(NetworkGraph, width=400, height=300)
+        # Tooltips and drag bindings need a real Tk root
+        self.chart._add_interactivity = lambda: None
+
+    def test_only_the_newest_snapshot_is_kept(self):
+        snapshots = queue.Queue(maxsize=1)
+        for step in range(3):
+            NetworkGraph._post_snapshot(snapshots, ([step], [step], False))
+        self.assertEqual(snapshots.get_nowait(), ([2], [2], False))
+        self.assertTrue(snapshots.empty())
+
+    def test_final_snapshot_is_flagged_done(self):
+        layout = make_layout()
+        snapshots = queue.Queue(maxsize=1)
+        self.chart._run_layout(layout, threading.Event(), snapshots)
+        xs, ys, done = snapshots.get_nowait()
+        self.assertTrue(done)
+        self.assertTrue(layout.done)
+        self.assertEqual((xs, ys), (list(layout.xs), list(layout.ys)))
+
+    def test_stopped_worker_posts_nothing(self):
+        layout = make_layout()
+        stop = threading.Event()
+        stop.set()
+        snapshots = queue.Queue(maxsize=1)
+        self.chart._run_layout(layout, stop, snapshots)
+        self.assertTrue(snapshots.empty())
+        self.assertEqual(layout.iterations, 0)
+
+    def test_replot_stops_the_running_worker(self):
+        nodes = [f'n{i}' for i in range(200)]
+        self.chart.plot(nodes, list(zip(nodes, nodes[1:])))
+        first_stop, first_thread = self.chart._layout_stop, self.chart._layout_thread
+        self.assertIsNotNone(first_thread)
+
+        self.chart.plot(['a', 'b'], [('a', 'b')])
+        self.assertTrue(first_stop.is_set())
+        self.assertIsNot(self.chart._layout_stop, first_stop)
+        first_thread.join(5)
+        self.assertFalse(first_thread.is_alive())
+
+        # The new worker's final snapshot still reaches the canvas
+        self.chart._finish_pending_render()
+        self.assertIsNone(self.chart._layout_queue)
+        self.assertTrue(self.chart.canvas.find_withtag('node_1'))
+
+
+class TestRetainedScene(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = make_headless(NetworkGraph, width=400, height=300)
+        self.chart._add_interactivity = lambda: None
+        nodes = list('abcdefgh')
+        self.chart.plot(nodes, list(zip(nodes, nodes[1:])), animate=False, show_edge_labels=True)
+        self.canvas = self.chart.canvas
+
+    def snapshot(self, shift):
+        """Positions of the current layout with node i moved by shift(i)."""
+        xs, ys = [], []
+        for i, node in enumerate(self.chart.nodes):
+            x, y = self.chart.node_positions[node]
+            dx, dy = shift(i)
+            xs.append(x + dx)
+            ys.append(y + dy)
+        return xs, ys
+
+    def test_snapshot_moves_items_without_creating_any(self):
+        chart, canvas = self.chart, self.canvas
+        created, deleted = canvas.created, canvas.deleted
+        node_b = canvas.find_withtag('node_1')
+        before = [list(canvas.items[item]['coords']) for item in node_b]
+
+        chart._sync_layout_positions(*self.snapshot(lambda i: (5, -3)))
+        chart.redraw_chart()
+        self.assertEqual((canvas.created, canvas.deleted), (created, deleted))
+        self.assertEqual(canvas.find_withtag('node_1'), node_b)
+        self.assertEqual(
+            [canvas.items[item]['coords'] for item in node_b],
+            [[v + (-3 if k % 2 else 5) for k, v in enumerate(coords)] for coords in before],
+        )
+        a, b = chart.node_positions['a'], chart.node_positions['b']
+        self.assertEqual(canvas.coords('edge_0'), [a[0], a[1], b[0], b[1]])
+        self.assertEqual(canvas.coords('elabel_0'), [(a[0] + b[0]) / 2, (a[1] + b[1]) / 2])
+
+    def test_few_moved_nodes_touch_only_their_edges(self):
+        chart = self.chart
+        chart._sync_layout_positions(*self.snapshot(lambda i: (10, 0) if i == 0 else (0, 0)))
+        with mock.patch.object(self.canvas, 'coords', wraps=self.canvas.coords) as coords:
+            chart.redraw_chart()
+        self.assertEqual({call.args[0] for call in coords.call_args_list}, {'edge_0', 'elabel_0'})
+
+
+if __name__ == '__main__':
+    unittest.main()
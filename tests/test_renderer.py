@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+from ChartForgeTK.core import ChartRenderer, ChartStyle
+from tests.helpers import FakePhotoImage
+
+
+class Canvas:
+    """Stand-in for a Tk canvas; the cache only needs a weakly referenceable key."""
+
+
+class TestGradientImages(unittest.TestCase):
+
+    def test_gradient_colors_match_brightness_scaling(self):
+        style = ChartStyle()
+        colors = ChartRenderer.gradient_colors('#2563eb', 5, 1.3, 1.0)
+        self.assertEqual(len(colors), 5)
+        self.assertEqual(colors[0], style.adjust_brightness('#2563eb', 1.3))
+        self.assertEqual(colors[-1], '#2563eb')
+        self.assertEqual(ChartRenderer.gradient_colors('#2563eb', 1, 1.3, 1.0), (colors[0],))
+
+    @mock.patch('ChartForgeTK.core.tk.PhotoImage', FakePhotoImage)
+    def test_images_are_cached_per_canvas_and_size(self):
+        canvas = Canvas()
+        FakePhotoImage.created = 0
+        first = ChartRenderer.gradient_image(canvas, '#ff0000', 20, 100)
+        self.assertEqual((first.width, first.height), (20, 100))
+        self.assertIs(ChartRenderer.gradient_image(canvas, '#ff0000', 20.2, 99.6), first)
+        # A new width reuses the strip, so only the widened copy is new
+        ChartRenderer.gradient_image(canvas, '#ff0000', 30, 100)
+        self.assertEqual(FakePhotoImage.created, 3)
+        self.assertIsNot(ChartRenderer.gradient_image(Canvas(), '#ff0000', 20, 100), first)
+
+    @mock.patch('ChartForgeTK.core.tk.PhotoImage', FakePhotoImage)
+    @mock.patch.object(ChartRenderer, 'GRADIENT_CACHE_SIZE', 4)
+    def test_cache_is_bounded(self):
+        canvas = Canvas()
+        for height in range(1, 20):
+            ChartRenderer.gradient_image(canvas, '#00ff00', 1, height)
+        self.assertEqual(len(ChartRenderer._gradient_caches[canvas]), 4)
+
+
+class TestColorCache(unittest.TestCase):
+
+    def test_derivations_are_memoized(self):
+        style = ChartStyle()
+        first = style.create_lighter('#2563eb', 1.3)
+        self.assertEqual(style.color_cache_info()['misses'], 1)
+        # create_lighter and adjust_brightness share the entry
+        self.assertEqual(style.adjust_brightness('#2563eb', 1.3), first)
+        self.assertEqual(style.color_cache_info()['hits'], 1)
+        self.assertEqual(first, style._compute_brightness('#2563eb', 1.3))
+
+    def test_theme_change_invalidates(self):
+        style = ChartStyle(theme='light')
+        light = style.create_rgba_from_hex('#ff0000', 0.5)
+        style.set_theme('dark')
+        self.assertEqual(style.color_cache_info()['size'], 0)
+        self.assertNotEqual(style.create_rgba_from_hex('#ff0000', 0.5), light)
+        style.create_shadow('#ff0000')
+        style.set_palette('ocean')
+        self.assertEqual(style.color_cache_info()['size'], 0)
+
+    def test_cache_is_bounded(self):
+        style = ChartStyle()
+        style.COLOR_CACHE_SIZE = 8
+        for i in range(20):
+            style.adjust_brightness('#336699', 1 + i / 100)
+        self.assertEqual(style.color_cache_info()['size'], 8)
+        self.assertEqual(style.adjust_brightness(None, 1.0), '#2563eb')
+
+    def test_blends_share_the_memo(self):
+        style = ChartStyle()
+        blended = style.blend_colors('#000000', '#ffffff', 0.5)
+        self.assertEqual(blended, '#7f7f7f')
+        self.assertEqual(style.blend_colors('#000000', '#ffffff', 0.5), blended)
+        self.assertEqual(style.color_cache_info()['hits'], 1)
+        # Unhashable colors are computed without the memo
+        self.assertEqual(style.blend_colors('#000000', ['#ffffff'], 0.5), '#000000')
+        style.set_theme('dark')
+        self.assertEqual(style.color_cache_info()['size'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
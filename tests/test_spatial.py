@@ -0,0 +1,51 @@
+import math
+import random
+import unittest
+from ChartForgeTK.spatial import PointGrid
+
+
+class TestPointGrid(unittest.TestCase):
+
+    def brute_force(self, points, x, y, max_dist):
+        best, best_dist = None, math.inf
+        for px, py, key, reach in points:
+            dist = math.hypot(x - px, y - py)
+            limit = max_dist if reach is None else reach
+            if dist < best_dist and dist < limit:
+                best, best_dist = key, dist
+        return None if best is None else (best, best_dist)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(3)
+        points = [(rng.uniform(0, 800), rng.uniform(0, 600), i, None) for i in range(5000)]
+        grid = PointGrid(20)
+        for px, py, key, _ in points:
+            grid.add(px, py, key)
+        self.assertEqual(len(grid), 5000)
+        for _ in range(500):
+            x, y = rng.uniform(-30, 830), rng.uniform(-30, 630)
+            self.assertEqual(grid.nearest(x, y, 20), self.brute_force(points, x, y, 20))
+
+    def test_per_point_reach(self):
+        rng = random.Random(5)
+        points = [(rng.uniform(0, 400), rng.uniform(0, 400), i, rng.uniform(5, 40)) for i in range(500)]
+        grid = PointGrid()
+        for px, py, key, reach in points:
+            grid.add(px, py, key, reach=reach)
+        for _ in range(300):
+            x, y = rng.uniform(0, 400), rng.uniform(0, 400)
+            self.assertEqual(grid.nearest(x, y), self.brute_force(points, x, y, None))
+
+    def test_ties_and_empty(self):
+        grid = PointGrid()
+        self.assertIsNone(grid.nearest(0, 0, 20))
+        grid.add(10, 10, 'first')
+        grid.add(10, 10, 'second')
+        self.assertEqual(grid.nearest(12, 10, 20), ('first', 2.0))
+        self.assertIsNone(grid.nearest(50, 50, 20))
+        with self.assertRaises(ValueError):
+            PointGrid(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
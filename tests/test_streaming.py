@@ -0,0 +1,78 @@
+import random
+import unittest
+from ChartForgeTK.line import LineChart
+from ChartForgeTK.streaming import RingBuffer
+from tests.helpers import make_headless
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_append_and_evict(self):
+        buffer = RingBuffer(3, [1.0, 2.0])
+        self.assertEqual(len(buffer), 2)
+        self.assertFalse(buffer.append(3.0))
+        self.assertTrue(buffer.append(4.0))
+        self.assertEqual(buffer.tolist(), [2.0, 3.0, 4.0])
+        self.assertEqual(buffer.extend([5.0, 6.0]), 2)
+        self.assertEqual(list(buffer), [4.0, 5.0, 6.0])
+        self.assertEqual((buffer[0], buffer[-1]), (4.0, 6.0))
+        self.assertEqual(buffer[1:], [5.0, 6.0])
+        self.assertEqual(buffer.total_appended, 6)
+        with self.assertRaises(IndexError):
+            buffer[3]
+
+    def test_running_min_max(self):
+        rng = random.Random(7)
+        buffer = RingBuffer(50)
+        for _ in range(1000):
+            buffer.append(rng.uniform(-100, 100))
+            self.assertEqual(buffer.min(), min(buffer.tolist()))
+            self.assertEqual(buffer.max(), max(buffer.tolist()))
+        self.assertIsNone(RingBuffer(5).min())
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+        with self.assertRaises(TypeError):
+            RingBuffer(2.5)
+
+
+
+class TestStreamingBars(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = make_headless(LineChart, width=400, height=300)
+        self.chart.set_animations_enabled(False)
+        self.chart.plot([1, 2, 3, 4])
+
+    def bar_coords(self, index):
+        return self.chart.canvas.items[self.chart.bars[index]['id']]['coords']
+
+    def test_bars_follow_the_streamed_view(self):
+        chart = self.chart
+        chart.add_bar('horizontal', 3, label='target')
+        chart.add_bar('vertical', 2)
+        view = chart._view_range
+        for value in range(5, 40):
+            chart.append(0, value)
+        self.assertNotEqual(chart._view_range, view)
+        x_min, x_max, y_min, y_max = chart._view_range
+        y_pixel = chart._data_to_pixel_y(3, y_min, y_max)
+        self.assertEqual(self.bar_coords(0), [chart.padding, y_pixel, chart.width - chart.padding, y_pixel])
+        self.assertEqual(self.bar_coords(1)[0], chart._data_to_pixel_x(2, x_min, x_max))
+        label = chart.canvas.items[chart.bars[0]['label_id']]
+        self.assertEqual(label['coords'][1], y_pixel - 10)
+        self.assertEqual(len(chart.canvas.tagged('static_bar')), 2)
+
+    def test_vertical_bar_range_is_the_view(self):
+        for value in range(5, 40):
+            self.chart.append(0, value)
+        x_max = self.chart._view_range[1]
+        self.assertGreater(x_max, 38)
+        self.chart.add_bar('vertical', x_max)
+        with self.assertRaises(ValueError):
+            self.chart.add_bar('vertical', x_max + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from ChartForgeTK.tableau import TableauChart
+from ChartForgeTK.tablestore import TableStore
+from tests.helpers import make_headless
+
+
+def shown_rows(canvas, top, bottom):
+    """Row texts by y inside [top, bottom), in screen order."""
+    shown = [
+        (item['coords'][1], item['options']['text'])
+        for item in canvas.tagged('row')
+        if item['kind'] == 'text' and top <= item['coords'][1] < bottom
+    ]
+    return [text for _, text in sorted(shown)]
+
+
+def make_table(rows):
+    chart = make_headless(TableauChart, width=400, height=400, theme='light')
+    chart.padding = 20
+    chart.data = TableStore.from_rows([{'id': i} for i in range(rows)])
+    chart.columns = ['id']
+    chart.column_widths = {'id': 60}
+    chart._view = chart._apply_filters_and_sort()
+    chart._draw_rows()
+    return chart
+
+
+class TestVirtualRows(unittest.TestCase):
+
+    def test_item_count_is_bounded_by_the_viewport(self):
+        small = make_table(1000)
+        large = make_table(100000)
+        self.assertEqual(len(large._row_slots), len(small._row_slots))
+        self.assertEqual(large.canvas.created, small.canvas.created)
+        # 300px body at 60px rows: 6 partially visible plus 2 overscan each side
+        self.assertEqual(len(large._row_slots), 10)
+        self.assertEqual(len(make_table(3)._row_slots), 3)
+
+    def test_scrolling_recycles_items(self):
+        chart = make_table(100000)
+        canvas = chart.canvas
+        created = canvas.created
+        top, bottom = chart._body_bounds()
+        self.assertEqual(shown_rows(canvas, top, bottom)[:2], ['0', '1'])
+
+        chart._scroll_by(120)
+        self.assertEqual(shown_rows(canvas, top, bottom)[:2], ['2', '3'])
+        chart.scroll_to(50000)
+        self.assertEqual(shown_rows(canvas, top, bottom)[:3], ['50000', '50001', '50002'])
+        self.assertIn(50000, chart.visible_row_range())
+        chart.scroll_to(10 ** 9)
+        self.assertEqual(shown_rows(canvas, top, bottom)[-1], '99999')
+        self.assertEqual(canvas.created, created)
+
+    def test_rebinding_follows_sort_and_filter(self):
+        chart = make_table(30)
+        chart.scroll_to(10)
+        created = chart.canvas.created
+        top, bottom = chart._body_bounds()
+
+        chart.sort_column, chart.sort_ascending = 'id', False
+        chart._redraw_table()
+        self.assertEqual(chart._scroll_offset, 0)
+        self.assertEqual(shown_rows(chart.canvas, top, bottom)[0], '29')
+        self.assertEqual(chart.canvas.created, created)
+
+        chart.filters['id'] = '2'
+        chart._redraw_table()
+        self.assertEqual(shown_rows(chart.canvas, top, bottom), ['29', '28', '27', '26', '25'])
+
+    def test_column_widths_come_from_a_sample(self):
+        chart = make_table(100000)
+        misses = chart.text_metrics.misses
+        chart._calculate_column_widths()
+        # Header "id ↑" is 28px, widest sampled value "99901" 35px, plus 16px
+        self.assertEqual(chart.column_widths, {'id': 51})
+        self.assertLessEqual(chart.text_metrics.misses - misses, chart.WIDTH_SAMPLE_SIZE + 1)
+
+    def test_scroll_to_validation(self):
+        with self.assertRaises(TypeError):
+            make_table(5).scroll_to(1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
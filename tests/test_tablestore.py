@@ -0,0 +1,138 @@
+import random
+import unittest
+from ChartForgeTK.tablestore import DictColumn, TableStore, encode_column
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+def brute_force(rows, filters, sort_column, ascending):
+    """The scan TableauChart used before the store, returning row indices."""
+    indices = list(range(len(rows)))
+    for column, value in filters.items():
+        if value:
+            indices = [i for i in indices if str(rows[i].get(column, '')).lower().startswith(value.lower())]
+    if sort_column:
+        indices.sort(key=lambda i: rows[i].get(sort_column, ''), reverse=not ascending)
+    return indices
+
+
+class TestTableStore(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        names = ['Alice', 'alan', 'Bob', 'bobby', 'Carol', 'carla', 'Dan', '']
+        self.rows = [
+            {'name': rng.choice(names) + str(rng.randint(0, 30)), 'city': rng.choice(['Paris', 'paris', 'Pune', 'Oslo']),
+             'score': rng.randint(0, 20)}
+            for _ in range(2000)
+        ]
+        self.store = TableStore.from_rows(self.rows)
+
+    def test_matches_linear_scan(self):
+        cases = [
+            ({}, None, True),
+            ({}, 'score', False),
+            ({'name': 'al'}, None, True),
+            ({'name': 'BOB', 'city': 'p'}, 'score', True),
+            ({'city': 'pa', 'name': ''}, 'name', False),
+            ({'score': '1'}, 'city', True),
+            ({'name': 'zzz'}, 'score', True),
+        ]
+        for filters, sort_column, ascending in cases:
+            self.assertEqual(
+                list(self.store.query(filters, sort_column, ascending)),
+                brute_force(self.rows, filters, sort_column, ascending),
+                (filters, sort_column, ascending),
+            )
+
+    def test_sort_orders_are_cached_and_stable(self):
+        first = self.store.sort_order('city', False)
+        self.assertIs(self.store.sort_order('city', False), first)
+        self.assertIsNot(self.store.sort_order('city', True), first)
+        # Ties keep input order in both directions
+        paris = [i for i in first if self.rows[i]['city'] == 'paris']
+        self.assertEqual(paris, sorted(paris))
+
+    def test_growing_filter_refines_previous_range(self):
+        lo, hi = self.store.prefix_range('name', 'b')
+        for prefix in ('bo', 'bob', 'bobb', 'bobby1'):
+            new_lo, new_hi = self.store.prefix_range('name', prefix)
+            self.assertTrue(lo <= new_lo <= new_hi <= hi)
+            lo, hi = new_lo, new_hi
+            self.assertEqual(
+                list(self.store.query({'name': prefix})),
+                brute_force(self.rows, {'name': prefix}, None, True),
+            )
+        # A shorter prefix searches the whole index again
+        self.assertEqual(list(self.store.query({'name': 'a'})), brute_force(self.rows, {'name': 'a'}, None, True))
+
+    def test_missing_keys_read_as_empty(self):
+        store = TableStore.from_rows([{'a': 'x'}, {}, {'a': 'xy'}])
+        self.assertEqual(list(store.values('a')), ['x', '', 'xy'])
+        self.assertEqual(list(store.query({'a': 'x'}, 'a', False)), [2, 0])
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.row(1), {'a': ''})
+
+
+class TestColumnarStorage(unittest.TestCase):
+
+    def test_column_encodings(self):
+        self.assertEqual(encode_column([3, 1, 2]).typecode, 'q')
+        self.assertEqual(encode_column([0.5, 1.5]).typecode, 'd')
+        labels = encode_column(['a', 'b', 'a', 'a'])
+        self.assertIsInstance(labels, DictColumn)
+        self.assertEqual(labels.categories, ['a', 'b'])
+        self.assertEqual(labels.codes.typecode, 'B')
+        self.assertEqual(encode_column([str(i) for i in range(300)]).codes.typecode, 'H')
+        # Mixed types keep their values, so they display as before
+        self.assertEqual(encode_column([1, 2.0, None]), [1, 2.0, None])
+        self.assertEqual(encode_column([True, False]), [True, False])
+
+    def test_from_columns_matches_from_rows(self):
+        columns = {'name': ['b', 'a', 'c', 'a'], 'score': [2, 3, 1, 3]}
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        by_columns = TableStore.from_columns(columns)
+        by_rows = TableStore.from_rows(rows)
+        self.assertEqual(by_columns.columns, ['name', 'score'])
+        self.assertEqual([by_columns.row(i) for i in range(4)], rows)
+        for sort_column in ('name', 'score'):
+            for ascending in (True, False):
+                self.assertEqual(
+                    list(by_columns.query({'name': 'a'}, sort_column, ascending)),
+                    list(by_rows.query({'name': 'a'}, sort_column, ascending)),
+                )
+
+    def test_column_validation(self):
+        with self.assertRaises(ValueError):
+            TableStore.from_columns({'a': [1, 2], 'b': [1]})
+        with self.assertRaises(TypeError):
+            TableStore.from_columns({'a': 'text'})
+
+    @unittest.skipUnless(np is not None, "numpy not installed")
+    def test_numpy_columns_sort_stably(self):
+        values = np.array([2, 1, 2, 3, 1])
+        store = TableStore.from_columns({'v': values})
+        self.assertIs(store.values('v'), values)
+        for ascending in (True, False):
+            expected = sorted(range(5), key=values.tolist().__getitem__, reverse=not ascending)
+            self.assertEqual(list(store.sort_order('v', ascending)), expected)
+            self.assertEqual(list(store.query({'v': '2'}, 'v', ascending)), [0, 2])
+
+    @unittest.skipUnless(pd is not None, "pandas not installed")
+    def test_from_dataframe(self):
+        df = pd.DataFrame({'city': ['Oslo', 'Pune', 'Oslo'], 'temp': [1.5, 30.0, -2.0]})
+        store = TableStore.from_dataframe(df)
+        self.assertIsInstance(store.values('city'), DictColumn)
+        self.assertEqual(str(store.row(2)['temp']), '-2.0')
+        self.assertEqual(list(store.query({'city': 'o'}, 'temp', True)), [2, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
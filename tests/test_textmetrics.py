@@ -0,0 +1,52 @@
+import unittest
+from ChartForgeTK.textmetrics import TextMetrics
+from tests.helpers import MeasureWidget
+
+
+class TestTextMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = MeasureWidget()
+        self.metrics = TextMetrics(self.widget, max_entries=3)
+
+    def test_measure_is_cached_per_font_and_text(self):
+        font = ('Helvetica', 10)
+        self.assertEqual(self.metrics.measure('abc', font), 21)
+        self.assertEqual(self.metrics.measure('abc', ['Helvetica', 10]), 21)
+        self.assertEqual(self.metrics.measure(123, font), 21)
+        self.assertEqual(self.widget.tk.calls, 2)
+        self.assertEqual((self.metrics.hits, self.metrics.misses), (1, 2))
+        self.metrics.measure('abc', ('Helvetica', 12))
+        self.assertEqual(self.widget.tk.calls, 3)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        for text in ('a', 'b', 'c'):
+            self.metrics.measure(text, 'f')
+        self.metrics.measure('a', 'f')
+        self.metrics.measure('d', 'f')
+        self.assertEqual(len(self.metrics), 3)
+        calls = self.widget.tk.calls
+        self.metrics.measure('a', 'f')
+        self.assertEqual(self.widget.tk.calls, calls)
+        self.metrics.measure('b', 'f')
+        self.assertEqual(self.widget.tk.calls, calls + 1)
+
+    def test_metrics(self):
+        self.assertEqual(self.metrics.metrics('f'), {'ascent': 9, 'descent': 3, 'linespace': 12, 'fixed': 0})
+        self.metrics.metrics('f')
+        self.assertEqual(self.widget.tk.calls, 1)
+
+    def test_fit(self):
+        metrics = TextMetrics(self.widget)
+        self.assertEqual(metrics.fit('short', 'f', 35), 'short')
+        self.assertEqual(metrics.fit('a longer label', 'f', 35), 'a lo…')
+        self.assertEqual(metrics.fit('abc', 'f', 7), '…')
+        self.assertEqual(metrics.fit('abc', 'f', 5), '')
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            TextMetrics(self.widget, max_entries=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+from ChartForgeTK.tiles import TileCache, TiledMatrix
+from ChartForgeTK.validation import DataValidator
+
+np = DataValidator._get_numpy()
+
+
+def pooled_reference(matrix, level, pooling):
+    """Pool level by level with plain loops (2x2 blocks, partial at the edges)."""
+    combine = max if pooling == 'max' else (lambda vals: sum(vals) / len(vals))
+    for _ in range(level):
+        rows, cols = len(matrix), len(matrix[0])
+        matrix = [[combine([matrix[r][c] for r in range(i, min(i + 2, rows)) for c in range(j, min(j + 2, cols))])
+                   for j in range(0, cols, 2)] for i in range(0, rows, 2)]
+    return matrix
+
+
+class TestTileCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = TileCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)  # 'b' is now least recently used
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        with self.assertRaises(ValueError):
+            TileCache(0)
+
+
+class TestTiledMatrix(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.matrix = [[rng.uniform(-5, 5) for _ in range(37)] for _ in range(23)]
+
+    def as_lists(self, block):
+        return [[float(v) for v in row] for row in block]
+
+    def test_levels_match_reference_pooling(self):
+        for pooling in ('mean', 'max'):
+            tiled = TiledMatrix(self.matrix, tile_size=4, pooling=pooling, max_tiles=8)
+            self.assertEqual(tiled.max_level, 4)
+            for level in range(tiled.max_level + 1):
+                rows, cols = tiled.level_shape(level)
+                expected = pooled_reference(self.matrix, level, pooling)
+                got = self.as_lists(tiled.region(level, 0, rows, 0, cols))
+                self.assertEqual(len(got), len(expected))
+                for got_row, expected_row in zip(got, expected):
+                    for a, b in zip(got_row, expected_row):
+                        self.assertAlmostEqual(a, b, places=9)
+            self.assertLessEqual(len(tiled.cache), 8)
+
+    def test_region_window_and_values(self):
+        tiled = TiledMatrix(self.matrix, tile_size=5)
+        window = self.as_lists(tiled.region(0, 3, 17, 8, 29))
+        self.assertEqual(window, [row[8:29] for row in self.matrix[3:17]])
+        self.assertEqual(tiled.value(4, 6), self.matrix[4][6])
+        flat = [v for row in self.matrix for v in row]
+        self.assertEqual(tiled.value_range(), (min(flat), max(flat)))
+
+    def test_rejects_non_finite_and_bad_arguments(self):
+        matrix = [row[:] for row in self.matrix]
+        matrix[2][3] = float('nan')
+        with self.assertRaises(ValueError):
+            TiledMatrix(matrix).value_range()
+        with self.assertRaises(ValueError):
+            TiledMatrix(self.matrix, pooling='median')
+        with self.assertRaises(ValueError):
+            TiledMatrix(self.matrix, tile_size=0)
+
+    @unittest.skipUnless(np is not None, "numpy not installed")
+    def test_memmap_source(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'matrix.dat')
+            mm = np.memmap(path, dtype=np.float32, mode='w+', shape=(300, 200))
+            mm[:] = np.arange(300 * 200, dtype=np.float32).reshape(300, 200)
+            mm.flush()
+            source = np.memmap(path, dtype=np.float32, mode='r', shape=(300, 200))
+            tiled = TiledMatrix(source, tile_size=64, pooling='max')
+            self.assertEqual((tiled.rows, tiled.cols), (300, 200))
+            self.assertEqual(tiled.value_range(), (0.0, 300 * 200 - 1.0))
+            rows, cols = tiled.level_shape(tiled.max_level)
+            self.assertLessEqual(max(rows, cols), 64)  # Top level fits in one tile
+            top = tiled.region(tiled.max_level, 0, rows, 0, cols)
+            self.assertEqual(float(top.max()), 300 * 200 - 1.0)
+            self.assertEqual(float(top[0][0]), 7.0 * 200 + 7.0)  # max of the top-left 8x8 block
+            del source, mm
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,17 @@
+import array
 import unittest
 from ChartForgeTK.validation import DataValidator
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 class TestDataValidator(unittest.TestCase):
 
     def test_validate_numeric_list(self):
@@ -27,6 +38,78 @@ class TestDataValidator(unittest.TestCase):
             DataValidator.validate_numeric_list([1, -2, 3], allow_negative=False)
         self.assertEqual(DataValidator.validate_numeric_list([1, -2, 3], allow_negative=True), [1.0, -2.0, 3.0])
 
+    def test_validate_numeric_array(self):
+        # array.array works with or without numpy
+        result = DataValidator.validate_numeric_array(array.array('i', [1, 2, 3]))
+        self.assertEqual(list(result), [1.0, 2.0, 3.0])
+        self.assertEqual(DataValidator.validate_numeric_list(array.array('d', [1.5])), [1.5])
+
+        # Same index-specific errors as the list path
+        with self.assertRaisesRegex(ValueError, r"data\[1\] is negative"):
+            DataValidator.validate_numeric_array(array.array('d', [1, -2]), allow_negative=False)
+        with self.assertRaisesRegex(ValueError, r"data\[2\] is NaN"):
+            DataValidator.validate_numeric_array(array.array('d', [1, 2, float('nan')]))
+        self.assertEqual(
+            list(DataValidator.validate_numeric_array(
+                array.array('d', [1, float('inf'), 3]), allow_inf=True)),
+            [1.0, 3.0]
+        )
+
+        # Text and bytes are not numeric arrays
+        self.assertFalse(DataValidator.is_numeric_array("123"))
+        self.assertFalse(DataValidator.is_numeric_array(b"123"))
+
+    @unittest.skipUnless(np is not None, "numpy not installed")
+    def test_validate_numeric_array_numpy(self):
+        data = np.array([1, 2, 3], dtype=np.int32)
+        result = DataValidator.validate_numeric_array(data)
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result.tolist(), [1.0, 2.0, 3.0])
+
+        # The result never aliases the caller's array
+        data = np.array([1.0, 2.0])
+        result = DataValidator.validate_numeric_array(data)
+        result[0] = 99.0
+        self.assertEqual(data[0], 1.0)
+
+        # First offending index wins, matching the scalar loop's order
+        with self.assertRaisesRegex(ValueError, r"data\[1\] is infinity"):
+            DataValidator.validate_numeric_array(np.array([1.0, np.inf, np.nan]), allow_nan=True)
+        with self.assertRaises(TypeError):
+            DataValidator.validate_numeric_array(np.zeros((2, 2)))
+
+        # Long lists take the vectorized path with identical results
+        values = [float(i) for i in range(DataValidator.NUMPY_FAST_PATH_THRESHOLD + 1)]
+        self.assertEqual(DataValidator.validate_numeric_list(values), values)
+        values[500] = -1.0
+        with self.assertRaisesRegex(ValueError, r"data\[500\] is negative \(-1.0\)"):
+            DataValidator.validate_numeric_list(values, allow_negative=False)
+
+    @unittest.skipUnless(pd is not None, "pandas not installed")
+    def test_pandas_conversion(self):
+        index = pd.date_range('2024-01-01', periods=4, freq='h')
+        series = pd.Series([1.0, float('nan'), 3.0, float('inf')], index=index)
+        values, labels = DataValidator.convert_series_to_list(series)
+        self.assertEqual(values, [1.0, 3.0])
+        self.assertEqual(labels, ['2024-01-01 00:00:00', '2024-01-01 02:00:00'])
+
+        df = pd.DataFrame({
+            'a': [1.0, float('nan'), 3.0],
+            'b': [4.0, 5.0, float('inf')],
+            'name': ['x', 'y', 'z'],
+        })
+        values, labels = DataValidator.convert_dataframe_to_list(df, 'b', 'name')
+        self.assertEqual((values, labels), ([4.0, 5.0], ['x', 'y']))
+
+        # Rows with NaN/inf in any requested column are dropped from every column
+        columns, labels = DataValidator.extract_dataframe_columns(
+            df, ['a', 'b'], label_column='name'
+        )
+        self.assertEqual(columns, [[1.0], [4.0]])
+        self.assertEqual(labels, ['x'])
+        with self.assertRaises(ValueError):
+            DataValidator.extract_dataframe_columns(df, ['a'], label_column='missing')
+
     def test_validate_color(self):
         # Valid hex colors
         self.assertEqual(DataValidator.validate_color("#FFFFFF"), "#ffffff")